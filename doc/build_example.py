@@ -2788,6 +2788,11 @@ class ExGenFrame(ExGen):
             yield 'from pathlib import Path'
             yield "Path('/tmp/f.csv').read_text()"
             yield f"{iattr}('/tmp/f.csv', index_depth=1)"
+        elif attr == 'from_csv_iter':
+            yield f'f1 = {icls}({kwa(FRAME_INIT_A1)})'
+            yield 'f1'
+            yield "f1.to_csv('/tmp/f.csv')"
+            yield f"tuple({iattr}('/tmp/f.csv', index_depth=1, chunk_rows=1))"
         elif attr == 'from_delimited':
             yield f'f1 = {icls}({kwa(FRAME_INIT_A1)})'
             yield 'f1'
@@ -2795,6 +2800,11 @@ class ExGenFrame(ExGen):
             yield 'from pathlib import Path'
             yield "Path('/tmp/f.psv').read_text()"
             yield f"{iattr}('/tmp/f.psv', delimiter='|', index_depth=1)"
+        elif attr == 'from_delimited_iter':
+            yield f'f1 = {icls}({kwa(FRAME_INIT_A1)})'
+            yield 'f1'
+            yield "f1.to_delimited('/tmp/f.psv', delimiter='|')"
+            yield f"tuple({iattr}('/tmp/f.psv', delimiter='|', index_depth=1, chunk_rows=1))"
         elif attr == 'from_dict':
             yield f'{iattr}({kwa(FRAME_INIT_FROM_DICT_A, arg_first=True)})'
         elif attr == 'from_dict_records':
@@ -2887,6 +2897,11 @@ class ExGenFrame(ExGen):
             yield 'f1'
             yield "f1.to_parquet('/tmp/f.parquet')"
             yield f"{iattr}('/tmp/f.parquet', index_depth=1)"
+        elif attr == 'from_parquet_iter':
+            yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_C)})'
+            yield 'f1'
+            yield "f1.to_parquet('/tmp/f.parquet', row_group_size=1)"
+            yield f"tuple({iattr}('/tmp/f.parquet', index_depth=1))"
 
         elif attr == 'from_pickle':
             yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_A)})'
@@ -2914,6 +2929,15 @@ class ExGenFrame(ExGen):
             yield f'{iattr}("select * from x limit 2", connection=conn, index_depth=1)'
             yield 'conn.close()'
 
+        elif attr == 'from_sql_iter':
+            yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_A)})'
+            yield 'f1'
+            yield "f1.to_sqlite('/tmp/f.db')"
+            yield 'import sqlite3'
+            yield "conn = sqlite3.connect('/tmp/f.db')"
+            yield f'tuple({iattr}("select * from x", connection=conn, index_depth=1, chunksize=2))'
+            yield 'conn.close()'
+
         elif attr == 'from_sqlite':
             yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_A)})'
             yield 'f1'
@@ -2933,6 +2957,12 @@ class ExGenFrame(ExGen):
             yield "Path('/tmp/f.tsv').read_text()"
             yield f"{iattr}('/tmp/f.tsv', index_depth=1)"
 
+        elif attr == 'from_tsv_iter':
+            yield f'f1 = {icls}({kwa(FRAME_INIT_A1)})'
+            yield 'f1'
+            yield "f1.to_tsv('/tmp/f.tsv')"
+            yield f"tuple({iattr}('/tmp/f.tsv', index_depth=1, chunk_rows=1))"
+
         elif attr == 'from_xlsx':
             yield f'f1 = {icls}({kwa(FRAME_INIT_A1)})'
             yield 'f1'
@@ -7467,6 +7497,18 @@ class ExGenQuilt(ExGen):
             yield f'q = {icls}(b, retain_labels=True, axis=0)'
             yield 'q'
             yield f'q.{attr_func}(2, 2, seed=0).to_frame()'
+        elif attr in (
+            'count()',
+            'max()',
+            'mean()',
+            'min()',
+            'sum()',
+        ):
+            yield f'b = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_D)})'
+            yield f'q = {icls}(b, retain_labels=True, axis=0)'
+            yield 'q'
+            yield f'q.{attr_func}()'
+            yield f'q.{attr_func}(axis=1)'
         elif attr == 'unpersist()':
             yield f'b1 = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_D)})'
             yield "b1.to_zip_npz('/tmp/b.zip')"
@@ -29,6 +29,7 @@ from static_frame.core.exception import ErrorInitStoreConfig as ErrorInitStoreCo
 from static_frame.core.exception import LocEmpty as LocEmpty
 from static_frame.core.exception import LocInvalid as LocInvalid
 from static_frame.core.exception import StoreFileMutation as StoreFileMutation
+from static_frame.core.executor import ExecutorContext as ExecutorContext
 from static_frame.core.fill_value_auto import FillValueAuto as FillValueAuto
 from static_frame.core.frame import Frame as Frame
 from static_frame.core.frame import FrameAssign as FrameAssign
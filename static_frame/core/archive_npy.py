@@ -9,6 +9,7 @@ import struct
 from ast import literal_eval
 from collections import defaultdict
 from contextlib import contextmanager
+from itertools import repeat
 from io import UnsupportedOperation
 from zipfile import ZIP_STORED, ZipFile
 
@@ -33,9 +34,12 @@ from static_frame.core.index_datetime import dtype_to_index_cls
 from static_frame.core.interface_meta import InterfaceMeta
 from static_frame.core.metadata import NPYLabel
 from static_frame.core.util import (
+    DTYPE_INT_DEFAULT,
+    DTYPE_OBJECT,
     DTYPE_OBJECT_KIND,
     JSONTranslator,
     ManyToOneType,
+    PositionsAllocator,
     TLabel,
     TName,
     TNDArrayIntDefault,
@@ -43,9 +47,11 @@ from static_frame.core.util import (
     TPathSpecifierOrBinaryIO,
     TPathSpecifierOrIO,
     concat_resolved,
+    ufunc_unique1d,
 )
 
 if tp.TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
     from types import TracebackType
 
     import pandas as pd
@@ -53,6 +59,8 @@ if tp.TYPE_CHECKING:
     from static_frame.core.bus import Bus
     from static_frame.core.frame import Frame
     from static_frame.core.generic_aliases import TFrameAny
+    from static_frame.core.store import FrameMetadata
+    from static_frame.core.type_blocks import TypeBlocks
     from static_frame.core.yarn import Yarn
 
     TNDArrayAny = np.ndarray[tp.Any, tp.Any]
@@ -627,6 +635,211 @@ class ArchiveZipWrapper(Archive):
         return self._archive.getinfo(name).file_size
 
 
+class ArchiveZipMemoryMap(Archive):
+    """Read-only archive of NPY stored (uncompressed) in a ZIP, or in a ZIP stored within a ZIP, where arrays are memory mapped from their positions in the file. Arrays retain their memory map, and are unmapped when garbage collected."""
+
+    __slots__ = ('prefix', '_file', '_offset')
+
+    _archive: ZipFileRO
+
+    def __init__(
+        self,
+        zf: ZipFileRO,
+        file: tp.IO[bytes],
+        offset: int = 0,
+    ):
+        """
+        Args:
+            zf: a ZipFileRO, reading from ``file`` or a range of ``file``.
+            file: the file, supporting ``fileno()``, that contains the ZIP.
+            offset: the position in ``file`` of the start of the ZIP read by ``zf``.
+        """
+        self._archive = zf
+        self._file = file
+        self._offset = offset
+        self.prefix = ''  # can be directly set by clients
+        self._header_decode_cache = {}
+        self._memory_map = True
+
+    def labels(self) -> tp.Iterator[str]:
+        yield from self._archive.namelist()
+
+    def __contains__(
+        self,
+        name: str,
+        /,
+    ) -> bool:
+        try:
+            self._archive.getinfo(f'{self.prefix}{name}')
+        except KeyError:
+            return False
+        return True
+
+    def read_array(self, name: str) -> TNDArrayAny:
+        file = self._file
+        file.seek(self._offset + self._archive.data_offset(f'{self.prefix}{name}'))
+        # NOTE: the memory map is retained by the array
+        array, _ = NPYConverter.from_npy(file, self._header_decode_cache, True)
+        return array
+
+    def read_array_header(self, name: str) -> HeaderType:
+        """Alternate reader for status displays."""
+        f = self._archive.open(f'{self.prefix}{name}')
+        try:
+            header = NPYConverter.header_from_npy(f, self._header_decode_cache)
+        finally:
+            f.close()
+        return header
+
+    def size_array(self, name: str) -> int:
+        return self._archive.getinfo(f'{self.prefix}{name}').file_size
+
+    def read_metadata(self) -> tp.Any:
+        return json.loads(self._archive.read(f'{self.prefix}{self.FILE_META}'))
+
+    def size_metadata(self) -> int:
+        return self._archive.getinfo(f'{self.prefix}{self.FILE_META}').file_size
+
+
+class SharedMemoryDescriptor(tp.NamedTuple):
+    """Picklable description of the arrays and metadata stored in a shared memory segment."""
+
+    name: str
+    metadata: str
+    arrays: tp.Dict[str, tp.Tuple[int, str, tp.Tuple[int, ...], bool]]
+
+
+class ArchiveSharedMemory(Archive):
+    """Archive of arrays stored in a single ``multiprocessing.shared_memory.SharedMemory`` segment. When writing, arrays are retained until ``to_shared_memory()`` copies them into a new segment; when reading, arrays are read-only views of the segment or, if ``copy`` is True, copies."""
+
+    __slots__ = ('_arrays', '_specs', '_metadata', '_copy')
+
+    _archive: tp.Optional[SharedMemory]
+
+    ALIGN = 64
+
+    def __init__(
+        self,
+        descriptor: tp.Optional[SharedMemoryDescriptor] = None,
+        *,
+        copy: bool = False,
+    ):
+        """
+        Args:
+            descriptor: if None, a writeable archive is created; otherwise, the segment described by ``descriptor`` is attached for reading.
+            copy: if True, arrays read are copied out of the segment.
+        """
+        self._arrays: tp.Dict[str, TNDArrayAny] = {}
+        self._copy = copy
+        self._header_decode_cache = {}
+        self._memory_map = not copy
+
+        if descriptor is None:
+            self._archive = None
+            self._specs: tp.Dict[str, tp.Tuple[int, str, tp.Tuple[int, ...], bool]] = {}
+            self._metadata = ''
+        else:
+            from multiprocessing.shared_memory import SharedMemory
+
+            self._archive = SharedMemory(name=descriptor.name)
+            self._specs = descriptor.arrays
+            self._metadata = descriptor.metadata
+
+    def __contains__(
+        self,
+        name: str,
+        /,
+    ) -> bool:
+        return name in self._specs or name in self._arrays
+
+    def labels(self) -> tp.Iterator[str]:
+        yield from self._specs.keys()
+
+    def write_array(self, name: str, array: TNDArrayAny) -> None:
+        dtype = array.dtype
+        if dtype.kind == DTYPE_OBJECT_KIND:
+            raise ErrorNPYEncode('No support for object dtypes.')
+        if dtype.names is not None:
+            raise ErrorNPYEncode('No support for structured arrays')
+        if array.ndim == 0 or array.ndim > 2:
+            raise ErrorNPYEncode('No support for ndim other than 1 and 2.')
+        self._arrays[name] = array
+
+    def to_shared_memory(self) -> SharedMemoryDescriptor:
+        """Copy all written arrays into a new shared memory segment, returning its descriptor. The segment remains open until ``close()`` is called, and persists until ``unlink()`` is called."""
+        from multiprocessing.shared_memory import SharedMemory
+
+        align = self.ALIGN
+        size = 0
+        for name, array in self._arrays.items():
+            fortran_order = array.flags.f_contiguous and not array.flags.c_contiguous
+            self._specs[name] = (size, array.dtype.str, array.shape, fortran_order)
+            size += -(-array.nbytes // align) * align
+
+        # NOTE: a segment of size zero cannot be created
+        shm = SharedMemory(create=True, size=max(size, 1))
+        self._archive = shm
+        for name, array in self._arrays.items():
+            if array.size:
+                offset, _, shape, fortran_order = self._specs[name]
+                np.frombuffer(
+                    shm.buf,  # type: ignore
+                    dtype=array.dtype,
+                    count=array.size,
+                    offset=offset,
+                ).reshape(shape, order='F' if fortran_order else 'C')[...] = array
+        self._arrays.clear()
+        return SharedMemoryDescriptor(shm.name, self._metadata, self._specs)
+
+    def read_array(self, name: str) -> TNDArrayAny:
+        if self._archive is None:
+            raise RuntimeError('No shared memory segment is attached.')
+        offset, dtype_str, shape, fortran_order = self._specs[name]
+        dtype = np.dtype(dtype_str)
+        count = int(np.prod(shape))
+        if not count:
+            array = np.empty(shape, dtype=dtype)
+        else:
+            # NOTE: unlike the ndarray constructor, frombuffer retains an export of the buffer, such that the segment cannot be closed while arrays are views of it
+            array = np.frombuffer(
+                self._archive.buf,  # type: ignore
+                dtype=dtype,
+                count=count,
+                offset=offset,
+            ).reshape(shape, order='F' if fortran_order else 'C')
+        if self._copy:
+            array = array.copy(order='K')
+        array.flags.writeable = False
+        return array
+
+    def read_array_header(self, name: str) -> HeaderType:
+        _, dtype_str, shape, fortran_order = self._specs[name]
+        return np.dtype(dtype_str), fortran_order, shape
+
+    def size_array(self, name: str) -> int:
+        _, dtype_str, shape, _ = self._specs[name]
+        return int(np.prod(shape)) * np.dtype(dtype_str).itemsize
+
+    def write_metadata(self, content: tp.Any) -> None:
+        self._metadata = json.dumps(content)
+
+    def read_metadata(self) -> tp.Any:
+        return json.loads(self._metadata)
+
+    def size_metadata(self) -> int:
+        return len(self._metadata)
+
+    def close(self) -> None:
+        """Close this process's handle to the segment. Raises ``BufferError`` if arrays are still views of the segment."""
+        if self._archive is not None:
+            self._archive.close()
+
+    def unlink(self) -> None:
+        """Request destruction of the segment; memory is released when all processes have closed it."""
+        if self._archive is not None:
+            self._archive.unlink()
+
+
 # -------------------------------------------------------------------------------
 
 
@@ -811,15 +1024,74 @@ class ArchiveFrameConverter:
                 cls._ARCHIVE_CLS.FUNC_REMOVE_FP(fp)
             raise
 
+    @staticmethod
+    def _blocks_decode_select(
+        *,
+        archive: Archive,
+        block_count: int,
+        columns: tp.Optional[IndexBase],
+        columns_select: tp.Iterable[TLabel],
+    ) -> tp.Tuple[TypeBlocks, tp.Optional[IndexBase]]:
+        """
+        Read only the blocks that contain columns in `columns_select`, using array headers to determine block widths without reading array data. Returns the projected :obj:`TypeBlocks` and columns.
+        """
+        from static_frame.core.type_blocks import TypeBlocks
+
+        shapes = [
+            archive.read_array_header(NPYLabel.FILE_TEMPLATE_BLOCKS.format(i))[2]
+            for i in range(block_count)
+        ]
+        widths = np.array(
+            [shape[1] if len(shape) == 2 else 1 for shape in shapes],
+            dtype=DTYPE_INT_DEFAULT,
+        )
+        ends = np.cumsum(widths)
+        starts = ends - widths
+
+        if columns is None:  # labels are positions
+            selected = np.isin(
+                PositionsAllocator.get(int(ends[-1]) if block_count else 0),
+                list(columns_select),  # type: ignore[arg-type]
+            )
+        else:
+            selected = columns.isin(columns_select)
+        positions = np.nonzero(selected)[0]
+
+        if columns is not None:
+            columns = columns._extract_iloc(positions)
+
+        if not len(positions):
+            rows = shapes[0][0] if block_count else 0
+            return TypeBlocks.from_zero_size_shape((rows, 0)), columns
+
+        block_of = np.searchsorted(ends, positions, side='right')
+        blocks = []
+        for i in ufunc_unique1d(block_of):
+            array = archive.read_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(i))
+            local = positions[block_of == i] - starts[i]
+            if array.ndim == 1 or len(local) == widths[i]:
+                blocks.append(array)
+            elif len(local) == 1:
+                blocks.append(array[:, local[0]])
+            elif local[-1] - local[0] + 1 == len(local):  # contiguous: take a view
+                blocks.append(array[:, local[0] : local[-1] + 1])
+            else:
+                blocks.append(array[:, local])
+        return TypeBlocks.from_blocks(blocks), columns
+
     @classmethod
     def frame_decode(
         cls,
         *,
         archive: Archive,
         constructor: tp.Type[TFrameAny],
+        columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
     ) -> TFrameAny:
         """
         Create a :obj:`Frame` from an npz file.
+
+        Args:
+            columns_select: An optional iterable of column labels to decode; only the blocks that contain selected columns are read. Columns retain their stored order.
         """
         from static_frame.core.type_blocks import TypeBlocks
 
@@ -867,7 +1139,14 @@ class ArchiveFrameConverter:
             name=name_columns,
         )
 
-        if block_count:
+        if columns_select is not None:
+            tb, columns = cls._blocks_decode_select(
+                archive=archive,
+                block_count=block_count,
+                columns=columns,
+                columns_select=columns_select,
+            )
+        elif block_count:
             tb = TypeBlocks.from_blocks(
                 archive.read_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(i))
                 for i in range(block_count)
@@ -886,12 +1165,69 @@ class ArchiveFrameConverter:
         )
         return f
 
+    @staticmethod
+    def frame_metadata_decode(
+        *,
+        archive: Archive,
+    ) -> FrameMetadata:
+        """
+        Create the :obj:`FrameMetadata` of a :obj:`Frame` from an npz file, reading only array headers and the (columns) labels; block data is not read.
+        """
+        from static_frame.core.series import Series
+        from static_frame.core.store import FrameMetadata
+
+        metadata = archive.read_metadata()
+        name = JSONTranslator.decode_element(metadata[NPYLabel.KEY_NAMES][0])
+        name_columns = JSONTranslator.decode_element(metadata[NPYLabel.KEY_NAMES][2])
+        block_count, _, depth_columns = metadata[NPYLabel.KEY_DEPTHS]
+
+        cls_columns: tp.Type[IndexBase] = ContainerMap.str_to_cls(  # type: ignore[assignment]
+            metadata[NPYLabel.KEY_TYPES][1]
+        )
+        if not cls_columns.STATIC:
+            cls_columns = cls_columns._IMMUTABLE_CONSTRUCTOR  # type: ignore
+
+        columns = ArchiveIndexConverter.index_decode(
+            archive=archive,
+            metadata=metadata,
+            key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_COLUMNS,
+            key_types=NPYLabel.KEY_TYPES_COLUMNS,
+            depth=depth_columns,
+            cls_index=cls_columns,
+            name=name_columns,
+        )
+
+        dtypes: tp.List[TDtypeAny] = []
+        rows = 0
+        nbytes = 0
+        for i in range(block_count):
+            dtype, _, shape = archive.read_array_header(
+                NPYLabel.FILE_TEMPLATE_BLOCKS.format(i)
+            )
+            rows = shape[0]
+            dtypes.extend(repeat(dtype, shape[1] if len(shape) == 2 else 1))
+            nbytes += int(np.prod(shape)) * dtype.itemsize
+
+        key_index = NPYLabel.FILE_TEMPLATE_VALUES_INDEX.format(0)
+        if not block_count and key_index in archive:
+            rows = archive.read_array_header(key_index)[2][0]
+
+        values = np.empty(len(dtypes), dtype=DTYPE_OBJECT)
+        values[:] = dtypes
+        values.flags.writeable = False
+        return FrameMetadata(
+            (rows, len(dtypes)),
+            nbytes,
+            Series(values, index=columns, name=name),
+        )
+
     @classmethod
     def from_archive(
         cls,
         *,
         constructor: tp.Type[TFrameAny],
         fp: TPathSpecifierOrIO,
+        columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
     ) -> TFrameAny:
         """
         Create a :obj:`Frame` from an npz file.
@@ -904,6 +1240,7 @@ class ArchiveFrameConverter:
         f = cls.frame_decode(
             archive=archive,
             constructor=constructor,
+            columns_select=columns_select,
         )
         return f
 
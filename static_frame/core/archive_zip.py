@@ -367,6 +367,66 @@ class ZipFilePartRO(io.BufferedIOBase):
 # -------------------------------------------------------------------------------
 
 
+class FileRangeRO(io.BufferedIOBase):
+    """
+    A read-only view of a range of positions in an IO bytes stream, presented as a complete file. This permits reading a ZIP stored (uncompressed) within a ZIP without reading it into memory.
+    """
+
+    __slots__ = (
+        '_file',
+        '_start',
+        '_end',
+        '_pos',
+    )
+
+    def __init__(
+        self,
+        file: tp.IO[bytes],
+        start: int,
+        size: int,
+    ) -> None:
+        self._file = file
+        self._start = start
+        self._end = start + size
+        self._pos = start
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos - self._start
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            pos = self._start + offset
+        elif whence == 1:
+            pos = self._pos + offset
+        else:
+            pos = self._end + offset
+        if pos < self._start:
+            raise OSError('Invalid seek before start of range.')
+        self._pos = pos
+        return self._pos - self._start
+
+    def read(self, n: int | None = -1) -> bytes:
+        if n is None or n < 0:
+            n = self._end - self._pos
+        else:
+            n = min(n, self._end - self._pos)
+        if n <= 0:
+            return b''
+        self._file.seek(self._pos)
+        data = self._file.read(n)
+        self._pos += len(data)
+        return data
+
+    def write(self, data: tp.Buffer, /) -> int:
+        raise NotImplementedError()  # pragma: no cover
+
+
+# -------------------------------------------------------------------------------
+
+
 @tp.overload
 def yield_zinfos(
     file: tp.IO[bytes],
@@ -572,6 +632,11 @@ class ZipFileRO:
         with self.open(name) as file:
             return file.read()
 
+    def data_offset(self, name: str) -> int:
+        """Return the position, in the file, of the start of the data for ``name``, after the local file header. As members are not compressed, data can be read (or memory mapped) directly from this position."""
+        with self.open(name) as file:
+            return file.tell()
+
     def open(self, name: str) -> tp.IO[bytes]:
         """Return file-like object for 'name'.
 
@@ -4,11 +4,12 @@ from copy import deepcopy
 from functools import partial
 from itertools import repeat
 
+import numpy as np
 import typing_extensions as tp
 from arraykit import array_deepcopy
 
 from static_frame.core.bus import Bus
-from static_frame.core.exception import AxisInvalid
+from static_frame.core.exception import AxisInvalid, ErrorInitIndexNonUnique
 from static_frame.core.generic_aliases import (
     TBusAny,
     TFrameAny,
@@ -20,9 +21,12 @@ from static_frame.core.index_auto import IndexAutoConstructorFactory
 from static_frame.core.index_hierarchy import IndexHierarchy, IndexHierarchyGO, TTreeNode
 from static_frame.core.util import (
     DTYPE_INT_DEFAULT,
+    INT_TYPES,
     TCallableAny,
+    TILocSelector,
     TLabel,
     TName,
+    TNDArrayIntDefault,
     TNDArrayObject,
 )
 
@@ -31,6 +35,7 @@ if tp.TYPE_CHECKING:
     from static_frame.core.yarn import Yarn
 
     TYarnAny = Yarn[tp.Any]
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any]
 
 
 def get_extractor(
@@ -139,6 +144,80 @@ def bus_to_hierarchy(
     ), opposite
 
 
+def hierarchy_to_offsets(
+    axis_hierarchy: IndexHierarchy,
+) -> tp.Tuple[TNDArrayIntDefault, tp.List[TLabel]]:
+    """
+    Given an :obj:`IndexHierarchy` derived from a :obj:`Bus`, where the outermost depth holds the labels of contiguous components, return an array of cumulative offsets (one more than the count of components), such that component ``i`` spans positions ``offsets[i]`` to ``offsets[i + 1]``, and a list of component labels.
+    """
+    size = len(axis_hierarchy)
+    indexer = axis_hierarchy._indexers[0]
+    starts = np.flatnonzero(indexer[1:] != indexer[:-1]) + 1
+
+    offsets = np.empty(len(starts) + 2, dtype=DTYPE_INT_DEFAULT)
+    offsets[0] = 0
+    offsets[1:-1] = starts
+    offsets[-1] = size
+    if not size:
+        offsets = offsets[:1]
+    offsets.flags.writeable = False
+
+    labels = list(axis_hierarchy.values_at_depth(0)[offsets[:-1]])
+    return offsets, labels
+
+
+def offsets_to_component_keys(
+    offsets: TNDArrayIntDefault,
+    key: TILocSelector,
+) -> tp.Iterator[tp.Tuple[int, tp.Union[slice, TNDArrayAny]]]:
+    """
+    Given cumulative component offsets and an iloc selection over all components, yield pairs of component position and an iloc selection local to that component, for only the components selected, in order of first occurrence. Integers and contiguous ascending slices are resolved by binary search on ``offsets``; other selections are resolved as a Boolean selection per component, and cannot select a position more than once.
+    """
+    size = int(offsets[-1])
+
+    if isinstance(key, INT_TYPES):
+        pos = key + size if key < 0 else key
+        if not 0 <= pos < size:
+            raise IndexError(f'index {key} is out of bounds for size {size}')
+        i = int(offsets.searchsorted(pos, side='right')) - 1
+        local = int(pos - offsets[i])
+        yield i, slice(local, local + 1)
+        return
+
+    if isinstance(key, slice):
+        start, stop, step = key.indices(size)
+        if step == 1:
+            if start >= stop:
+                return
+            i_start = int(offsets.searchsorted(start, side='right')) - 1
+            i_stop = int(offsets.searchsorted(stop - 1, side='right'))
+            for i in range(i_start, i_stop):
+                offset = int(offsets[i])
+                yield (
+                    i,
+                    slice(
+                        max(start, offset) - offset,
+                        min(stop, int(offsets[i + 1])) - offset,
+                    ),
+                )
+            return
+
+    sel = np.full(size, False)
+    sel[key] = True
+    positions = np.arange(size)[key]
+    if not len(positions):
+        return
+    if len(positions) > np.count_nonzero(sel):
+        raise ErrorInitIndexNonUnique(
+            'Cannot select positions more than once across components.'
+        )
+
+    components = offsets.searchsorted(positions, side='right') - 1
+    _, first = np.unique(components, return_index=True)
+    for i in components[np.sort(first)]:
+        yield int(i), sel[offsets[i] : offsets[i + 1]]
+
+
 def buses_to_iloc_hierarchy(
     buses: tp.Iterable[TBusAny],
     deepcopy_from_bus: bool,
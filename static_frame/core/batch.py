@@ -24,6 +24,7 @@ from static_frame.core.node_transpose import InterfaceBatchTranspose
 from static_frame.core.node_values import InterfaceBatchValues
 from static_frame.core.reduce import InterfaceBatchReduceDispatch
 from static_frame.core.series import Series
+from static_frame.core.shared_memory import SharedMemoryTransfer
 from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
@@ -131,6 +132,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         '_chunksize',
         '_use_threads',
         '_mp_context',
+        '_use_shared_memory',
     )
 
     _mp_context: TMpContext
@@ -146,6 +148,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """Return a :obj:`Batch` from an iterable of :obj:`Frame`; labels will be drawn from :obj:`Frame.name`."""
         return cls(
@@ -155,6 +158,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     # ---------------------------------------------------------------------------
@@ -170,6 +174,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         items = ((label, store.read(label)) for label in store.labels())
 
@@ -179,6 +184,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     @classmethod
@@ -193,6 +199,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """
         Given a file path to zipped TSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -206,6 +213,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     @classmethod
@@ -220,6 +228,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """
         Given a file path to zipped CSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -233,6 +242,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     @classmethod
@@ -247,6 +257,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """
         Given a file path to zipped pickle :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -260,6 +271,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     @classmethod
@@ -274,6 +286,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """
         Given a file path to zipped NPZ :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -287,6 +300,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     @classmethod
@@ -301,6 +315,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """
         Given a file path to zipped NPY :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -314,6 +329,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     @classmethod
@@ -328,6 +344,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """
         Given a file path to zipped parquet :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -341,6 +358,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     @classmethod
@@ -355,6 +373,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """
         Given a file path to an XLSX :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -368,6 +387,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     @classmethod
@@ -382,6 +402,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> 'Batch':
         """
         Given a file path to an SQLite :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -395,6 +416,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize=chunksize,
             use_threads=use_threads,
             mp_context=mp_context,
+            use_shared_memory=use_shared_memory,
         )
 
     # ---------------------------------------------------------------------------
@@ -408,6 +430,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ):
         """
         Default constructor of a :obj:`Batch`.
@@ -421,6 +444,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         self._chunksize = chunksize
         self._use_threads = use_threads
         self._mp_context = mp_context
+        self._use_shared_memory = use_shared_memory
 
     # ---------------------------------------------------------------------------
     def _derive(
@@ -435,6 +459,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers=self._max_workers,
             chunksize=self._chunksize,
             use_threads=self._use_threads,
+            mp_context=self._mp_context,
+            use_shared_memory=self._use_shared_memory,
         )
 
     @property
@@ -523,11 +549,24 @@ class Batch(ContainerOperand, StoreClientMixin):
             mp_context=self._mp_context,
         )
 
-        def gen_pool() -> TIteratorFrameItems:
-            with pool_executor() as executor:
-                yield from zip(
-                    labels, executor.map(caller, arg_iter, chunksize=self._chunksize)
-                )
+        if self._use_shared_memory and not self._use_threads:
+
+            def gen_pool() -> TIteratorFrameItems:
+                with (
+                    SharedMemoryTransfer(caller) as transfer,
+                    pool_executor() as executor,
+                ):
+                    yield from zip(
+                        labels,
+                        transfer.map(executor, arg_iter, chunksize=self._chunksize),
+                    )
+        else:
+
+            def gen_pool() -> TIteratorFrameItems:
+                with pool_executor() as executor:
+                    yield from zip(
+                        labels, executor.map(caller, arg_iter, chunksize=self._chunksize)
+                    )
 
         return self._derive(gen_pool)
 
@@ -549,18 +588,41 @@ class Batch(ContainerOperand, StoreClientMixin):
             mp_context=self._mp_context,
         )
 
-        def gen_pool() -> TIteratorFrameItems:
-            futures = []
-            with pool_executor() as executor:
-                for args in arg_iter:
-                    futures.append(executor.submit(caller, args))
+        if self._use_shared_memory and not self._use_threads:
+
+            def gen_pool() -> TIteratorFrameItems:
+                futures = []
+                with (
+                    SharedMemoryTransfer(caller) as transfer,
+                    pool_executor() as executor,
+                ):
+                    for args in arg_iter:
+                        futures.append(
+                            executor.submit(transfer.func, transfer.wrap(args))
+                        )
+
+                    for label, future in zip(labels, futures):
+                        try:
+                            container = future.result()
+                        except exception:
+                            continue
+                        finally:
+                            transfer.release()
+                        yield label, container
+        else:
 
-                for label, future in zip(labels, futures):
-                    try:
-                        container = future.result()
-                    except exception:
-                        continue
-                    yield label, container
+            def gen_pool() -> TIteratorFrameItems:
+                futures = []
+                with pool_executor() as executor:
+                    for args in arg_iter:
+                        futures.append(executor.submit(caller, args))
+
+                    for label, future in zip(labels, futures):
+                        try:
+                            container = future.result()
+                        except exception:
+                            continue
+                        yield label, container
 
         return self._derive(gen_pool)
 
@@ -1836,13 +1898,13 @@ class Batch(ContainerOperand, StoreClientMixin):
             name=self._name,
         )
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
-        return self.to_bus()._to_signature_bytes(
+    ) -> tp.Iterator[bytes | memoryview]:
+        return self.to_bus()._iter_signature_bytes(
             include_name=include_name,
             include_class=include_class,
             encoding=encoding,
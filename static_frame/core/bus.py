@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from itertools import chain, islice, zip_longest
+import threading
+from collections import deque
+from itertools import islice, zip_longest
 
 import numpy as np
 import typing_extensions as tp
@@ -30,7 +32,7 @@ from static_frame.core.node_selector import (
     InterGetItemLocReduces,
 )
 from static_frame.core.series import Series
-from static_frame.core.store import Store, StoreBase, StoreManifest
+from static_frame.core.store import FrameMetadata, Store, StoreBase, StoreManifest
 from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
@@ -46,6 +48,7 @@ from static_frame.core.util import (
     DEFAULT_SORT_KIND,
     DTYPE_BOOL,
     DTYPE_FLOAT_DEFAULT,
+    DTYPE_INT_DEFAULT,
     DTYPE_OBJECT,
     INT_TYPES,
     NAME_DEFAULT,
@@ -111,6 +114,66 @@ if tp.TYPE_CHECKING:
     TBusItems = tp.Iterable[tp.Tuple[TLabel, tp.Union[TFrameAny, tp.Type[FrameDeferred]]]]
 
     TIterFrame = tp.Iterator[TFrameAny]
+    TLabels = tp.Union[TNDArrayAny, IndexBase]
+
+
+def iter_prefetch(
+    read_many: tp.Callable[[TLabels], tp.Iterator[TFrameAny]],
+    labels: TLabels,
+    count: int,
+) -> tp.Iterator[TFrameAny]:
+    """Yield the Frame read by ``read_many`` for ``labels``, reading in a background thread that holds no more than ``count`` Frame not yet consumed, including Frame being read. Labels are read in groups of as many Frame as there are free slots, permitting a Store reading with a pool to read in parallel. Exceptions raised in the background thread are re-raised in the consumer."""
+    buffer: deque[tp.Tuple[TFrameAny | None, BaseException | None]] = deque()
+    available = threading.Semaphore(
+        count
+    )  # slots for Frame being read or not yet consumed
+    ready = threading.Semaphore(0)  # values in the buffer
+    stop = threading.Event()
+    size = len(labels)
+
+    def produce() -> None:
+        try:
+            start = 0
+            while start < size:
+                while not available.acquire(timeout=0.05):
+                    if stop.is_set():
+                        return
+                end = start + 1
+                while end < size and available.acquire(blocking=False):
+                    end += 1
+                if stop.is_set():
+                    return
+                for f in read_many(labels[start:end]):
+                    buffer.append((f, None))
+                    ready.release()
+                start = end
+            buffer.append((None, None))
+            ready.release()
+        except BaseException as e:  # forward to the consumer
+            buffer.append((None, e))
+            ready.release()
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            ready.acquire()
+            f, e = buffer.popleft()
+            if e is not None:
+                raise e
+            if f is None:
+                return
+            available.release()
+            yield f
+    finally:
+        stop.set()
+        thread.join()
+
+
+# positions in Bus._persist_counts
+_PERSIST_HIT = 0
+_PERSIST_MISS = 1
+_PERSIST_EVICT = 2
 
 # -------------------------------------------------------------------------------
 TVIndex = tp.TypeVar('TVIndex', bound=IndexBase, default=tp.Any)
@@ -131,6 +194,12 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         '_store',
         '_last_loaded',
         '_max_persist',
+        '_prefetch',
+        '_max_persist_bytes',
+        '_loaded_nbytes',
+        '_persist_counts',
+        '_lock',
+        '_persist_epoch',
     )
 
     _values_mutable: TNDArrayAny
@@ -219,6 +288,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         store: Store | StoreManifest | None = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         own_data: bool = False,
     ) -> tp.Self:
         """
@@ -230,6 +301,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             index=series.index,
             store=store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             own_data=own_data,
             own_index=True,
             name=series.name,
@@ -260,6 +333,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         store: Store | StoreManifest,
         *,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         return cls(
@@ -268,6 +343,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             index_constructor=index_constructor,
             store=store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             own_data=True,
         )
 
@@ -280,6 +357,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         config: StoreConfigMapInitializer = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -291,6 +370,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -303,6 +384,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         config: StoreConfigMapInitializer = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -314,6 +397,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -326,6 +411,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         config: StoreConfigMapInitializer = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -337,6 +424,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -349,6 +438,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         config: StoreConfigMapInitializer = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -360,6 +451,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -372,6 +465,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         config: StoreConfigMapInitializer = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -383,6 +478,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -395,6 +492,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         config: StoreConfigMapInitializer = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -406,6 +505,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -418,6 +519,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         config: StoreConfigMapInitializer = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -429,6 +532,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -441,6 +546,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         *,
         config: StoreConfigMapInitializer = None,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -452,6 +559,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -463,6 +572,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         /,
         *,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
         index_constructor: TIndexCtorSpecifier = None,
     ) -> tp.Self:
         """
@@ -474,6 +585,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         return cls._from_store(
             store,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
             index_constructor=index_constructor,
         )
 
@@ -488,6 +601,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         name: TName = NAME_DEFAULT,
         store: Store | StoreManifest | None = None,
         max_persist: int | None = None,
+        prefetch: int | None = None,
+        max_persist_bytes: int | None = None,
         own_index: bool = False,
         own_data: bool = False,
     ):
@@ -496,13 +611,23 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
 
         {args}
         """
-        if max_persist is not None:
-            if max_persist < 1:
-                raise ErrorInitBus(
-                    'Cannot initialize a :obj:`Bus` with `max_persist` less than 1; use `None` to disable `max_persist`.'
-                )
-            # use an dict to give use an ordered set pointing to None for all keys
-            self._last_loaded: tp.Dict[TLabel, None] = {}
+        if max_persist is not None and max_persist < 1:
+            raise ErrorInitBus(
+                'Cannot initialize a :obj:`Bus` with `max_persist` less than 1; use `None` to disable `max_persist`.'
+            )
+        if max_persist_bytes is not None and max_persist_bytes < 1:
+            raise ErrorInitBus(
+                'Cannot initialize a :obj:`Bus` with `max_persist_bytes` less than 1; use `None` to disable `max_persist_bytes`.'
+            )
+        if max_persist is not None or max_persist_bytes is not None:
+            # use an ordered dict as an LRU of loaded labels, mapping to the nbytes of each Frame if max_persist_bytes is set, else 0
+            self._last_loaded: tp.Dict[TLabel, int] = {}
+        self._max_persist_bytes = max_persist_bytes
+        self._loaded_nbytes = 0
+        if prefetch is not None and prefetch < 1:
+            raise ErrorInitBus(
+                'Cannot initialize a :obj:`Bus` with `prefetch` less than 1; use `None` to disable `prefetch`.'
+            )
 
         if own_index:
             self._index = index  # type: ignore
@@ -559,8 +684,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                 if value is FrameDeferred:
                     self._loaded[i] = False
                 elif isinstance(value, Frame):  # permit FrameGO?
-                    if max_persist is not None:
-                        self._last_loaded[label] = None
+                    if max_persist is not None or max_persist_bytes is not None:
+                        self._persist_record(label, value)
                     self._loaded[i] = True
                 else:
                     raise ErrorInitBus(
@@ -585,6 +710,29 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                 'max_persist cannot be less than the number of already loaded Frames'
             )
         self._max_persist = max_persist
+        self._prefetch = prefetch
+        # counts of hits, misses (reads from the Store), and evictions per Frame
+        self._persist_counts = np.zeros((3, count), dtype=DTYPE_INT_DEFAULT)
+        # loading and evicting Frame is only done with the lock held; the epoch is incremented with each such change
+        self._lock = threading.RLock()
+        self._persist_epoch = 0
+
+    def __getstate__(self) -> tuple[None, dict[str, tp.Any]]:
+        # the lock cannot be pickled; unassigned slots (such as _last_loaded) are omitted
+        slots = (s for cls in type(self).__mro__ for s in getattr(cls, '__slots__', ()))
+        return (
+            None,
+            {
+                attr: getattr(self, attr)
+                for attr in slots
+                if attr != '_lock' and hasattr(self, attr)
+            },
+        )
+
+    def __setstate__(self, state: tuple[None, dict[str, tp.Any]]) -> None:
+        for key, value in state[1].items():
+            setattr(self, key, value)
+        self._lock = threading.RLock()
 
     # ---------------------------------------------------------------------------
     def _derive_from_series(
@@ -599,6 +747,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             series,
             store=self._store,
             max_persist=self._max_persist,
+            prefetch=self._prefetch,
+            max_persist_bytes=self._max_persist_bytes,
             own_data=own_data,
         )
 
@@ -616,16 +766,18 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         """
         Return a shallow copy of this :obj:`Bus`.
         """
-        # NOTE: do not want to use .values as this will force loading all Frames; use _values_mutable and let a copy be made by constructor
+        # NOTE: do not want to use .values as this will force loading all Frames; use a copy of _values_mutable
         # NOTE: the copy will retain the same loaded Frame as the origin
         return self.__class__(
-            self._values_mutable,
+            self._values_snapshot(),
             index=self._index,
             name=self._name,
             store=self._store,
             max_persist=self._max_persist,
+            prefetch=self._prefetch,
+            max_persist_bytes=self._max_persist_bytes,
             own_index=True,
-            own_data=False,  # force copy of _values_mutable
+            own_data=True,
         )
 
     def copy(self) -> tp.Self:
@@ -651,15 +803,17 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         """
         Return a new :obj:`Bus` with an updated name attribute.
         """
-        # NOTE: do not want to use .values as this will force loading all Frames; use _values_mutable and let a copy be made by constructor
+        # NOTE: do not want to use .values as this will force loading all Frames; use a copy of _values_mutable
         return self.__class__(
-            self._values_mutable,
+            self._values_snapshot(),
             index=self._index,
             name=name,
             store=self._store,
             max_persist=self._max_persist,
+            prefetch=self._prefetch,
+            max_persist_bytes=self._max_persist_bytes,
             own_index=True,
-            own_data=False,
+            own_data=True,
         )
 
     # ---------------------------------------------------------------------------
@@ -838,12 +992,20 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             # no-op so Yarn or Quilt can call regardless of Store
             return
 
-        self._values_mutable[self._loaded] = FrameDeferred
-        self._loaded[NULL_SLICE] = False
-        self._loaded_all = False
+        with self._lock:
+            self._values_mutable[self._loaded] = FrameDeferred
+            self._loaded[NULL_SLICE] = False
+            self._loaded_all = False
+
+            if self._max_persist is not None or self._max_persist_bytes is not None:
+                self._last_loaded.clear()
+                self._loaded_nbytes = 0
+            self._persist_epoch += 1
 
-        if self._max_persist is not None:
-            self._last_loaded.clear()
+    def _values_snapshot(self) -> TNDArrayAny:
+        """Return a copy of the values, including :obj:`FrameDeferred` for unloaded Frame, without loading."""
+        with self._lock:
+            return self._values_mutable.copy()
 
     # ---------------------------------------------------------------------------
 
@@ -865,10 +1027,50 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             for label in restore:  # move to back
                 self._last_loaded[label] = self._last_loaded.pop(label)
 
-        del self._last_loaded[label_remove]
-        idx_remove = self._index._loc_to_iloc(label_remove)
+        self._unpersist_label(label_remove)
+
+    def _unpersist_label(self, label: TLabel) -> None:
+        """Evict the loaded Frame at ``label``. This does not adjust self._loaded_all."""
+        self._loaded_nbytes -= self._last_loaded.pop(label)
+        idx_remove = self._index._loc_to_iloc(label)
         self._loaded[idx_remove] = False
         self._values_mutable[idx_remove] = FrameDeferred
+        self._persist_counts[_PERSIST_EVICT, idx_remove] += 1
+
+    def _unpersist_bytes(self, labels_retain: Container[TLabel]) -> int:
+        """If ``max_persist_bytes`` is set, evict least-recently loaded Frame until loaded Frame fit within ``max_persist_bytes``. The most-recently loaded Frame, and Frame in ``labels_retain``, are never evicted. This does not adjust self._loaded_all.
+
+        Returns:
+            The count of Frame evicted.
+        """
+        max_bytes = self._max_persist_bytes
+        if max_bytes is None or self._loaded_nbytes <= max_bytes:
+            return 0
+
+        last_loaded = self._last_loaded
+        label_last = next(reversed(last_loaded))
+        nbytes = self._loaded_nbytes
+        labels_remove = []
+        for label, label_nbytes in last_loaded.items():
+            if nbytes <= max_bytes:
+                break
+            if label == label_last or label in labels_retain:
+                continue
+            labels_remove.append(label)
+            nbytes -= label_nbytes
+
+        for label in labels_remove:
+            self._unpersist_label(label)
+        return len(labels_remove)
+
+    def _persist_record(self, label: TLabel, f: TFrameAny) -> None:
+        """Record ``f`` as the most-recently loaded Frame."""
+        if self._max_persist_bytes is None:
+            self._last_loaded[label] = 0
+        else:
+            nbytes = f.nbytes
+            self._last_loaded[label] = nbytes
+            self._loaded_nbytes += nbytes
 
     def _persist_one(
         self,
@@ -879,10 +1081,33 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         f: Frame = self._store.read(label)  # type: ignore
         self._values_mutable[pos] = f
         self._loaded[pos] = True  # update loaded status
+        self._persist_counts[_PERSIST_MISS, pos] += 1
         if update_last_loaded:
-            self._last_loaded[label] = None
+            self._persist_record(label, f)
         return f
 
+    def _prefetch_count(self) -> int:
+        """Return the number of Frame to read ahead of consumption, or 0 if not prefetching. Frame read ahead count against ``max_persist``, such that at least one Frame can be held by the Bus."""
+        if self._prefetch is None:
+            return 0
+        if self._max_persist is None:
+            return self._prefetch
+        return min(self._prefetch, self._max_persist - 1)
+
+    def _read_many(
+        self, labels: TNDArrayAny | IndexBase
+    ) -> tp.Generator[Frame, None, None]:
+        """Read ``labels`` from the Store; if ``prefetch`` is set, reads are done in a background thread ahead of consumption."""
+        store: Store | StoreManifest = self._store  # type: ignore[assignment]
+        if count := self._prefetch_count():
+            yield from iter_prefetch(store.read_many, labels, count)
+        elif self._max_persist is None and self._max_persist_bytes is None:
+            yield from store.read_many(labels)
+        else:
+            # read one at a time so that a Store reading with a pool does not read ahead of what can be persisted
+            for i in range(len(labels)):
+                yield from store.read_many(labels[i : i + 1])
+
     # ---------------------------------------------------------------------------
 
     def _update_mutable_persistent_one(
@@ -894,33 +1119,41 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         _ = self._persist_one(key, False)
         self._loaded_all = self._loaded.all()
 
-    def _update_mutable_persistent_iter(self) -> tp.Iterator[Frame]:
+    def _update_mutable_persistent_iter(self) -> tp.Generator[Frame, None, None]:
         values_mutable = self._values_mutable
         if self._loaded_all:
+            self._persist_counts[_PERSIST_HIT] += 1
             yield from values_mutable
+            return
 
         index = self._index
         loaded = self._loaded  # Boolean array
+        counts = self._persist_counts
         loaded_count = loaded.sum()
         size = len(loaded)
 
-        labels_to_load: tp.Iterable[TLabel]
+        labels_to_load: TNDArrayAny | IndexBase
         if index._NDIM == 2:  # if an IndexHierarchy avoid going to an array
             labels_to_load = index[~loaded]
         else:
             labels_to_load = index.values[~loaded]
 
-        store_reader = self._store.read_many(labels_to_load)  # type: ignore
-        for idx in range(size):  # iter over all values
-            if not loaded[idx]:
-                f = next(store_reader)
-                values_mutable[idx] = f
-                loaded[idx] = True
-                loaded_count += 1
-                self._loaded_all = loaded_count == size
-                yield f
-            else:
-                yield values_mutable[idx]
+        store_reader = self._read_many(labels_to_load)
+        try:
+            for idx in range(size):  # iter over all values
+                if not loaded[idx]:
+                    f = next(store_reader)
+                    values_mutable[idx] = f
+                    loaded[idx] = True
+                    counts[_PERSIST_MISS, idx] += 1
+                    loaded_count += 1
+                    self._loaded_all = loaded_count == size
+                    yield f
+                else:
+                    counts[_PERSIST_HIT, idx] += 1
+                    yield values_mutable[idx]
+        finally:
+            store_reader.close()
 
     def _update_mutable_persistant_many(
         self,
@@ -955,6 +1188,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                 values_mutable[idx] = f
 
             loaded[labels_unloaded] = True
+            self._persist_counts[_PERSIST_MISS, labels_unloaded] += 1
             self._loaded_all = self._loaded.all()
 
     # ---------------------------------------------------------------------------
@@ -976,27 +1210,65 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
 
         size = len(loaded)
         loaded_count += 1
-        if loaded_count > self._max_persist:
+        if self._max_persist is not None and loaded_count > self._max_persist:
             self._unpersist_next(())
             loaded_count -= 1
 
         _ = self._persist_one(key, True)
+        loaded_count -= self._unpersist_bytes(())
         self._loaded_all = loaded_count == size
 
-    def _update_mutable_max_persist_iter(self) -> tp.Iterator[Frame]:
+    def _update_mutable_max_persist_iter(self) -> tp.Generator[Frame, None, None]:
         """Iterator of all values in the context of max_persist"""
         values_mutable = self._values_mutable
+        counts = self._persist_counts
         if self._loaded_all:
+            counts[_PERSIST_HIT] += 1
             yield from values_mutable
+            return
 
-        max_persist: int = self._max_persist  # type: ignore[assignment]
         index = self._index
         loaded = self._loaded  # Boolean array
-        last_loaded = self._last_loaded
         loaded_count = loaded.sum()
         size = len(loaded)
-
-        if max_persist > 1:
+        max_persist = size if self._max_persist is None else self._max_persist
+
+        if self._prefetch is not None or self._max_persist_bytes is not None:
+            # read all unloaded Frame in one pass so that reading can proceed ahead of the consumer; Frame are only held (and evicted) as they are consumed, and Frame read ahead count against max_persist
+            max_held = max_persist
+            if self._max_persist is not None:
+                max_held -= self._prefetch_count()
+            to_read = ~loaded
+            labels_to_read: TNDArrayAny | IndexBase
+            if index._NDIM == 2:  # if an IndexHierarchy avoid going to an array
+                labels_to_read = index[to_read]
+            else:
+                labels_to_read = index.values[to_read]
+            store_reader = self._read_many(labels_to_read)
+            try:
+                for idx in range(size):
+                    if loaded[idx]:
+                        counts[_PERSIST_HIT, idx] += 1
+                        yield values_mutable[idx]
+                        continue
+                    loaded_count += 1
+                    while loaded_count > max_held:
+                        self._unpersist_next(())
+                        loaded_count -= 1
+                    if to_read[idx]:
+                        f = next(store_reader)
+                        values_mutable[idx] = f
+                        loaded[idx] = True
+                        counts[_PERSIST_MISS, idx] += 1
+                        self._persist_record(index[idx], f)
+                    else:  # loaded before iteration but since evicted
+                        f = self._persist_one(idx, True)
+                    loaded_count -= self._unpersist_bytes(())
+                    self._loaded_all = loaded_count == size
+                    yield f
+            finally:
+                store_reader.close()
+        elif max_persist > 1:
             i = 0
             labels_to_load: tp.Iterable[TLabel]
             while i < size:
@@ -1005,6 +1277,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                 targets[i:i_end] = True
                 labels_unloaded = ~loaded & targets
                 if not labels_unloaded.any():
+                    counts[_PERSIST_HIT, i:i_end] += 1
                     yield from islice(values_mutable, i, i_end)
                 else:
                     if index._NDIM == 2:  # if an IndexHierarchy avoid going to an array
@@ -1016,6 +1289,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                     store_reader = self._store.read_many(labels_to_load)  # type: ignore
                     for idx in range(i, min(i_end, size)):
                         if loaded[idx]:
+                            counts[_PERSIST_HIT, idx] += 1
                             yield values_mutable[idx]
                         else:
                             loaded_count += 1
@@ -1025,13 +1299,15 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                             f = next(store_reader)
                             values_mutable[idx] = f
                             loaded[idx] = True
-                            last_loaded[index[idx]] = None
+                            counts[_PERSIST_MISS, idx] += 1
+                            self._persist_record(index[idx], f)
                             self._loaded_all = loaded_count == size
                             yield f
                 i = i_end
         else:  # max_persist is 1
             for i in range(size):
                 if loaded[i]:
+                    counts[_PERSIST_HIT, i] += 1
                     yield values_mutable[i]
                 else:
                     loaded_count += 1
@@ -1052,11 +1328,10 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
 
         index = self._index
         loaded = self._loaded  # Boolean array
-        last_loaded = self._last_loaded
         values_mutable = self._values_mutable
-        max_persist: int = self._max_persist  # type: ignore[assignment]
         loaded_count = loaded.sum()
         size = len(loaded)
+        max_persist = size if self._max_persist is None else self._max_persist
 
         if key.__class__ is slice and key == NULL_SLICE:
             targets = np.ones(size, dtype=DTYPE_BOOL)
@@ -1081,10 +1356,12 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                     self._store.read_many(labels_to_load),  # type: ignore[union-attr]
                 ):
                     values_mutable[idx] = f
-                    last_loaded[label] = None
+                    self._persist_record(label, f)
 
                 loaded[labels_unloaded] = True
-                self._loaded_all = to_load_count + loaded_count == size
+                self._persist_counts[_PERSIST_MISS, labels_unloaded] += 1
+                loaded_count += to_load_count - self._unpersist_bytes(index[targets])
+                self._loaded_all = loaded_count == size
 
             else:  # load only max_persist count from targets
                 # from original targets, find max_persist number of indices
@@ -1110,21 +1387,59 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                             loaded_count -= 1
                         f = next(store_reader)
                         values_mutable[idx] = f
-                        last_loaded[label] = None
+                        self._persist_record(label, f)
 
                     loaded[labels_unloaded] = True
+                    self._persist_counts[_PERSIST_MISS, labels_unloaded] += 1
+                    loaded_count -= self._unpersist_bytes(labels_to_keep)
                     self._loaded_all = loaded_count == size
 
     # ---------------------------------------------------------------------------
     def _persist_iloc(self, key: TILocSelector) -> None:
-        if self._max_persist is None:
-            self._update_mutable_persistant_many(key)
-        else:
-            self._update_mutable_max_persist_many(key)
+        with self._lock:
+            if self._max_persist is None and self._max_persist_bytes is None:
+                self._update_mutable_persistant_many(key)
+            else:
+                self._update_mutable_max_persist_many(key)
+            self._persist_epoch += 1
 
     def _persist_loc(self, key: TLocSelector) -> None:
         return self._persist_iloc(self._index._loc_to_iloc(key))
 
+    def _iter_persist(self) -> tp.Iterator[Frame]:
+        """Yield all Frame in order, loading from the Store as needed. The lock is held while each Frame is produced, not while it is consumed; if Frame are loaded or evicted elsewhere during iteration (by another thread or by the consumer), the planned reads are abandoned and remaining Frame are loaded one at a time."""
+        planned: tp.Generator[Frame, None, None] | None
+        if self._max_persist is None and self._max_persist_bytes is None:
+            planned = self._update_mutable_persistent_iter()
+            load_one = self._update_mutable_persistent_one
+        else:
+            planned = self._update_mutable_max_persist_iter()
+            load_one = self._update_mutable_max_persist_one
+
+        lock = self._lock
+        with lock:
+            epoch = self._persist_epoch
+        try:
+            for pos in range(self.__len__()):
+                with lock:
+                    if planned is not None and epoch == self._persist_epoch:
+                        f = next(planned)
+                    else:
+                        if planned is not None:
+                            planned.close()
+                            planned = None
+                        if self._loaded[pos]:
+                            self._persist_counts[_PERSIST_HIT, pos] += 1
+                        else:
+                            load_one(pos)
+                        f = self._values_mutable[pos]
+                    self._persist_epoch += 1
+                    epoch = self._persist_epoch
+                yield f
+        finally:
+            if planned is not None:
+                planned.close()
+
     # ---------------------------------------------------------------------------
     # extraction
 
@@ -1139,17 +1454,25 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         Returns:
             Bus or, if an element is selected, a Frame
         """
-        if self._max_persist is None:
-            self._update_mutable_persistent_one(key)
-        else:
-            self._update_mutable_max_persist_one(key)
+        with self._lock:
+            if isinstance(key, INT_TYPES):
+                if self._loaded[key]:
+                    self._persist_counts[_PERSIST_HIT, key] += 1
+                else:
+                    if self._max_persist is None and self._max_persist_bytes is None:
+                        self._update_mutable_persistent_one(key)
+                    else:
+                        self._update_mutable_max_persist_one(key)
+                    self._persist_epoch += 1
 
-        # iterable selection should be handled by NP
-        values: tp.Any = self._values_mutable[key]
+            # iterable selection should be handled by NP
+            values: tp.Any = self._values_mutable[key]
 
-        # NOTE: Bus only stores Frame and FrameDeferred, can rely on check with values
-        if values.__class__ is not np.ndarray:  # if we have a single element
-            return values  # type: ignore
+            # NOTE: Bus only stores Frame and FrameDeferred, can rely on check with values
+            if values.__class__ is not np.ndarray:  # if we have a single element
+                return values  # type: ignore
+            if key.__class__ is slice:  # a view must be copied while the lock is held
+                values = values.copy()
 
         return self.__class__(
             values,
@@ -1157,8 +1480,10 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             name=self._name,
             store=self._store,
             max_persist=self._max_persist,
+            prefetch=self._prefetch,
+            max_persist_bytes=self._max_persist_bytes,
             own_index=True,
-            own_data=False,  # force immutable copy
+            own_data=True,  # values are a copy
         )
 
     @tp.overload
@@ -1211,23 +1536,14 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
     def _axis_element(
         self,
     ) -> tp.Iterator[tp.Any]:
-        max_persist = self._max_persist
-        if self._loaded_all:
-            yield from self._values_mutable
-        elif max_persist is None:
-            yield from self._update_mutable_persistent_iter()
-        else:
-            yield from self._update_mutable_max_persist_iter()
+        yield from self._iter_persist()
 
     # ---------------------------------------------------------------------------
     # dictionary-like interface; these will force loading contained Frame
 
     def items(self) -> tp.Iterator[tp.Tuple[TLabel, TFrameAny]]:
         """Iterator of pairs of :obj:`Bus` label and contained :obj:`Frame`."""
-        if self._max_persist is None:  # load all at once if possible
-            yield from zip(self._index, self._update_mutable_persistent_iter())
-        else:
-            yield from zip(self._index, self._update_mutable_max_persist_iter())
+        yield from zip(self._index, self._iter_persist())
 
     _items_store = items
 
@@ -1236,24 +1552,18 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         """A 1D object array of all :obj:`Frame` contained in the :obj:`Bus`. The returned ``np.ndarray`` will have ``Frame``; this will never return an array with ``FrameDeferred``, but ``max_persist`` will be observed in reading from the Store."""
         # NOTE: when self._values_mutable is fully loaded, it could become immutable and avoid a copy. However, with unpersist(), we might unload all Frame
 
-        if self._loaded_all:
-            post = self._values_mutable.copy()
-            post.flags.writeable = False
-            return post
-
-        max_persist = self._max_persist
-        if max_persist is None:  # load all at once if possible
-            post = np.fromiter(
-                self._update_mutable_persistent_iter(),
-                dtype=DTYPE_OBJECT,
-                count=self.__len__(),
-            )
-        else:
-            post = np.fromiter(
-                self._update_mutable_max_persist_iter(),
-                dtype=DTYPE_OBJECT,
-                count=self.__len__(),
-            )
+        with self._lock:
+            if self._loaded_all:
+                self._persist_counts[_PERSIST_HIT] += 1
+                post = self._values_mutable.copy()
+                post.flags.writeable = False
+                return post
+
+        post = np.fromiter(
+            self._iter_persist(),
+            dtype=DTYPE_OBJECT,
+            count=self.__len__(),
+        )
         post.flags.writeable = False
         return post
 
@@ -1296,7 +1606,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             return Series.from_element(None, index=self._index)
 
         def gen() -> tp.Iterator[tp.Tuple[TLabel, tp.Optional[tp.Tuple[int, ...]]]]:
-            for label, f in zip(self._index, self._values_mutable):
+            for label, f in zip(self._index, self._values_snapshot()):
                 if f is FrameDeferred:
                     yield label, None
                 else:
@@ -1304,45 +1614,73 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
 
         return Series.from_items(gen())
 
+    def _iter_metadata(
+        self,
+    ) -> tp.Iterator[tp.Tuple[TLabel, TFrameAny | FrameMetadata | None]]:
+        """Yield pairs of label and either the loaded :obj:`Frame`, the :obj:`FrameMetadata` from the :obj:`Store` of an unloaded :obj:`Frame`, or None."""
+        metadata: tp.Iterator[FrameMetadata | None] = iter(())
+        with self._lock:
+            values = self._values_mutable.copy()
+            unloaded = ~self._loaded
+        if self._store is not None and unloaded.any():
+            # read metadata of all unloaded Frame in one pass of the Store
+            metadata = self._store.read_metadata_many(self._index[unloaded])
+        for label, f in zip(self._index, values):
+            if f is not FrameDeferred:
+                yield label, f
+            else:
+                yield label, next(metadata, None)
+
     @property
     def dtypes(self) -> TFrameAny:
-        """Returns a :obj:`Frame` of dtype per column for all loaded Frames."""
-        if not self._loaded.any():
+        """Returns a :obj:`Frame` of dtype per column for all loaded Frames, as well as unloaded Frames with dtypes available from :obj:`Store` metadata."""
+        if not self._loaded.any() and self._store is None:
+            return Frame(index=self._index)
+
+        dtypes = [
+            md.dtypes.rename(label)
+            for label, md in self._iter_metadata()
+            if md is not None
+        ]
+        if not dtypes:
             return Frame(index=self._index)
 
         f: TFrameAny = Frame.from_concat(
-            (f.dtypes for f in self._values_mutable if f is not FrameDeferred),
+            dtypes,
             fill_value=None,
         ).reindex(index=self._index, fill_value=None)
         return f
 
     @property
     def shapes(self) -> TSeriesObject:
-        """A :obj:`Series` describing the shape of each loaded :obj:`Frame`. Unloaded :obj:`Frame` will have a shape of None.
+        """A :obj:`Series` describing the shape of each loaded :obj:`Frame`. Unloaded :obj:`Frame` will have a shape from :obj:`Store` metadata, if available, or otherwise None.
 
         Returns:
             :obj:`Series`
         """
-        values = (
-            f.shape if f is not FrameDeferred else None for f in self._values_mutable
-        )
+        values = (None if md is None else md.shape for _, md in self._iter_metadata())
         return Series(values, index=self._index, dtype=DTYPE_OBJECT, name='shape')
 
     @property
     def nbytes(self) -> int:
         """Total bytes of data currently loaded in the Bus."""
         return sum(
-            f.nbytes if f is not FrameDeferred else 0 for f in self._values_mutable
+            f.nbytes if f is not FrameDeferred else 0 for f in self._values_snapshot()
         )
 
     @property
     def status(self) -> TFrameAny:
         """
-        Return a :obj:`Frame` indicating loaded status, size, bytes, and shape of all loaded :obj:`Frame`.
+        Return a :obj:`Frame` indicating loaded status, size, bytes, and shape of all loaded :obj:`Frame`, as well as counts of hits, misses (reads from the :obj:`Store`), and evictions for each :obj:`Frame`.
         """
 
+        with self._lock:
+            frames = self._values_mutable.copy()
+            loaded = self._loaded.copy()
+            persist_counts = self._persist_counts.copy()
+
         def gen() -> tp.Iterator[TSeriesAny]:
-            yield Series(self._loaded, index=self._index, dtype=DTYPE_BOOL, name='loaded')
+            yield Series(loaded, index=self._index, dtype=DTYPE_BOOL, name='loaded')
 
             for attr, dtype, missing in (
                 ('size', DTYPE_FLOAT_DEFAULT, np.nan),
@@ -1351,10 +1689,13 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             ):
                 values = (
                     getattr(f, attr) if f is not FrameDeferred else missing
-                    for f in self._values_mutable
+                    for f in frames
                 )
                 yield Series(values, index=self._index, dtype=dtype, name=attr)
 
+            for name, counts in zip(('hits', 'misses', 'evictions'), persist_counts):
+                yield Series(counts, index=self._index, name=name)
+
         return Frame.from_concat(gen(), axis=1)
 
     @property
@@ -1713,9 +2054,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         ArchiveManifest.to_manifest(fp, self, label_encoder=label_encoder)
 
     def _to_series_state(self) -> TSeriesObject:
-        # the mutable array will be copied in the Series construction
         return Series(
-            self._values_mutable,
+            self._values_snapshot(),
             index=self._index,
             own_index=True,
             name=self._name,
@@ -1731,39 +2071,29 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
             name=self._name,
         )
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
-        v = (
-            f._to_signature_bytes(
+    ) -> tp.Iterator[bytes | memoryview]:
+        yield from iter_component_signature_bytes(
+            self,
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        yield from self._index._iter_signature_bytes(
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        for f in self._axis_element():
+            yield from f._iter_signature_bytes(
                 include_name=include_name,
                 include_class=include_class,
                 encoding=encoding,
             )
-            for f in self._axis_element()
-        )
-
-        return b''.join(
-            chain(
-                iter_component_signature_bytes(
-                    self,
-                    include_name=include_name,
-                    include_class=include_class,
-                    encoding=encoding,
-                ),
-                (
-                    self._index._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding,
-                    ),
-                ),
-                v,
-            )
-        )
 
 
 TBusAny = Bus[tp.Any]
@@ -193,13 +193,27 @@ class ContainerBase(metaclass=InterfaceMeta):
 
     # ---------------------------------------------------------------------------
 
+    def _iter_signature_bytes(
+        self,
+        include_name: bool = True,
+        include_class: bool = True,
+        encoding: str = 'utf-8',
+    ) -> tp.Iterator[bytes | memoryview]:
+        raise NotImplementedError()  # pragma: no cover
+
     def _to_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
     ) -> bytes:
-        raise NotImplementedError()  # pragma: no cover
+        return b''.join(
+            self._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding,
+            )
+        )
 
     @property
     def via_hashlib(self) -> InterfaceHashlib:
@@ -208,6 +222,7 @@ class ContainerBase(metaclass=InterfaceMeta):
         """
         return InterfaceHashlib(
             to_bytes=self._to_signature_bytes,
+            iter_bytes=self._iter_signature_bytes,
             include_name=True,
             include_class=True,
             encoding='utf-8',
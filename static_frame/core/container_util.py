@@ -4,18 +4,27 @@ This module us for utilty functions that take as input and / or return Container
 
 from __future__ import annotations
 
+import csv
+import datetime
 from collections import defaultdict
 from functools import partial
-from itertools import zip_longest
+from itertools import chain, zip_longest
 
 import numpy as np
 import typing_extensions as tp
-from arraykit import column_2d_filter, resolve_dtype_iter, slice_to_ascending_slice
+from arraykit import (
+    column_2d_filter,
+    delimited_to_arrays,
+    resolve_dtype_iter,
+    slice_to_ascending_slice,
+)
 from numpy import char as npc
+from numpy.lib.stride_tricks import sliding_window_view
 
 from static_frame.core.container import ContainerBase, ContainerOperand
 from static_frame.core.exception import (
     AxisInvalid,
+    ErrorInitFrame,
     ErrorInitIndex,
     invalid_window_label_factory,
 )
@@ -24,10 +33,17 @@ from static_frame.core.rank import RankMethod, rank_1d
 from static_frame.core.util import (
     BOOL_TYPES,
     DEFAULT_SORT_KIND,
+    DT64_DAY,
     DTYPE_BOOL,
+    DTYPE_COMPLEX_KIND,
+    DTYPE_FLOAT_DEFAULT,
+    DTYPE_FLOAT_KIND,
+    DTYPE_INT_DEFAULT,
+    DTYPE_NUMERICABLE_KINDS,
     DTYPE_OBJECT,
     DTYPE_STR,
     DTYPE_STR_KINDS,
+    EMPTY_ARRAY,
     INT_TYPES,
     NAME_DEFAULT,
     NULL_SLICE,
@@ -57,6 +73,7 @@ from static_frame.core.util import (
     TUFunc,
     WarningsSilent,
     concat_resolved,
+    get_concurrent_executor,
     is_dtype_specifier,
     is_mapping,
     iterable_to_array_1d,
@@ -69,6 +86,9 @@ from static_frame.core.util import (
 
 if tp.TYPE_CHECKING:
     import pandas as pd
+    from pyarrow import DataType, Schema
+    from pyarrow.compute import Expression
+    from pyarrow.parquet import FileMetaData
 
     from static_frame.core.frame import Frame
     from static_frame.core.index_auto import (
@@ -81,6 +101,7 @@ if tp.TYPE_CHECKING:
     from static_frame.core.quilt import Quilt
     from static_frame.core.series import Series
     from static_frame.core.sort_interface import TSortInterface
+    from static_frame.core.store_config import TReadWhere
     from static_frame.core.type_blocks import TypeBlocks
 
     TNDArrayAny = np.ndarray[tp.Any, tp.Any]
@@ -979,6 +1000,327 @@ def axis_window_items(
             break
 
 
+# functions that, given an axis argument, reduce a window to an element; these can be applied to a strided view of all windows at once
+WINDOW_REDUCE_FUNCS = frozenset(
+    (
+        np.sum,
+        np.nansum,
+        np.prod,
+        np.nanprod,
+        np.mean,
+        np.nanmean,
+        np.min,
+        np.amin,
+        np.nanmin,
+        np.max,
+        np.amax,
+        np.nanmax,
+        np.std,
+        np.nanstd,
+        np.var,
+        np.nanvar,
+        np.all,
+        np.any,
+        len,
+    )
+)
+
+# for windows given as a Series, functions mapped to the function that gives the same result for the window's values; NumPy dispatches functions such as np.sum to Series methods that skip NaN
+WINDOW_REDUCE_FUNCS_SERIES: tp.Dict[TCallableAny, TCallableAny] = {
+    np.sum: np.nansum,
+    np.nansum: np.nansum,
+    np.prod: np.nanprod,
+    np.nanprod: np.nanprod,
+    np.min: np.nanmin,
+    np.amin: np.nanmin,
+    np.nanmin: np.nanmin,
+    np.max: np.nanmax,
+    np.amax: np.nanmax,
+    np.nanmax: np.nanmax,
+    np.nanmean: np.nanmean,
+    np.nanstd: np.nanstd,
+    np.nanvar: np.nanvar,
+    np.all: np.all,
+    len: len,
+}
+
+# for windows given as a Frame, functions that give the same result for the window's values
+WINDOW_REDUCE_FUNCS_FRAME: tp.Dict[TCallableAny, TCallableAny] = {
+    f: f
+    for f in (
+        np.nansum,
+        np.nanprod,
+        np.nanmin,
+        np.nanmax,
+        np.nanmean,
+        np.nanstd,
+        np.nanvar,
+        len,
+    )
+}
+
+# for windows that share a start, functions given as pairs of a function that reduces each row and a function that accumulates row reductions
+_WINDOW_ACCUMULATE: tp.Dict[TCallableAny, tp.Tuple[TCallableAny, TCallableAny]] = {
+    np.sum: (np.sum, np.cumsum),
+    np.nansum: (np.nansum, np.cumsum),
+    np.prod: (np.prod, np.cumprod),
+    np.nanprod: (np.nanprod, np.cumprod),
+    np.min: (np.min, np.minimum.accumulate),
+    np.amin: (np.min, np.minimum.accumulate),
+    np.nanmin: (np.fmin.reduce, np.fmin.accumulate),
+    np.max: (np.max, np.maximum.accumulate),
+    np.amax: (np.max, np.maximum.accumulate),
+    np.nanmax: (np.fmax.reduce, np.fmax.accumulate),
+    np.all: (np.all, np.logical_and.accumulate),
+    np.any: (np.any, np.logical_or.accumulate),
+}
+
+# maximum count of elements processed per reduction, bounding temporaries created by functions such as np.std
+WINDOW_REDUCE_CHUNK_ELEMENTS = 2**22
+
+
+def window_bounds(
+    *,
+    count_labels: int,
+    size: int,
+    step: int,
+    window_sized: bool,
+    label_shift: int,
+    label_missing_skips: bool,
+    label_missing_raises: bool,
+    start_shift: int,
+    size_increment: int,
+    empty_skips: bool = True,
+) -> tp.Optional[
+    tp.Tuple[TNDArrayIntDefault, TNDArrayIntDefault, TNDArrayIntDefault, TNDArrayAny]
+]:
+    """Return arrays of the start, stop, and label position of each window yielded by ``axis_window_items``, and a Boolean array of windows without a label, derived without extracting windows.
+
+    Args:
+        empty_skips: if True, skip empty windows, as is done for windows of elements or rows; if False, return None if any window is empty.
+    """
+    if start_shift >= 0:
+        count_window_max = count_labels
+    else:  # add for iterations when less than 0
+        count_window_max = count_labels + abs(start_shift)
+
+    # as the left index and size change monotonically, iterations continue until the first iteration that fails a condition
+    counts = np.arange(count_window_max + 1)
+    idx_lefts = start_shift + counts * step
+    sizes = size + counts * size_increment
+    proceed = (idx_lefts <= count_window_max - 1) & (sizes >= 0)
+    proceed[0] = True
+    if not proceed.all():
+        stop = int(np.argmin(proceed))
+        idx_lefts = idx_lefts[:stop]
+        sizes = sizes[:stop]
+
+    idx_rights = idx_lefts + sizes - 1
+    # floor at zero so as to not wrap; slices are truncated at the count of labels
+    starts = np.minimum(np.maximum(idx_lefts, 0), count_labels)
+    stops = np.minimum(np.maximum(idx_rights + 1, 0), count_labels)
+    lengths = stops - starts
+    if not empty_skips and not lengths.all():
+        # empty windows of columns are evaluated by the count of rows
+        return None
+    valid = lengths > 0
+    if window_sized:
+        valid &= lengths == sizes
+
+    starts = starts[valid]
+    stops = stops[valid]
+    idx_labels = idx_rights[valid] + label_shift
+    label_invalid = (idx_labels < 0) | (idx_labels >= count_labels)
+
+    if label_invalid.any():
+        if label_missing_raises:
+            raise invalid_window_label_factory(int(idx_labels[label_invalid][0]))
+        if label_missing_skips:
+            label_valid = ~label_invalid
+            starts = starts[label_valid]
+            stops = stops[label_valid]
+            idx_labels = idx_labels[label_valid]
+            label_invalid = label_invalid[label_valid]
+    return starts, stops, idx_labels, label_invalid
+
+
+def window_reduce(
+    values: TNDArrayAny,
+    starts: TNDArrayIntDefault,
+    stops: TNDArrayIntDefault,
+    func: TCallableAny,
+) -> tp.Optional[TNDArrayAny]:
+    """Given ``values`` (1D, or 2D with windows of rows) and the start and stop of each window along axis 0, return an array of ``func`` applied to each window, or None if ``func`` or the windows are not supported. Windows of equal size with evenly spaced starts are reduced from a strided view of all windows; windows that share a start (such as expanding windows) are reduced by accumulating reductions of each row."""
+    if (
+        func not in WINDOW_REDUCE_FUNCS
+        or values.dtype.kind not in DTYPE_NUMERICABLE_KINDS
+    ):
+        return None
+    count = len(starts)
+    if count == 0:
+        return EMPTY_ARRAY
+
+    lengths = stops - starts
+    if func is len:
+        return lengths
+
+    size = int(lengths[0])
+    step = int(starts[1] - starts[0]) if count > 1 else 1
+    if step > 0 and (lengths == size).all() and (np.diff(starts) == step).all():
+        # as starts is an arithmetic progression, the selection of windows remains a view
+        windows = sliding_window_view(values, size, axis=0)[
+            int(starts[0]) : int(starts[-1]) + 1 : step
+        ]
+        reduce_axis: tp.Union[int, tp.Tuple[int, int]] = (
+            -1 if values.ndim == 1 else (1, 2)
+        )
+        chunk = max(WINDOW_REDUCE_CHUNK_ELEMENTS // (size * values[:1].size), 1)
+        parts: tp.List[TNDArrayAny] = [
+            func(windows[i : i + chunk], axis=reduce_axis) for i in range(0, count, chunk)
+        ]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    start = int(starts[0])
+    if not (starts == start).all():
+        return None
+    # windows share a start: accumulate row reductions from that start
+    rows = values[start : int(stops.max())]
+    if rows.ndim == 1:
+        rows = rows.reshape(-1, 1)
+    positions = stops - start - 1
+
+    if func is np.mean or func is np.nanmean:
+        kind = rows.dtype.kind
+        if kind == DTYPE_COMPLEX_KIND:
+            return None
+        with WarningsSilent():  # only the dtype of the first row is needed
+            dtype = np.asarray(func(rows[:1])).dtype
+        if func is np.mean:
+            totals = np.cumsum(rows.sum(axis=1, dtype=DTYPE_FLOAT_DEFAULT))
+            sizes = (positions + 1) * rows.shape[1]
+        else:
+            totals = np.cumsum(np.nansum(rows, axis=1, dtype=DTYPE_FLOAT_DEFAULT))
+            if kind == DTYPE_FLOAT_KIND:
+                sizes = np.cumsum((~np.isnan(rows)).sum(axis=1))[positions]
+            else:
+                sizes = (positions + 1) * rows.shape[1]
+        with WarningsSilent():  # windows of only NaN are NaN
+            means: TNDArrayAny = totals[positions] / sizes
+        return means.astype(dtype, copy=False)
+
+    pair = _WINDOW_ACCUMULATE.get(func)
+    if pair is None:  # var, std
+        return None
+    func_row, func_accumulate = pair
+    return func_accumulate(func_row(rows, axis=1))[positions]  # type: ignore
+
+
+def axis_window_reduce_items(
+    *,
+    source: tp.Union[TSeriesAny, TFrameAny, Quilt],
+    func: TCallableAny,
+    size: int,
+    axis: int = 0,
+    step: int = 1,
+    window_sized: bool = True,
+    window_func: tp.Optional[TCallableAny] = None,
+    window_valid: tp.Optional[TCallableAny] = None,
+    label_shift: int = 0,
+    label_missing_skips: bool = True,
+    label_missing_raises: bool = False,
+    start_shift: int = 0,
+    size_increment: int = 0,
+    as_array: bool = False,
+) -> tp.Optional[tp.Tuple[tp.Sequence[TLabel], TNDArrayAny]]:
+    """Return a pair of window labels and reduced-window values, equivalent to applying ``func`` to each window yielded by ``axis_window_items``, but computed for all windows at once with ``window_reduce``. If ``func`` is not a recognized reduction, or window configuration or source values are not supported, return None."""
+    from static_frame.core.frame import Frame
+    from static_frame.core.series import Series
+
+    if window_func is not None or window_valid is not None or size <= 0 or step < 0:
+        return None
+
+    values: TNDArrayAny
+    if isinstance(source, Series):
+        if not as_array:
+            func = WINDOW_REDUCE_FUNCS_SERIES.get(func)  # type: ignore
+        labels = source._index
+        values = source.values
+    elif isinstance(source, Frame):
+        if not as_array:
+            func = WINDOW_REDUCE_FUNCS_FRAME.get(func)  # type: ignore
+        if axis == 0:
+            labels = source._index
+        elif axis == 1:
+            if not source._blocks.unified_dtypes:
+                # windows of columns are consolidated per window, and might not share a dtype
+                return None
+            labels = source._columns
+        else:
+            return None
+        if source._blocks.shape[0] == 0 or source._blocks.shape[1] == 0:
+            return None
+        values = source._blocks.values
+        if axis == 1:  # reduce windows of rows of the transposed values
+            values = values.T
+    else:
+        return None
+
+    if func is None or values.dtype.kind not in DTYPE_NUMERICABLE_KINDS:
+        return None
+
+    bounds = window_bounds(
+        count_labels=len(labels),
+        size=size,
+        step=step,
+        window_sized=window_sized,
+        label_shift=label_shift,
+        label_missing_skips=label_missing_skips,
+        label_missing_raises=label_missing_raises,
+        start_shift=start_shift,
+        size_increment=size_increment,
+        empty_skips=source.ndim == 1 or axis == 0,
+    )
+    if bounds is None:
+        return None
+    starts, stops, idx_labels, label_invalid = bounds
+
+    post: tp.Optional[TNDArrayAny]
+    if func is len and values.ndim == 2 and axis == 1 and len(starts):
+        # len() of a window of columns is the count of rows
+        post = np.full(len(starts), values.shape[1], dtype=DTYPE_INT_DEFAULT)
+    else:
+        post = window_reduce(values, starts, stops, func)
+    if post is None:
+        return None
+    return window_labels(labels, idx_labels, label_invalid), post
+
+
+def window_labels(
+    labels: IndexBase,
+    idx_labels: TNDArrayIntDefault,
+    label_invalid: TNDArrayAny,
+) -> tp.Sequence[TLabel]:
+    """Return the labels of windows given label positions from ``window_bounds``; windows without a label are labelled None."""
+    if not len(idx_labels):
+        return ()
+    labels_invalid = label_invalid.any()
+    if labels_invalid:
+        idx_labels = idx_labels.copy()
+        idx_labels[label_invalid] = 0  # placeholder, replaced with None below
+
+    if labels.depth == 1:
+        labels_post: tp.Sequence[TLabel] = labels.values[idx_labels]  # type: ignore[assignment]
+    else:
+        labels_post = [labels.iloc[i] for i in idx_labels]
+
+    if labels_invalid:
+        labels_post = [
+            None if invalid else label
+            for label, invalid in zip(labels_post, label_invalid)
+        ]
+    return labels_post
+
+
 def get_block_match(
     width: int,
     values_source: tp.List[TNDArrayAny],
@@ -1919,6 +2261,41 @@ def iter_component_signature_bytes(
         yield bytes(container.__class__.__name__, encoding=encoding)
 
 
+SIGNATURE_CHUNK_BYTES = 2**20
+
+
+def iter_array_signature_bytes(
+    array: TNDArrayAny,
+    *,
+    chunk_bytes: int = SIGNATURE_CHUNK_BYTES,
+) -> tp.Iterator[bytes | memoryview]:
+    """Yield the bytes of an array in pieces of at most `chunk_bytes`, such that the concatenation of pieces is equal to `array.tobytes('F')`. Contiguous arrays are yielded as views of the underlying buffer; otherwise, only one bounded piece is copied at a time."""
+    if array.dtype == DTYPE_OBJECT:
+        raise TypeError('Object dtypes do not have stable hashes')
+
+    if array.ndim == 2:
+        if not array.flags.f_contiguous:
+            for i in range(array.shape[1]):
+                yield from iter_array_signature_bytes(
+                    array[:, i], chunk_bytes=chunk_bytes
+                )
+            return
+        array = array.ravel(order='F')  # a view when F-contiguous
+
+    itemsize = array.dtype.itemsize
+    if itemsize == 0 or len(array) == 0:
+        return
+
+    if array.flags.c_contiguous:
+        buffer = array.view(np.uint8).data
+        for start in range(0, len(buffer), chunk_bytes):
+            yield buffer[start : start + chunk_bytes]
+    else:
+        step = max(chunk_bytes // itemsize, 1)
+        for start in range(0, len(array), step):
+            yield array[start : start + step].tobytes()
+
+
 @tp.overload
 def sort_index_from_params(
     index: IndexBase,
@@ -1972,3 +2349,361 @@ def sort_index_from_params(
 
     order = sort_index_for_order(index, kind=kind, ascending=ascending, key=key)
     return container._apply_ordering(order, sort_status, axis)
+
+
+# -------------------------------------------------------------------------------
+# delimited parsing
+
+
+def _delimited_record_continues(
+    line: str,
+    in_quote: bool,
+    *,
+    delimiter: str,
+    quote_char: str | None,
+    quote_double: bool,
+    escape_char: str | None,
+    skip_initial_space: bool,
+) -> bool:
+    """Return True if a record continues past the end of this line, either within a quoted field or through an escaped line break. This follows the quoting rules of the `csv` module: a quote character only opens a quoted field at the start of a field.
+
+    Args:
+        in_quote: True if this line starts within a quoted field.
+    """
+    field_start = not in_quote
+    escaped = False
+    closed = False  # True if the previous character closed a quoted field
+
+    for c in line:
+        if escaped:
+            escaped = False
+            field_start = False
+            continue
+        if c == escape_char:
+            escaped = True
+            continue
+        if in_quote:
+            if c == quote_char:
+                in_quote = False
+                closed = True
+            continue
+        if c == quote_char and (field_start or (closed and quote_double)):
+            in_quote = True
+            closed = False
+            continue
+        closed = False
+        if c == delimiter:
+            field_start = True
+        elif not (skip_initial_space and field_start and c == ' '):
+            field_start = False
+
+    return in_quote or escaped
+
+
+def iter_delimited_chunks(
+    lines: tp.Iterable[str],
+    *,
+    chunk_rows: int,
+    delimiter: str,
+    quoting: int,
+    quote_char: str,
+    quote_double: bool,
+    escape_char: str | None,
+    skip_initial_space: bool,
+) -> tp.Iterator[tp.List[str]]:
+    """Group lines into lists of at most `chunk_rows` records, only splitting at line ends that are record boundaries; lines within a multi-line quoted field are never separated."""
+    quote_char_active = None if quoting == csv.QUOTE_NONE else quote_char
+    lines_iter = iter(lines)
+
+    chunk: tp.List[str] = []
+    count = 0
+
+    # NOTE: until a line has a quote or escape character, every line is a record
+    line = ''
+    for line in lines_iter:
+        if (quote_char_active is not None and quote_char_active in line) or (
+            escape_char is not None and escape_char in line
+        ):
+            break
+        chunk.append(line)
+        count += 1
+        if count == chunk_rows:
+            yield chunk
+            chunk = []
+            count = 0
+    else:
+        if chunk:
+            yield chunk
+        return
+
+    # NOTE: from the first line with a quote or escape character, use a csv.reader to find record boundaries, as the csv module implements the same parsing rules as delimited_to_arrays; lines are held in pending until the reader has consumed a complete record
+    pending: tp.List[str] = []
+
+    def feed() -> tp.Iterator[str]:
+        pending.append(line)
+        yield line
+        for line_next in lines_iter:
+            pending.append(line_next)
+            yield line_next
+
+    reader = csv.reader(
+        feed(),
+        delimiter=delimiter,
+        quotechar=quote_char,
+        doublequote=quote_double,
+        escapechar=escape_char,
+        skipinitialspace=skip_initial_space,
+        quoting=csv.QUOTE_NONE if quoting == csv.QUOTE_NONE else csv.QUOTE_MINIMAL,
+        strict=False,
+    )
+    try:
+        for _ in reader:
+            chunk.extend(pending)
+            pending.clear()
+            count += 1
+            if count == chunk_rows:
+                yield chunk
+                chunk = []
+                count = 0
+    except csv.Error:
+        # NOTE: the reader can fail where delimited_to_arrays will not (such as on fields larger than csv.field_size_limit()); as pending starts at a record boundary, scan characters of all remaining lines
+        continues = False
+        for line in chain(tuple(pending), lines_iter):
+            chunk.append(line)
+            continues = _delimited_record_continues(
+                line,
+                continues,
+                delimiter=delimiter,
+                quote_char=quote_char_active,
+                quote_double=quote_double,
+                escape_char=escape_char,
+                skip_initial_space=skip_initial_space,
+            )
+            if continues:
+                continue
+            count += 1
+            if count == chunk_rows:
+                yield chunk
+                chunk = []
+                count = 0
+        pending.clear()
+
+    # lines consumed by the reader without completing a record
+    chunk.extend(pending)
+    if chunk:
+        yield chunk
+
+
+def delimited_to_arrays_chunked(
+    lines: tp.Iterable[str],
+    *,
+    chunk_rows: int,
+    max_workers: int | None,
+    line_select: tp.Callable[[int], bool] | None,
+    dtypes: tp.Callable[[int], tp.Any] | None,
+    delimiter: str,
+    quoting: int,
+    quote_char: str,
+    quote_double: bool,
+    escape_char: str | None,
+    thousands_char: str,
+    decimal_char: str,
+    skip_initial_space: bool,
+) -> tp.List[TNDArrayAny]:
+    """Parse delimited lines into column arrays, splitting lines into chunks of records that are parsed on a thread pool. Columns for which chunks evaluate to different dtypes (and are not all strings) are parsed again over all lines, such that the returned arrays are identical to those from a single call to `delimited_to_arrays`."""
+    # NOTE: record the positions selected by line_select to map from output columns to source columns
+    selected: tp.Set[int] = set()
+
+    def line_select_record(i: int) -> bool:
+        if line_select is None or line_select(i):
+            selected.add(i)
+            return True
+        return False
+
+    parse = partial(
+        delimited_to_arrays,
+        axis=1,
+        delimiter=delimiter,
+        quoting=quoting,
+        quotechar=quote_char,
+        doublequote=quote_double,
+        escapechar=escape_char,
+        thousandschar=thousands_char,
+        decimalchar=decimal_char,
+        skipinitialspace=skip_initial_space,
+        dtypes=dtypes,
+    )
+
+    chunks = []
+    pool_executor = get_concurrent_executor(
+        use_threads=True,
+        max_workers=max_workers,
+        mp_context=None,
+    )
+    with pool_executor() as executor:
+        futures = []
+        for chunk in iter_delimited_chunks(
+            lines,
+            chunk_rows=chunk_rows,
+            delimiter=delimiter,
+            quoting=quoting,
+            quote_char=quote_char,
+            quote_double=quote_double,
+            escape_char=escape_char,
+            skip_initial_space=skip_initial_space,
+        ):
+            chunks.append(chunk)
+            futures.append(executor.submit(parse, chunk, line_select=line_select_record))
+        parts = [f.result() for f in futures]
+
+    if len(parts) <= 1:
+        return list(parts[0]) if parts else list(parse((), line_select=line_select))
+
+    if len({len(arrays) for arrays in parts}) != 1:
+        # ragged records resolve to a different count of columns per chunk
+        return list(parse(chain.from_iterable(chunks), line_select=line_select))
+
+    positions = sorted(selected)
+    post: tp.List[TNDArrayAny | None] = []
+    reparse = []
+    for i, arrays in enumerate(zip(*parts)):
+        dtype_first = arrays[0].dtype
+        if all(a.dtype == dtype_first for a in arrays) or all(
+            a.dtype.kind == 'U' for a in arrays
+        ):
+            post.append(np.concatenate(arrays))
+        else:
+            post.append(None)
+            reparse.append(positions[i])
+
+    if reparse:
+        arrays_reparse = iter(
+            parse(chain.from_iterable(chunks), line_select=set(reparse).__contains__)
+        )
+        post = [next(arrays_reparse) if a is None else a for a in post]
+
+    for a in post:
+        a.flags.writeable = False  # type: ignore
+    return post  # type: ignore
+
+
+# datetime64 units that pyarrow converts to timestamps
+_PARQUET_UNITS = frozenset(('s', 'ms', 'us', 'ns'))
+# datetime64 units that can be exactly represented as dates
+_PARQUET_UNITS_DATE = frozenset(('Y', 'M', 'W', 'D'))
+
+
+def _parquet_statistics_admit(
+    operator: str,
+    value: tp.Any,
+    minimum: tp.Any,
+    maximum: tp.Any,
+) -> bool:
+    """Return False only if no value between `minimum` and `maximum` (inclusive) can satisfy the predicate."""
+    if operator == '==':
+        return bool(minimum <= value <= maximum)
+    if operator == '!=':
+        return not (minimum == value and maximum == value)
+    if operator == '<':
+        return bool(minimum < value)
+    if operator == '<=':
+        return bool(minimum <= value)
+    if operator == '>':
+        return bool(maximum > value)
+    if operator == '>=':
+        return bool(maximum >= value)
+    # operator is 'in'
+    return any(minimum <= v <= maximum for v in value)
+
+
+def parquet_row_groups_select(
+    metadata: 'FileMetaData',
+    *,
+    row_groups: tp.Iterable[int] | None,
+    where: TReadWhere | None,
+) -> tp.List[int]:
+    """Return the positions of row groups to read, in ascending order, limited to `row_groups` (if provided) and excluding those whose column statistics show that no row can satisfy all `where` predicates."""
+    count = metadata.num_row_groups
+    if row_groups is None:
+        positions = list(range(count))
+    else:
+        positions = sorted(set(row_groups))
+        for i in positions:
+            if not 0 <= i < count:
+                raise ErrorInitFrame(f'row group {i} is not in range 0 to {count - 1}')
+
+    if not where or not count:
+        return positions
+
+    field_to_column = {
+        metadata.row_group(0).column(j).path_in_schema: j
+        for j in range(metadata.num_columns)
+    }
+    post = []
+    for i in positions:
+        row_group = metadata.row_group(i)
+        for field, operator, value in where:
+            j = field_to_column.get(field)
+            if j is None:
+                continue
+            statistics = row_group.column(j).statistics
+            if statistics is None or not statistics.has_min_max:
+                continue
+            try:
+                if not _parquet_statistics_admit(
+                    operator, value, statistics.min, statistics.max
+                ):
+                    break
+            except TypeError:  # statistics not comparable to the value
+                continue
+        else:
+            post.append(i)
+    return post
+
+
+def _parquet_where_value(value: tp.Any, field_type: 'DataType') -> tp.Any:
+    """Return a date or ``datetime64`` `value` of a unit not supported by pyarrow (such as ``D``) in the unit of a timestamp field, or as a ``datetime.date`` for a date field; other values are returned unchanged."""
+    import pyarrow as pa
+
+    if isinstance(value, datetime.datetime) or not isinstance(
+        value, (datetime.date, np.datetime64)
+    ):
+        return value
+    dt64 = np.datetime64(value)
+    unit, _ = np.datetime_data(dt64.dtype)
+    if unit in _PARQUET_UNITS:
+        return value
+    if pa.types.is_timestamp(field_type) and field_type.tz is None:
+        # NOTE: units not supported by pyarrow are coarser than the field's, such that the cast is exact
+        return dt64.astype(f'datetime64[{field_type.unit}]')
+    if pa.types.is_date(field_type) and unit in _PARQUET_UNITS_DATE:
+        return dt64.astype(DT64_DAY).item()
+    return value
+
+
+def parquet_where_cast(
+    where: TReadWhere,
+    schema: 'Schema',
+) -> tp.Tuple[tp.Tuple[str, str, tp.Any], ...]:
+    """Return `where` triples with date values converted to the type of their timestamp or date field, as pyarrow cannot compare such fields to ``datetime64`` values of other units."""
+    post = []
+    for field, operator, value in where:
+        field_type = schema.field(field).type
+        if operator == 'in':
+            value = [_parquet_where_value(v, field_type) for v in value]
+        else:
+            value = _parquet_where_value(value, field_type)
+        post.append((field, operator, value))
+    return tuple(post)
+
+
+def parquet_where_to_expression(where: TReadWhere) -> 'Expression':
+    """Convert `where` triples into a pyarrow compute expression that filters rows."""
+    import pyarrow.parquet as pq
+
+    return pq.filters_to_expression(
+        [
+            (field, operator, list(value) if operator == 'in' else value)
+            for field, operator, value in where
+        ]
+    )
@@ -16,6 +16,7 @@ from static_frame.core.util import (
     DTYPE_NAT_KINDS,
     DTYPE_STR_KINDS,
     TLabel,
+    TNDArrayAny,
 )
 
 TDtypeAny = np.dtype[tp.Any]
@@ -139,6 +140,17 @@ dtype_to_type_decl_mariadb = partial(
 #     return np.dtype(np.object_)
 
 
+# map of supported operators to their SQL form, as used in StoreConfig(read_where)
+SQL_OPERATORS = {
+    '==': '=',
+    '!=': '!=',
+    '<': '<',
+    '<=': '<=',
+    '>': '>',
+    '>=': '>=',
+    'in': 'IN',
+}
+
 UNIT_STR = frozenset(('(0)', '(3)', '(6)', '(9)'))
 PRECISION_TO_UNIT = {0: 's', 3: 'ms', 6: 'us', 9: 'ns'}
 
@@ -368,6 +380,15 @@ class DBType(Enum):
             return DTypeToTypeDecl(dtype_to_type_decl_mariadb)
         raise NotImplementedError('A dtype to type declaration mapping must be provided.')
 
+    def to_max_parameters(self) -> int:
+        """Return the maximum number of parameters permitted in a single query."""
+        if self == DBType.SQLITE:
+            # SQLITE_MAX_VARIABLE_NUMBER was raised from 999 in 3.32.0
+            return 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+        elif self in (DBType.POSTGRESQL, DBType.MYSQL, DBType.MARIADB):
+            return 65535
+        return 999
+
     def supports_lazy_parameters(self) -> bool:
         if self == DBType.POSTGRESQL or self == DBType.SQLITE:
             return True
@@ -541,6 +562,58 @@ class DBQuery:
 
         return query, parameters
 
+    def _sql_insert_chunks(
+        self,
+        *,
+        frame: Frame,
+        label: TLabel,
+        schema: str,
+        include_index: bool = True,
+        chunksize: int = 1_000,
+    ) -> tp.Iterator[tuple[str, list[tp.Any]]]:
+        """
+        Yield pairs of multi-row insert queries and their parameters, each inserting at most ``chunksize`` rows. Parameters are generated per chunk from column arrays, such that only one chunk of Python objects is realized at a time.
+
+        Args:
+            chunksize: The maximum number of rows per query; this is reduced if the resulting number of parameters would exceed that permitted by the database.
+        """
+        index = frame._index
+        arrays: list[TNDArrayAny] = []
+        if include_index:
+            columns = chain(index.names, frame._columns)
+            if index.ndim == 1:
+                arrays.append(index.values)
+            else:
+                arrays.extend(index.values_at_depth(i) for i in range(index.depth))
+        else:
+            columns = frame._columns  # type: ignore
+        arrays.extend(frame._blocks.axis_values(0))
+
+        count = len(arrays)
+        if not count:
+            return
+
+        rows = len(frame)
+        rows_per_query = max(
+            1, min(chunksize, self._db_type.to_max_parameters() // count)
+        )
+
+        ph = self._placeholder
+        table_name = ((schema + '.') if schema else '') + str(label)
+        prefix = f'INSERT INTO {table_name} ({",".join(str(c) for c in columns)}) VALUES '
+        values_row = f'({",".join(ph for _ in range(count))})'
+
+        query = ''
+        query_rows = 0
+        for start in range(0, rows, rows_per_query):
+            stop = min(start + rows_per_query, rows)
+            if stop - start != query_rows:  # only the last chunk might differ
+                query_rows = stop - start
+                query = prefix + ','.join(values_row for _ in range(query_rows)) + ';'
+            # NOTE: tolist() converts to Python objects as done by iter_row_lists()
+            fields = [a[start:stop].tolist() for a in arrays]
+            yield query, list(chain.from_iterable(zip(*fields)))
+
     def execute(
         self,
         *,
@@ -551,7 +624,12 @@ class DBQuery:
         create: bool = True,
         scalars: bool = False,
         eager: bool = False,
+        chunksize: int | None = None,
     ) -> None:
+        """
+        Args:
+            chunksize: If provided, insert with multi-row queries of at most ``chunksize`` rows, rather than one ``executemany()`` call. All queries are executed in the same transaction; committing remains the responsibility of the caller.
+        """
         if create:
             query_create = self._sql_create(
                 frame=frame,
@@ -560,21 +638,31 @@ class DBQuery:
                 include_index=include_index,
             )
             # print(query_create)
-        query_insert, parameters = self._sql_insert(
-            frame=frame,
-            label=label,
-            schema=schema,
-            include_index=include_index,
-            scalars=scalars,
-            eager=eager,
-        )
 
         cursor: sqlite3.Cursor | None = None
         try:
             cursor = self._connection.cursor()
             if create:
                 cursor.execute(query_create)
-            cursor.executemany(query_insert, parameters)
+            if chunksize is not None and not scalars:
+                for query_insert, parameters_chunk in self._sql_insert_chunks(
+                    frame=frame,
+                    label=label,
+                    schema=schema,
+                    include_index=include_index,
+                    chunksize=chunksize,
+                ):
+                    cursor.execute(query_insert, parameters_chunk)
+            else:
+                query_insert, parameters = self._sql_insert(
+                    frame=frame,
+                    label=label,
+                    schema=schema,
+                    include_index=include_index,
+                    scalars=scalars,
+                    eager=eager,
+                )
+                cursor.executemany(query_insert, parameters)
         finally:
             if cursor:
                 cursor.close()
@@ -586,6 +674,7 @@ class DBQuery:
         label: TLabel,
         schema: str,
         include_index: bool,
+        chunksize: int | None = None,
     ) -> None:
         """Entry point that fixes configuration based on the stored DBType."""
         scalars = False  # only works with SQLite, and badly
@@ -600,4 +689,5 @@ class DBQuery:
             create=create,
             scalars=scalars,
             eager=eager,
+            chunksize=chunksize,
         )
@@ -39,6 +39,8 @@ FP = 'fp: A string file path or :obj:`Path` instance.'
 INDEX_CONSTRUCTOR = 'index_constructor: Optional class or constructor function to create the :obj:`Index` applied to the rows.'
 
 MAX_PERSIST = 'max_persist: When loading :obj:`Frame` from a :obj:`Store`, optionally define the maximum number of :obj:`Frame` to remain in the :obj:`Bus`, regardless of the size of the :obj:`Bus`. If more than ``max_persist`` number of :obj:`Frame` are loaded, least-recently loaded :obj:`Frame` will be replaced by ``FrameDeferred``. A ``max_persist`` of 1, for example, permits reading one :obj:`Frame` at a time without ever holding in memory more than 1 :obj:`Frame`.'
+MAX_PERSIST_BYTES = 'max_persist_bytes: When loading :obj:`Frame` from a :obj:`Store`, optionally define the maximum number of bytes of :obj:`Frame` to remain in the :obj:`Bus`. If loaded :obj:`Frame` exceed ``max_persist_bytes``, least-recently loaded :obj:`Frame` will be replaced by ``FrameDeferred``; the most-recently loaded :obj:`Frame` is always retained. Can be used with ``max_persist``.'
+PREFETCH = 'prefetch: When loading :obj:`Frame` from a :obj:`Store`, optionally define the number of :obj:`Frame` to read ahead in a background thread while iterating, permitting reading to overlap with computation. If ``max_persist`` is set, :obj:`Frame` read ahead count against ``max_persist``, and no more than ``max_persist - 1`` :obj:`Frame` will be read ahead.'
 
 MAX_WORKERS = 'max_workers: Number of parallel executors, as passed to the Thread- or ProcessPoolExecutor; ``None`` defaults to the max number of machine processes.'
 
@@ -62,6 +64,8 @@ USE_THREADS = (
     'use_threads: Use the ThreadPoolExecutor instead of the ProcessPoolExecutor.'
 )
 
+USE_SHARED_MEMORY = 'use_shared_memory: When using the ProcessPoolExecutor, transfer the arrays of :obj:`Frame` arguments and results through shared memory rather than pickling them. :obj:`Frame` with object dtypes are pickled.'
+
 
 class DOC_TEMPLATE:
     # ---------------------------------------------------------------------------
@@ -138,6 +142,7 @@ class DOC_TEMPLATE:
         max_workers=MAX_WORKERS,
         chunksize=CHUNKSIZE,
         use_threads=USE_THREADS,
+        use_shared_memory=USE_SHARED_MEMORY,
     )
 
     argminmax = dict(
@@ -155,6 +160,7 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {USE_SHARED_MEMORY}
             """
     )
 
@@ -166,6 +172,7 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {USE_SHARED_MEMORY}
             """
     )
 
@@ -175,6 +182,8 @@ class DOC_TEMPLATE:
             {FP}
             {STORE_CONFIG_MAP}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PREFETCH}
             """
     )
 
@@ -184,6 +193,8 @@ class DOC_TEMPLATE:
             {STORE}
             {STORE_CONFIG_MAP}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PREFETCH}
             """
     )
 
@@ -336,6 +347,8 @@ class DOC_TEMPLATE:
             {RETAIN_LABELS}
             {DEEPCOPY_FROM_BUS}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PREFETCH}
             """
     )
 
@@ -348,6 +361,17 @@ class DOC_TEMPLATE:
             {DEEPCOPY_FROM_BUS}
             """
     )
+    quilt_reduce = dict(
+        doc="""Return the {name} along the provided ``axis``, where 0 provides {names} per column, 1 provides {names} per row. Each component :obj:`Frame` is reduced independently, optionally in a pool, and partial results are combined.""",
+        args="""
+        Args:
+            axis
+            skipna
+            max_workers: Number of parallel executors, as passed to the Thread- or ProcessPoolExecutor; ``None`` defaults to serial reduction of components.
+            use_threads: Use a ThreadPoolExecutor instead of ProcessPoolExecutor.
+            mp_context: A multiprocessing context to use with a ProcessPoolExecutor.
+            """,
+    )
     rank = dict(
         skipna="""skipna: If ``True``, exclude NA values (NaN or None) from ranking, replacing those values with ``fill_value``. """,
         ascending="""ascending: If ``True``, the lowest ranks correspond to the lowest values. The default is ``True``.""",
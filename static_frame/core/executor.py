@@ -0,0 +1,165 @@
+"""
+A registry of executors shared by all parallel operations. Operations that take ``max_workers``, such as those of :obj:`Batch`, ``apply_pool()``, and :obj:`Store` reads and writes, obtain executors from ``get_concurrent_executor()``, which returns the executor of the innermost active :obj:`ExecutorContext` where compatible.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+import typing_extensions as tp
+
+if tp.TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from multiprocessing.context import BaseContext
+    from types import TracebackType
+
+    from static_frame.core.util import TMpContext
+
+# set in threads of a shared thread executor to avoid waiting on the same executor from its own threads
+_WORKER = threading.local()
+
+
+def _executor_init() -> None:
+    """Initializer of shared executor workers: import StaticFrame such that the first task does not pay that cost."""
+    import static_frame
+
+    _WORKER.active = True
+
+
+def _executor_noop() -> None:
+    pass
+
+
+class ExecutorContext:
+    """
+    A context manager of an executor shared by all parallel operations, avoiding starting and stopping a pool per call. While active, operations that use a ``ThreadPoolExecutor`` (if ``use_threads``) or a ``ProcessPoolExecutor`` (otherwise) use this executor and its number of workers, ignoring ``max_workers`` given to each operation; operations that give an ``mp_context`` other than that of this context use their own executor. Contexts can be nested; the innermost compatible context is used. The executor is shut down on exit.
+    """
+
+    __slots__ = (
+        '_max_workers',
+        '_use_threads',
+        '_mp_context',
+        '_warm',
+        '_executor',
+        '_pid',
+    )
+
+    _STACK: tp.List[ExecutorContext] = []
+    _LOCK = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
+        mp_context: TMpContext = None,
+        warm: bool = True,
+    ) -> None:
+        """
+        Args:
+            max_workers: Number of workers; ``None`` defaults to the executor's default.
+            use_threads: Share a ``ThreadPoolExecutor`` instead of a ``ProcessPoolExecutor``.
+            mp_context: The multiprocessing start method of a ``ProcessPoolExecutor``.
+            warm: If True, start all workers, with StaticFrame imported, on entering the context.
+        """
+        self._max_workers = max_workers
+        self._use_threads = use_threads
+        self._mp_context = mp_context
+        self._warm = warm
+        self._executor: tp.Optional[Executor] = None
+        self._pid = -1
+
+    def __repr__(self) -> str:
+        kind = 'threads' if self._use_threads else 'processes'
+        return f'<{self.__class__.__name__} max_workers={self._max_workers} {kind}>'
+
+    @property
+    def executor(self) -> tp.Optional[Executor]:
+        """The shared executor, or None if the context is not active."""
+        return self._executor
+
+    def __enter__(self) -> tp.Self:
+        # NOTE: these imports are conditional as these modules are not supported in pyodide
+        from concurrent.futures import wait
+
+        if self._executor is not None:
+            raise RuntimeError('ExecutorContext is already active.')
+
+        executor: Executor
+        if self._use_threads:
+            from concurrent.futures import ThreadPoolExecutor
+
+            executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_executor_init,
+            )
+            count = executor._max_workers
+        else:
+            import multiprocessing as mp
+            from concurrent.futures import ProcessPoolExecutor
+
+            mp_context: tp.Optional[BaseContext] = None
+            if isinstance(self._mp_context, str):
+                mp_context = mp.get_context(self._mp_context)
+            elif self._mp_context is not None:
+                mp_context = self._mp_context  # type: ignore
+            if os.name != 'nt':
+                # NOTE: workers must share the resource tracker of this process to transfer shared memory; if workers are forked before it starts, each starts its own
+                from multiprocessing import resource_tracker
+
+                resource_tracker.ensure_running()
+            executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=mp_context,
+                initializer=_executor_init,
+            )
+            count = executor._max_workers  # type: ignore
+
+        if self._warm:
+            wait([executor.submit(_executor_noop) for _ in range(count)])
+
+        with self._LOCK:
+            self._executor = executor
+            self._pid = os.getpid()
+            self._STACK.append(self)
+        return self
+
+    def __exit__(
+        self,
+        type: tp.Optional[tp.Type[BaseException]],
+        value: tp.Optional[BaseException],
+        traceback: tp.Optional[TracebackType],
+    ) -> None:
+        with self._LOCK:
+            if self in self._STACK:
+                self._STACK.remove(self)
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def active(
+        cls,
+        *,
+        use_threads: bool,
+        mp_context: TMpContext,
+    ) -> tp.Optional[Executor]:
+        """Return the executor of the innermost active context compatible with ``use_threads`` and ``mp_context``, or None."""
+        if not cls._STACK or getattr(_WORKER, 'active', False):
+            return None
+        pid = os.getpid()
+        with cls._LOCK:
+            for context in reversed(cls._STACK):
+                # NOTE: forked workers inherit the stack but not its executors
+                if context._pid != pid or context._use_threads != use_threads:
+                    continue
+                if (
+                    not use_threads
+                    and mp_context is not None
+                    and mp_context != context._mp_context
+                ):
+                    continue
+                return context._executor
+        return None
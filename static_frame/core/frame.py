@@ -11,7 +11,6 @@ from dataclasses import is_dataclass
 from functools import partial
 from io import BytesIO, StringIO
 from itertools import chain, product, zip_longest
-from operator import itemgetter
 
 import numpy as np
 import typing_extensions as tp
@@ -24,6 +23,7 @@ from arraykit import (
     delimited_to_arrays,
     first_true_2d,
     name_filter,
+    nonzero_1d,
     resolve_dtype,
     resolve_dtype_iter,
     split_after_count,
@@ -36,11 +36,13 @@ from static_frame.core.container import ContainerOperand
 
 # from static_frame.core.container_util import pandas_version_under_1
 from static_frame.core.container_util import (
+    WINDOW_REDUCE_FUNCS,
     apex_to_name,
     array_from_value_iter,
     axis_window_items,
     bloc_key_normalize,
     constructor_from_optional_constructors,
+    delimited_to_arrays_chunked,
     df_slice_to_arrays,
     frame_to_frame,
     get_col_dtype_factory,
@@ -51,14 +53,22 @@ from static_frame.core.container_util import (
     index_many_concat,
     index_many_to_one,
     is_fill_value_factory_initializer,
+    iter_array_signature_bytes,
     iter_component_signature_bytes,
+    iter_delimited_chunks,
     key_to_ascending_key,
     matmul,
     pandas_to_numpy,
+    parquet_row_groups_select,
+    parquet_where_cast,
+    parquet_where_to_expression,
     prepare_values_for_lex,
     rehierarch_from_index_hierarchy,
     rehierarch_from_type_blocks,
     sort_index_from_params,
+    window_bounds,
+    window_labels,
+    window_reduce,
 )
 from static_frame.core.db_util import DBQuery, DBType
 from static_frame.core.display import Display, DisplayActive, DisplayHeader
@@ -141,12 +151,16 @@ from static_frame.core.util import (
     DEFAULT_STABLE_SORT_KIND,
     DT64_NS,
     DTU_PYARROW,
+    DTU_PYARROW_ZERO_COPY,
     DTYPE_BOOL,
     DTYPE_DATETIME_KIND,
     DTYPE_FLOAT_DEFAULT,
+    DTYPE_FLOAT_KIND,
     DTYPE_INT_DEFAULT,
+    DTYPE_INT_KINDS,
     DTYPE_NA_KINDS,
     DTYPE_OBJECT,
+    DTYPE_STR,
     EMPTY_ARRAY,
     FILL_VALUE_DEFAULT,
     FRAME_INITIALIZER_DEFAULT,
@@ -157,6 +171,7 @@ from static_frame.core.util import (
     REVERSE_SLICE,
     STORE_LABEL_DEFAULT,
     STRING_TYPES,
+    UFUNC_GROUP_REDUCE,
     IterNodeType,
     Join,
     JSONFilter,
@@ -216,6 +231,8 @@ from static_frame.core.util import (
     iterable_to_array_nd,
     key_normalize,
     path_filter,
+    ufunc_dtype_to_dtype,
+    ufunc_group_reduce,
     ufunc_unique,
     ufunc_unique1d,
     ufunc_unique_enumerated,
@@ -230,6 +247,7 @@ if tp.TYPE_CHECKING:
     from xarray import Dataset
 
     from static_frame.core.reduce import ReduceDispatchAligned
+    from static_frame.core.store_config import TReadWhere
 
     TNDArrayAny = np.ndarray[tp.Any, tp.Any]
     TDtypeAny = np.dtype[tp.Any]
@@ -1917,39 +1935,29 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
     # file, data format loaders
 
     @classmethod
-    @doc_inject(selector='constructor_frame')
-    def from_sql(
+    def _from_sql_chunks(
         cls,
         query: str,
-        /,
         *,
         connection: sqlite3.Connection,
-        index_depth: int = 0,
-        index_constructors: TIndexCtorSpecifiers = None,
-        columns_depth: int = 1,
-        columns_select: tp.Iterable[str | tp.Tuple[str, ...]] | None = None,
-        columns_constructors: TIndexCtorSpecifiers = None,
-        dtypes: TDtypesSpecifier = None,
-        name: TLabel = None,
-        consolidate_blocks: bool = False,
-        parameters: tp.Any = (),
-    ) -> tp.Self:
+        index_depth: int,
+        index_constructors: TIndexCtorSpecifiers,
+        columns_depth: int,
+        columns_select: tp.Iterable[str | tp.Tuple[str, ...]] | None,
+        columns_constructors: TIndexCtorSpecifiers,
+        dtypes: TDtypesSpecifier,
+        name: TLabel,
+        consolidate_blocks: bool,
+        parameters: tp.Any,
+        chunksize: int,
+        combine: bool,
+    ) -> tp.Generator[tp.Self, None, None]:
         """
-        Frame constructor from an SQL query and a database connection object.
-
-        Args:
-            query: A query string.
-            connection: A DBAPI2 (PEP 249) Connection object, such as those returned from SQLite (via the sqlite3 module) or PyODBC.
-            {dtypes}
-            index_depth:
-            index_constructors:
-            columns_depth:
-            columns_select: An optional iterable of field names to extract from the results of the query.
-            columns_constructors:
-            {name}
-            {consolidate_blocks}
-            parameters: Provide a list of values for an SQL query expecting parameter substitution.
+        Core implementation of :obj:`Frame` construction from an SQL query. Rows are retrieved from the cursor with ``fetchmany()`` and transposed into typed column arrays per chunk. If ``combine`` is True, chunks are concatenated and a single :obj:`Frame` is yielded; otherwise, a :obj:`Frame` is yielded per chunk.
         """
+        if chunksize < 1:
+            raise ErrorInitFrame('chunksize must be greater than zero.')
+
         columns: tp.Optional[IndexBase] = None
         own_columns = False
 
@@ -1963,15 +1971,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             if columns_select:
                 columns_select = set(columns_select)
 
-                # NOTE: this function implements columns_select functionality; selector function defined in closure below
-                def filter_row(row: tp.Sequence[tp.Any]) -> tp.Sequence[tp.Any]:
-                    post = selector(row)
-                    return post if not selector_reduces else (post,)
-
-            # if columns_depth > 0 or columns_select:
-            #     # always need to derive labels if using columns_select
-            #     labels = (col[0] in cursor.description[index_depth:])
             labels_cols: tp.Iterator[str] = (ld[0] for ld in label_to_dtype[index_depth:])
+            # positions of selected value fields after the index fields
+            iloc_sel: tp.Sequence[int] = range(len(label_to_dtype) - index_depth)
 
             if columns_depth <= 1 and columns_select:
                 iloc_sel, labels_cols = zip(  # type: ignore
@@ -1981,8 +1983,6 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                         if pair[1] in columns_select
                     )
                 )
-                selector = itemgetter(*iloc_sel)
-                selector_reduces = len(iloc_sel) == 1
 
             if columns_depth == 1:
                 columns, own_columns = index_from_optional_constructors(
@@ -2006,8 +2006,6 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
 
                 if columns_select:
                     iloc_sel = columns._loc_to_iloc(columns.isin(columns_select))  # type: ignore
-                    selector = itemgetter(*iloc_sel)
-                    selector_reduces = len(iloc_sel) == 1  # pyright: ignore
                     columns = columns.iloc[iloc_sel]  # type: ignore
 
             # NOTE: cannot own_index as we defer calling the constructor until after call Frame
@@ -2021,14 +2019,10 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                     get_col_dtype = get_col_dtype_factory(dtypes, labels_index)
 
             index_constructor: TIndexCtorSpecifier
-            row_gen: tp.Callable[..., tp.Iterator[tp.Sequence[tp.Any]]]  # pyright: ignore
 
             if index_depth == 0:
-                index = None
-                row_gen = lambda: cursor
                 index_constructor = None
             elif index_depth == 1:
-                index = []  # lazily populate
                 default_ctor: TIndexCtor = partial(Index, dtype=get_col_dtype(0))
                 # parital to include everything but values
                 index_constructor = constructor_from_optional_constructors(
@@ -2036,13 +2030,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                     default_constructor=default_ctor,
                     explicit_constructors=index_constructors,
                 )
-
-                def row_gen() -> tp.Iterator[tp.Sequence[tp.Any]]:
-                    for row in cursor:
-                        index.append(row[0])
-                        yield row[1:]
             else:  # > 1
-                index = [list() for _ in range(index_depth)]
 
                 def default_constructor(
                     iterables: tp.Iterable[tp.Iterable[TLabel]],
@@ -2052,8 +2040,6 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                         iterable_to_array_1d(it, get_col_dtype(i))[0]
                         for i, it in enumerate(iterables)
                     ]
-                    # else:
-                    #     blocks = [iterable_to_array_1d(it)[0] for it in iterables]
                     return IndexHierarchy._from_type_blocks(
                         TypeBlocks.from_blocks(blocks),
                         index_constructors=index_constructors,
@@ -2067,33 +2053,233 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                     explicit_constructors=index_constructors,
                 )
 
-                def row_gen() -> tp.Iterator[tp.Sequence[tp.Any]]:
-                    for row in cursor:
-                        for i, label in enumerate(row[:index_depth]):
-                            index[i].append(label)
-                        yield row[index_depth:]
+            get_col_dtype_values = get_col_dtype_factory(
+                dtypes if dtypes is not None else dict(label_to_dtype[index_depth:]),
+                columns,
+            )
+            # NOTE: a shared mutable columns cannot be owned by more than one Frame
+            own_columns_chunk = own_columns and (combine or cls.STATIC)
 
-            if columns_select:
-                row_gen_final = (filter_row(row) for row in row_gen())
-            else:
-                row_gen_final = row_gen()  # type: ignore
-            # print(dict(label_to_dtype[index_depth:]))
-            return cls.from_records(
-                row_gen_final,
+            def get_index(index_cols: tp.Sequence[tp.List[TLabel]]) -> tp.Any:
+                if index_depth == 0:
+                    return None
+                if index_depth == 1:
+                    return index_cols[0]
+                return index_cols
+
+            index_cols: tp.List[tp.List[TLabel]] = [[] for _ in range(index_depth)]
+            values_cols: tp.List[tp.List[TNDArrayAny]] = [[] for _ in iloc_sel]
+            row_count = 0
+
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                # transpose rows to columns of values
+                fields = list(zip(*rows))
+                count = len(rows)
+                del rows
+
+                if not combine:  # a new index and values per chunk
+                    index_cols = [[] for _ in range(index_depth)]
+                    values_cols = [[] for _ in iloc_sel]
+
+                for i in range(index_depth):
+                    index_cols[i].extend(fields[i])
+                for col_idx, iloc in enumerate(iloc_sel):
+                    values_cols[col_idx].append(
+                        array_from_value_iter(
+                            key=index_depth + iloc,
+                            idx=col_idx,
+                            get_value_iter=lambda key, idx: iter(fields[key]),  # type: ignore[index] # pyright: ignore
+                            get_col_dtype=get_col_dtype_values,
+                            row_count=count,
+                        )
+                    )
+                del fields
+                row_count += count
+
+                if not combine:
+                    yield cls._from_sql_arrays(
+                        values_cols,
+                        index=get_index(index_cols),
+                        index_constructor=index_constructor,
+                        columns=columns,
+                        own_columns=own_columns_chunk,
+                        name=name,
+                        consolidate_blocks=consolidate_blocks,
+                    )
+
+            if not combine:
+                return
+
+            if not row_count:
+                yield cls.from_records(
+                    (),
+                    columns=columns,
+                    index=get_index(index_cols),
+                    dtypes=dtypes
+                    if dtypes is not None
+                    else dict(label_to_dtype[index_depth:]),
+                    name=name,
+                    own_columns=own_columns,
+                    index_constructor=index_constructor,
+                    consolidate_blocks=consolidate_blocks,
+                )
+                return
+
+            yield cls._from_sql_arrays(
+                values_cols,
+                index=get_index(index_cols),
+                index_constructor=index_constructor,
                 columns=columns,
-                index=index,
-                dtypes=dtypes
-                if dtypes is not None
-                else dict(label_to_dtype[index_depth:]),
-                name=name,
                 own_columns=own_columns,
-                index_constructor=index_constructor,
+                name=name,
                 consolidate_blocks=consolidate_blocks,
             )
         finally:
             if cursor:
                 cursor.close()
 
+    @classmethod
+    def _from_sql_arrays(
+        cls,
+        values_cols: tp.Sequence[tp.Sequence[TNDArrayAny]],
+        *,
+        index: tp.Any,
+        index_constructor: TIndexCtorSpecifier,
+        columns: tp.Optional[IndexBase],
+        own_columns: bool,
+        name: TLabel,
+        consolidate_blocks: bool,
+    ) -> tp.Self:
+        """
+        Create a :obj:`Frame` from, for each column, a sequence of chunk arrays.
+        """
+        blocks = (
+            arrays[0] if len(arrays) == 1 else concat_resolved(arrays)
+            for arrays in values_cols
+        )
+        return cls(
+            TypeBlocks.from_blocks(
+                TypeBlocks.consolidate_blocks(blocks) if consolidate_blocks else blocks
+            ),
+            index=index,
+            columns=columns,
+            name=name,
+            own_data=True,
+            index_constructor=index_constructor,
+            own_columns=own_columns,
+        )
+
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_sql(
+        cls,
+        query: str,
+        /,
+        *,
+        connection: sqlite3.Connection,
+        index_depth: int = 0,
+        index_constructors: TIndexCtorSpecifiers = None,
+        columns_depth: int = 1,
+        columns_select: tp.Iterable[str | tp.Tuple[str, ...]] | None = None,
+        columns_constructors: TIndexCtorSpecifiers = None,
+        dtypes: TDtypesSpecifier = None,
+        name: TLabel = None,
+        consolidate_blocks: bool = False,
+        parameters: tp.Any = (),
+        chunksize: int = 10_000,
+    ) -> tp.Self:
+        """
+        Frame constructor from an SQL query and a database connection object.
+
+        Args:
+            query: A query string.
+            connection: A DBAPI2 (PEP 249) Connection object, such as those returned from SQLite (via the sqlite3 module) or PyODBC.
+            {dtypes}
+            index_depth:
+            index_constructors:
+            columns_depth:
+            columns_select: An optional iterable of field names to extract from the results of the query.
+            columns_constructors:
+            {name}
+            {consolidate_blocks}
+            parameters: Provide a list of values for an SQL query expecting parameter substitution.
+            chunksize: The number of rows to retrieve from the cursor at a time; column arrays are built per chunk and concatenated.
+        """
+        chunks = cls._from_sql_chunks(
+            query,
+            connection=connection,
+            index_depth=index_depth,
+            index_constructors=index_constructors,
+            columns_depth=columns_depth,
+            columns_select=columns_select,
+            columns_constructors=columns_constructors,
+            dtypes=dtypes,
+            name=name,
+            consolidate_blocks=consolidate_blocks,
+            parameters=parameters,
+            chunksize=chunksize,
+            combine=True,
+        )
+        try:
+            return next(chunks)
+        finally:
+            chunks.close()
+
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_sql_iter(
+        cls,
+        query: str,
+        /,
+        *,
+        connection: sqlite3.Connection,
+        index_depth: int = 0,
+        index_constructors: TIndexCtorSpecifiers = None,
+        columns_depth: int = 1,
+        columns_select: tp.Iterable[str | tp.Tuple[str, ...]] | None = None,
+        columns_constructors: TIndexCtorSpecifiers = None,
+        dtypes: TDtypesSpecifier = None,
+        name: TLabel = None,
+        consolidate_blocks: bool = False,
+        parameters: tp.Any = (),
+        chunksize: int = 10_000,
+    ) -> tp.Iterator[tp.Self]:
+        """
+        Frame generator from an SQL query and a database connection object, yielding a :obj:`Frame` for each chunk of at most ``chunksize`` rows. No :obj:`Frame` is yielded if the query returns no rows.
+
+        Args:
+            query: A query string.
+            connection: A DBAPI2 (PEP 249) Connection object, such as those returned from SQLite (via the sqlite3 module) or PyODBC.
+            {dtypes}
+            index_depth:
+            index_constructors:
+            columns_depth:
+            columns_select: An optional iterable of field names to extract from the results of the query.
+            columns_constructors:
+            {name}
+            {consolidate_blocks}
+            parameters: Provide a list of values for an SQL query expecting parameter substitution.
+            chunksize: The maximum number of rows in each yielded :obj:`Frame`.
+        """
+        yield from cls._from_sql_chunks(
+            query,
+            connection=connection,
+            index_depth=index_depth,
+            index_constructors=index_constructors,
+            columns_depth=columns_depth,
+            columns_select=columns_select,
+            columns_constructors=columns_constructors,
+            dtypes=dtypes,
+            name=name,
+            consolidate_blocks=consolidate_blocks,
+            parameters=parameters,
+            chunksize=chunksize,
+            combine=False,
+        )
+
     # ---------------------------------------------------------------------------
     @classmethod
     @doc_inject(selector='json')
@@ -2393,66 +2579,47 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
 
     # ---------------------------------------------------------------------------
     @classmethod
-    @doc_inject(selector='constructor_frame')
-    def from_delimited(
+    def _from_delimited_chunks(
         cls,
         fp: TPathSpecifierOrTextIOOrIterator,
         /,
         *,
         delimiter: str,
-        index_depth: int = 0,
-        index_column_first: int = 0,
-        index_name_depth_level: tp.Optional[TDepthLevel] = None,
-        index_constructors: TIndexCtorSpecifiers = None,
-        index_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
-        columns_depth: int = 1,
-        columns_name_depth_level: tp.Optional[TDepthLevel] = None,
-        columns_constructors: TIndexCtorSpecifiers = None,
-        columns_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
-        columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
-        skip_header: int = 0,
-        skip_footer: int = 0,
-        skip_initial_space: bool = False,
-        quote_char: str = '"',
-        quote_double: bool = True,
-        escape_char: tp.Optional[str] = None,
-        quoting: TCSVQuoting = csv.QUOTE_MINIMAL,
-        thousands_char: str = '',
-        decimal_char: str = '.',
-        encoding: tp.Optional[str] = None,
-        dtypes: TDtypesSpecifier = None,
-        name: TLabel = None,
-        consolidate_blocks: bool = False,
-        store_filter: StoreFilter | None = None,
-    ) -> tp.Self:
+        index_depth: int,
+        index_column_first: int,
+        index_name_depth_level: tp.Optional[TDepthLevel],
+        index_constructors: TIndexCtorSpecifiers,
+        index_continuation_token: tp.Optional[TLabel],
+        columns_depth: int,
+        columns_name_depth_level: tp.Optional[TDepthLevel],
+        columns_constructors: TIndexCtorSpecifiers,
+        columns_continuation_token: tp.Optional[TLabel],
+        columns_select: tp.Optional[tp.Iterable[TLabel]],
+        skip_header: int,
+        skip_footer: int,
+        skip_initial_space: bool,
+        quote_char: str,
+        quote_double: bool,
+        escape_char: tp.Optional[str],
+        quoting: TCSVQuoting,
+        thousands_char: str,
+        decimal_char: str,
+        encoding: tp.Optional[str],
+        dtypes: TDtypesSpecifier,
+        name: TLabel,
+        consolidate_blocks: bool,
+        store_filter: StoreFilter | None,
+        max_workers: int | None,
+        chunk_rows: int,
+        combine: bool,
+    ) -> tp.Generator[tp.Self, None, None]:
         """
-        Create a :obj:`Frame` from a file path or a file-like object defining a delimited (CSV, TSV) data file.
-
-        Args:
-            fp: A file path or a file-like object.
-            delimiter: The character used to seperate row elements.
-            index_depth: Specify the number of columns used to create the index labels; a value greater than 1 will attempt to create a hierarchical index.
-            index_column_first: Optionally specify a column, by position in the realized columns, to become the start of the index if index_depth is greater than 0 and columns_depth is 0.
-            index_name_depth_level: If columns_depth is greater than 0, interpret values over index as the index name.
-            index_constructors:
-            index_continuation_token:
-            columns_depth: Specify the number of rows after the skip_header used to create the column labels. A value of 0 will be no header; a value greater than 1 will attempt to create a hierarchical index.
-            columns_name_depth_level: If index_depth is greater than 0, interpret values over index as the columns name.
-            columns_constructors:
-            columns_continuation_token:
-            columns_select: an iterable of columns to select by label or position; can only be used if index_depth is 0.
-            skip_header: Number of leading lines to skip.
-            skip_footer: Number of trailing lines to skip.
-            store_filter: A StoreFilter instance, defining translation between unrepresentable strings and types. By default it is disabled, and only empty fields or "NAN" are intepreted as NaN. To force usage, set the type of the column to string.
-            {dtypes}
-            {name}
-            {consolidate_blocks}
-
-        Returns:
-            :obj:`static_frame.Frame`
+        Core implementation of :obj:`Frame` construction from delimited text. If ``combine`` is True, all records are parsed and a single :obj:`Frame` is yielded; otherwise, a :obj:`Frame` is yielded per chunk of ``chunk_rows`` records.
         """
         if skip_header < 0:
             raise ErrorInitFrame('skip_header must be greater than or equal to 0')
+        if chunk_rows < 1:
+            raise ErrorInitFrame('chunk_rows must be greater than 0')
 
         fpf = path_filter(fp)  # normalize Path to strings
 
@@ -2620,10 +2787,65 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             if dtypes is None
             else get_col_dtype_factory(dtypes, columns, index_depth)
         )
-        values_arrays: tp.Sequence[TNDArrayAny] = delimited_to_arrays(
-            row_iter,
+        values_arrays: tp.Sequence[TNDArrayAny]
+        if combine:
+            if max_workers is None:
+                values_arrays = delimited_to_arrays(
+                    row_iter,
+                    axis=1,  # process type per column
+                    line_select=line_select,
+                    delimiter=delimiter,
+                    quoting=quoting,
+                    quotechar=quote_char,
+                    doublequote=quote_double,
+                    escapechar=escape_char,
+                    thousandschar=thousands_char,
+                    decimalchar=decimal_char,
+                    skipinitialspace=skip_initial_space,
+                    dtypes=get_col_dtype,
+                )
+            else:
+                values_arrays = delimited_to_arrays_chunked(
+                    row_iter,
+                    chunk_rows=chunk_rows,
+                    max_workers=max_workers,
+                    line_select=line_select,
+                    dtypes=get_col_dtype,
+                    delimiter=delimiter,
+                    quoting=quoting,
+                    quote_char=quote_char,
+                    quote_double=quote_double,
+                    escape_char=escape_char,
+                    thousands_char=thousands_char,
+                    decimal_char=decimal_char,
+                    skip_initial_space=skip_initial_space,
+                )
+            yield cls._from_delimited_arrays(
+                values_arrays,
+                columns=columns,
+                own_columns=own_columns,
+                apex_rows=apex_rows,
+                index_depth=index_depth,
+                index_column_first=index_column_first,
+                index_name_depth_level=index_name_depth_level,
+                index_constructors=index_constructors,
+                index_continuation_token=index_continuation_token,
+                columns_depth=columns_depth,
+                store_filter=store_filter,
+                consolidate_blocks=consolidate_blocks,
+                name=name,
+            )
+            return
+
+        # NOTE: a shared mutable columns cannot be owned by more than one Frame
+        own_columns = own_columns and cls.STATIC
+        # positions of the columns returned by delimited_to_arrays
+        positions: tp.Sequence[int] | None = (
+            None if line_select is None else sorted(set(columns_included))  # type: ignore[arg-type]
+        )
+        parse = partial(
+            delimited_to_arrays,
             axis=1,  # process type per column
-            line_select=line_select,
             delimiter=delimiter,
             quoting=quoting,
             quotechar=quote_char,
@@ -2632,14 +2854,103 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             thousandschar=thousands_char,
             decimalchar=decimal_char,
             skipinitialspace=skip_initial_space,
-            dtypes=get_col_dtype,
         )
-        if store_filter is not None:
-            values_arrays = [store_filter.to_type_filter_array(a) for a in values_arrays]
-        if index_depth:
-            if index_column_first:
-                # NOTE: we cannot use index_columns_first with labels in columns, as columns has to be truncated for index_depth before the index can be created
-                if columns is not None:
+        dtypes_first: tp.Dict[int, TDtypeAny] | None = None
+        record_count = 0  # records in yielded Frames
+        frame_count = 0
+        for chunk in iter_delimited_chunks(
+            row_iter,
+            chunk_rows=chunk_rows,
+            delimiter=delimiter,
+            quoting=quoting,
+            quote_char=quote_char,
+            quote_double=quote_double,
+            escape_char=escape_char,
+            skip_initial_space=skip_initial_space,
+        ):
+            try:
+                values_arrays = parse(
+                    chunk, line_select=line_select, dtypes=get_col_dtype
+                )
+            except TypeError as e:
+                if dtypes_first is None:
+                    raise
+                # find the first field that does not conform to its dtype
+                for position in sorted(dtypes_first):
+                    try:
+                        parse(chunk, line_select=position.__eq__, dtypes=get_col_dtype)
+                    except TypeError:
+                        break
+                field: TLabel = position
+                if columns is not None and not index_depth:
+                    field = columns[
+                        position
+                        if line_select is None
+                        else columns_included.index(position)
+                    ]
+                raise ErrorInitFrame(
+                    f'Cannot parse the chunk starting at record {record_count}: values of field {field!r} do not conform to dtype {dtypes_first[position]}, evaluated on the first chunk; provide dtypes to specify the dtype of this field.'
+                ) from e
+            del chunk
+            if not values_arrays:
+                continue
+            if dtypes_first is None:
+                # fix dtypes evaluated (or given) on the first chunk for all subsequent chunks; string dtypes are given without a size
+                dtypes_first = {
+                    (i if positions is None else positions[i]): (
+                        DTYPE_STR if a.dtype.kind == 'U' else a.dtype  # type: ignore[attr-defined]
+                    )
+                    for i, a in enumerate(values_arrays)
+                }
+                get_col_dtype = dtypes_first.get
+
+            yield cls._from_delimited_arrays(
+                values_arrays,
+                columns=columns,
+                own_columns=own_columns,
+                apex_rows=apex_rows,
+                index_depth=index_depth,
+                index_column_first=index_column_first,
+                index_name_depth_level=index_name_depth_level,
+                index_constructors=index_constructors,
+                index_continuation_token=index_continuation_token,
+                columns_depth=columns_depth,
+                store_filter=store_filter,
+                consolidate_blocks=consolidate_blocks,
+                name=frame_count if name is None else (name, frame_count),
+                index_start=record_count,
+            )
+            record_count += len(values_arrays[0])
+            frame_count += 1
+
+    @classmethod
+    def _from_delimited_arrays(
+        cls,
+        values_arrays: tp.Sequence[TNDArrayAny],
+        *,
+        columns: IndexBase | None,
+        own_columns: bool,
+        apex_rows: tp.Sequence[tp.Sequence[TLabel]],
+        index_depth: int,
+        index_column_first: int,
+        index_name_depth_level: tp.Optional[TDepthLevel],
+        index_constructors: TIndexCtorSpecifiers,
+        index_continuation_token: tp.Optional[TLabel],
+        columns_depth: int,
+        store_filter: StoreFilter | None,
+        consolidate_blocks: bool,
+        name: TLabel,
+        index_start: int = 0,
+    ) -> tp.Self:
+        """
+        Create a :obj:`Frame` from column arrays parsed from delimited text, taking index arrays from the values as specified by ``index_depth``. If ``index_depth`` is 0, the auto-incremented index starts from ``index_start``.
+        """
+        if store_filter is not None:
+            values_arrays = [store_filter.to_type_filter_array(a) for a in values_arrays]
+        if index_depth:
+            if index_column_first:
+                # NOTE: we cannot use index_columns_first with labels in columns, as columns has to be truncated for index_depth before the index can be created
+                if columns is not None:
                     raise ErrorInitFrame(
                         'Cannot use index_column_first if columns_depth is greater than 0.'
                     )
@@ -2675,6 +2986,14 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         kwargs = dict(own_data=True, columns=columns, own_columns=own_columns, name=name)
 
         if index_depth == 0:
+            if index_start:
+                positions = np.arange(
+                    index_start,
+                    index_start + blocks.shape[0],
+                    dtype=DTYPE_INT_DEFAULT,
+                )
+                positions.flags.writeable = False
+                return cls(blocks, index=positions, **kwargs)  # type: ignore
             return cls(blocks, index=None, **kwargs)  # type: ignore
 
         index_name = (
@@ -2737,7 +3056,332 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         )
 
     @classmethod
-    def from_csv(
+    @doc_inject(selector='constructor_frame')
+    def from_delimited(
+        cls,
+        fp: TPathSpecifierOrTextIOOrIterator,
+        /,
+        *,
+        delimiter: str,
+        index_depth: int = 0,
+        index_column_first: int = 0,
+        index_name_depth_level: tp.Optional[TDepthLevel] = None,
+        index_constructors: TIndexCtorSpecifiers = None,
+        index_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+        columns_depth: int = 1,
+        columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+        columns_constructors: TIndexCtorSpecifiers = None,
+        columns_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+        columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+        skip_header: int = 0,
+        skip_footer: int = 0,
+        skip_initial_space: bool = False,
+        quote_char: str = '"',
+        quote_double: bool = True,
+        escape_char: tp.Optional[str] = None,
+        quoting: TCSVQuoting = csv.QUOTE_MINIMAL,
+        thousands_char: str = '',
+        decimal_char: str = '.',
+        encoding: tp.Optional[str] = None,
+        dtypes: TDtypesSpecifier = None,
+        name: TLabel = None,
+        consolidate_blocks: bool = False,
+        store_filter: StoreFilter | None = None,
+        max_workers: int | None = None,
+        chunk_rows: int = 100_000,
+    ) -> tp.Self:
+        """
+        Create a :obj:`Frame` from a file path or a file-like object defining a delimited (CSV, TSV) data file.
+
+        Args:
+            fp: A file path or a file-like object.
+            delimiter: The character used to seperate row elements.
+            index_depth: Specify the number of columns used to create the index labels; a value greater than 1 will attempt to create a hierarchical index.
+            index_column_first: Optionally specify a column, by position in the realized columns, to become the start of the index if index_depth is greater than 0 and columns_depth is 0.
+            index_name_depth_level: If columns_depth is greater than 0, interpret values over index as the index name.
+            index_constructors:
+            index_continuation_token:
+            columns_depth: Specify the number of rows after the skip_header used to create the column labels. A value of 0 will be no header; a value greater than 1 will attempt to create a hierarchical index.
+            columns_name_depth_level: If index_depth is greater than 0, interpret values over index as the columns name.
+            columns_constructors:
+            columns_continuation_token:
+            columns_select: an iterable of columns to select by label or position; can only be used if index_depth is 0.
+            skip_header: Number of leading lines to skip.
+            skip_footer: Number of trailing lines to skip.
+            store_filter: A StoreFilter instance, defining translation between unrepresentable strings and types. By default it is disabled, and only empty fields or "NAN" are intepreted as NaN. To force usage, set the type of the column to string.
+            max_workers: If not None, split records into chunks of `chunk_rows` records and parse chunks on a thread pool with this number of workers.
+            chunk_rows: Number of records per chunk when `max_workers` is not None.
+            {dtypes}
+            {name}
+            {consolidate_blocks}
+
+        Returns:
+            :obj:`static_frame.Frame`
+        """
+        frames = cls._from_delimited_chunks(
+            fp,
+            delimiter=delimiter,
+            index_depth=index_depth,
+            index_column_first=index_column_first,
+            index_name_depth_level=index_name_depth_level,
+            index_constructors=index_constructors,
+            index_continuation_token=index_continuation_token,
+            columns_depth=columns_depth,
+            columns_name_depth_level=columns_name_depth_level,
+            columns_constructors=columns_constructors,
+            columns_continuation_token=columns_continuation_token,
+            columns_select=columns_select,
+            skip_header=skip_header,
+            skip_footer=skip_footer,
+            skip_initial_space=skip_initial_space,
+            quote_char=quote_char,
+            quote_double=quote_double,
+            escape_char=escape_char,
+            quoting=quoting,
+            thousands_char=thousands_char,
+            decimal_char=decimal_char,
+            encoding=encoding,
+            dtypes=dtypes,
+            name=name,
+            consolidate_blocks=consolidate_blocks,
+            store_filter=store_filter,
+            max_workers=max_workers,
+            chunk_rows=chunk_rows,
+            combine=True,
+        )
+        try:
+            return next(frames)
+        finally:
+            frames.close()
+
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_delimited_iter(
+        cls,
+        fp: TPathSpecifierOrTextIOOrIterator,
+        /,
+        *,
+        delimiter: str,
+        index_depth: int = 0,
+        index_column_first: int = 0,
+        index_name_depth_level: tp.Optional[TDepthLevel] = None,
+        index_constructors: TIndexCtorSpecifiers = None,
+        index_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+        columns_depth: int = 1,
+        columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+        columns_constructors: TIndexCtorSpecifiers = None,
+        columns_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+        columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+        skip_header: int = 0,
+        skip_footer: int = 0,
+        skip_initial_space: bool = False,
+        quote_char: str = '"',
+        quote_double: bool = True,
+        escape_char: tp.Optional[str] = None,
+        quoting: TCSVQuoting = csv.QUOTE_MINIMAL,
+        thousands_char: str = '',
+        decimal_char: str = '.',
+        encoding: tp.Optional[str] = None,
+        dtypes: TDtypesSpecifier = None,
+        name: TLabel = None,
+        consolidate_blocks: bool = False,
+        store_filter: StoreFilter | None = None,
+        chunk_rows: int = 100_000,
+    ) -> tp.Iterator[tp.Self]:
+        """
+        Frame generator from a file path or a file-like object defining a delimited (CSV, TSV) data file, yielding a :obj:`Frame` for each chunk of at most ``chunk_rows`` records. Only one chunk of records is held in memory at a time. Unless provided with ``dtypes``, the dtypes of values in all chunks are those evaluated on the first chunk. No :obj:`Frame` is yielded if there are no records. If ``index_depth`` is 0, the index of each :obj:`Frame` continues from that of the prior :obj:`Frame`, such that index labels are unique across all yielded :obj:`Frame`. Each :obj:`Frame` is named with its ordinal position or, if ``name`` is provided, a tuple of ``name`` and that ordinal position.
+
+        Args:
+            fp: A file path or a file-like object.
+            delimiter: The character used to seperate row elements.
+            index_depth: Specify the number of columns used to create the index labels; a value greater than 1 will attempt to create a hierarchical index.
+            index_column_first: Optionally specify a column, by position in the realized columns, to become the start of the index if index_depth is greater than 0 and columns_depth is 0.
+            index_name_depth_level: If columns_depth is greater than 0, interpret values over index as the index name.
+            index_constructors:
+            index_continuation_token:
+            columns_depth: Specify the number of rows after the skip_header used to create the column labels. A value of 0 will be no header; a value greater than 1 will attempt to create a hierarchical index.
+            columns_name_depth_level: If index_depth is greater than 0, interpret values over index as the columns name.
+            columns_constructors:
+            columns_continuation_token:
+            columns_select: an iterable of columns to select by label or position; can only be used if index_depth is 0.
+            skip_header: Number of leading lines to skip.
+            skip_footer: Number of trailing lines to skip.
+            store_filter: A StoreFilter instance, defining translation between unrepresentable strings and types. By default it is disabled, and only empty fields or "NAN" are intepreted as NaN. To force usage, set the type of the column to string.
+            chunk_rows: The maximum number of records in each yielded :obj:`Frame`.
+            {dtypes}
+            {name}
+            {consolidate_blocks}
+
+        """
+        yield from cls._from_delimited_chunks(
+            fp,
+            delimiter=delimiter,
+            index_depth=index_depth,
+            index_column_first=index_column_first,
+            index_name_depth_level=index_name_depth_level,
+            index_constructors=index_constructors,
+            index_continuation_token=index_continuation_token,
+            columns_depth=columns_depth,
+            columns_name_depth_level=columns_name_depth_level,
+            columns_constructors=columns_constructors,
+            columns_continuation_token=columns_continuation_token,
+            columns_select=columns_select,
+            skip_header=skip_header,
+            skip_footer=skip_footer,
+            skip_initial_space=skip_initial_space,
+            quote_char=quote_char,
+            quote_double=quote_double,
+            escape_char=escape_char,
+            quoting=quoting,
+            thousands_char=thousands_char,
+            decimal_char=decimal_char,
+            encoding=encoding,
+            dtypes=dtypes,
+            name=name,
+            consolidate_blocks=consolidate_blocks,
+            store_filter=store_filter,
+            max_workers=None,
+            chunk_rows=chunk_rows,
+            combine=False,
+        )
+
+    @classmethod
+    def from_csv(
+        cls,
+        fp: TPathSpecifierOrTextIOOrIterator,
+        /,
+        *,
+        index_depth: int = 0,
+        index_column_first: int = 0,
+        index_name_depth_level: tp.Optional[TDepthLevel] = None,
+        index_constructors: TIndexCtorSpecifiers = None,
+        index_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+        columns_depth: int = 1,
+        columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+        columns_constructors: TIndexCtorSpecifiers = None,
+        columns_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+        columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+        skip_header: int = 0,
+        skip_footer: int = 0,
+        skip_initial_space: bool = False,
+        quote_char: str = '"',
+        quote_double: bool = True,
+        escape_char: tp.Optional[str] = None,
+        quoting: TCSVQuoting = csv.QUOTE_MINIMAL,
+        thousands_char: str = '',
+        decimal_char: str = '.',
+        encoding: tp.Optional[str] = None,
+        dtypes: TDtypesSpecifier = None,
+        name: TLabel = None,
+        consolidate_blocks: bool = False,
+        store_filter: StoreFilter | None = None,
+        max_workers: int | None = None,
+        chunk_rows: int = 100_000,
+    ) -> tp.Self:
+        """
+        Specialized version of :obj:`Frame.from_delimited` for CSV files.
+
+        Returns:
+            :obj:`Frame`
+        """
+        return cls.from_delimited(
+            fp,
+            delimiter=',',
+            index_depth=index_depth,
+            index_column_first=index_column_first,
+            index_name_depth_level=index_name_depth_level,
+            index_constructors=index_constructors,
+            index_continuation_token=index_continuation_token,
+            columns_depth=columns_depth,
+            columns_name_depth_level=columns_name_depth_level,
+            columns_constructors=columns_constructors,
+            columns_continuation_token=columns_continuation_token,
+            columns_select=columns_select,
+            skip_header=skip_header,
+            skip_footer=skip_footer,
+            skip_initial_space=skip_initial_space,
+            quoting=quoting,
+            quote_char=quote_char,
+            quote_double=quote_double,
+            escape_char=escape_char,
+            thousands_char=thousands_char,
+            decimal_char=decimal_char,
+            encoding=encoding,
+            dtypes=dtypes,
+            name=name,
+            consolidate_blocks=consolidate_blocks,
+            store_filter=store_filter,
+            max_workers=max_workers,
+            chunk_rows=chunk_rows,
+        )
+
+    @classmethod
+    def from_csv_iter(
+        cls,
+        fp: TPathSpecifierOrTextIOOrIterator,
+        /,
+        *,
+        index_depth: int = 0,
+        index_column_first: int = 0,
+        index_name_depth_level: tp.Optional[TDepthLevel] = None,
+        index_constructors: TIndexCtorSpecifiers = None,
+        index_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+        columns_depth: int = 1,
+        columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+        columns_constructors: TIndexCtorSpecifiers = None,
+        columns_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+        columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+        skip_header: int = 0,
+        skip_footer: int = 0,
+        skip_initial_space: bool = False,
+        quote_char: str = '"',
+        quote_double: bool = True,
+        escape_char: tp.Optional[str] = None,
+        quoting: TCSVQuoting = csv.QUOTE_MINIMAL,
+        thousands_char: str = '',
+        decimal_char: str = '.',
+        encoding: tp.Optional[str] = None,
+        dtypes: TDtypesSpecifier = None,
+        name: TLabel = None,
+        consolidate_blocks: bool = False,
+        store_filter: StoreFilter | None = None,
+        chunk_rows: int = 100_000,
+    ) -> tp.Iterator[tp.Self]:
+        """
+        Specialized version of :obj:`Frame.from_delimited_iter` for CSV files.
+        """
+        yield from cls.from_delimited_iter(
+            fp,
+            delimiter=',',
+            index_depth=index_depth,
+            index_column_first=index_column_first,
+            index_name_depth_level=index_name_depth_level,
+            index_constructors=index_constructors,
+            index_continuation_token=index_continuation_token,
+            columns_depth=columns_depth,
+            columns_name_depth_level=columns_name_depth_level,
+            columns_constructors=columns_constructors,
+            columns_continuation_token=columns_continuation_token,
+            columns_select=columns_select,
+            skip_header=skip_header,
+            skip_footer=skip_footer,
+            skip_initial_space=skip_initial_space,
+            quoting=quoting,
+            quote_char=quote_char,
+            quote_double=quote_double,
+            escape_char=escape_char,
+            thousands_char=thousands_char,
+            decimal_char=decimal_char,
+            encoding=encoding,
+            dtypes=dtypes,
+            name=name,
+            consolidate_blocks=consolidate_blocks,
+            store_filter=store_filter,
+            chunk_rows=chunk_rows,
+        )
+
+    @classmethod
+    def from_tsv(
         cls,
         fp: TPathSpecifierOrTextIOOrIterator,
         /,
@@ -2766,16 +3410,18 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         name: TLabel = None,
         consolidate_blocks: bool = False,
         store_filter: StoreFilter | None = None,
+        max_workers: int | None = None,
+        chunk_rows: int = 100_000,
     ) -> tp.Self:
         """
-        Specialized version of :obj:`Frame.from_delimited` for CSV files.
+        Specialized version of :obj:`Frame.from_delimited` for TSV files.
 
         Returns:
-            :obj:`Frame`
+            :obj:`static_frame.Frame`
         """
         return cls.from_delimited(
             fp,
-            delimiter=',',
+            delimiter='\t',
             index_depth=index_depth,
             index_column_first=index_column_first,
             index_name_depth_level=index_name_depth_level,
@@ -2800,10 +3446,12 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name=name,
             consolidate_blocks=consolidate_blocks,
             store_filter=store_filter,
+            max_workers=max_workers,
+            chunk_rows=chunk_rows,
         )
 
     @classmethod
-    def from_tsv(
+    def from_tsv_iter(
         cls,
         fp: TPathSpecifierOrTextIOOrIterator,
         /,
@@ -2832,14 +3480,12 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         name: TLabel = None,
         consolidate_blocks: bool = False,
         store_filter: StoreFilter | None = None,
-    ) -> tp.Self:
+        chunk_rows: int = 100_000,
+    ) -> tp.Iterator[tp.Self]:
         """
-        Specialized version of :obj:`Frame.from_delimited` for TSV files.
-
-        Returns:
-            :obj:`static_frame.Frame`
+        Specialized version of :obj:`Frame.from_delimited_iter` for TSV files.
         """
-        return cls.from_delimited(
+        yield from cls.from_delimited_iter(
             fp,
             delimiter='\t',
             index_depth=index_depth,
@@ -2866,6 +3512,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name=name,
             consolidate_blocks=consolidate_blocks,
             store_filter=store_filter,
+            chunk_rows=chunk_rows,
         )
 
     @classmethod
@@ -3037,14 +3684,20 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         cls,
         fp: TPathSpecifierOrBinaryIO,
         /,
+        *,
+        columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
     ) -> TFrameAny:
         """
         Create a :obj:`Frame` from an npz file.
+
+        Args:
+            columns_select: An optional iterable of column labels to load; only blocks that contain selected columns are read.
         """
         # NOTE: `fp`` can be a bytes object
         return NPZFrameConverter.from_archive(
             constructor=cls,
             fp=fp,
+            columns_select=columns_select,
         )
 
     @classmethod
@@ -3263,8 +3916,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         dtypes: TDtypesSpecifier = None,
         name: TLabel = None,
         consolidate_blocks: bool = False,
+        zero_copy_only: bool = False,
     ) -> tp.Self:
-        """Realize a ``Frame`` from an Arrow Table.
+        """Realize a ``Frame`` from an Arrow Table. Columns of integer, float, and nanosecond timestamp types without nulls in a single chunk are realized as immutable arrays that share memory with Arrow buffers.
 
         Args:
             value: A :obj:`pyarrow.Table` instance.
@@ -3273,6 +3927,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             {dtypes}
             {name}
             {consolidate_blocks}
+            zero_copy_only: If True, raise if any column cannot be realized without copying Arrow buffers.
 
         Returns:
             :obj:`Frame`
@@ -3297,19 +3952,41 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             None if dtypes is None else get_col_dtype_factory(dtypes, value.column_names)
         )
 
+        import pyarrow
+
+        def is_zero_copy(chunked_array: 'pyarrow.ChunkedArray') -> bool:
+            # NOTE: these types have the same layout in Arrow and NumPy, and are realized with the same dtype as through pandas
+            t = chunked_array.type
+            return (
+                chunked_array.null_count == 0
+                and chunked_array.num_chunks == 1
+                and (
+                    pyarrow.types.is_integer(t)
+                    or pyarrow.types.is_floating(t)
+                    or (pyarrow.types.is_timestamp(t) and t.unit == 'ns' and t.tz is None)
+                )
+            )
+
         def blocks() -> tp.Iterator[TNDArrayAny]:
             for col_idx, (column_name, chunked_array) in enumerate(
                 zip(value.column_names, value.columns)
             ):
                 # NOTE: name will be the encoded columns representation, or auto increment integers; if an IndexHierarchy, will contain all depths: "['a' 1]"
-                # This creates a Series with an index; better to find a way to go only to numpy, but does not seem available on ChunkedArray, even with pyarrow==0.16.0
-                series = chunked_array.to_pandas(
-                    date_as_object=False,  # get an np array
-                    self_destruct=True,  # documented as "experimental"
-                    ignore_metadata=True,
-                )
-
-                array_final = pandas_to_numpy(series, own_data=True)
+                if is_zero_copy(chunked_array):
+                    # an immutable view of the Arrow buffer
+                    array_final = chunked_array.chunk(0).to_numpy(zero_copy_only=True)
+                elif zero_copy_only:
+                    raise ErrorInitFrame(
+                        f'Column {column_name!r} of type {chunked_array.type} cannot be realized without a copy.'
+                    )
+                else:
+                    # This creates a Series with an index; better to find a way to go only to numpy, but does not seem available on ChunkedArray, even with pyarrow==0.16.0
+                    series = chunked_array.to_pandas(
+                        date_as_object=False,  # get an np array
+                        self_destruct=True,  # documented as "experimental"
+                        ignore_metadata=True,
+                    )
+                    array_final = pandas_to_numpy(series, own_data=True)
 
                 if get_col_dtype:
                     # ordered values will include index positions
@@ -3415,6 +4092,120 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             own_index=own_index,
         )
 
+    @staticmethod
+    def _from_parquet_tables(
+        fp: TPathSpecifier,
+        /,
+        *,
+        index_depth: int,
+        columns_select: tp.Optional[tp.Iterable[str]],
+        row_groups: tp.Optional[tp.Iterable[int]],
+        where: tp.Optional[TReadWhere],
+        combine: bool,
+    ) -> tp.Iterator['pyarrow.Table']:
+        """
+        Yield pyarrow Tables from a Parquet file: if ``combine``, a single Table of all selected row groups; otherwise, a Table per selected row group.
+        """
+        import pyarrow.parquet as pq
+        from pyarrow.lib import ArrowInvalid
+
+        if columns_select and index_depth != 0:
+            raise ErrorInitFrame(
+                f'cannot load index_depth {index_depth} when columns_select is specified.'
+            )
+
+        fpf: str = path_filter(fp)  # type: ignore
+
+        if columns_select is not None and not isinstance(columns_select, list):
+            columns_select = list(columns_select)
+
+        if combine and row_groups is None and where is None:
+            # NOTE: the order of columns_select will determine their order
+            try:
+                table = pq.read_table(
+                    fp,
+                    columns=columns_select,
+                    use_pandas_metadata=False,
+                )
+            except ArrowInvalid:  # pragma: no cover
+                # support loading parquet files saved with pyarrow<1.0
+                # https://github.com/apache/arrow/issues/32660
+                table = pq.read_table(
+                    fp,  # pragma: no cover
+                    columns=columns_select,
+                    use_pandas_metadata=False,
+                    use_legacy_dataset=True,  # pyright: ignore
+                )
+            if columns_select:
+                # pq.read_table will silently accept requested columns that are not found; this can be identified if we got back fewer columns than requested
+                if len(table.column_names) < len(columns_select):
+                    missing = set(columns_select) - set(table.column_names)
+                    raise ErrorInitFrame(
+                        f'cannot load all columns in columns_select: missing {missing}'
+                    )
+            yield table
+            return
+
+        where = None if where is None else tuple(where)
+        # fields used only by where predicates must be read, then removed after filtering
+        columns_read = columns_select
+        if columns_select is not None and where:
+            columns_read = columns_select + [
+                field
+                for field in dict.fromkeys(field for field, _, _ in where)
+                if field not in columns_select
+            ]
+
+        with pq.ParquetFile(fpf) as pf:
+            names = set(pf.schema_arrow.names)
+            if columns_select:
+                missing = set(columns_select) - names
+                if missing:
+                    raise ErrorInitFrame(
+                        f'cannot load all columns in columns_select: missing {missing}'
+                    )
+            if where:
+                missing = {field for field, _, _ in where} - names
+                if missing:
+                    raise ErrorInitFrame(
+                        f'cannot filter by fields in where: missing {missing}'
+                    )
+                where = parquet_where_cast(where, pf.schema_arrow)
+
+            positions = parquet_row_groups_select(
+                pf.metadata,
+                row_groups=row_groups,
+                where=where,
+            )
+            expression = None if not where else parquet_where_to_expression(where)
+
+            def post(table: 'pyarrow.Table') -> 'pyarrow.Table':
+                if expression is not None:
+                    table = table.filter(expression)
+                if columns_read is not columns_select:
+                    table = table.select(columns_select)
+                return table
+
+            if combine:
+                yield post(
+                    pf.read_row_groups(
+                        positions,
+                        columns=columns_read,
+                        use_pandas_metadata=False,
+                    )
+                )
+            else:
+                for i in positions:
+                    table = post(
+                        pf.read_row_group(
+                            i,
+                            columns=columns_read,
+                            use_pandas_metadata=False,
+                        )
+                    )
+                    if table.num_rows or expression is None:
+                        yield table
+
     @classmethod
     @doc_inject(selector='from_any')
     def from_parquet(
@@ -3429,6 +4220,8 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         columns_name_depth_level: tp.Optional[TDepthLevel] = None,
         columns_constructors: TIndexCtorSpecifiers = None,
         columns_select: tp.Optional[tp.Iterable[str]] = None,
+        row_groups: tp.Optional[tp.Iterable[int]] = None,
+        where: tp.Optional[TReadWhere] = None,
         dtypes: TDtypesSpecifier = None,
         name: TLabel = None,
         consolidate_blocks: bool = False,
@@ -3445,46 +4238,24 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             columns_name_depth_level:
             columns_constructors:
             {columns_select}
+            row_groups: an iterable of row group positions to read; if None, all row groups are read.
+            where: an iterable of (field, operator, value) triples, combined with AND, to filter rows; operator is one of "==", "!=", "<", "<=", ">", ">=", or "in" (with an iterable value). Row groups whose statistics show that no row can match are not read.
             {dtypes}
             {name}
             {consolidate_blocks}
         """
-        import pyarrow.parquet as pq
-        from pyarrow.lib import ArrowInvalid
-
-        if columns_select and index_depth != 0:
-            raise ErrorInitFrame(
-                f'cannot load index_depth {index_depth} when columns_select is specified.'
-            )
-
-        fpf: str = path_filter(fp)  # type: ignore
-
-        if columns_select is not None and not isinstance(columns_select, list):
-            columns_select = list(columns_select)
-
-        # NOTE: the order of columns_select will determine their order
+        tables = cls._from_parquet_tables(
+            fp,
+            index_depth=index_depth,
+            columns_select=columns_select,
+            row_groups=row_groups,
+            where=where,
+            combine=True,
+        )
         try:
-            table = pq.read_table(
-                fp,
-                columns=columns_select,
-                use_pandas_metadata=False,
-            )
-        except ArrowInvalid:  # pragma: no cover
-            # support loading parquet files saved with pyarrow<1.0
-            # https://github.com/apache/arrow/issues/32660
-            table = pq.read_table(
-                fp,  # pragma: no cover
-                columns=columns_select,
-                use_pandas_metadata=False,
-                use_legacy_dataset=True,  # pyright: ignore
-            )
-        if columns_select:
-            # pq.read_table will silently accept requested columns that are not found; this can be identified if we got back fewer columns than requested
-            if len(table.column_names) < len(columns_select):
-                missing = set(columns_select) - set(table.column_names)
-                raise ErrorInitFrame(
-                    f'cannot load all columns in columns_select: missing {missing}'
-                )
+            table = next(tables)
+        finally:
+            tables.close()  # type: ignore
 
         return cls.from_arrow(
             table,
@@ -3499,6 +4270,65 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name=name,
         )
 
+    @classmethod
+    @doc_inject(selector='from_any')
+    def from_parquet_iter(
+        cls,
+        fp: TPathSpecifier,
+        /,
+        *,
+        index_depth: int = 0,
+        index_name_depth_level: tp.Optional[TDepthLevel] = None,
+        index_constructors: TIndexCtorSpecifiers = None,
+        columns_depth: int = 1,
+        columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+        columns_constructors: TIndexCtorSpecifiers = None,
+        columns_select: tp.Optional[tp.Iterable[str]] = None,
+        row_groups: tp.Optional[tp.Iterable[int]] = None,
+        where: tp.Optional[TReadWhere] = None,
+        dtypes: TDtypesSpecifier = None,
+        name: TLabel = None,
+        consolidate_blocks: bool = False,
+    ) -> tp.Iterator[tp.Self]:
+        """
+        Frame generator from a Parquet file, yielding a :obj:`Frame` for each selected row group. Only one row group is held in memory at a time. Row groups that have no rows matching ``where`` are not yielded.
+
+        Args:
+            {fp}
+            {index_depth}
+            index_name_depth_level:
+            index_constructors:
+            {columns_depth}
+            columns_name_depth_level:
+            columns_constructors:
+            {columns_select}
+            row_groups: an iterable of row group positions to read; if None, all row groups are read.
+            where: an iterable of (field, operator, value) triples, combined with AND, to filter rows; operator is one of "==", "!=", "<", "<=", ">", ">=", or "in" (with an iterable value). Row groups whose statistics show that no row can match are not read.
+            {dtypes}
+            {name}
+            {consolidate_blocks}
+        """
+        for table in cls._from_parquet_tables(
+            fp,
+            index_depth=index_depth,
+            columns_select=columns_select,
+            row_groups=row_groups,
+            where=where,
+            combine=False,
+        ):
+            yield cls.from_arrow(
+                table,
+                index_depth=index_depth,
+                index_name_depth_level=index_name_depth_level,
+                index_constructors=index_constructors,
+                columns_depth=columns_depth,
+                columns_name_depth_level=columns_name_depth_level,
+                columns_constructors=columns_constructors,
+                dtypes=dtypes,
+                consolidate_blocks=consolidate_blocks,
+                name=name,
+            )
+
     # ---------------------------------------------------------------------------
     def __init__(
         self,
@@ -6208,6 +7038,107 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             )
         )
 
+    def _axis_group_loc_starts(
+        self,
+        key: TLocSelector,
+    ) -> tp.Optional[tp.Tuple[TNDArrayAny, TNDArrayAny, TNDArrayAny, TNDArrayAny]]:
+        """
+        For grouping rows by a single column, return the stable ordering of rows by group, the start and count of each group in that ordering, and the group labels. Return None if the key does not select a single, sortable column free of missing values.
+        """
+        if not self._blocks.shape[0]:
+            return None
+        iloc_key = self._columns._loc_to_iloc(key)
+        if not isinstance(iloc_key, INT_TYPES):
+            return None
+        group_source = self._blocks._extract_array_column(iloc_key)
+        if group_source.dtype == DTYPE_OBJECT or isna_array(group_source).any():
+            return None
+
+        ordering = np.argsort(group_source, kind=DEFAULT_STABLE_SORT_KIND)
+        group_source = group_source[ordering]
+        transitions = np.empty(len(group_source), dtype=DTYPE_BOOL)
+        transitions[0] = True
+        transitions[1:] = group_source[1:] != group_source[:-1]
+        starts = nonzero_1d(transitions)
+        counts = np.diff(starts, append=len(group_source))
+        return ordering, starts, counts, group_source[starts]
+
+    def _axis_group_loc_reduce(
+        self,
+        key: TLocSelector,
+        *,
+        iloc_to_func: tp.Sequence[tp.Tuple[tp.Any, TCallableAny]],
+        axis: int = 0,
+        drop: bool = False,
+        as_array: bool = False,
+    ) -> tp.Optional[tp.Tuple[TNDArrayAny, tp.List[TNDArrayAny]]]:
+        """
+        Reduce groups of rows per column without creating a ``Frame`` per group, returning the group labels and one array per pair of column position and function. Return None if the grouping or any function is not supported.
+
+        Args:
+            iloc_to_func: pairs of column positions (after ``drop``) and functions.
+        """
+        if axis != 0 or as_array:
+            return None
+        for iloc, func in iloc_to_func:
+            if not isinstance(iloc, INT_TYPES) or func not in UFUNC_GROUP_REDUCE:
+                return None
+        if (prepared := self._axis_group_loc_starts(key)) is None:
+            return None
+
+        ordering, starts, counts, labels = prepared
+        positions: TNDArrayAny | range = range(self._blocks.shape[1])
+        if drop:
+            positions = np.arange(self._blocks.shape[1])
+            positions = positions[positions != self._columns._loc_to_iloc(key)]
+
+        blocks = []
+        for iloc, func in iloc_to_func:
+            array = self._blocks._extract_array_column(positions[iloc])
+            post = ufunc_group_reduce(
+                array[ordering],
+                starts,
+                counts,
+                func,
+                dtype=ufunc_dtype_to_dtype(func, array.dtype),
+            )
+            if post is None:
+                return None
+            post.flags.writeable = False
+            blocks.append(post)
+        return labels, blocks
+
+    def _axis_group_loc_array_reduce(
+        self,
+        func: TCallableAny,
+        key: TLocSelector,
+        *,
+        axis: int = 0,
+        drop: bool = False,
+        as_array: bool = False,
+    ) -> tp.Optional[tp.Tuple[TNDArrayAny, TNDArrayAny]]:
+        """
+        Reduce each group of rows, given as an array, with ``func``, without extracting an array per group, returning the group labels and the reduced values. Return None if the grouping or function is not supported.
+        """
+        if axis != 0 or not as_array or func not in UFUNC_GROUP_REDUCE:
+            return None
+        if (prepared := self._axis_group_loc_starts(key)) is None:
+            return None
+
+        ordering, starts, counts, labels = prepared
+        if drop:
+            drop_mask = np.full(self._blocks.shape[1], True, dtype=DTYPE_BOOL)
+            drop_mask[self._columns._loc_to_iloc(key)] = False
+            values = self._blocks._extract_array(ordering, drop_mask)
+        else:
+            values = self._blocks._extract_array(ordering)
+
+        post = ufunc_group_reduce(values, starts, counts, func)
+        if post is None:
+            return None
+        post.flags.writeable = False
+        return labels, post
+
     # -----------------------------------------------------------------------
     def _axis_group_labels_items(
         self,
@@ -6440,6 +7371,72 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             derive_label=True,
         )
 
+    def _axis_window_reduce(
+        self,
+        *,
+        iloc_to_func: tp.Sequence[tp.Tuple[tp.Any, TCallableAny]],
+        size: int,
+        axis: int = 0,
+        step: int = 1,
+        window_sized: bool = True,
+        window_func: tp.Optional[TCallableAny] = None,
+        window_valid: tp.Optional[TCallableAny] = None,
+        label_shift: int = 0,
+        label_missing_skips: bool = True,
+        label_missing_raises: bool = False,
+        start_shift: int = 0,
+        size_increment: int = 0,
+        as_array: bool = False,
+    ) -> tp.Optional[tp.Tuple[tp.Sequence[TLabel], tp.List[TNDArrayAny]]]:
+        """
+        Reduce windows of rows per column without creating a ``Frame`` per window, returning the window labels and one array per pair of column position and function. Return None if the windows or any function are not supported.
+
+        Args:
+            iloc_to_func: pairs of column positions and functions.
+        """
+        if (
+            axis != 0
+            or window_func is not None
+            or window_valid is not None
+            or size <= 0
+            or step < 0
+        ):
+            return None
+        if as_array and not self._blocks.unified_dtypes:
+            # columns of windows are taken from consolidated values
+            return None
+        for iloc, func in iloc_to_func:
+            if not isinstance(iloc, INT_TYPES) or func not in WINDOW_REDUCE_FUNCS:
+                return None
+
+        bounds = window_bounds(
+            count_labels=self._blocks.shape[0],
+            size=size,
+            step=step,
+            window_sized=window_sized,
+            label_shift=label_shift,
+            label_missing_skips=label_missing_skips,
+            label_missing_raises=label_missing_raises,
+            start_shift=start_shift,
+            size_increment=size_increment,
+        )
+        if bounds is None or not len(bounds[0]):
+            return None
+        starts, stops, idx_labels, label_invalid = bounds
+
+        blocks = []
+        for iloc, func in iloc_to_func:
+            array = self._blocks._extract_array_column(iloc)
+            post = window_reduce(array, starts, stops, func)
+            if post is None:
+                return None
+            dtype = ufunc_dtype_to_dtype(func, array.dtype)
+            if dtype is not None and len(post):
+                post = post.astype(dtype, copy=False)
+            post.flags.writeable = False
+            blocks.append(post)
+        return window_labels(self._index, idx_labels, label_invalid), blocks
+
     def _axis_window(
         self,
         *,
@@ -9134,42 +10131,35 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             zip(major, (tuple(zip(minor, v)) for v in self._blocks.axis_values(axis)))
         )
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
-        v = []
+    ) -> tp.Iterator[bytes | memoryview]:
         for a in self._blocks._blocks:
             if a.dtype == DTYPE_OBJECT:
                 raise TypeError('Object dtypes do not have stable hashes')
-            # NOTE: use Fortran ordering to ensure uniform result regardless of block consolidation
-            v.append(a.tobytes('F'))
 
-        return b''.join(
-            chain(
-                iter_component_signature_bytes(
-                    self,
-                    include_name=include_name,
-                    include_class=include_class,
-                    encoding=encoding,
-                ),
-                (
-                    self._index._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding,
-                    ),
-                    self._columns._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding,
-                    ),
-                ),
-                v,
-            )
+        yield from iter_component_signature_bytes(
+            self,
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        yield from self._index._iter_signature_bytes(
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        yield from self._columns._iter_signature_bytes(
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
         )
+        for a in self._blocks._blocks:
+            # NOTE: bytes are yielded in Fortran ordering to ensure uniform result regardless of block consolidation
+            yield from iter_array_signature_bytes(a)
 
     # ---------------------------------------------------------------------------
     # exporters: alternate libraries
@@ -9208,9 +10198,13 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         include_index_name: bool = True,
         include_columns: bool = True,
         include_columns_name: bool = False,
+        zero_copy_only: bool = False,
     ) -> 'pyarrow.Table':
         """
-        Return a ``pyarrow.Table`` from this :obj:`Frame`.
+        Return a ``pyarrow.Table`` from this :obj:`Frame`. Contiguous arrays of integer, float, and datetime64 (with units supported by Arrow) types share memory with the resulting Arrow arrays.
+
+        Args:
+            zero_copy_only: If True, raise if any column cannot be exported without a copy.
         """
         import pyarrow
 
@@ -9230,6 +10224,20 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 Store.get_column_iterator(frame=self, include_index=include_index),
                 dtypes,
             ):
+                if zero_copy_only and not (
+                    array.flags.c_contiguous
+                    and (
+                        dtype.kind == DTYPE_FLOAT_KIND
+                        or dtype.kind in DTYPE_INT_KINDS
+                        or (
+                            dtype.kind == DTYPE_DATETIME_KIND
+                            and np.datetime_data(dtype)[0] in DTU_PYARROW_ZERO_COPY
+                        )
+                    )
+                ):
+                    raise ValueError(
+                        f'Array of dtype {dtype} cannot be exported without a copy.'
+                    )
                 if (
                     dtype.kind == DTYPE_DATETIME_KIND
                     and np.datetime_data(dtype)[0] not in DTU_PYARROW
@@ -9250,9 +10258,13 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         include_index_name: bool = True,
         include_columns: bool = True,
         include_columns_name: bool = False,
+        row_group_size: tp.Optional[int] = None,
     ) -> None:
         """
         Write an Arrow Parquet binary file.
+
+        Args:
+            row_group_size: the maximum number of rows in each row group; if None, the pyarrow default is used.
         """
         import pyarrow.parquet as pq
 
@@ -9264,7 +10276,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         )
         fpf = path_filter(fp)  # type: ignore
         # NOTE:  compression='none' shown to not provide a clear performance improvement over the assumed default, 'snappy'
-        pq.write_table(table, fpf)
+        pq.write_table(table, fpf, row_group_size=row_group_size)
 
     def to_xarray(self) -> 'Dataset':
         """
@@ -9852,6 +10864,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         schema: str = '',
         placeholder: str = '',
         dtype_to_type_decl: Mapping[TDtypeAny, str] | None = None,
+        chunksize: int = 1_000,
     ) -> None:
         """
         Write `Frame` to the database provided by `connection`. Connections to SQLite, PostgreSQL, MySQL, and MariaDB are fully supported. The table name can be provided by `label`, otherwise `Frame.name` will be used. If the target table does not exist, it will be created using optimal mappings to NumPy dtypes. If the target table exists, records will be appended. Parameterized insert queries are always used. Records will never be deleted, nor tables dropped.
@@ -9864,6 +10877,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             `schema`: If provided, this string will be used as a database schema label to prefix the table name in all SQL queries.
             `placeholder`: String used as a placeholder in parameterized insert queries. Correct defaults are provided for SQLite, PostgreSQL, MySQL, and MariaDB.
             `dtype_to_type_decl`: Mapping from NumPy dtype to a string to be used in type declaration when creating tables. Sensible defaults are provided for SQLite, PostgreSQL, MySQL, and MariaDB.
+            `chunksize`: The maximum number of rows inserted per multi-row insert query; fewer rows are used if needed to not exceed the database's limit on parameters. All queries are executed in the connection's current transaction.
         """
         if label is STORE_LABEL_DEFAULT:
             if not self.name:
@@ -9880,6 +10894,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             label=label,
             schema=schema,
             include_index=include_index,
+            chunksize=chunksize,
         )
 
     # ---------------------------------------------------------------------------
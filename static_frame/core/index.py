@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections import Counter
 from copy import deepcopy
-from itertools import chain, zip_longest
+from itertools import zip_longest
 
 import numpy as np
 import typing_extensions as tp
@@ -25,6 +25,7 @@ from static_frame.core.container_util import (
     apply_binary_operator,
     index_from_optional_constructor,
     index_many_to_one,
+    iter_array_signature_bytes,
     iter_component_signature_bytes,
     key_from_container_key,
     matmul,
@@ -172,6 +173,34 @@ class _ArgsortCache(tp.NamedTuple):
         return obj
 
 
+class _MapDeferred:
+    """Holder assigned to ``Index._map`` when the ``FrozenAutoMap`` is not created until first needed. The holder is shared by ``Index`` that share labels, such that the map is created once for all of them. Pickles and copies as a new, empty holder."""
+
+    __slots__ = ('map',)
+
+    def __init__(self) -> None:
+        self.map: tp.Optional[FrozenAutoMap] = None
+
+    def __reduce__(self) -> tp.Tuple[tp.Type[_MapDeferred], tp.Tuple[()]]:
+        return (_MapDeferred, ())
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}>'
+
+
+# dtype kinds for which strict monotonicity, found with vectorized comparisons, proves uniqueness
+DTYPE_KINDS_DEFERRED_MAP = frozenset(('i', 'u', 'f', 'U', 'S', 'M', 'm'))
+
+
+def sort_status_strict(labels: TNDArrayAny) -> SortStatus:
+    """Return ASC or DESC if the (non-object) ``labels`` are strictly ascending or descending (and thus unique), or otherwise UNKNOWN."""
+    if (labels[1:] > labels[:-1]).all():
+        return SortStatus.ASC
+    if (labels[1:] < labels[:-1]).all():
+        return SortStatus.DESC
+    return SortStatus.UNKNOWN
+
+
 TVDtype = tp.TypeVar('TVDtype', bound=np.generic, default=tp.Any)
 
 
@@ -186,6 +215,7 @@ class Index(IndexBase, tp.Generic[TVDtype]):
         '_name',
         '_argsort_cache',
         '_sort_status',
+        '_sort_status_checked',
     )
 
     # _IMMUTABLE_CONSTRUCTOR is None from IndexBase
@@ -199,19 +229,20 @@ class Index(IndexBase, tp.Generic[TVDtype]):
     depth: int = 1
     _NDIM: int = 1
 
-    _map: tp.Optional[FrozenAutoMap]
+    _map: tp.Optional[FrozenAutoMap | _MapDeferred]
     _labels: TNDArrayAny
     _positions: TNDArrayAny
     _recache: bool
     _name: TName
     _argsort_cache: tp.Optional[_ArgsortCache]
     _sort_status: SortStatus
+    _sort_status_checked: bool
 
     # ---------------------------------------------------------------------------
     # methods used in __init__ that are customized in derived classes; there, we need to mutate instance state, this these are instance methods
     @staticmethod
     def _extract_labels(
-        mapping: tp.Dict[TLabel, int] | FrozenAutoMap | None,
+        mapping: tp.Dict[TLabel, int] | FrozenAutoMap | _MapDeferred | None,
         labels: tp.Iterable[TLabel],
         dtype: TDtypeSpecifier = None,
     ) -> TNDArrayAny:
@@ -398,7 +429,7 @@ class Index(IndexBase, tp.Generic[TVDtype]):
         {args}
         """
         self._recache: bool = False
-        self._map: tp.Optional[FrozenAutoMap] = None
+        self._map: tp.Optional[FrozenAutoMap | _MapDeferred] = None
         self._argsort_cache: tp.Optional[_ArgsortCache] = None
 
         positions: TNDArrayAny | None = None
@@ -431,7 +462,7 @@ class Index(IndexBase, tp.Generic[TVDtype]):
             if labels.depth == 1:  # not an IndexHierarchy
                 if labels.STATIC and self.STATIC and dtype is None:
                     if not is_typed or (is_typed and self._DTYPE == labels.dtype):  # type: ignore
-                        # can take the map if static and if types in the dict are the same as those in the labels (or to become the labels after conversion)
+                        # can take the map if static and if types in the dict are the same as those in the labels (or to become the labels after conversion); a deferred map is shared, such that it is created once
                         self._map = labels._map  # type: ignore
                 # get a reference to the immutable arrays, even if this is an IndexGO index, we can take the cached arrays, assuming they are up to date; for datetime64 indices, we might need to translate to a different type
                 positions = labels._positions  # type: ignore
@@ -471,14 +502,27 @@ class Index(IndexBase, tp.Generic[TVDtype]):
                     raise ErrorInitIndex(
                         'Cannot create an Index from a single string; provide an iterable of strings.'
                     )
-                try:
-                    self._map = FrozenAutoMap(labels) if self.STATIC else AutoMap(labels)
-                except (
-                    NonUniqueError
-                ):  # Automap will raise ValueError of non-unique values are encountered
-                    raise self._error_init_index_non_unique(labels) from None
-                # must take length after map as might be iterator
-                size = len(self._map)  # pyright: ignore
+                if (
+                    self.STATIC
+                    # NOTE: use isinstance, as the attributes of some iterators (such as from arraykit.array_to_tuple_iter) are not available before iteration
+                    and isinstance(labels, np.ndarray)
+                    and len(labels) > 1
+                    and labels.dtype.kind in DTYPE_KINDS_DEFERRED_MAP
+                    and (dtype_extract is None or dtype_extract == labels.dtype)
+                    and sort_status_strict(labels) is not SortStatus.UNKNOWN
+                ):
+                    # strictly ordered labels are unique: defer creating the map until first lookup
+                    self._map = _MapDeferred()
+                    size = len(labels)
+                else:
+                    try:
+                        self._map = (
+                            FrozenAutoMap(labels) if self.STATIC else AutoMap(labels)
+                        )
+                    except NonUniqueError:  # Automap will raise ValueError of non-unique values are encountered
+                        raise self._error_init_index_non_unique(labels) from None
+                    # must take length after map as might be iterator
+                    size = len(self._map)  # pyright: ignore
 
                 if labels.__class__ is range:
                     sort_status = SortStatus.from_range_step(labels.step)  # type: ignore
@@ -487,8 +531,8 @@ class Index(IndexBase, tp.Generic[TVDtype]):
                 size = len(labels)  # type: ignore
                 if positions is None:
                     positions = labels  # type: ignore
-        else:  # map shared from another Index
-            size = len(self._map)
+        else:  # map shared from another Index, possibly deferred
+            size = len(labels)  # type: ignore
 
         # this might be NP array, or a list, depending on if static or grow only; if an array, dtype will be compared with passed dtype_extract
         self._labels: TNDArrayAny = self._extract_labels(self._map, labels, dtype_extract)
@@ -498,6 +542,7 @@ class Index(IndexBase, tp.Generic[TVDtype]):
             self._sort_status = SortStatus.ASC
         else:
             self._sort_status = sort_status
+        self._sort_status_checked = False
 
         if self._DTYPE and self._labels.dtype != self._DTYPE:
             raise ErrorInitIndex(
@@ -533,6 +578,7 @@ class Index(IndexBase, tp.Generic[TVDtype]):
         obj._name = self._name  # should be hashable/immutable
         obj._argsort_cache = deepcopy(self._argsort_cache, memo)
         obj._sort_status = self._sort_status  # Enum is immutable
+        obj._sort_status_checked = self._sort_status_checked
 
         memo[id(self)] = obj
         return obj
@@ -892,6 +938,31 @@ class Index(IndexBase, tp.Generic[TVDtype]):
 
         return self._argsort_cache
 
+    def _get_sort_status(self) -> SortStatus:
+        """
+        Return the :obj:`SortStatus` of the labels. If unknown, on first use, labels that are not of object dtype are checked to be ascending or descending, and the result is cached.
+        """
+        if self._sort_status is SortStatus.UNKNOWN and not self._sort_status_checked:
+            if self._recache:
+                self._update_array_cache()
+            if self._labels.dtype != DTYPE_OBJECT:
+                # labels are unique, so sorted labels are strictly ordered
+                self._sort_status = sort_status_strict(self._labels)
+            self._sort_status_checked = True
+        return self._sort_status
+
+    def _get_map(self) -> FrozenAutoMap:
+        """
+        Return the mapping of labels to positions, creating it on first use if its creation was deferred.
+        """
+        if self._map.__class__ is _MapDeferred:
+            # labels were found to be unique on initialization; the map might have been created by an Index sharing the holder
+            deferred: _MapDeferred = self._map
+            if deferred.map is None:
+                deferred.map = FrozenAutoMap(self._labels)
+            self._map = deferred.map
+        return self._map  # type: ignore
+
     def _index_iloc_map(self, other: Index) -> TNDArrayAny:
         """
         Return an array of index locations to map from this array to another
@@ -913,6 +984,7 @@ class Index(IndexBase, tp.Generic[TVDtype]):
 
             if self._sort_status is SortStatus.DESC:
                 ar1 = ar1[::-1]
+                ar1_indexer = ar1_indexer[::-1]
 
         ar2 = other.values
 
@@ -1043,11 +1115,12 @@ class Index(IndexBase, tp.Generic[TVDtype]):
             self._update_array_cache()
 
         return LocMap.loc_to_iloc(  # can rause IndexError
-            label_to_pos=self._map,
+            label_to_pos=self._get_map(),
             labels=self._labels,
             positions=self._positions,  # always an np.ndarray
             key=key,
             partial_selection=partial_selection,
+            sort_status=self._get_sort_status,
         )
 
     @tp.overload
@@ -1306,7 +1379,7 @@ class Index(IndexBase, tp.Generic[TVDtype]):
             if isinstance(value, INT_TYPES):
                 return value >= 0 and value < len(self)  # type: ignore
             return False
-        return self._map.__contains__(value)
+        return self._get_map().__contains__(value)
 
     # ---------------------------------------------------------------------------
     # utility functions
@@ -1712,25 +1785,21 @@ class Index(IndexBase, tp.Generic[TVDtype]):
             return pandas.RangeIndex(self.__len__(), name=self._name)  # pyright: ignore
         return pandas.Index(self.values.copy(), name=self._name)
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
+    ) -> tp.Iterator[bytes | memoryview]:
         if self.dtype == DTYPE_OBJECT:
             raise TypeError('Object dtypes do not have stable hashes')
-        return b''.join(
-            chain(
-                iter_component_signature_bytes(
-                    self,
-                    include_name=include_name,
-                    include_class=include_class,
-                    encoding=encoding,
-                ),
-                (self.values.tobytes(),),
-            )
+        yield from iter_component_signature_bytes(
+            self,
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
         )
+        yield from iter_array_signature_bytes(self.values)
 
 
 doc_update(Index.__init__, selector='index_init')
@@ -1752,6 +1821,7 @@ class _IndexGOMixin:
     _positions_mutable_count: int
     _argsort_cache: tp.Optional[_ArgsortCache]
     _sort_status: SortStatus
+    _sort_status_checked: bool
     _name: TLabel
 
     # ---------------------------------------------------------------------------
@@ -1770,6 +1840,7 @@ class _IndexGOMixin:
         obj._positions_mutable_count = self._positions_mutable_count
         obj._argsort_cache = deepcopy(self._argsort_cache, memo)
         obj._sort_status = self._sort_status
+        obj._sort_status_checked = self._sort_status_checked
 
         memo[id(self)] = obj
         return obj
@@ -671,10 +671,10 @@ class IndexBase(ContainerOperandSequence):
     def to_pandas(self) -> 'pandas.Index':
         raise NotImplementedError()  # pragma: no cover
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
+    ) -> tp.Iterator[bytes | memoryview]:
         raise NotImplementedError()  # pragma: no cover
@@ -24,6 +24,7 @@ from static_frame.core.util import (
     DT64_US,
     DT64_YEAR,
     DTYPE_BOOL,
+    DTYPE_DATETIME_KIND,
     NAME_DEFAULT,
     TD64_DAY,
     TD64_MONTH,
@@ -103,7 +104,7 @@ class IndexDatetime(Index[np.datetime64]):
             v = to_datetime64(value)
         except ValueError:  # cannot be converted to dt64
             return False
-        return self._map.__contains__(v)  # type: ignore
+        return self._get_map().__contains__(v)
 
     # ---------------------------------------------------------------------------
     # operators
@@ -206,9 +207,20 @@ class IndexDatetime(Index[np.datetime64]):
             {side_left}
         """
         # permit variable forms of date specification
+        values = key_to_datetime_key(values)
+        if (
+            values.__class__ is np.datetime64 or values.__class__ is np.ndarray
+        ) and values.dtype.kind == DTYPE_DATETIME_KIND:
+            if self._DTYPE < values.dtype:
+                # values are more granular than labels: search at the unit of labels rather than converting all labels. As labels are whole units, searching left from a value is searching left from its ceiling, and searching right from a value is searching right from its floor.
+                floor = values.astype(self._DTYPE)
+                if side_left:
+                    values = floor + (floor.astype(values.dtype) != values)
+                else:
+                    values = floor
         return Index.iloc_searchsorted(
             self,
-            key_to_datetime_key(values),
+            values,
             side_left=side_left,
         )
 
@@ -344,7 +356,7 @@ class IndexYear(IndexDatetime):
     ) -> bool:
         """Return True if value in the labels. Will only return True for an exact match to the type of dates stored within."""
         try:
-            return self._map.__contains__(to_datetime64(value, self._DTYPE))  # type: ignore
+            return self._get_map().__contains__(to_datetime64(value, self._DTYPE))
         except InvalidDatetime64Initializer:
             # if value is a dt64 and not of a the same unit as self._DTYPE, the initializations exception is raised, which means False
             return False
@@ -5,7 +5,6 @@ import operator
 from ast import literal_eval
 from copy import deepcopy
 from functools import partial
-from itertools import chain
 
 import numpy as np
 import typing_extensions as tp
@@ -22,6 +21,7 @@ from static_frame.core.container_util import (
     constructor_from_optional_constructor,
     get_col_dtype_factory,
     index_from_optional_constructor,
+    iter_array_signature_bytes,
     iter_component_signature_bytes,
     key_from_container_key,
     matmul,
@@ -3022,30 +3022,27 @@ class IndexHierarchy(IndexBase, tp.Generic[tp.Unpack[TVIndices]]):
 
         return tp.cast(TFrameGOAny, self._to_frame(FrameGO))
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
-        v = []
+    ) -> tp.Iterator[bytes | memoryview]:
+        arrays = []
         for i in range(self.depth):
             a = self.values_at_depth(i)
             if a.dtype == DTYPE_OBJECT:
                 raise TypeError('Object dtypes do not have stable hashes')
-            v.append(a.tobytes())
-
-        return b''.join(
-            chain(
-                iter_component_signature_bytes(
-                    self,
-                    include_name=include_name,
-                    include_class=include_class,
-                    encoding=encoding,
-                ),
-                v,
-            )
+            arrays.append(a)
+
+        yield from iter_component_signature_bytes(
+            self,
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
         )
+        for a in arrays:
+            yield from iter_array_signature_bytes(a)
 
     # --------------------------------------------------------------------------
     def to_pandas(self) -> pandas.MultiIndex:
@@ -22,6 +22,7 @@ from static_frame.core.container import (
 )
 from static_frame.core.display import DisplayActive
 from static_frame.core.display_config import _DEFAULT_ELLIPSIS, DisplayConfig
+from static_frame.core.executor import ExecutorContext
 from static_frame.core.fill_value_auto import FillValueAuto
 from static_frame.core.frame import Frame, FrameAsType, FrameGO, FrameHE
 from static_frame.core.hloc import HLoc
@@ -149,6 +150,7 @@ DOCUMENTED_COMPONENTS = (
     DisplayConfig,
     StoreConfig,
     StoreFilter,
+    ExecutorContext,
     IndexAutoFactory,
     IndexDefaultConstructorFactory,
     IndexAutoConstructorFactory,
@@ -1387,6 +1389,7 @@ class InterfaceSummary(Features):
                 DisplayConfig,
                 StoreFilter,
                 StoreConfig,
+                ExecutorContext,
                 DisplayActive,
                 Platform,
                 WWW,
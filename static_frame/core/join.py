@@ -14,8 +14,14 @@ from static_frame.core.container_util import (
 from static_frame.core.index import Index
 from static_frame.core.type_blocks import TypeBlocks
 from static_frame.core.util import (
+    DEFAULT_STABLE_SORT_KIND,
     DTYPE_BOOL,
+    DTYPE_INEXACT_KINDS,
+    DTYPE_INT_DEFAULT,
+    DTYPE_NAT_KINDS,
+    DTYPE_NUMERICABLE_KINDS,
     DTYPE_OBJECT,
+    DTYPE_OBJECT_KIND,
     EMPTY_ARRAY_INT,
     NULL_SLICE,
     Join,
@@ -24,8 +30,10 @@ from static_frame.core.util import (
     TLocSelector,
     TNDArray1DBool,
     TNDArrayAny,
+    TNDArrayIntDefault,
     WarningsSilent,
     dtype_from_element,
+    ufunc_unique1d_indexer,
 )
 
 if tp.TYPE_CHECKING:
@@ -34,6 +42,11 @@ if tp.TYPE_CHECKING:
 
 # -------------------------------------------------------------------------------
 
+# kinds that, when compared with each other, can be factorized with the same semantics as element-wise comparison
+_JOIN_SAME_KINDS = frozenset(('U', 'S', 'M', 'm'))
+# kinds that can be hashed together with object arrays
+_JOIN_HASHABLE_KINDS = frozenset(('O', 'b', 'i', 'u', 'f', 'U', 'S'))
+
 
 def _join_trimap_target_one(
     src_target: TNDArrayAny,
@@ -120,6 +133,124 @@ def _join_trimap_target_many(
     return tm
 
 
+def _join_codes(
+    src: TNDArrayAny,
+    dst: TNDArrayAny,
+) -> tp.Optional[tp.Tuple[TNDArrayIntDefault, TNDArrayIntDefault]]:
+    """
+    Factorize `src` and `dst` into shared integer codes, such that elements that compare equal have the same code; elements that can never match (such as NaN and NaT) are given -1. Returns None if arrays cannot be factorized with the same semantics as element-wise comparison.
+    """
+    src_kind = src.dtype.kind
+    dst_kind = dst.dtype.kind
+
+    if src_kind == DTYPE_OBJECT_KIND or dst_kind == DTYPE_OBJECT_KIND:
+        # NOTE: hashes of NumPy scalars of these kinds are consistent with their Python equivalents
+        if src_kind not in _JOIN_HASHABLE_KINDS or dst_kind not in _JOIN_HASHABLE_KINDS:
+            return None
+        code_map: tp.Dict[tp.Any, int] = {}
+        try:
+            with WarningsSilent():
+                # NOTE: `e == e` excludes NaN, which never compares equal
+                codes_dst = np.fromiter(
+                    (
+                        code_map.setdefault(e, len(code_map)) if e == e else -1
+                        for e in dst
+                    ),
+                    dtype=DTYPE_INT_DEFAULT,
+                    count=len(dst),
+                )
+                codes_src = np.fromiter(
+                    (code_map.get(e, -1) if e == e else -1 for e in src),
+                    dtype=DTYPE_INT_DEFAULT,
+                    count=len(src),
+                )
+        except (TypeError, ValueError):  # unhashable, or ambiguous truth values
+            return None
+        return codes_src, codes_dst
+
+    if src_kind in DTYPE_NUMERICABLE_KINDS and dst_kind in DTYPE_NUMERICABLE_KINDS:
+        pass
+    elif src_kind != dst_kind or src_kind not in _JOIN_SAME_KINDS:
+        return None
+
+    # NOTE: comparison promotes to the same type
+    dtype = np.promote_types(src.dtype, dst.dtype)
+    values = np.concatenate(
+        (src.astype(dtype, copy=False), dst.astype(dtype, copy=False))
+    )
+    _, codes = ufunc_unique1d_indexer(values)
+
+    if dtype.kind in DTYPE_INEXACT_KINDS:
+        codes = np.where(np.isnan(values), -1, codes)
+    elif dtype.kind in DTYPE_NAT_KINDS:
+        codes = np.where(np.isnat(values), -1, codes)
+
+    return codes[: len(src)], codes[len(src) :]
+
+
+def _join_trimap_codes(
+    src_target: list[TNDArrayAny],
+    dst_target: list[TNDArrayAny],
+    join_type: Join,
+) -> tp.Optional[TriMap]:
+    """
+    A TriMap constructor and mapper that factorizes each depth of the target into shared integer codes, and finds matches by sorting destination codes. Returns None if any depth cannot be factorized.
+    """
+    codes_src: tp.Optional[TNDArrayIntDefault] = None
+    codes_dst: tp.Optional[TNDArrayIntDefault] = None
+
+    for src, dst in zip(src_target, dst_target):
+        # NOTE: column selections of single-row frames can be 2D arrays of one column
+        if src.ndim == 2 and src.shape[1] == 1:
+            src = src.reshape(-1)
+        if dst.ndim == 2 and dst.shape[1] == 1:
+            dst = dst.reshape(-1)
+        if src.ndim != 1 or dst.ndim != 1:
+            return None
+        post = _join_codes(src, dst)
+        if post is None:
+            return None
+        if codes_src is None or codes_dst is None:
+            codes_src, codes_dst = post
+            continue
+        # combine with codes of previous depths, retaining -1 for non-matching
+        count = max(post[0].max(initial=0), post[1].max(initial=0)) + 1
+        codes = np.concatenate((codes_src * count + post[0], codes_dst * count + post[1]))
+        invalid = np.concatenate(
+            ((codes_src < 0) | (post[0] < 0), (codes_dst < 0) | (post[1] < 0))
+        )
+        _, codes = ufunc_unique1d_indexer(codes)  # compact the range of codes
+        codes = np.where(invalid, -1, codes)
+        codes_src = codes[: len(src)]
+        codes_dst = codes[len(src) :]
+
+    assert codes_src is not None and codes_dst is not None
+    dst_count = len(codes_dst)
+    tm = TriMap(len(codes_src), dst_count)
+
+    # stable sort retains ascending destination positions for each code
+    dst_order = np.argsort(codes_dst, kind=DEFAULT_STABLE_SORT_KIND)
+    codes_dst_sorted = codes_dst[dst_order]
+    starts = np.searchsorted(codes_dst_sorted, codes_src, 'left')
+    counts = np.searchsorted(codes_dst_sorted, codes_src, 'right') - starts
+    counts[codes_src < 0] = 0
+
+    dst_order_list = dst_order.tolist()
+    register_one = tm.register_one
+    for src_i, (count, start) in enumerate(zip(counts.tolist(), starts.tolist())):
+        if count == 0:
+            if join_type is not Join.INNER:
+                register_one(src_i, -1)
+        elif count == 1:
+            register_one(src_i, dst_order_list[start])
+        else:  # one source value to many positions
+            tm.register_many(src_i, dst_order[start : start + count])
+
+    if join_type is Join.OUTER:
+        tm.register_unmatched_dst()
+    return tm
+
+
 def join(
     frame: TFrameAny,
     other: TFrameAny,  # support a named Series as a 1D frame?
@@ -192,10 +323,16 @@ def join(
         src_target = left_target
         dst_target = right_target
 
-    if target_depth == 1:
-        tm = _join_trimap_target_one(src_target, dst_target, join_type)  # type: ignore
-    else:
-        tm = _join_trimap_target_many(src_target, dst_target, join_type, target_depth)  # type: ignore
+    tm = _join_trimap_codes(
+        [src_target] if target_depth == 1 else src_target,  # type: ignore
+        [dst_target] if target_depth == 1 else dst_target,  # type: ignore
+        join_type,
+    )
+    if tm is None:  # fall back to element-wise comparison
+        if target_depth == 1:
+            tm = _join_trimap_target_one(src_target, dst_target, join_type)  # type: ignore
+        else:
+            tm = _join_trimap_target_many(src_target, dst_target, join_type, target_depth)  # type: ignore
     tm.finalize()
 
     # ---------------------------------------------------------------------------
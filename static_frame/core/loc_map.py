@@ -32,9 +32,11 @@ from static_frame.core.util import (
     SLICE_START_ATTR,
     SLICE_STEP_ATTR,
     SLICE_STOP_ATTR,
+    SortStatus,
     TILocSelector,
     TLabel,
     TLocSelector,
+    ufunc_unique1d,
 )
 
 if tp.TYPE_CHECKING:
@@ -51,6 +53,14 @@ TypePos = tp.Optional[int]
 LocEmptyInstance = LocEmpty()
 
 
+def dt64_unit_bounds(
+    key: np.datetime64 | TNDArrayAny,
+    dtype: TDtypeAny,
+) -> tp.Tuple[tp.Any, tp.Any]:
+    """Given a datetime64 ``key`` (or array of keys) of a unit less granular than ``dtype``, return the start of the key's unit, and the start of the next unit, in ``dtype``. Labels of ``dtype`` that fall within the key's unit are within this half-open interval."""
+    return key.astype(dtype), (key + 1).astype(dtype)
+
+
 class FirstDuplicatePosition(KeyError):
     def __init__(self, first_dup: int) -> None:
         self.first_dup = first_dup
@@ -62,11 +72,13 @@ class LocMap:
         label_to_pos: tp.Callable[[TLabel], int],
         key: slice,
         labels: tp.Optional[TNDArrayAny] = None,
+        sort_status: tp.Optional[tp.Callable[[], SortStatus]] = None,
     ) -> tp.Iterator[tp.Union[int, None]]:
         """Given a slice ``key`` and a label-to-position mapping, yield each integer argument necessary to create a new iloc slice. If the ``key`` defines a region with no constituents, raise ``LocEmpty``
 
         Args:
             label_to_pos: callable into mapping (can be a get() method from a dictionary)
+            sort_status: optional callable returning the :obj:`SortStatus` of ``labels``; only called when ascending labels permit a binary search rather than a scan of all labels.
         """
         # NOTE: it is expected that NULL_SLICE is already identified
         labels_astype: tp.Optional[TNDArrayAny] = None
@@ -89,6 +101,22 @@ class LocMap:
                         raise LocInvalid('Invalid loc given in a slice', attr, field)
                     if field is SLICE_STOP_ATTR:
                         pos += 1  # stop is inclusive
+                elif (
+                    attr.dtype < labels.dtype  # type: ignore
+                    and not np.isnat(attr)
+                    and sort_status is not None
+                    and sort_status() is SortStatus.ASC
+                ):
+                    # labels are ascending: find the labels within the attr's unit by binary search, without converting labels to the attr's unit
+                    lower, upper = dt64_unit_bounds(attr, labels.dtype)  # type: ignore
+                    if field is SLICE_START_ATTR:
+                        pos = int(np.searchsorted(labels, lower, 'left'))  # type: ignore
+                        if pos == len(labels) or labels[pos] >= upper:  # type: ignore
+                            raise LocEmptyInstance
+                    else:
+                        pos = int(np.searchsorted(labels, upper, 'left'))  # type: ignore
+                        if pos == 0 or labels[pos - 1] < lower:  # type: ignore
+                            raise LocEmptyInstance
                 elif field is SLICE_START_ATTR:
                     # NOTE: as an optimization only for the start attr, we can try to convert attr to labels unit and see if there is a match; this avoids astyping the entire labels array
                     pos: TypePos = label_to_pos(attr.astype(labels.dtype))  # type: ignore
@@ -136,12 +164,14 @@ class LocMap:
         positions: TNDArrayAny,
         key: TLocSelector,
         partial_selection: bool = False,
+        sort_status: tp.Optional[tp.Callable[[], SortStatus]] = None,
     ) -> TILocSelector:
         """
         Note: all SF objects (Series, Index) need to be converted to basic types before being passed as `key` to this function.
 
         Args:
             partial_selection: if True and key is an iterable of labels that includes labels not in the mapping, available matches will be returned rather than raising.
+            sort_status: optional callable returning the :obj:`SortStatus` of ``labels``; only called when ascending labels permit a binary search rather than a scan of all labels.
         Returns:
             An integer mapped slice, or GetItemKey type that is based on integers, compatible with TypeBlocks
         """
@@ -156,6 +186,7 @@ class LocMap:
                         label_to_pos.get,
                         key,  # type: ignore
                         labels,
+                        sort_status,
                     )
                 )
             except LocEmpty:
@@ -174,6 +205,14 @@ class LocMap:
                 if np.isnan(key):  # type: ignore
                     pass  # key is nat; keep it as such for lookup
                 elif key.dtype < labels.dtype:  # type: ignore
+                    if sort_status is not None and sort_status() is SortStatus.ASC:
+                        # labels are ascending: the labels within the key's unit are contiguous, and can be found by binary search; return a view of positions, as would a Boolean selection
+                        lower, upper = dt64_unit_bounds(key, labels.dtype)
+                        return positions[
+                            np.searchsorted(labels, lower, 'left') : np.searchsorted(
+                                labels, upper, 'left'
+                            )
+                        ]
                     key = labels.astype(key.dtype) == key  # type: ignore
                     # if not key.any(), we do not raise a KeyError to be consistent with sub-dt-unit selection
                 # if key.dtype >= labels.dtype, keep it the same so as to do a direct, single element selection
@@ -200,6 +239,17 @@ class LocMap:
                     is_array = False
                     is_list = True
                 elif labels_is_dt64 and key.dtype < labels.dtype:  # type: ignore
+                    if sort_status is not None and sort_status() is SortStatus.ASC:
+                        # labels are ascending: for each unique key, take the contiguous positions of labels within the key's unit, found by binary search; this retains the order of labels, as does a Boolean selection
+                        lower, upper = dt64_unit_bounds(ufunc_unique1d(key), labels.dtype)  # type: ignore
+                        starts = np.searchsorted(labels, lower, 'left')
+                        stops = np.searchsorted(labels, upper, 'left')
+                        if not (stops - starts).any():
+                            return EMPTY_ARRAY_INT
+                        post: TNDArrayAny = np.concatenate(
+                            [positions[start:stop] for start, stop in zip(starts, stops)]
+                        )
+                        return post
                     # NOTE: change the labels to the dt64 dtype, i.e., if the key is years, recast the labels as years, and do a Boolean selection of everything that matches each key
                     labels_ref = labels.astype(key.dtype)  # type: ignore
                     # NOTE: this is only correct if both key and labels are dt64, and key is a less granular unit, as the order in the key and will not be used
@@ -7,10 +7,13 @@ import typing_extensions as tp
 if tp.TYPE_CHECKING:
     from hashlib import _Hash
 
+TVHash = tp.TypeVar('TVHash', '_Hash', hashlib.blake2b, hashlib.blake2s)
+
 
 class InterfaceHashlib:
     __slots__ = (
         '_to_bytes',
+        '_iter_bytes',
         '_include_name',
         '_include_class',
         '_encoding',
@@ -32,6 +35,7 @@ class InterfaceHashlib:
     def __init__(
         self,
         to_bytes: tp.Callable[[bool, bool, str], bytes],
+        iter_bytes: tp.Callable[[bool, bool, str], tp.Iterable[bytes | memoryview]],
         *,
         include_name: bool,
         include_class: bool,
@@ -45,6 +49,7 @@ class InterfaceHashlib:
             encoding: Encoding to use for converting strings to bytes.
         """
         self._to_bytes = to_bytes
+        self._iter_bytes = iter_bytes
         self._include_name = include_name
         self._include_class = include_class
         self._encoding = encoding
@@ -65,6 +70,7 @@ class InterfaceHashlib:
         """
         return self.__class__(
             to_bytes=self._to_bytes,
+            iter_bytes=self._iter_bytes,
             include_name=include_name if include_name is not None else self._include_name,
             include_class=include_class
             if include_class is not None
@@ -80,26 +86,36 @@ class InterfaceHashlib:
             self._encoding,
         )
 
+    def _update(self, hasher: TVHash) -> TVHash:
+        """Feed the byte signature to the hash object in bounded pieces, never materializing the complete signature; the digest is identical to that of `to_bytes()`."""
+        for part in self._iter_bytes(
+            self._include_name,
+            self._include_class,
+            self._encoding,
+        ):
+            hasher.update(part)
+        return hasher
+
     def md5(self) -> '_Hash':
-        return hashlib.md5(self.to_bytes())
+        return self._update(hashlib.md5())
 
     def sha256(self) -> '_Hash':
-        return hashlib.sha256(self.to_bytes())
+        return self._update(hashlib.sha256())
 
     def sha512(self) -> '_Hash':
-        return hashlib.sha512(self.to_bytes())
+        return self._update(hashlib.sha512())
 
     def sha3_256(self) -> '_Hash':
-        return hashlib.sha3_256(self.to_bytes())
+        return self._update(hashlib.sha3_256())
 
     def sha3_512(self) -> '_Hash':
-        return hashlib.sha3_512(self.to_bytes())
+        return self._update(hashlib.sha3_512())
 
     def shake_128(self) -> '_Hash':
-        return hashlib.shake_128(self.to_bytes())  # pyright: ignore
+        return self._update(hashlib.shake_128())  # pyright: ignore
 
     def shake_256(self) -> '_Hash':
-        return hashlib.shake_256(self.to_bytes())  # pyright: ignore
+        return self._update(hashlib.shake_256())  # pyright: ignore
 
     def blake2b(
         self,
@@ -117,20 +133,21 @@ class InterfaceHashlib:
         last_node: bool = False,
         # usedforsecurity: bool = True, # py 3.9
     ) -> hashlib.blake2b:
-        return hashlib.blake2b(
-            self.to_bytes(),
-            digest_size=digest_size,
-            key=key,
-            salt=salt,
-            person=person,
-            fanout=fanout,
-            depth=depth,
-            leaf_size=leaf_size,
-            node_offset=node_offset,
-            node_depth=node_depth,
-            inner_size=inner_size,
-            last_node=last_node,
-            # usedforsecurity=usedforsecurity,
+        return self._update(
+            hashlib.blake2b(
+                digest_size=digest_size,
+                key=key,
+                salt=salt,
+                person=person,
+                fanout=fanout,
+                depth=depth,
+                leaf_size=leaf_size,
+                node_offset=node_offset,
+                node_depth=node_depth,
+                inner_size=inner_size,
+                last_node=last_node,
+                # usedforsecurity=usedforsecurity,
+            )
         )
 
     def blake2s(
@@ -149,18 +166,19 @@ class InterfaceHashlib:
         last_node: bool = False,
         # usedforsecurity: bool = True,
     ) -> hashlib.blake2s:
-        return hashlib.blake2s(
-            self.to_bytes(),
-            digest_size=digest_size,
-            key=key,
-            salt=salt,
-            person=person,
-            fanout=fanout,
-            depth=depth,
-            leaf_size=leaf_size,
-            node_offset=node_offset,
-            node_depth=node_depth,
-            inner_size=inner_size,
-            last_node=last_node,
-            # usedforsecurity=usedforsecurity,
+        return self._update(
+            hashlib.blake2s(
+                digest_size=digest_size,
+                key=key,
+                salt=salt,
+                person=person,
+                fanout=fanout,
+                depth=depth,
+                leaf_size=leaf_size,
+                node_offset=node_offset,
+                node_depth=node_depth,
+                inner_size=inner_size,
+                last_node=last_node,
+                # usedforsecurity=usedforsecurity,
+            )
         )
@@ -11,7 +11,10 @@ import numpy as np
 import typing_extensions as tp
 from arraykit import name_filter
 
-from static_frame.core.container_util import group_from_container
+from static_frame.core.container_util import (
+    axis_window_reduce_items,
+    group_from_container,
+)
 from static_frame.core.doc_str import doc_inject
 
 # from static_frame.core.util import TUFunc
@@ -58,6 +61,25 @@ TContainerAny = tp.TypeVar(
 )
 
 
+def _is_func_group_loc(func: tp.Callable[..., tp.Any]) -> bool:
+    """Return True if ``func`` is a partial of ``Frame._axis_group_loc_items``, i.e., an iterator of groups of a ``Frame`` selected by a key."""
+    from static_frame.core.frame import Frame
+
+    return (
+        getattr(getattr(func, 'func', None), '__func__', None)
+        is Frame._axis_group_loc_items
+    )
+
+
+def _is_func_window(func: tp.Callable[..., tp.Any]) -> bool:
+    """Return True if ``func`` is a partial of ``Frame._axis_window_items``, i.e., an iterator of windows of a ``Frame``."""
+    from static_frame.core.frame import Frame
+
+    return (
+        getattr(getattr(func, 'func', None), '__func__', None) is Frame._axis_window_items
+    )
+
+
 class IterNodeApplyType(Enum):
     SERIES_VALUES = 0
     SERIES_ITEMS = 1  # only used for iter_window_*
@@ -126,6 +148,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
         if not callable(func):  # support array, Series mapping
             func = func.__getitem__
@@ -152,6 +175,16 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
             mp_context=mp_context,
         )
 
+        if use_shared_memory and not use_threads:
+            from static_frame.core.shared_memory import SharedMemoryTransfer
+
+            with SharedMemoryTransfer(func) as transfer, pool_executor() as executor:
+                yield from zip(
+                    func_keys,
+                    transfer.map(executor, arg_gen(), chunksize=chunksize),
+                )
+            return
+
         with pool_executor() as executor:
             yield from zip(func_keys, executor.map(func, arg_gen(), chunksize=chunksize))
 
@@ -163,6 +196,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
         chunksize: int = 1,
         use_threads: bool = False,
         mp_context: TMpContext = None,
+        use_shared_memory: bool = False,
     ) -> tp.Iterator[tp.Any]:
         if not callable(func):  # support array, Series mapping
             func = func.__getitem__
@@ -180,6 +214,13 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
             mp_context=mp_context,
         )
 
+        if use_shared_memory and not use_threads:
+            from static_frame.core.shared_memory import SharedMemoryTransfer
+
+            with SharedMemoryTransfer(func) as transfer, pool_executor() as executor:
+                yield from transfer.map(executor, arg_gen(), chunksize=chunksize)
+            return
+
         with pool_executor() as executor:
             yield from executor.map(func, arg_gen(), chunksize=chunksize)
 
@@ -248,6 +289,47 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
                 'use map_fill(), map_any(), or map_all() for applying a mapping type'
             )
 
+        if (
+            self._apply_type is IterNodeApplyType.SERIES_ITEMS
+            and self._yield_type is IterNodeType.VALUES
+            and columns_constructor is None
+        ):
+            # for iter_window_array, recognized reductions can be applied to all windows at once
+            reduced = axis_window_reduce_items(
+                source=self._container,
+                func=func,
+                **self._func_items.keywords,  # type: ignore
+            )
+            if reduced is not None:
+                labels, values = reduced
+                return self._apply_constructor(
+                    values,
+                    labels=labels,
+                    dtype=dtype,
+                    name=name,
+                    index_constructor=index_constructor,
+                )
+        elif (
+            self._apply_type is IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES
+            and self._yield_type is IterNodeType.VALUES
+            and columns_constructor is None
+            and _is_func_group_loc(self._func_items)
+        ):
+            # for iter_group_array, recognized reductions can be applied to all groups at once
+            reduced = self._container._axis_group_loc_array_reduce(  # type: ignore
+                func,
+                **self._func_items.keywords,  # type: ignore
+            )
+            if reduced is not None:
+                labels, values = reduced
+                return self._apply_constructor(
+                    values,
+                    labels=labels,
+                    dtype=dtype,
+                    name=name,
+                    index_constructor=index_constructor,
+                )
+
         if IterNodeApplyType.is_items(self._apply_type):
             apply_func = self.apply_iter_items
         else:
@@ -284,6 +366,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
         max_workers: tp.Optional[int] = None,
         chunksize: int = 1,
         use_threads: bool = False,
+        use_shared_memory: bool = False,
     ) -> TContainerAny:
         """
         {doc} Employ parallel processing with either the ProcessPoolExecutor or ThreadPoolExecutor.
@@ -296,6 +379,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
             {max_workers}
             {chunksize}
             {use_threads}
+            {use_shared_memory}
         """
         # only use when we need pairs of values to dynamically create an Index
         if IterNodeApplyType.is_items(self._apply_type):
@@ -308,6 +392,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
             ),
             dtype=dtype,
             name=name,
@@ -362,11 +447,30 @@ class IterNodeDelegateReducible(IterNodeDelegate[TContainerAny]):
             axis_labels = self._container.columns.drop.loc[key]  # type: ignore
         else:
             axis_labels = self._container.columns  # type: ignore
+
+        group_reduce = None
+        if self._yield_type is IterNodeType.VALUES and _is_func_group_loc(
+            self._func_items
+        ):
+            # groups of a Frame might be reduced per column without creating a Frame per group
+            group_reduce = partial(
+                self._container._axis_group_loc_reduce,  # type: ignore
+                **self._func_items.keywords,  # type: ignore
+            )
+        elif self._yield_type is IterNodeType.VALUES and _is_func_window(
+            self._func_items
+        ):
+            # windows of a Frame might be reduced per column without creating a Frame per window
+            group_reduce = partial(
+                self._container._axis_window_reduce,  # type: ignore
+                **self._func_items.keywords,  # type: ignore
+            )
         # always use the items iterator, as we always want labelled values
         return ReduceDispatchAligned(
             self._func_items(),
             axis_labels,
             yield_type=self._yield_type,
+            group_reduce=group_reduce,
         )
 
 
@@ -687,7 +791,12 @@ class IterNode(tp.Generic[TContainerAny]):
         name: TName = None,
         index_constructor: tp.Optional[TIndexCtorSpecifier] = None,
         axis: int = 0,
+        labels: tp.Optional[tp.Sequence[TLabel]] = None,
     ) -> TSeriesAny:
+        """
+        Args:
+            labels: if provided, ``pairs`` is an array of values aligned to these labels.
+        """
         from static_frame.core.series import Series
 
         # apply_constructor should be implemented to take a pairs of label, value; only used for iter_window
@@ -712,6 +821,14 @@ class IterNode(tp.Generic[TContainerAny]):
             index_constructor,
             name=name_index,
         )
+        if labels is not None:
+            return Series(
+                pairs,
+                index=index_constructor_final(labels),
+                dtype=dtype,
+                name=name,
+                own_index=True,
+            )
         # always return a Series
         return Series.from_items(
             pairs,
@@ -729,7 +846,12 @@ class IterNode(tp.Generic[TContainerAny]):
         name: TName = None,
         index_constructor: tp.Optional[TIndexCtorSpecifier] = None,
         name_index: TName = None,
+        labels: tp.Optional[tp.Sequence[TLabel]] = None,
     ) -> TSeriesAny:
+        """
+        Args:
+            labels: if provided, ``pairs`` is an array of values aligned to these labels.
+        """
         from static_frame.core.index import Index
         from static_frame.core.series import Series
 
@@ -739,6 +861,14 @@ class IterNode(tp.Generic[TContainerAny]):
             Index if index_constructor is None else index_constructor,
             name=name_index,
         )
+        if labels is not None:
+            return Series(
+                pairs,
+                index=index_constructor(labels),
+                dtype=dtype,
+                name=name,
+                own_index=True,
+            )
         return Series.from_items(
             pairs, dtype=dtype, name=name, index_constructor=index_constructor
         )
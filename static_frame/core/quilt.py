@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from collections import deque
 from functools import partial
-from itertools import chain, repeat, zip_longest
+from itertools import repeat, zip_longest
 
 import numpy as np
 import typing_extensions as tp
 
-from static_frame.core.axis_map import bus_to_hierarchy, get_extractor
+from static_frame.core.axis_map import (
+    bus_to_hierarchy,
+    get_extractor,
+    hierarchy_to_offsets,
+    offsets_to_component_keys,
+)
 from static_frame.core.bus import Bus
 from static_frame.core.container import ContainerBase
 from static_frame.core.container_util import (
@@ -23,8 +29,8 @@ from static_frame.core.exception import (
     immutable_type_error_factory,
 )
 from static_frame.core.frame import Frame
-from static_frame.core.hloc import HLoc
 from static_frame.core.index_auto import IndexAutoConstructorFactory as IACF
+from static_frame.core.index_auto import IndexAutoFactory
 from static_frame.core.index_hierarchy import IndexHierarchy, TTreeNode
 from static_frame.core.node_iter import (
     IterNodeApplyType,
@@ -49,6 +55,8 @@ from static_frame.core.store_zip import (
     StoreZipTSV,
 )
 from static_frame.core.util import (
+    DTYPE_FLOAT_DEFAULT,
+    DTYPE_OBJECT,
     INT_TYPES,
     NULL_SLICE,
     IterNodeType,
@@ -61,9 +69,12 @@ from static_frame.core.util import (
     TLocSelector,
     TLocSelectorCompound,
     TLocSelectorMany,
+    TMpContext,
     TName,
+    TNDArrayIntDefault,
     TPathSpecifier,
     concat_resolved,
+    get_concurrent_executor,
     get_tuple_constructor,
 )
 from static_frame.core.yarn import Yarn
@@ -87,6 +98,41 @@ TBusAny = Bus[tp.Any]
 TYarnAny = Yarn[tp.Any]
 
 
+def _reduce_frame(
+    frame: TFrameAny,
+    *,
+    method: str,
+    axis: int,
+    skipna: bool,
+) -> TSeriesAny:
+    """Reduce ``frame`` with ``method``. Without ``skipna``, object reductions do not reliably propagate NaN, and NaN is assigned where NA is found."""
+    post: TSeriesAny = getattr(frame, method)(axis=axis, skipna=skipna)
+    if skipna or post.dtype != DTYPE_OBJECT:
+        return post
+    isna = frame.isna().any(axis=axis).values
+    if isna.any():
+        return post.assign.iloc[isna](np.nan)
+    return post
+
+
+def _reduce_component(
+    frame: TFrameAny,
+    *,
+    method: str,
+    axis: int,
+    skipna: bool,
+) -> tp.Tuple[TSeriesAny, ...]:
+    """Return the partial results of a reduction of one component; a mean is returned as a sum and a count."""
+    if method == 'count':
+        return (frame.count(axis=axis, skipna=skipna),)
+    if method == 'mean':
+        return (
+            _reduce_frame(frame, method='sum', axis=axis, skipna=skipna),
+            frame.count(axis=axis, skipna=skipna),
+        )
+    return (_reduce_frame(frame, method=method, axis=axis, skipna=skipna),)
+
+
 class Quilt(ContainerBase, StoreClientMixin):
     """
     A :obj:`Frame`-like view of the contents of a :obj:`Bus` or :obj:`Yarn`. With the Quilt, :obj:`Frame` contained in a :obj:`Bus` or :obj:`Yarn` can be conceived as stacking vertically (primary axis 0) or horizontally (primary axis 1). If the labels of the primary axis are unique across all contained :obj:`Frame`, ``retain_labels`` can be set to ``False`` and underlying labels are simply concatenated; otherwise, ``retain_labels`` must be set to ``True`` and an additional depth-level is added to the primary axis labels. A :obj:`Quilt` can only be created if labels of the opposite axis of all contained :obj:`Frame` are aligned.
@@ -96,6 +142,7 @@ class Quilt(ContainerBase, StoreClientMixin):
         '_bus',
         '_axis',
         '_axis_hierarchy',
+        '_axis_offsets',
         '_retain_labels',
         '_axis_opposite',
         '_assign_axis',
@@ -107,6 +154,7 @@ class Quilt(ContainerBase, StoreClientMixin):
     _bus: tp.Union[TBusAny, TYarnAny]
     _axis: int
     _axis_hierarchy: tp.Optional[IndexHierarchy]
+    _axis_offsets: tp.Optional[tp.Tuple[TNDArrayIntDefault, tp.List[TLabel]]]
     _axis_opposite: tp.Optional[IndexBase]
     _columns: IndexBase
     _index: IndexBase
@@ -202,10 +250,14 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         bus = Bus._from_store(
             store=store,
             max_persist=max_persist,  # None is default
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
         return cls(
             bus,
@@ -226,6 +278,8 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         """
         Given a file path to zipped TSV :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -239,6 +293,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels=retain_labels,
             deepcopy_from_bus=deepcopy_from_bus,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
 
     @classmethod
@@ -253,6 +309,8 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         """
         Given a file path to zipped CSV :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -266,6 +324,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels=retain_labels,
             deepcopy_from_bus=deepcopy_from_bus,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
 
     @classmethod
@@ -280,6 +340,8 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         """
         Given a file path to zipped pickle :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -293,6 +355,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels=retain_labels,
             deepcopy_from_bus=deepcopy_from_bus,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
 
     @classmethod
@@ -307,6 +371,8 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         """
         Given a file path to zipped NPZ :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -320,6 +386,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels=retain_labels,
             deepcopy_from_bus=deepcopy_from_bus,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
 
     @classmethod
@@ -334,6 +402,8 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         """
         Given a file path to zipped NPY :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -347,6 +417,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels=retain_labels,
             deepcopy_from_bus=deepcopy_from_bus,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
 
     @classmethod
@@ -361,6 +433,8 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         """
         Given a file path to zipped parquet :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -374,6 +448,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels=retain_labels,
             deepcopy_from_bus=deepcopy_from_bus,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
 
     @classmethod
@@ -388,6 +464,8 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         """
         Given a file path to an XLSX :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -401,6 +479,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels=retain_labels,
             deepcopy_from_bus=deepcopy_from_bus,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
 
     @classmethod
@@ -415,6 +495,8 @@ class Quilt(ContainerBase, StoreClientMixin):
         retain_labels: bool,
         deepcopy_from_bus: bool = False,
         max_persist: tp.Optional[int] = None,
+        prefetch: tp.Optional[int] = None,
+        max_persist_bytes: tp.Optional[int] = None,
     ) -> 'Quilt':
         """
         Given a file path to an SQLite :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -428,6 +510,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels=retain_labels,
             deepcopy_from_bus=deepcopy_from_bus,
             max_persist=max_persist,
+            prefetch=prefetch,
+            max_persist_bytes=max_persist_bytes,
         )
 
     # ---------------------------------------------------------------------------
@@ -499,6 +583,7 @@ class Quilt(ContainerBase, StoreClientMixin):
 
         # can creation until needed
         self._axis_hierarchy = axis_hierarchy
+        self._axis_offsets = None
         self._axis_opposite = axis_opposite
         self._assign_axis = True  # Boolean to control deferred axis index creation
 
@@ -539,6 +624,13 @@ class Quilt(ContainerBase, StoreClientMixin):
             self._index = self._axis_opposite  # type: ignore
         self._assign_axis = False
 
+    def _get_axis_offsets(self) -> tp.Tuple[TNDArrayIntDefault, tp.List[TLabel]]:
+        """Return, building once if necessary, the cumulative offsets of components along the primary axis and the :obj:`Bus` label of each component."""
+        if self._axis_offsets is None:
+            assert self._axis_hierarchy is not None  # mypy
+            self._axis_offsets = hierarchy_to_offsets(self._axis_hierarchy)
+        return self._axis_offsets
+
     def unpersist(self) -> None:
         """For the :obj:`Bus` or :obj:`Yarn` contained in this object, replace all loaded :obj:`Frame` with :obj:`FrameDeferred`."""
         self._bus.unpersist()
@@ -563,7 +655,7 @@ class Quilt(ContainerBase, StoreClientMixin):
         Args:
             name
         """
-        return self.__class__(
+        quilt = self.__class__(
             self._bus.rename(name),
             axis=self._axis,
             retain_labels=self._retain_labels,
@@ -571,6 +663,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             axis_hierarchy=self._axis_hierarchy,
             axis_opposite=self._axis_opposite,
         )
+        quilt._axis_offsets = self._axis_offsets
+        return quilt
 
     # ---------------------------------------------------------------------------
 
@@ -981,7 +1075,6 @@ class Quilt(ContainerBase, StoreClientMixin):
             )
 
         parts: tp.List[TNDArrayAny] = []
-        bus_keys: tp.Iterable[TLabel]
 
         if self._axis == 0:
             sel_key = row_key
@@ -993,19 +1086,11 @@ class Quilt(ContainerBase, StoreClientMixin):
         sel_reduces = isinstance(sel_key, INT_TYPES)
         opposite_reduces = isinstance(opposite_key, INT_TYPES)
 
-        sel = np.full(len(self._axis_hierarchy), False)
-        sel[sel_key] = True
-
-        # get ordered unique Bus labels
-        axis_map_sub = self._axis_hierarchy.iloc[sel_key]
-        if isinstance(axis_map_sub, tuple):
-            bus_keys = (axis_map_sub[0],)
-        else:
-            bus_keys = axis_map_sub.unique(0, order_by_occurrence=True)
-
-        for key in bus_keys:
-            sel_component = sel[self._axis_hierarchy._loc_to_iloc(HLoc[key])]
+        # get ordered Bus labels, and the selection within each component
+        offsets, bus_keys = self._get_axis_offsets()
 
+        for i, sel_component in offsets_to_component_keys(offsets, sel_key):
+            key = bus_keys[i]
             if self._axis == 0:
                 component = self._bus.loc[key]._extract_array(sel_component, opposite_key)  # type: ignore
                 if sel_reduces:
@@ -1135,7 +1220,6 @@ class Quilt(ContainerBase, StoreClientMixin):
             )
 
         parts: tp.List[tp.Any] = []
-        frame_labels: tp.Iterable[TLabel]
         opposite_key: TILocSelector
         sel_key: TILocSelector
 
@@ -1147,24 +1231,17 @@ class Quilt(ContainerBase, StoreClientMixin):
             opposite_key = row_key
 
         sel_reduces = isinstance(sel_key, INT_TYPES)
-        sel = np.full(len(self._axis_hierarchy), False)
-        sel[sel_key] = True
 
-        # get ordered unique Bus labels
-        axis_map_sub = self._axis_hierarchy.iloc[sel_key]
-        if isinstance(axis_map_sub, tuple):
-            frame_labels = (axis_map_sub[0],)
-        else:
-            # get the outer level, or just the unique frame labels needed
-            frame_labels = axis_map_sub.unique(0, order_by_occurrence=True)
+        # get ordered Bus labels, and the selection within each component
+        offsets, frame_labels = self._get_axis_offsets()
 
         component: tp.Any
-        for key_count, key in enumerate(frame_labels):
-            # get Boolean segment for this Frame
-            sel_component = sel[self._axis_hierarchy._loc_to_iloc(HLoc[key, NULL_SLICE])]
-
+        for key_count, (i, sel_component) in enumerate(
+            offsets_to_component_keys(offsets, sel_key)
+        ):
+            key = frame_labels[i]
             if self._axis == 0:
-                component = self._bus.loc[key].iloc[sel_component, opposite_key]  # pyright: ignore
+                component = self._bus.loc[key].iloc[sel_component, opposite_key]  # type: ignore  # pyright: ignore
                 if key_count == 0:
                     component_is_series = isinstance(component, Series)
                 if self._retain_labels:
@@ -1172,7 +1249,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 if sel_reduces:  # make Frame into a Series, Series into an element
                     component = component.iloc[0]
             else:
-                component = self._bus.loc[key].iloc[opposite_key, sel_component]  # pyright: ignore
+                component = self._bus.loc[key].iloc[opposite_key, sel_component]  # type: ignore  # pyright: ignore
                 if key_count == 0:
                     component_is_series = isinstance(component, Series)
                 if self._retain_labels:
@@ -1507,6 +1584,210 @@ class Quilt(ContainerBase, StoreClientMixin):
         """
         return self.iloc[-count:]
 
+    # ---------------------------------------------------------------------------
+    # component-wise reductions
+
+    def _iter_component_apply(
+        self,
+        func: tp.Callable[[TFrameAny], tp.Any],
+        *,
+        max_workers: tp.Optional[int],
+        use_threads: bool,
+        mp_context: TMpContext,
+    ) -> tp.Iterator[tp.Any]:
+        """
+        Yield the result of calling ``func`` on each component :obj:`Frame`, in order. If ``max_workers`` is provided, calls are made in a pool while components continue to be loaded; no more than twice ``max_workers`` components are held by pending calls.
+        """
+        frames = (f for _, f in self._bus.items())
+        if max_workers is None:
+            yield from map(func, frames)
+            return
+
+        pool_executor = get_concurrent_executor(
+            use_threads=use_threads,
+            max_workers=max_workers,
+            mp_context=mp_context,
+        )
+        with pool_executor() as executor:
+            futures: tp.Deque[tp.Any] = deque()
+            for frame in frames:
+                if len(futures) >= max_workers * 2:
+                    yield futures.popleft().result()
+                futures.append(executor.submit(func, frame))
+            while futures:
+                yield futures.popleft().result()
+
+    def _reduce_components(
+        self,
+        method: str,
+        *,
+        axis: int,
+        skipna: bool,
+        max_workers: tp.Optional[int],
+        use_threads: bool,
+        mp_context: TMpContext,
+    ) -> TSeriesAny:
+        if axis not in (0, 1):
+            raise AxisInvalid(f'invalid axis {axis}')
+        if self._assign_axis:
+            self._update_axis_labels()
+
+        func = partial(_reduce_component, method=method, axis=axis, skipna=skipna)
+        partials = list(
+            self._iter_component_apply(
+                func,
+                max_workers=max_workers,
+                use_threads=use_threads,
+                mp_context=mp_context,
+            )
+        )
+
+        post: TSeriesAny
+        if axis == self._axis:
+            # partials share labels of the opposite axis: combine them per label
+            def combine(position: int, method: str) -> TSeriesAny:
+                frame = Frame.from_concat(
+                    (p[position] for p in partials),
+                    axis=1,
+                    columns=IndexAutoFactory,
+                )
+                return _reduce_frame(frame, method=method, axis=1, skipna=skipna)
+
+            if method == 'mean':
+                post = combine(0, 'sum') / combine(1, 'sum')
+            else:
+                post = combine(0, 'sum' if method == 'count' else method)
+        else:
+            # partials are labelled by segments of the primary axis: concatenate them
+            if method == 'mean':
+                arrays = [(p[0] / p[1]).values for p in partials]
+            else:
+                arrays = [p[0].values for p in partials]
+            post = Series(
+                concat_resolved(arrays),
+                index=self._index if axis == 1 else self._columns,
+            )
+
+        if method == 'mean' and post.dtype == DTYPE_OBJECT:
+            # sums of object components are objects; a mean is a float
+            return post.astype(DTYPE_FLOAT_DEFAULT)
+        return post
+
+    @doc_inject(selector='quilt_reduce', name='sum', names='sums')
+    def sum(
+        self,
+        *,
+        axis: int = 0,
+        skipna: bool = True,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
+        mp_context: TMpContext = None,
+    ) -> TSeriesAny:
+        """{doc}
+
+        {args}
+        """
+        return self._reduce_components(
+            'sum',
+            axis=axis,
+            skipna=skipna,
+            max_workers=max_workers,
+            use_threads=use_threads,
+            mp_context=mp_context,
+        )
+
+    @doc_inject(selector='quilt_reduce', name='minimum', names='minima')
+    def min(
+        self,
+        *,
+        axis: int = 0,
+        skipna: bool = True,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
+        mp_context: TMpContext = None,
+    ) -> TSeriesAny:
+        """{doc}
+
+        {args}
+        """
+        return self._reduce_components(
+            'min',
+            axis=axis,
+            skipna=skipna,
+            max_workers=max_workers,
+            use_threads=use_threads,
+            mp_context=mp_context,
+        )
+
+    @doc_inject(selector='quilt_reduce', name='maximum', names='maxima')
+    def max(
+        self,
+        *,
+        axis: int = 0,
+        skipna: bool = True,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
+        mp_context: TMpContext = None,
+    ) -> TSeriesAny:
+        """{doc}
+
+        {args}
+        """
+        return self._reduce_components(
+            'max',
+            axis=axis,
+            skipna=skipna,
+            max_workers=max_workers,
+            use_threads=use_threads,
+            mp_context=mp_context,
+        )
+
+    @doc_inject(selector='quilt_reduce', name='mean', names='means')
+    def mean(
+        self,
+        *,
+        axis: int = 0,
+        skipna: bool = True,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
+        mp_context: TMpContext = None,
+    ) -> TSeriesAny:
+        """{doc}
+
+        {args}
+        """
+        return self._reduce_components(
+            'mean',
+            axis=axis,
+            skipna=skipna,
+            max_workers=max_workers,
+            use_threads=use_threads,
+            mp_context=mp_context,
+        )
+
+    @doc_inject(selector='quilt_reduce', name='count of non-NA values', names='counts')
+    def count(
+        self,
+        *,
+        axis: int = 0,
+        skipna: bool = True,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
+        mp_context: TMpContext = None,
+    ) -> TSeriesAny:
+        """{doc}
+
+        {args}
+        """
+        return self._reduce_components(
+            'count',
+            axis=axis,
+            skipna=skipna,
+            max_workers=max_workers,
+            use_threads=use_threads,
+            mp_context=mp_context,
+        )
+
     # ---------------------------------------------------------------------------
     @doc_inject()
     def equals(
@@ -1590,41 +1871,35 @@ class Quilt(ContainerBase, StoreClientMixin):
             self._update_axis_labels()
         return self._extract(NULL_SLICE, NULL_SLICE)
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
+    ) -> tp.Iterator[bytes | memoryview]:
         if self._assign_axis:
             self._update_axis_labels()
 
-        return b''.join(
-            chain(
-                iter_component_signature_bytes(
-                    self,
-                    include_name=include_name,
-                    include_class=include_class,
-                    encoding=encoding,
-                ),
-                (
-                    self._axis_hierarchy._to_signature_bytes(  # type: ignore
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding,
-                    ),
-                    self._axis_opposite._to_signature_bytes(  # type: ignore
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding,
-                    ),
-                    self._bus._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding,
-                    ),
-                ),
-            )
+        yield from iter_component_signature_bytes(
+            self,
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        yield from self._axis_hierarchy._iter_signature_bytes(  # type: ignore
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        yield from self._axis_opposite._iter_signature_bytes(  # type: ignore
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        yield from self._bus._iter_signature_bytes(
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
         )
 
 
@@ -44,6 +44,10 @@ TShape2D = tp.Tuple[int, int]
 
 TListILocToFunc = tp.List[tp.Tuple[TILocSelectorOne, TUFunc]]
 TListLabelToFunc = tp.List[tp.Tuple[TLabel, TUFunc]]
+TLabelsBlocks = tp.Tuple[
+    tp.Union[TNDArrayAny, tp.Sequence[TLabel]], tp.Sequence[TNDArrayAny]
+]
+TGroupReduce = tp.Callable[..., tp.Optional[TLabelsBlocks]]
 
 
 # -------------------------------------------------------------------------------
@@ -328,6 +332,12 @@ class ReduceAxis(Reduce):
     ) -> tp.Sequence[TNDArrayAny]:
         raise NotImplementedError()  # pragma: no cover
 
+    def _get_labels_blocks(
+        self,
+    ) -> tp.Optional[TLabelsBlocks]:
+        """Optionally return labels and blocks derived without iterating items."""
+        return None
+
     def _prepare_items(
         self,
         axis: int,
@@ -359,17 +369,20 @@ class ReduceAxis(Reduce):
         """
         Return a ``Frame`` after processing column reduction functions.
         """
-        labels, components, shape = self._prepare_items(
-            self._axis,
-            self._items,
-        )
-        if components:
-            sample = components[0]
-        else:  # return a zero-row Frame
-            raise NotImplementedError()  # pragma: no cover
+        if (labels_blocks := self._get_labels_blocks()) is not None:
+            labels, blocks = labels_blocks
+        else:
+            labels, components, shape = self._prepare_items(
+                self._axis,
+                self._items,
+            )
+            if components:
+                sample = components[0]
+            else:  # return a zero-row Frame
+                raise NotImplementedError()  # pragma: no cover
 
-        is_array = sample.__class__ is np.ndarray
-        blocks = self._get_blocks(components, labels, shape, sample, is_array)
+            is_array = sample.__class__ is np.ndarray
+            blocks = self._get_blocks(components, labels, shape, sample, is_array)
 
         own_columns = False
         if columns is None:
@@ -407,7 +420,10 @@ class ReduceAligned(ReduceAxis):
 
     # Axis 1 will reduce components into rows (labels are the index, ilocs refer to column positions); axis 0 will reduce components into columns (labels are the column labels, ilocs refer to index positions).
 
-    __slots__ = ('_iloc_to_func',)
+    __slots__ = (
+        '_iloc_to_func',
+        '_group_reduce',
+    )
 
     def __init__(
         self,
@@ -417,10 +433,13 @@ class ReduceAligned(ReduceAxis):
         yield_type: IterNodeType,
         axis: int = 1,
         /,
+        *,
+        group_reduce: tp.Optional[TGroupReduce] = None,
     ):
         """
         Args:
             axis_labels: Index on the axis used to label reductions.
+            group_reduce: optional callable that, given ``iloc_to_func``, returns labels and reduced blocks without iterating ``items``, or None if not supported.
         """
         self._items = items
         self._iloc_to_func = iloc_to_func
@@ -428,6 +447,14 @@ class ReduceAligned(ReduceAxis):
         self._yield_type = yield_type
         self._axis = axis
         self._axis_len = len(self._iloc_to_func)
+        self._group_reduce = group_reduce
+
+    def _get_labels_blocks(
+        self,
+    ) -> tp.Optional[TLabelsBlocks]:
+        if self._group_reduce is None:
+            return None
+        return self._group_reduce(iloc_to_func=self._iloc_to_func)
 
     def _get_blocks(
         self,
@@ -758,7 +785,10 @@ class ReduceDispatch(Interface):
 class ReduceDispatchAligned(ReduceDispatch):
     """Interface for creating reductions from uniform collections of Frames."""
 
-    __slots__ = ('_axis_labels',)
+    __slots__ = (
+        '_axis_labels',
+        '_group_reduce',
+    )
 
     def __init__(
         self,
@@ -767,15 +797,18 @@ class ReduceDispatchAligned(ReduceDispatch):
         *,
         yield_type: IterNodeType,
         axis: int = 1,
+        group_reduce: tp.Optional[TGroupReduce] = None,
     ) -> None:
         """
         Args:
             axis_labels: Index on the axis used to label reductions.
+            group_reduce: optional callable to reduce groups without iterating ``items``.
         """
         self._items = items
         self._axis_labels = axis_labels
         self._yield_type = yield_type
         self._axis = axis
+        self._group_reduce = group_reduce
 
     def from_map_func(
         self,
@@ -798,6 +831,7 @@ class ReduceDispatchAligned(ReduceDispatch):
             self._axis_labels,
             self._yield_type,
             self._axis,
+            group_reduce=self._group_reduce,
         )
 
     def from_label_map(
@@ -823,6 +857,7 @@ class ReduceDispatchAligned(ReduceDispatch):
             self._axis_labels,
             self._yield_type,
             self._axis,
+            group_reduce=self._group_reduce,
         )
 
     def from_label_pair_map(
@@ -852,6 +887,7 @@ class ReduceDispatchAligned(ReduceDispatch):
             axis_labels,
             self._yield_type,
             self._axis,
+            group_reduce=self._group_reduce,
         )
 
 
@@ -30,6 +30,7 @@ from static_frame.core.container_util import (
     index_many_concat,
     index_many_to_one,
     is_fill_value_factory_initializer,
+    iter_array_signature_bytes,
     iter_component_signature_bytes,
     matmul,
     pandas_to_numpy,
@@ -3807,33 +3808,27 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
             own_index=True,
         )
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
+    ) -> tp.Iterator[bytes | memoryview]:
         if self.values.dtype == DTYPE_OBJECT:
             raise TypeError('Object dtypes do not have stable hashes')
 
-        return b''.join(
-            chain(
-                iter_component_signature_bytes(
-                    self,
-                    include_name=include_name,
-                    include_class=include_class,
-                    encoding=encoding,
-                ),
-                (
-                    self._index._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding,
-                    ),
-                    self.values.tobytes(),
-                ),
-            )
+        yield from iter_component_signature_bytes(
+            self,
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        yield from self._index._iter_signature_bytes(
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
         )
+        yield from iter_array_signature_bytes(self.values)
 
     # ---------------------------------------------------------------------------
 
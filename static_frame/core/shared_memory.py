@@ -0,0 +1,209 @@
+"""
+Tools for transferring :obj:`Frame` to and from ``ProcessPoolExecutor`` workers with shared memory. Rather than pickling the bytes of every array, the arrays of a :obj:`Frame` are copied into a ``multiprocessing.shared_memory.SharedMemory`` segment and only a small descriptor is pickled. These components are imported by node_iter.py and batch.py, and thus use deferred, function-based imports.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+
+import typing_extensions as tp
+
+from static_frame.core.archive_npy import (
+    ArchiveSharedMemory,
+    NPYFrameConverter,
+    SharedMemoryDescriptor,
+)
+from static_frame.core.exception import ErrorNPYEncode
+
+if tp.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from static_frame.core.generic_aliases import TFrameAny
+
+# segments attached by a worker, retained until no arrays are views of them
+_ATTACHED: tp.List[ArchiveSharedMemory] = []
+
+
+def _attached_sweep() -> None:
+    """Close, and stop retaining, attached segments that no longer have arrays viewing them."""
+    retain = []
+    for archive in _ATTACHED:
+        try:
+            archive.close()
+        except BufferError:  # arrays still view the segment
+            retain.append(archive)
+    _ATTACHED[:] = retain
+
+
+def _frame_from_view(
+    constructor: tp.Type[TFrameAny],
+    descriptor: SharedMemoryDescriptor,
+) -> TFrameAny:
+    """Reconstruct a :obj:`Frame` from read-only views of a segment; the segment is retained until those arrays are garbage collected."""
+    _attached_sweep()
+    archive = ArchiveSharedMemory(descriptor)
+    _ATTACHED.append(archive)
+    return NPYFrameConverter.frame_decode(archive=archive, constructor=constructor)
+
+
+def _frame_from_copy(
+    constructor: tp.Type[TFrameAny],
+    descriptor: SharedMemoryDescriptor,
+) -> TFrameAny:
+    """Reconstruct a :obj:`Frame` from copies of the arrays of a segment, then unlink the segment."""
+    archive = ArchiveSharedMemory(descriptor, copy=True)
+    try:
+        return NPYFrameConverter.frame_decode(archive=archive, constructor=constructor)
+    finally:
+        archive.close()
+        archive.unlink()
+
+
+def _frame_identity(frame: TFrameAny) -> TFrameAny:
+    return frame
+
+
+class SharedMemoryFrame:
+    """
+    A picklable proxy of a :obj:`Frame`. When pickled, the arrays of the :obj:`Frame` are copied into a new shared memory segment and only a descriptor of that segment is pickled. If ``result`` is False, the segment is unpickled as a :obj:`Frame` of read-only views, and must be unlinked by the creating process with ``unlink()``; if ``result`` is True, the segment is unpickled as a :obj:`Frame` of copies and unlinked by the receiving process. :obj:`Frame` that cannot be encoded (such as those with object dtypes) are pickled normally.
+    """
+
+    __slots__ = (
+        '_frame',
+        '_result',
+        '_archive',
+        '_descriptor',
+        '_closed',
+        '_lock',
+    )
+
+    def __init__(self, frame: TFrameAny, *, result: bool = False) -> None:
+        self._frame = frame
+        self._result = result
+        self._archive: tp.Optional[ArchiveSharedMemory] = None
+        self._descriptor: tp.Optional[SharedMemoryDescriptor] = None
+        self._closed = False
+        # NOTE: arguments are pickled in an executor thread while they might be unlinked by the caller
+        self._lock = threading.Lock()
+
+    def _encode(self) -> tp.Optional[SharedMemoryDescriptor]:
+        archive = ArchiveSharedMemory()
+        try:
+            NPYFrameConverter.frame_encode(archive=archive, frame=self._frame)
+        except ErrorNPYEncode:
+            return None
+        descriptor = archive.to_shared_memory()
+        if self._result:
+            # the receiving process unlinks; the segment persists after this handle is closed
+            archive.close()
+        else:
+            self._archive = archive
+        return descriptor
+
+    def __reduce__(self) -> tp.Tuple[tp.Any, ...]:
+        with self._lock:
+            if self._descriptor is None and not self._closed:
+                self._descriptor = self._encode()
+            if self._descriptor is None or self._closed:
+                return _frame_identity, (self._frame,)
+            if self._result:
+                return _frame_from_copy, (self._frame.__class__, self._descriptor)
+            return _frame_from_view, (self._frame.__class__, self._descriptor)
+
+    def unlink(self) -> None:
+        """Release the segment of an argument proxy; subsequent pickling will pickle the :obj:`Frame` normally."""
+        with self._lock:
+            self._closed = True
+            if self._archive is not None:
+                self._archive.close()
+                self._archive.unlink()
+                self._archive = None
+
+
+class SharedMemoryCall:
+    """A picklable wrapper of a function called in a worker process, returning a :obj:`Frame` result as a :obj:`SharedMemoryFrame`."""
+
+    __slots__ = ('_func',)
+
+    def __init__(self, func: tp.Callable[..., tp.Any]) -> None:
+        self._func = func
+
+    def __call__(self, arg: tp.Any) -> tp.Any:
+        from static_frame.core.frame import Frame
+
+        post = self._func(arg)
+        # NOTE: on Windows a segment is destroyed when its last handle is closed, and the worker cannot hold its handle until the result is received
+        if isinstance(post, Frame) and os.name != 'nt':
+            return SharedMemoryFrame(post, result=True)
+        return post
+
+
+class SharedMemoryTransfer:
+    """
+    Context manager of arguments sent to a ``ProcessPoolExecutor`` with shared memory. Arguments are wrapped with ``wrap()`` in the order they are submitted, and their segments are released, in the same order, with ``release()`` as each result is received; all remaining segments are released on exit.
+    """
+
+    __slots__ = ('func', '_pending')
+
+    def __init__(self, func: tp.Callable[..., tp.Any]) -> None:
+        self.func = SharedMemoryCall(func)
+        self._pending: tp.Deque[tp.List[SharedMemoryFrame]] = deque()
+
+    def __enter__(self) -> tp.Self:
+        if os.name != 'nt':
+            # NOTE: the resource tracker must be running before workers are forked so that workers and the parent share a tracker
+            from multiprocessing import resource_tracker
+
+            resource_tracker.ensure_running()
+        return self
+
+    def __exit__(self, *args: tp.Any) -> None:
+        while self._pending:
+            self.release()
+
+    def wrap(self, arg: tp.Any) -> tp.Any:
+        """Return ``arg``, or a tuple of components of ``arg``, with :obj:`Frame` replaced by :obj:`SharedMemoryFrame`."""
+        from static_frame.core.frame import Frame
+
+        proxies: tp.List[SharedMemoryFrame] = []
+        if isinstance(arg, Frame):
+            arg = SharedMemoryFrame(arg)
+            proxies.append(arg)
+        elif arg.__class__ is tuple:
+            parts = []
+            for part in arg:
+                if isinstance(part, Frame):
+                    part = SharedMemoryFrame(part)
+                    proxies.append(part)
+                parts.append(part)
+            arg = tuple(parts)
+        self._pending.append(proxies)
+        return arg
+
+    def release(self) -> None:
+        """Unlink the segments of the oldest wrapped argument."""
+        for proxy in self._pending.popleft():
+            proxy.unlink()
+
+    def map(
+        self,
+        executor: Executor,
+        args: tp.Iterable[tp.Any],
+        *,
+        chunksize: int = 1,
+    ) -> tp.Iterator[tp.Any]:
+        """Equivalent to ``executor.map()``: all arguments are submitted when called, and the segments of each argument are released as its result is received."""
+        results = executor.map(
+            self.func,
+            (self.wrap(arg) for arg in args),
+            chunksize=chunksize,
+        )
+
+        def gen() -> tp.Iterator[tp.Any]:
+            for post in results:
+                self.release()
+                yield post
+
+        return gen()
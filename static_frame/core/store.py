@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import pickle
 from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
 from functools import partial, wraps
@@ -27,6 +28,7 @@ from static_frame.core.util import (
 )
 
 if tp.TYPE_CHECKING:
+    from static_frame.core.series import Series
     from static_frame.core.store_config import StoreConfigMapInitializer
 
     TNDArrayAny: tp.TypeAlias = np.ndarray[tp.Any, tp.Any]
@@ -104,6 +106,90 @@ class InventoryDescriptor:
         return func
 
 
+# -------------------------------------------------------------------------------
+class FrameMetadata(tp.NamedTuple):
+    """Attributes of a stored :obj:`Frame` that can be known without reading it."""
+
+    shape: tuple[int, int]
+    nbytes: int
+    dtypes: Series[tp.Any, tp.Any]
+
+    @classmethod
+    def from_frame(cls, frame: TFrameAny) -> tp.Self:
+        return cls(frame.shape, frame.nbytes, frame.dtypes)
+
+
+# version of the manifest sidecar format; manifests of other versions are ignored
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = '.manifest'
+
+
+class Manifest:
+    """
+    The contents of a manifest sidecar: the encoded labels of all stored :obj:`Frame`, and their :obj:`FrameMetadata`, which is only unpickled when first needed.
+    """
+
+    __slots__ = ('names', '_metadata', '_metadata_bytes')
+
+    def __init__(
+        self,
+        names: tp.Sequence[str],
+        metadata_bytes: bytes,
+    ) -> None:
+        self.names = names
+        self._metadata_bytes = metadata_bytes
+        self._metadata: dict[str, FrameMetadata] | None = None
+
+    def get(self, name: str) -> FrameMetadata | None:
+        if self._metadata is None:
+            self._metadata = pickle.loads(self._metadata_bytes)
+        return self._metadata.get(name)
+
+    @classmethod
+    def write(
+        cls,
+        fp: str,
+        name_to_metadata: Mapping[str, FrameMetadata],
+    ) -> tp.Self:
+        """
+        Write a manifest sidecar for the archive at ``fp``, recording the size and modification time of the archive such that the manifest can be validated when read.
+        """
+        names = tuple(name_to_metadata.keys())
+        metadata_bytes = pickle.dumps(
+            dict(name_to_metadata), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        stat = os.stat(fp)
+        with open(fp + MANIFEST_SUFFIX, 'wb') as f:
+            pickle.dump(
+                (MANIFEST_VERSION, stat.st_size, stat.st_mtime, names, metadata_bytes),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        return cls(names, metadata_bytes)
+
+    @classmethod
+    def read(cls, fp: str) -> tp.Self | None:
+        """
+        Read the manifest sidecar for the archive at ``fp``, returning None if there is no manifest, or if the size or modification time of the archive is not as recorded.
+        """
+        fp_manifest = fp + MANIFEST_SUFFIX
+        if not os.path.exists(fp_manifest) or not os.path.exists(fp):
+            return None
+        with open(fp_manifest, 'rb') as f:
+            version, size, mtime, names, metadata_bytes = pickle.load(f)
+        stat = os.stat(fp)
+        if version != MANIFEST_VERSION or stat.st_size != size or stat.st_mtime != mtime:
+            return None
+        return cls(names, metadata_bytes)
+
+    @staticmethod
+    def remove(fp: str) -> None:
+        """Remove the manifest sidecar for the archive at ``fp``, if it exists."""
+        fp_manifest = fp + MANIFEST_SUFFIX
+        if os.path.exists(fp_manifest):
+            os.remove(fp_manifest)
+
+
 # -------------------------------------------------------------------------------
 class StoreBase:
     __slots__ = ('_weak_cache',)
@@ -125,7 +211,11 @@ class StoreBase:
         slots = (s for cls in type(self).__mro__ for s in getattr(cls, '__slots__', ()))
         return (
             None,
-            {attr: getattr(self, attr) for attr in slots if attr != '_weak_cache'},
+            {
+                attr: getattr(self, attr)
+                for attr in slots
+                if attr not in ('_weak_cache', '_manifest')
+            },
         )
 
     def __setstate__(self, state: tuple[None, dict[str, tp.Any]]) -> None:
@@ -284,6 +374,18 @@ class StoreBase:
     ) -> tp.Iterator[TLabel]:
         raise NotImplementedError()  # pragma: no cover
 
+    def read_metadata(self, label: TLabel) -> FrameMetadata | None:
+        """Return the :obj:`FrameMetadata` of the Frame given by ``label`` if it can be known without reading the Frame; otherwise, return None."""
+        return next(iter(self.read_metadata_many((label,))))
+
+    def read_metadata_many(
+        self,
+        labels: tp.Iterable[TLabel],
+    ) -> tp.Iterator[FrameMetadata | None]:
+        """For each label, yield the :obj:`FrameMetadata` of the Frame if it can be known without reading the Frame; otherwise, yield None."""
+        for _ in labels:
+            yield None
+
 
 # -------------------------------------------------------------------------------
 class Store(StoreBase):
@@ -293,6 +395,7 @@ class Store(StoreBase):
         '_fp',
         '_last_modified',
         '_config',
+        '_manifest',
     )
 
     def __init__(
@@ -313,6 +416,69 @@ class Store(StoreBase):
         self._mtime_update()
         self._weak_cache = WeakValueDictionary()
         self._config = StoreConfigMap.from_initializer(config)
+        self._manifest: Manifest | object | None = NOT_IN_CACHE_SENTINEL
+
+    def __setstate__(self, state: tuple[None, dict[str, tp.Any]]) -> None:
+        StoreBase.__setstate__(self, state)
+        # the manifest is read again, if needed, after unpickling
+        self._manifest = NOT_IN_CACHE_SENTINEL
+
+    def _get_manifest(self) -> Manifest | None:
+        """Return the validated manifest sidecar, reading it on first use if ``StoreConfig(read_manifest)`` is set; return None if there is no valid manifest."""
+        if self._manifest is NOT_IN_CACHE_SENTINEL:
+            if self._config.default.read_manifest:
+                self._manifest = Manifest.read(self._fp)
+            else:
+                self._manifest = None
+        return self._manifest  # type: ignore[return-value]
+
+    def _set_manifest(
+        self,
+        label_to_metadata: tp.Iterable[tuple[TLabel, FrameMetadata]] | None,
+    ) -> None:
+        """After a write, write the manifest sidecar from pairs of label and metadata, or, if None, remove any existing manifest."""
+        if label_to_metadata is None:
+            Manifest.remove(self._fp)
+            self._manifest = None
+            return
+        label_encode = self._config.default.label_encode
+        self._manifest = Manifest.write(
+            self._fp,
+            {label_encode(label): md for label, md in label_to_metadata},
+        )
+
+    def _metadata_readable(self, label: TLabel) -> bool:
+        """Return True if metadata stored for ``label`` describes the Frame as read; Frame read with a column selection or a frame filter might differ in shape and dtypes."""
+        return (
+            self._config[label].columns_select is None
+            and self._config.default.read_frame_filter is None
+        )
+
+    @staticmethod
+    def _iter_items_metadata(
+        items: tp.Iterable[tuple[TLabel, TFrameAny]],
+        label_to_metadata: list[tuple[TLabel, FrameMetadata]],
+    ) -> tp.Iterator[tuple[TLabel, TFrameAny]]:
+        """Yield ``items`` unchanged while collecting the metadata of each Frame into ``label_to_metadata``."""
+        for label, frame in items:
+            label_to_metadata.append((label, FrameMetadata.from_frame(frame)))
+            yield label, frame
+
+    @store_coherent_non_write
+    def read_metadata_many(
+        self,
+        labels: tp.Iterable[TLabel],
+    ) -> tp.Iterator[FrameMetadata | None]:
+        manifest = self._get_manifest()
+        if manifest is None:
+            yield from StoreBase.read_metadata_many(self, labels)
+            return
+        label_encode = self._config.default.label_encode
+        for label in labels:
+            if not self._metadata_readable(label):
+                yield None
+                continue
+            yield manifest.get(label_encode(label))
 
     def _mtime_update(self) -> None:
         if os.path.exists(self._fp):
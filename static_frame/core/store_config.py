@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing_extensions as tp
 
+from static_frame.core.db_util import SQL_OPERATORS
 from static_frame.core.exception import ErrorInitStoreConfig
 from static_frame.core.frame import Frame
 from static_frame.core.interface_meta import InterfaceMeta
@@ -16,6 +17,7 @@ from static_frame.core.util import (
 )
 
 TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tuple[tp.Any, ...]]]
+TReadWhere = tp.Iterable[tuple[str, str, tp.Any]]
 
 
 def label_encode_tuple(source: tuple[tp.Any, ...]) -> str:
@@ -61,8 +63,16 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     merge_hierarchical_labels: bool
     read_max_workers: int | None
     read_chunksize: int
+    read_use_threads: bool
+    read_memory_map: bool
+    read_manifest: bool
+    read_where: TReadWhere | None
+    read_order_by: tp.Tuple[str, ...] | None
+    read_limit: int | None
     write_max_workers: int | None
     write_chunksize: int
+    write_row_group_size: int | None
+    write_manifest: bool
     mp_context: TMpContext
     _hash: int | None
 
@@ -86,8 +96,16 @@ class StoreConfigHE(metaclass=InterfaceMeta):
         'merge_hierarchical_labels',
         'read_max_workers',
         'read_chunksize',
+        'read_use_threads',
+        'read_memory_map',
+        'read_manifest',
+        'read_where',
+        'read_order_by',
+        'read_limit',
         'write_max_workers',
         'write_chunksize',
+        'write_row_group_size',
+        'write_manifest',
         'mp_context',
         '_hash',
     )
@@ -119,14 +137,30 @@ class StoreConfigHE(metaclass=InterfaceMeta):
         # multiprocessing configuration
         read_max_workers: int | None = None,
         read_chunksize: int = 1,
+        read_use_threads: bool = False,
+        read_memory_map: bool = False,
+        read_manifest: bool = False,
+        read_where: TReadWhere | None = None,
+        read_order_by: tp.Iterable[str] | None = None,
+        read_limit: int | None = None,
         write_max_workers: int | None = None,
         write_chunksize: int = 1,
+        write_row_group_size: int | None = None,
+        write_manifest: bool = False,
         mp_context: TMpContext = None,
     ) -> None:
         """
         Args:
             include_index: Boolean to determine if the ``index`` is included in output.
             include_columns: Boolean to determine if the ``columns`` is included in output.
+            read_use_threads: if True, and ``read_max_workers`` is provided, read with a thread pool rather than a process pool.
+            read_memory_map: if True, and reading from a ZIP of NPZ or NPY written without compression, arrays are memory mapped from the file rather than read into memory; compressed ZIPs are read without memory mapping.
+            read_manifest: if True, read labels, shapes, dtypes, and bytes from a sidecar manifest written with ``write_manifest``, if valid for the archive. As the manifest is unpickled, only enable for trusted files. Only used by ``StoreZip`` stores.
+            read_where: an iterable of (field, operator, value) triples, combined with AND, to filter rows in the database query; operator is one of "==", "!=", "<", "<=", ">", ">=", or "in" (with an iterable value). Only used by ``StoreSQLite`` and ``StoreZipParquet``; the latter does not read row groups whose statistics show that no row can match.
+            read_order_by: a field name, or an iterable of field names, by which rows are sorted ascending in the database query. Only used by ``StoreSQLite``.
+            read_limit: the maximum number of rows returned from the database query. Only used by ``StoreSQLite``.
+            write_row_group_size: the maximum number of rows in each Parquet row group. Only used by ``StoreZipParquet``.
+            write_manifest: if True, write a sidecar manifest of labels, shapes, dtypes, and bytes of each :obj:`Frame` next to the archive, permitting these to be read without reading the archive. Only used by ``StoreZip`` stores.
         """
         # constructor
         self.index_depth = index_depth
@@ -153,8 +187,30 @@ class StoreConfigHE(metaclass=InterfaceMeta):
 
         self.read_max_workers = read_max_workers
         self.read_chunksize = read_chunksize
+        self.read_use_threads = read_use_threads
+        self.read_memory_map = read_memory_map
+        self.read_manifest = read_manifest
+
+        if read_where is not None:
+            read_where = tuple(read_where)
+            for _, operator, _ in read_where:
+                if operator not in SQL_OPERATORS:
+                    raise ErrorInitStoreConfig(
+                        f'read_where operator {operator!r} is not one of {tuple(SQL_OPERATORS)}'
+                    )
+        self.read_where = read_where
+        if read_order_by is not None:
+            read_order_by = (
+                (read_order_by,)
+                if isinstance(read_order_by, str)
+                else tuple(read_order_by)
+            )
+        self.read_order_by = read_order_by
+        self.read_limit = read_limit
         self.write_max_workers = write_max_workers
         self.write_chunksize = write_chunksize
+        self.write_row_group_size = write_row_group_size
+        self.write_manifest = write_manifest
         self.mp_context = mp_context
         self._hash = None
 
@@ -189,6 +245,15 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             return tuple(dtypes_specifier)
         return dtypes_specifier  # type: ignore [return-value]
 
+    @staticmethod
+    def _hash_read_where(read_where: TReadWhere | None) -> TLabel:
+        if read_where is None:
+            return read_where
+        return tuple(
+            (field, operator, tuple(value) if operator == 'in' else value)
+            for field, operator, value in read_where
+        )
+
     def __hash__(self) -> int:
         if self._hash is None:
             self._hash = hash(
@@ -214,8 +279,16 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self.merge_hierarchical_labels,  # bool
                     self.read_max_workers,  # Optional[int]
                     self.read_chunksize,  # int
+                    self.read_use_threads,  # bool
+                    self.read_memory_map,  # bool
+                    self.read_manifest,  # bool
+                    self._hash_read_where(self.read_where),
+                    self.read_order_by,  # Optional[tuple]
+                    self.read_limit,  # Optional[int]
                     self.write_max_workers,  # Optional[int]
                     self.write_chunksize,  # int
+                    self.write_row_group_size,  # Optional[int]
+                    self.write_manifest,  # bool
                     self.mp_context,
                 )
             )
@@ -280,8 +353,16 @@ class StoreConfig(StoreConfigHE):
         read_frame_filter: tp.Callable[[TLabel, Frame], Frame] | None = None,
         read_max_workers: int | None = None,
         read_chunksize: int = 1,
+        read_use_threads: bool = False,
+        read_memory_map: bool = False,
+        read_manifest: bool = False,
+        read_where: TReadWhere | None = None,
+        read_order_by: tp.Iterable[str] | None = None,
+        read_limit: int | None = None,
         write_max_workers: int | None = None,
         write_chunksize: int = 1,
+        write_row_group_size: int | None = None,
+        write_manifest: bool = False,
         mp_context: TMpContext = None,
         store_filter: StoreFilter | None = STORE_FILTER_DEFAULT,
     ):
@@ -306,8 +387,16 @@ class StoreConfig(StoreConfigHE):
             merge_hierarchical_labels=merge_hierarchical_labels,
             read_max_workers=read_max_workers,
             read_chunksize=read_chunksize,
+            read_use_threads=read_use_threads,
+            read_memory_map=read_memory_map,
+            read_manifest=read_manifest,
+            read_where=read_where,
+            read_order_by=read_order_by,
+            read_limit=read_limit,
             write_max_workers=write_max_workers,
             write_chunksize=write_chunksize,
+            write_row_group_size=write_row_group_size,
+            write_manifest=write_manifest,
             mp_context=mp_context,
         )
         self.label_encoder = label_encoder
@@ -376,8 +465,12 @@ class StoreConfigMap:
         'read_frame_filter',
         'read_max_workers',
         'read_chunksize',
+        'read_use_threads',
+        'read_memory_map',
+        'read_manifest',
         'write_max_workers',
         'write_chunksize',
+        'write_manifest',
     )
 
     @classmethod
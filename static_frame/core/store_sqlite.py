@@ -4,17 +4,19 @@ import os
 import sqlite3
 from contextlib import suppress
 from fractions import Fraction
+from itertools import chain
 
 import numpy as np
 import typing_extensions as tp
 
-from static_frame.core.db_util import dtype_to_type_decl_sqlite
+from static_frame.core.db_util import SQL_OPERATORS, dtype_to_type_decl_sqlite
 
 # from static_frame.core.doc_str import doc_inject
 from static_frame.core.frame import Frame
 from static_frame.core.store import Store, store_coherent_non_write, store_coherent_write
 
 if tp.TYPE_CHECKING:
+    from static_frame.core.store_config import TReadWhere
     from static_frame.core.util import TLabel
 
     TDtypeAny: tp.TypeAlias = np.dtype[tp.Any]
@@ -22,6 +24,11 @@ if tp.TYPE_CHECKING:
 TFrameAny: tp.TypeAlias = Frame[tp.Any, tp.Any, tp.Unpack[tuple[tp.Any, ...]]]
 
 
+def _quote(name: str) -> str:
+    """Quote an SQLite identifier."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
 class StoreSQLite(Store):
     _EXT: frozenset[str] = frozenset(('.db', '.sqlite'))
     _BYTES_ONE = b'1'
@@ -73,6 +80,13 @@ class StoreSQLite(Store):
         values = cls._get_row_iterator(frame=frame, include_index=include_index)
         cursor.executemany(insert, values())
 
+        if include_index:
+            # the primary key indexes the outermost depth (and all depths together); index the remaining depths to support lookups by any depth
+            for i in range(1, index.depth):
+                cursor.execute(
+                    f'CREATE INDEX "__index{i}_{label}__" ON "{label}" ({field_names[i]})'
+                )
+
     @store_coherent_write
     def write(
         self,
@@ -110,6 +124,75 @@ class StoreSQLite(Store):
 
             conn.commit()
 
+    @staticmethod
+    def _query_select(
+        conn: sqlite3.Connection,
+        label_encoded: str,
+        *,
+        index_depth: int,
+        columns_depth: int,
+        columns_select: tp.Optional[tp.Iterable[str]],
+    ) -> tp.Tuple[str, tp.Optional[tp.Iterable[str]]]:
+        """
+        Return a query, and the `columns_select` remaining to be applied by `Frame.from_sql`. If possible, column selection is done in the query by naming the index and selected fields, such that unselected fields are never read.
+        """
+        query_all = f'SELECT * from "{label_encoded}"'
+        # NOTE: hierarchical columns are matched after construction by from_sql
+        if not columns_select or columns_depth != 1:
+            return query_all, columns_select
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f'PRAGMA table_info("{label_encoded}")')
+            field_names = [row[1] for row in cursor]
+        finally:
+            cursor.close()
+
+        columns_select = set(columns_select)
+        fields_selected = [n for n in field_names[index_depth:] if n in columns_select]
+        if not fields_selected:  # let from_sql handle
+            return query_all, columns_select
+
+        fields = ', '.join(
+            _quote(n) for n in chain(field_names[:index_depth], fields_selected)
+        )
+        return f'SELECT {fields} from "{label_encoded}"', None
+
+    @staticmethod
+    def _query_clauses(
+        *,
+        read_where: tp.Optional[TReadWhere],
+        read_order_by: tp.Optional[tp.Iterable[str]],
+        read_limit: tp.Optional[int],
+    ) -> tp.Tuple[str, tp.List[tp.Any]]:
+        """
+        Compile ``StoreConfig`` row selection into parameterized WHERE, ORDER BY, and LIMIT clauses, returning the clauses and their parameters.
+        """
+        clauses = []
+        parameters: tp.List[tp.Any] = []
+
+        if read_where:
+            predicates = []
+            for field, operator, value in read_where:
+                if operator == 'in':
+                    value = list(value)
+                    placeholders = ', '.join('?' for _ in value)
+                    predicates.append(f'{_quote(field)} IN ({placeholders})')
+                    parameters.extend(value)
+                else:
+                    predicates.append(f'{_quote(field)} {SQL_OPERATORS[operator]} ?')
+                    parameters.append(value)
+            clauses.append(f' WHERE {" AND ".join(predicates)}')
+
+        if read_order_by:
+            clauses.append(f' ORDER BY {", ".join(_quote(n) for n in read_order_by)}')
+
+        if read_limit is not None:
+            clauses.append(' LIMIT ?')
+            parameters.append(read_limit)
+
+        return ''.join(clauses), parameters
+
     @store_coherent_non_write
     def read_many(self, labels: tp.Iterable[TLabel]) -> tp.Iterator[TFrameAny]:
         sqlite3.register_converter('BOOLEAN', lambda x: x == self._BYTES_ONE)
@@ -119,14 +202,26 @@ class StoreSQLite(Store):
                 c = self._config[label]
                 label_encoded = self._config.default.label_encode(label)
                 name = label
-                query = f'SELECT * from "{label_encoded}"'
+                query, columns_select = self._query_select(
+                    conn,
+                    label_encoded,
+                    index_depth=c.index_depth,
+                    columns_depth=c.columns_depth,
+                    columns_select=c.columns_select,
+                )
+                clauses, parameters = self._query_clauses(
+                    read_where=c.read_where,
+                    read_order_by=c.read_order_by,
+                    read_limit=c.read_limit,
+                )
                 f = Frame.from_sql(
-                    query,
+                    query + clauses,
                     connection=conn,
+                    parameters=parameters,
                     index_depth=c.index_depth,
                     index_constructors=c.index_constructors,
                     columns_depth=c.columns_depth,
-                    columns_select=c.columns_select,
+                    columns_select=columns_select,
                     columns_constructors=c.columns_constructors,
                     dtypes=c.dtypes,
                     name=name,
@@ -3,20 +3,32 @@ from __future__ import annotations
 import io
 import os
 import pickle
+import threading
 import zipfile
 from contextlib import contextmanager
 from functools import partial
 
 import typing_extensions as tp
 
-from static_frame.core.archive_npy import ArchiveFrameConverter, ArchiveZipWrapper
-from static_frame.core.archive_zip import zip_namelist
+from static_frame.core.archive_npy import (
+    ArchiveFrameConverter,
+    ArchiveZip,
+    ArchiveZipMemoryMap,
+    ArchiveZipWrapper,
+)
+from static_frame.core.archive_zip import FileRangeRO, ZipFileRO, zip_namelist
 from static_frame.core.container_util import container_to_exporter_attr
 from static_frame.core.exception import ErrorNPYEncode, store_label_non_unique_factory
 from static_frame.core.frame import Frame
-from static_frame.core.store import Store, store_coherent_non_write, store_coherent_write
+from static_frame.core.store import (
+    FrameMetadata,
+    Store,
+    store_coherent_non_write,
+    store_coherent_write,
+)
 from static_frame.core.util import (
     NOT_IN_CACHE_SENTINEL,
+    NULL_SLICE,
     TCallableAny,
     TLabel,
     get_concurrent_executor,
@@ -80,6 +92,17 @@ def bytes_io_to_str_io(
         tw.detach()
 
 
+def _zip_file_ro_stored(file: tp.IO[bytes]) -> ZipFileRO | None:
+    """
+    Return a :obj:`ZipFileRO` of ``file``, or None if members of the zip are compressed and thus cannot be memory mapped.
+    """
+    try:
+        return ZipFileRO(file)
+    except zipfile.BadZipFile:
+        # NOTE: ZipFileRO raises for any compressed member; a corrupt zip will raise again when read without memory mapping
+        return None
+
+
 class _StoreZip(Store):
     _EXT: frozenset[str] = frozenset(('.zip',))
     _EXT_CONTAINED: str = ''
@@ -111,6 +134,14 @@ class _StoreZip(Store):
         *,
         strip_ext: bool = True,
     ) -> tp.Iterator[TLabel]:
+        manifest = self._get_manifest()
+        if manifest is not None:
+            for name in manifest.names:
+                if not strip_ext:
+                    name = name + self._EXT_CONTAINED
+                yield self._config.default.label_decode(name)
+            return
+
         for name in zip_namelist(self._fp):
             if strip_ext:
                 name = name.replace(self._EXT_CONTAINED, '')
@@ -204,26 +235,61 @@ class _StoreZip(Store):
                         config=self._config[label].to_store_config_he(),
                     )
 
+        use_threads = self._config.default.read_use_threads
+        zfs: list[zipfile.ZipFile] = []
+
+        if use_threads:
+            # each thread reads from its own ZipFile to avoid contention on a shared file handle; payloads and frames are never pickled
+            zf_local = threading.local()
+
+            def read_frame(label: TLabel) -> TFrameAny:
+                zf: zipfile.ZipFile | None = getattr(zf_local, 'zf', None)
+                if zf is None:
+                    zf = zipfile.ZipFile(self._fp)
+                    zf_local.zf = zf
+                    zfs.append(zf)
+                label_encoded: str = self._config.default.label_encode(label)
+                return self._build_frame(
+                    src=zf.read(label_encoded + self._EXT_CONTAINED),
+                    label=label,
+                    config=self._config[label],
+                )
+
+            def labels_to_read() -> tp.Iterator[TLabel]:
+                for label, cached_frame in results_items():
+                    if cached_frame is None:
+                        yield label
+
+            func: tp.Callable[[tp.Any], TFrameAny] = read_frame
+            args: tp.Iterator[tp.Any] = labels_to_read()
+        else:
+            func = self._payload_to_frame
+            args = gen()
+
         chunksize = self._config.default.read_chunksize
         pool_executor = get_concurrent_executor(
-            use_threads=False,
+            use_threads=use_threads,
             max_workers=self._config.default.read_max_workers,
             mp_context=self._config.default.mp_context,
         )
 
-        with pool_executor() as executor:
-            frame_gen = executor.map(self._payload_to_frame, gen(), chunksize=chunksize)
+        try:
+            with pool_executor() as executor:
+                frame_gen = executor.map(func, args, chunksize=chunksize)
 
-            for label, cached_frame in results_items():
-                if cached_frame is not None:
-                    yield cached_frame
-                else:
-                    f = next(frame_gen)
-                    if self._config.default.read_frame_filter is not None:
-                        f = self._config.default.read_frame_filter(label, f)
-                    # Newly read frame, add it to our weak_cache
-                    self._weak_cache[label] = f
-                    yield f
+                for label, cached_frame in results_items():
+                    if cached_frame is not None:
+                        yield cached_frame
+                    else:
+                        f = next(frame_gen)
+                        if self._config.default.read_frame_filter is not None:
+                            f = self._config.default.read_frame_filter(label, f)
+                        # Newly read frame, add it to our weak_cache
+                        self._weak_cache[label] = f
+                        yield f
+        finally:
+            for zf in zfs:
+                zf.close()
 
     # --------------------------------------------------------------------------
 
@@ -349,11 +415,16 @@ class _StoreZip(Store):
             self._config.default.write_max_workers is not None
             and self._config.default.write_max_workers > 1
         )
+        label_to_metadata: list[tuple[TLabel, FrameMetadata]] | None = None
+        if self._config.default.write_manifest:
+            label_to_metadata = []
+            items = self._iter_items_metadata(items, label_to_metadata)
 
         write_items = (
             self._write_multi_process if multiprocess else self._write_single_process
         )
         write_items(items=items, compression=compression)
+        self._set_manifest(label_to_metadata)
 
 
 class _StoreZipDelimited(_StoreZip):
@@ -434,6 +505,9 @@ class StoreZipPickle(_StoreZip):
         config: StoreConfigHE | StoreConfig,
     ) -> TFrameAny:
         frame = cls._CONSTRUCTOR(src)  # type: ignore
+        if config.columns_select is not None:
+            # NOTE: a pickle cannot be partially loaded; select after loading so that projection is consistent with other stores
+            frame = frame.loc[NULL_SLICE, frame.columns.isin(config.columns_select)]
         if frame.name is None:
             frame = frame.rename(label)
         return frame
@@ -463,7 +537,10 @@ class StoreZipNPZ(_StoreZip):
         label: TLabel,
         config: StoreConfigHE | StoreConfig,
     ) -> TFrameAny:
-        frame = cls._CONSTRUCTOR(io.BytesIO(src))
+        frame = cls._CONSTRUCTOR(
+            io.BytesIO(src),
+            columns_select=config.columns_select,
+        )
         if frame.name is None:
             frame = frame.rename(label)
         return frame
@@ -477,6 +554,94 @@ class StoreZipNPZ(_StoreZip):
             consolidate_blocks=config.consolidate_blocks,
         )
 
+    @store_coherent_non_write
+    def _read_many_memory_map(
+        self, labels: tp.Iterable[TLabel]
+    ) -> tp.Iterator[TFrameAny]:
+        """
+        Read many frames with arrays memory mapped from their positions in the file. This requires that the zip, and the NPZ within it, are not compressed; if the zip is compressed, frames are read without memory mapping.
+        """
+        with open(self._fp, 'rb') as file:
+            zf = _zip_file_ro_stored(file)
+            if zf is None:
+                yield from super().read_many(labels)
+                return
+            for label in labels:
+                cache_lookup = self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+                if cache_lookup is not NOT_IN_CACHE_SENTINEL:
+                    yield cache_lookup  # pyright: ignore
+                    continue
+
+                name = self._config.default.label_encode(label) + self._EXT_CONTAINED
+                offset = zf.data_offset(name)
+                archive = ArchiveZipMemoryMap(
+                    ZipFileRO(FileRangeRO(file, offset, zf.getinfo(name).file_size)),  # type: ignore[arg-type]
+                    file,
+                    offset,
+                )
+                # NOTE: _CONSTRUCTOR is a classmethod bound to the Frame class to create
+                f = ArchiveFrameConverter.frame_decode(
+                    archive=archive,
+                    constructor=self._CONSTRUCTOR.__self__,  # type: ignore[attr-defined]
+                    columns_select=self._config[label].columns_select,
+                )
+                if f.name is None:
+                    f = f.rename(label)
+                if self._config.default.read_frame_filter is not None:
+                    f = self._config.default.read_frame_filter(label, f)
+                # Newly read frame, add it to our weak_cache
+                self._weak_cache[label] = f
+                yield f
+
+    @store_coherent_non_write
+    def read_many(self, labels: tp.Iterable[TLabel]) -> tp.Iterator[TFrameAny]:
+        if self._config.default.read_memory_map:
+            yield from self._read_many_memory_map(labels)
+        else:
+            yield from super().read_many(labels)
+
+    @store_coherent_non_write
+    def read_metadata_many(
+        self,
+        labels: tp.Iterable[TLabel],
+    ) -> tp.Iterator[FrameMetadata | None]:
+        """
+        For each label, yield the :obj:`FrameMetadata` of the Frame from the manifest, if valid, or otherwise from NPY headers, without reading array data. If the zip is not compressed, only the headers and columns labels of each NPZ are read; otherwise, each NPZ is decompressed but not decoded.
+        """
+        if self._get_manifest() is not None:
+            yield from super().read_metadata_many(labels)
+            return
+
+        label_encode = self._config.default.label_encode
+        with open(self._fp, 'rb') as file:
+            zf: ZipFileRO | zipfile.ZipFile
+            try:
+                zf = ZipFileRO(file)
+                stored = True
+            except zipfile.BadZipFile:  # has compressed members
+                zf = zipfile.ZipFile(file)
+                stored = False
+            try:
+                for label in labels:
+                    if not self._metadata_readable(label):
+                        yield None
+                        continue
+                    name = label_encode(label) + self._EXT_CONTAINED
+                    try:
+                        size = zf.getinfo(name).file_size
+                    except KeyError:
+                        yield None
+                        continue
+                    member: FileRangeRO | io.BytesIO
+                    if stored:
+                        member = FileRangeRO(file, zf.data_offset(name), size)  # type: ignore[union-attr]
+                    else:
+                        member = io.BytesIO(zf.read(name))
+                    archive = ArchiveZip(member, writeable=False, memory_map=False)  # type: ignore[arg-type]
+                    yield ArchiveFrameConverter.frame_metadata_decode(archive=archive)
+            finally:
+                zf.close()
+
 
 # -------------------------------------------------------------------------------
 
@@ -504,6 +669,7 @@ class StoreZipParquet(_StoreZip):
             columns_name_depth_level=config.columns_name_depth_level,
             columns_constructors=config.columns_constructors,
             columns_select=config.columns_select,
+            where=config.read_where,
             dtypes=config.dtypes,
             name=label,
             consolidate_blocks=config.consolidate_blocks,
@@ -517,8 +683,39 @@ class StoreZipParquet(_StoreZip):
             include_index_name=config.include_index_name,
             include_columns=config.include_columns,
             include_columns_name=config.include_columns_name,
+            row_group_size=config.write_row_group_size,
         )
 
+    @store_coherent_non_write
+    def read_row_groups(
+        self,
+        label: TLabel,
+        *,
+        row_groups: tp.Iterable[int] | None = None,
+    ) -> tp.Iterator[TFrameAny]:
+        """
+        Yield a :obj:`Frame` for each selected row group of the Parquet file stored at ``label``, reading the file from the archive as needed such that only one row group is held in memory at a time.
+        """
+        config = self._config[label]
+        label_encoded: str = self._config.default.label_encode(label)
+        with zipfile.ZipFile(self._fp) as zf:
+            with zf.open(label_encoded + self._EXT_CONTAINED) as f:
+                yield from Frame.from_parquet_iter(
+                    f,  # type: ignore
+                    index_depth=config.index_depth,
+                    index_name_depth_level=config.index_name_depth_level,
+                    index_constructors=config.index_constructors,
+                    columns_depth=config.columns_depth,
+                    columns_name_depth_level=config.columns_name_depth_level,
+                    columns_constructors=config.columns_constructors,
+                    columns_select=config.columns_select,
+                    row_groups=row_groups,
+                    where=config.read_where,
+                    dtypes=config.dtypes,
+                    name=label,
+                    consolidate_blocks=config.consolidate_blocks,
+                )
+
 
 # -------------------------------------------------------------------------------
 class StoreZipNPY(Store):
@@ -534,6 +731,10 @@ class StoreZipNPY(Store):
         *,
         compression: int = zipfile.ZIP_DEFLATED,
     ) -> None:
+        label_to_metadata: list[tuple[TLabel, FrameMetadata]] | None = None
+        if self._config.default.write_manifest:
+            label_to_metadata = []
+            items = self._iter_items_metadata(items, label_to_metadata)
         try:
             with zipfile.ZipFile(
                 self._fp,
@@ -562,6 +763,7 @@ class StoreZipNPY(Store):
             if os.path.exists(self._fp):
                 os.remove(self._fp)
             raise
+        self._set_manifest(label_to_metadata)
 
     @store_coherent_non_write
     def labels(
@@ -569,6 +771,13 @@ class StoreZipNPY(Store):
         *,
         strip_ext: bool = True,  # not used
     ) -> tp.Iterator[TLabel]:
+        manifest = self._get_manifest()
+        if manifest is not None:
+            yield from (
+                self._config.default.label_decode(name) for name in manifest.names
+            )
+            return
+
         with zipfile.ZipFile(self._fp) as zf:
             archive = ArchiveZipWrapper(
                 zf,
@@ -581,11 +790,55 @@ class StoreZipNPY(Store):
                 self._config.default.label_decode(name) for name in archive.labels()
             )
 
+    @store_coherent_non_write
+    def _read_many_memory_map(
+        self, labels: tp.Iterable[TLabel]
+    ) -> tp.Iterator[TFrameAny]:
+        """
+        Read many frames with arrays memory mapped from their positions in the file. This requires that the zip is not compressed; if the zip is compressed, frames are read without memory mapping.
+        """
+        with open(self._fp, 'rb') as file:
+            zf = _zip_file_ro_stored(file)
+            if zf is None:
+                yield from self._read_many_decode(labels)
+                return
+            archive = ArchiveZipMemoryMap(zf, file)
+            for label in labels:
+                cache_lookup = self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+                if cache_lookup is not NOT_IN_CACHE_SENTINEL:
+                    yield cache_lookup  # pyright: ignore
+                    continue
+
+                label_encoded = self._config.default.label_encode(label)
+                archive.prefix = f'{label_encoded}{self._DELIMITER}'  # mutate
+                f = ArchiveFrameConverter.frame_decode(
+                    archive=archive,
+                    constructor=Frame,
+                    columns_select=self._config[label].columns_select,
+                )
+                if self._config.default.read_frame_filter is not None:
+                    f = self._config.default.read_frame_filter(label, f)
+                # Newly read frame, add it to our weak_cache
+                self._weak_cache[label] = f
+                yield f
+
     @store_coherent_non_write
     def read_many(
         self,
         labels: tp.Iterable[TLabel],
     ) -> tp.Iterator[TFrameAny]:
+        if self._config.default.read_memory_map:
+            yield from self._read_many_memory_map(labels)
+        else:
+            yield from self._read_many_decode(labels)
+
+    def _read_many_decode(
+        self,
+        labels: tp.Iterable[TLabel],
+    ) -> tp.Iterator[TFrameAny]:
+        """
+        Read many frames with arrays read into memory.
+        """
         with zipfile.ZipFile(self._fp) as zf:
             archive = ArchiveZipWrapper(
                 zf,
@@ -603,9 +856,39 @@ class StoreZipNPY(Store):
                 f = ArchiveFrameConverter.frame_decode(
                     archive=archive,
                     constructor=Frame,
+                    columns_select=self._config[label].columns_select,
                 )
                 # Newly read frame, add it to our weak_cache
                 if self._config.default.read_frame_filter is not None:
                     f = self._config.default.read_frame_filter(label, f)
                 self._weak_cache[label] = f
                 yield f
+
+    @store_coherent_non_write
+    def read_metadata_many(
+        self,
+        labels: tp.Iterable[TLabel],
+    ) -> tp.Iterator[FrameMetadata | None]:
+        """
+        For each label, yield the :obj:`FrameMetadata` of the Frame from the manifest, if valid, or otherwise from NPY headers, without reading array data.
+        """
+        if self._get_manifest() is not None:
+            yield from super().read_metadata_many(labels)
+            return
+
+        with zipfile.ZipFile(self._fp) as zf:
+            archive = ArchiveZipWrapper(
+                zf,
+                writeable=False,
+                memory_map=False,
+                delimiter=self._DELIMITER,
+            )
+            for label in labels:
+                if not self._metadata_readable(label):
+                    yield None
+                    continue
+                archive.prefix = self._config.default.label_encode(label)  # mutate
+                if archive.FILE_META not in archive:
+                    yield None
+                    continue
+                yield ArchiveFrameConverter.frame_metadata_decode(archive=archive)
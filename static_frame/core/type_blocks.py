@@ -37,6 +37,7 @@ from static_frame.core.node_selector import InterGetItemLocReduces
 from static_frame.core.util import (
     DEFAULT_FAST_SORT_KIND,
     DEFAULT_SORT_KIND,
+    DEFAULT_STABLE_SORT_KIND,
     DTYPE_BOOL,
     DTYPE_OBJECT,
     EMPTY_ARRAY,
@@ -179,13 +180,15 @@ def group_match(
         else:
             row_key = None if not drop else drop_mask
 
-    # generate all selection masks in a vectorized operation
-    # creates a 2D array where each row is a Boolean comparison to one group idx
-    # used assign selection with `np.equal(locations, idx, out=selection)`, which has lower memory footprint but more function calls / object translations
-    masks = locations == np.arange(group_count).reshape(-1, 1)
+    # rather than a 2D Boolean mask of groups by positions, order positions by group with a stable sort, such that each group's positions are a contiguous, ascending segment
+    ordering = np.argsort(locations, kind=DEFAULT_STABLE_SORT_KIND)
+    ends = np.cumsum(np.bincount(locations, minlength=group_count))
 
+    start = 0
     for idx, g in enumerate(groups):
-        selection = masks[idx]
+        end = ends[idx]
+        selection = ordering[start:end]
+        start = end
         if axis == 0:  # return row
             yield (
                 g,
@@ -1414,8 +1417,8 @@ class TypeBlocks(ContainerOperand):
                 if size_one_unity and b.size == 1 and not skipna:
                     # No function call is necessary; if skipna could turn NaN to zero.
                     end = pos + 1
-                    # Can assign an array, even 2D, as an element if size is 1
-                    out[pos] = b
+                    # NOTE: assign the element, as an object array would store the array itself
+                    out[pos] = b.reshape(-1)[0]
                 elif b.ndim == 1:
                     end = pos + 1
                     out[pos] = func(array=b, axis=axis)
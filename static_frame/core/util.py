@@ -1070,6 +1070,13 @@ def get_concurrent_executor(
     max_workers: tp.Optional[int],
     mp_context: TMpContext,
 ) -> tp.Type[Executor]:
+    from static_frame.core.executor import ExecutorContext
+
+    shared = ExecutorContext.active(use_threads=use_threads, mp_context=mp_context)
+    if shared is not None:
+        # NOTE: the shared executor is not shut down on exiting the ``with`` block
+        return partial(contextlib.nullcontext, shared)  # type: ignore
+
     # NOTE: these imports are conditional as these modules are not supported in pyodide
     exe: tp.Callable[..., Executor]
     if use_threads:
@@ -1655,6 +1662,76 @@ def ufunc_unique1d_indexer(
     return values, indexer
 
 
+# reducing functions that can be applied to contiguous segments of an array with a ufunc's reduceat
+UFUNC_TO_REDUCEAT: tp.Dict[tp.Callable[..., tp.Any], np.ufunc] = {
+    np.sum: np.add,
+    np.prod: np.multiply,
+    np.min: np.minimum,
+    np.amin: np.minimum,
+    np.max: np.maximum,
+    np.amax: np.maximum,
+}
+
+UFUNC_GROUP_REDUCE = frozenset(
+    chain(UFUNC_TO_REDUCEAT.keys(), (np.mean, np.var, np.std, len))
+)
+
+
+def ufunc_group_reduce(
+    array: TNDArrayAny,
+    starts: TNDArrayIntDefault,
+    counts: TNDArrayIntDefault,
+    func: tp.Callable[..., tp.Any],
+    *,
+    dtype: tp.Optional[TDtypeAny] = None,
+) -> tp.Optional[TNDArrayAny]:
+    """
+    Given an ``array`` ordered such that groups are contiguous along axis 0, with group positions given by ``starts`` and sizes given by ``counts``, return an array of the result of applying ``func`` to each group (reducing all axes), or None if ``func`` or the ``array`` dtype are not supported.
+
+    Args:
+        dtype: the dtype of the result; if None, the dtype of ``func`` applied to a single-row group.
+    """
+    if func not in UFUNC_GROUP_REDUCE:
+        return None
+    if func is len:
+        return counts
+    kind = array.dtype.kind
+    if (kind not in DTYPE_INT_KINDS and kind != DTYPE_FLOAT_KIND) or not array.size:
+        return None
+
+    if dtype is None:
+        dtype = np.asarray(func(array[:1])).dtype
+    ufunc = UFUNC_TO_REDUCEAT.get(func)
+    post: TNDArrayAny
+
+    if ufunc is not None:
+        if ufunc is np.add or ufunc is np.multiply:
+            post = ufunc.reduceat(array, starts, axis=0, dtype=dtype)
+        else:
+            post = ufunc.reduceat(array, starts, axis=0)
+        if array.ndim == 2:
+            post = ufunc.reduce(post, axis=1)
+        return post
+
+    # mean, var, std
+    size = counts if array.ndim == 1 else counts * array.shape[1]
+    dtype_sum = DTYPE_FLOAT_DEFAULT if kind in DTYPE_INT_KINDS else None
+    total = np.add.reduceat(array, starts, axis=0, dtype=dtype_sum)
+    if array.ndim == 2:
+        total = total.sum(axis=1)
+    post = total / size
+    if func is not np.mean:
+        mean = np.repeat(post, counts)
+        deviation = array - (mean if array.ndim == 1 else mean.reshape(-1, 1))
+        total = np.add.reduceat(deviation * deviation, starts, axis=0)
+        if array.ndim == 2:
+            total = total.sum(axis=1)
+        post = total / size
+        if func is np.std:
+            post = np.sqrt(post)
+    return post.astype(dtype, copy=False)
+
+
 def ufunc_unique1d_positions(
     array: TNDArrayAny,
 ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
@@ -2349,6 +2426,7 @@ TD64_NS = np.timedelta64(1, 'ns')
 DT_NOT_FROM_INT = (DT64_DAY, DT64_MONTH)  # year is handled separately
 
 DTU_PYARROW = frozenset(('ns', 'D', 's'))
+DTU_PYARROW_ZERO_COPY = frozenset(('ns', 's'))  # D is converted to date32
 
 
 def to_datetime64(
@@ -3637,8 +3715,7 @@ def array_from_element_method(
 class PositionsAllocator:
     """Resource for re-using a single array of contiguous ascending integers for common applications in IndexBase."""
 
-    _size: int = 1024  # 1048576
-    _array: TNDArrayIntDefault = np.arange(_size, dtype=DTYPE_INT_DEFAULT)
+    _array: TNDArrayIntDefault = np.arange(1024, dtype=DTYPE_INT_DEFAULT)
     _array.flags.writeable = False
 
     # NOTE: preliminary tests of using lru-style caching on these instances has not shown a general benfit
@@ -3648,12 +3725,14 @@ class PositionsAllocator:
         if size == 1:
             return UNIT_ARRAY_INT
 
-        if size > cls._size:
-            cls._size = size * 2
-            cls._array = np.arange(cls._size, dtype=DTYPE_INT_DEFAULT)
-            cls._array.flags.writeable = False
+        # NOTE: read the class attribute once, and only replace it with a complete array, such that concurrent callers always slice an array of sufficient size
+        array = cls._array
+        if size > len(array):
+            array = np.arange(size * 2, dtype=DTYPE_INT_DEFAULT)
+            array.flags.writeable = False
+            cls._array = array
         # slices of immutable arrays are immutable
-        return cls._array[:size]
+        return array[:size]
 
 
 def array_sample(
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections.abc import Set, Sized
 from functools import partial
-from itertools import chain
 
 import numpy as np
 import typing_extensions as tp
@@ -56,6 +55,7 @@ from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.util import (
     BOOL_TYPES,
     DEFAULT_SORT_KIND,
+    DTYPE_BOOL,
     DTYPE_INT_DEFAULT,
     DTYPE_OBJECT,
     EMPTY_SLICE,
@@ -812,17 +812,18 @@ class Yarn(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
 
     @property
     def dtypes(self) -> TFrameAny:
-        """Returns a Frame of dtypes for all loaded Frames."""
-        deferred_dtypes = Series((None,))
+        """Returns a Frame of dtypes for all loaded Frames, as well as unloaded Frames with dtypes available from :obj:`Store` metadata."""
+        # collect dtypes Frame, reading metadata of each Bus in one pass
+        dtypes = [(b.dtypes if b is not None else None) for b in self._values]
 
         def gen() -> tp.Iterator[TSeriesObject]:
             for b_pos, frame_label in self._hierarchy._extract_iloc(self._indexer):
-                b = self._values[b_pos]
-                f = b._values_mutable[b.index.loc_to_iloc(frame_label)]  # pyright: ignore
-                if f is FrameDeferred:
-                    yield deferred_dtypes
-                else:
-                    yield f.dtypes
+                f = dtypes[b_pos]
+                s = f.iloc[f.index.loc_to_iloc(frame_label)]  # pyright: ignore
+                # drop columns only found in other Frames of this Bus; as np.dtype(None) is float64, identity is used rather than isna()
+                yield s[
+                    np.fromiter((dt is not None for dt in s.values), dtype=DTYPE_BOOL)
+                ]
 
         return Frame.from_concat(gen(), index=self._index, fill_value=None)
 
@@ -860,7 +861,7 @@ class Yarn(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
     @property
     def status(self) -> TFrameAny:
         """
-        Return a :obj:`Frame` indicating loaded status, size, bytes, and shape of all loaded :obj:`Frame` in :obj:`Bus` contined in this :obj:`Yarn`.
+        Return a :obj:`Frame` indicating loaded status, size, bytes, and shape of all loaded :obj:`Frame`, as well as counts of hits, misses, and evictions, in :obj:`Bus` contined in this :obj:`Yarn`.
         """
         # collect status Frame
         status = [(b.status if b is not None else None) for b in self._values]
@@ -871,7 +872,9 @@ class Yarn(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                 yield f._extract_array(f.index.loc_to_iloc(frame_label))
 
         return Frame.from_records(
-            gen(), index=self._index, columns=('loaded', 'size', 'nbytes', 'shape')
+            gen(),
+            index=self._index,
+            columns=('loaded', 'size', 'nbytes', 'shape', 'hits', 'misses', 'evictions'),
         )
 
     @property
@@ -1261,41 +1264,31 @@ class Yarn(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
         """
         ArchiveManifest.to_manifest(fp, self, label_encoder=label_encoder)
 
-    def _to_signature_bytes(
+    def _iter_signature_bytes(
         self,
         include_name: bool = True,
         include_class: bool = True,
         encoding: str = 'utf-8',
-    ) -> bytes:
+    ) -> tp.Iterator[bytes | memoryview]:
         # For a Yarn, the signature bytes need only contain the signature of the associated Frame and the index; all else are internal implementation mechanisms
 
-        v = (
-            f._to_signature_bytes(
+        yield from iter_component_signature_bytes(
+            self,
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        yield from self._index._iter_signature_bytes(
+            include_name=include_name,
+            include_class=include_class,
+            encoding=encoding,
+        )
+        for f in self._axis_element():
+            yield from f._iter_signature_bytes(
                 include_name=include_name,
                 include_class=include_class,
                 encoding=encoding,
             )
-            for f in self._axis_element()
-        )
-
-        return b''.join(
-            chain(
-                iter_component_signature_bytes(
-                    self,
-                    include_name=include_name,
-                    include_class=include_class,
-                    encoding=encoding,
-                ),
-                (
-                    self._index._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding,
-                    ),
-                ),
-                v,
-            )
-        )
 
 
 TYarnAny = Yarn[tp.Any]
@@ -16,17 +16,22 @@ from static_frame.core.archive_npy import (
     NPY,
     NPZ,
     ArchiveDirectory,
+    ArchiveFrameConverter,
     ArchiveManifest,
+    ArchiveSharedMemory,
     ArchiveZip,
     ArchiveZipWrapper,
     NPYConverter,
+    NPZFrameConverter,
 )
 from static_frame.core.bus import Bus
 from static_frame.core.exception import AxisInvalid, ErrorNPYDecode, ErrorNPYEncode
 from static_frame.core.frame import Frame
 from static_frame.core.index import Index
+from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.metadata import NPYLabel
 from static_frame.core.store_config import StoreConfig
+from static_frame.core.type_blocks import TypeBlocks
 from static_frame.core.yarn import Yarn
 from static_frame.test.test_case import TestCase, temp_file
 
@@ -1090,6 +1095,136 @@ class TestUnit(TestCase):
                 {'f1', 'f2', 'f3'},
             )
 
+    # ---------------------------------------------------------------------------
+
+    def test_frame_decode_columns_select_a(self) -> None:
+        blocks = (
+            np.arange(6).reshape(3, 2),
+            np.array([0.5, 1.5, 2.5]),
+            np.array([True, False, True]),
+            np.array(['a', 'b', 'c']).reshape(3, 1),
+            np.arange(9).reshape(3, 3),
+        )
+        f1 = Frame(TypeBlocks.from_blocks(blocks), columns=tuple('pqrstuvw'), name='a')
+        self.assertEqual(f1._blocks.shapes.tolist(), [(3, 2), (3,), (3,), (3, 1), (3, 3)])
+
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp)
+            labels = f1.columns.values.tolist()
+            for select in (
+                labels[:1],
+                labels[1:2],
+                [labels[5], labels[0]],
+                labels[3:4],
+                labels[5:7],
+                labels[5:],
+                [labels[7], labels[5]],
+                [],
+            ):
+                f2 = NPZFrameConverter.from_archive(
+                    constructor=Frame,
+                    fp=fp,
+                    columns_select=select,
+                )
+                self.assertEqualFrames(f2, f1.loc[:, f1.columns.isin(select)])
+
+    def test_frame_decode_columns_select_b(self) -> None:
+        f1 = Frame(
+            np.arange(20).reshape(4, 5),
+            columns=IndexHierarchy.from_product(('a', 'b'), (1, 2, 3))[:5],
+        )
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp)
+            archive = ArchiveZip(fp, writeable=False, memory_map=False)
+            f2 = ArchiveFrameConverter.frame_decode(
+                archive=archive,
+                constructor=Frame,
+                columns_select=(('b', 1), ('a', 1), ('a', 3)),
+            )
+            self.assertEqual(
+                f2.to_pairs(),
+                (
+                    (('a', 1), ((0, 0), (1, 5), (2, 10), (3, 15))),
+                    (('a', 3), ((0, 2), (1, 7), (2, 12), (3, 17))),
+                    (('b', 1), ((0, 3), (1, 8), (2, 13), (3, 18))),
+                ),
+            )
+            self.assertIs(f2.columns.__class__, IndexHierarchy)
+            # a non-contiguous selection from a 2D block is not a view
+            self.assertFalse(f2._blocks._blocks[0].flags.writeable)
+
+    def test_frame_decode_columns_select_c(self) -> None:
+        f1 = ff.parse('s(3,4)|v(int,str)')
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp, include_columns=False, include_index=False)
+            f2 = NPZFrameConverter.from_archive(
+                constructor=Frame,
+                fp=fp,
+                columns_select=(1, 3),
+            )
+            self.assertEqual(f2.columns.values.tolist(), [0, 1])
+            self.assertEqual(f2.values.tolist(), f1.iloc[:, [1, 3]].values.tolist())
+
+    # ---------------------------------------------------------------------------
+
+    def test_archive_shared_memory_a(self) -> None:
+        f1 = Frame(
+            TypeBlocks.from_blocks(
+                (
+                    np.arange(8).reshape(2, 4).T,  # F-ordered
+                    np.array(['a', 'bb', 'c', 'd']),
+                    np.array([0.5, 1.5, 2.5, 3.5]),
+                )
+            ),
+            index=IndexHierarchy.from_product(('p', 'q'), (1, 2)),
+            columns=tuple('wxyz'),
+            name='a',
+        )
+        archive1 = ArchiveSharedMemory()
+        NPZFrameConverter.frame_encode(archive=archive1, frame=f1)
+        descriptor = archive1.to_shared_memory()
+
+        archive2 = ArchiveSharedMemory(descriptor)
+        f2 = NPZFrameConverter.frame_decode(archive=archive2, constructor=Frame)
+        self.assertEqualFrames(f1, f2)
+        self.assertFalse(f2._blocks._blocks[0].flags.writeable)
+        self.assertFalse(f2._blocks._blocks[0].flags.owndata)
+        # the segment cannot be closed while arrays are views of it
+        with self.assertRaises(BufferError):
+            archive2.close()
+        del f2
+        archive2.close()
+
+        archive3 = ArchiveSharedMemory(descriptor, copy=True)
+        f3 = NPZFrameConverter.frame_decode(archive=archive3, constructor=Frame)
+        archive3.close()
+        self.assertEqualFrames(f1, f3)
+
+        archive1.close()
+        archive1.unlink()
+        with self.assertRaises(FileNotFoundError):
+            ArchiveSharedMemory(descriptor)
+
+    def test_archive_shared_memory_b(self) -> None:
+        archive = ArchiveSharedMemory()
+        with self.assertRaises(ErrorNPYEncode):
+            archive.write_array('a', np.array([None, 1]))
+        with self.assertRaises(ErrorNPYEncode):
+            archive.write_array('a', np.arange(8).reshape(2, 2, 2))
+
+        archive.write_array('a', np.arange(3))
+        archive.write_array('b', np.arange(0))
+        archive.write_metadata({'x': [1, 2]})
+        descriptor = archive.to_shared_memory()
+        self.assertEqual([spec[0] for spec in descriptor.arrays.values()], [0, 64])
+        self.assertEqual(archive.read_metadata(), {'x': [1, 2]})
+        self.assertEqual(archive.read_array_header('a')[2], (3,))
+        self.assertEqual(archive.size_array('a'), 24)
+        self.assertEqual(archive.read_array('b').tolist(), [])
+        self.assertEqual(list(archive.labels()), ['a', 'b'])
+        archive.close()
+        archive.unlink()
+
 
 if __name__ == '__main__':
     import unittest
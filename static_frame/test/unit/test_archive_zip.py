@@ -5,7 +5,12 @@ from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile
 import numpy as np
 
 # from static_frame.core.archive_zip import ZipFilePartRO
-from static_frame.core.archive_zip import ZipFileRO, ZipInfoRO, zip_namelist
+from static_frame.core.archive_zip import (
+    FileRangeRO,
+    ZipFileRO,
+    ZipInfoRO,
+    zip_namelist,
+)
 from static_frame.core.frame import Frame
 from static_frame.test.test_case import TestCase, temp_file
 
@@ -179,6 +184,47 @@ class TestUnit(TestCase):
                 with ZipFileRO(fp) as zfro:
                     pass
 
+    # ---------------------------------------------------------------------------
+    def test_zip_file_ro_data_offset_a(self) -> None:
+        with temp_file('.zip') as fp:
+            with ZipFile(fp, 'w') as zf:
+                zf.writestr('foo', b'abc')
+                zf.writestr('bar', b'defg')
+
+            with ZipFileRO(fp) as zf, open(fp, 'rb') as file:
+                for name, data in (('foo', b'abc'), ('bar', b'defg')):
+                    file.seek(zf.data_offset(name))
+                    self.assertEqual(file.read(len(data)), data)
+
+    def test_file_range_ro_a(self) -> None:
+        inner = io.BytesIO()
+        with ZipFile(inner, 'w') as zf:
+            zf.writestr('a', b'123')
+            zf.writestr('b', b'4567')
+
+        with temp_file('.zip') as fp:
+            with ZipFile(fp, 'w') as zf:
+                zf.writestr('pre', b'x' * 100)
+                zf.writestr('inner.zip', inner.getvalue())
+
+            with open(fp, 'rb') as file:
+                zf_outer = ZipFileRO(file)
+                offset = zf_outer.data_offset('inner.zip')
+                size = zf_outer.getinfo('inner.zip').file_size
+
+                fr = FileRangeRO(file, offset, size)
+                self.assertTrue(fr.seekable())
+                self.assertEqual(fr.read(2), b'PK')
+                self.assertEqual(fr.tell(), 2)
+                self.assertEqual(fr.seek(0, 2), size)
+                self.assertEqual(fr.read(), b'')
+                with self.assertRaises(OSError):
+                    fr.seek(-1, 0)
+
+                zf_inner = ZipFileRO(fr)  # type: ignore[arg-type]
+                self.assertEqual(zf_inner.namelist(), ['a', 'b'])
+                self.assertEqual(zf_inner.read('b'), b'4567')
+
     # ---------------------------------------------------------------------------
     def test_zip_namelist_a(self) -> None:
         with temp_file('.zip') as fp:
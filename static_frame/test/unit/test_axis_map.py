@@ -4,11 +4,17 @@ import frame_fixtures as ff
 import numpy as np
 import typing_extensions as tp
 
-from static_frame.core.axis_map import bus_to_hierarchy, buses_to_iloc_hierarchy
+from static_frame.core.axis_map import (
+    bus_to_hierarchy,
+    buses_to_iloc_hierarchy,
+    hierarchy_to_offsets,
+    offsets_to_component_keys,
+)
 from static_frame.core.bus import Bus
 from static_frame.core.exception import (
     AxisInvalid,
     ErrorInitBus,
+    ErrorInitIndexNonUnique,
     ErrorInitQuilt,
     ErrorInitYarn,
 )
@@ -204,6 +210,50 @@ class TestUnit(TestCase):
             [[0, 'f1'], [0, 'f2'], [0, 'f3'], [1, 'f4'], [1, 'f5']],
         )
 
+    def test_hierarchy_to_offsets_a(self) -> None:
+        ih1 = IndexHierarchy.from_labels(
+            (('a', 0), ('a', 1), ('b', 0), ('c', 0), ('c', 1), ('c', 2))
+        )
+        offsets, labels = hierarchy_to_offsets(ih1)
+        self.assertEqual(offsets.tolist(), [0, 2, 3, 6])
+        self.assertEqual(labels, ['a', 'b', 'c'])
+        self.assertFalse(offsets.flags.writeable)
+
+        offsets, labels = hierarchy_to_offsets(ih1.iloc[:0])
+        self.assertEqual(offsets.tolist(), [0])
+        self.assertEqual(labels, [])
+
+    def test_offsets_to_component_keys_a(self) -> None:
+        offsets = np.array([0, 2, 3, 6])
+
+        def keys(key: tp.Any) -> tp.List[tp.Tuple[int, tp.Any]]:
+            return [
+                (i, k if isinstance(k, slice) else k.tolist())
+                for i, k in offsets_to_component_keys(offsets, key)
+            ]
+
+        self.assertEqual(keys(0), [(0, slice(0, 1))])
+        self.assertEqual(keys(4), [(2, slice(1, 2))])
+        self.assertEqual(keys(-1), [(2, slice(2, 3))])
+        self.assertEqual(
+            keys(slice(1, 4)), [(0, slice(1, 2)), (1, slice(0, 1)), (2, slice(0, 1))]
+        )
+        self.assertEqual(keys(slice(3, None)), [(2, slice(0, 3))])
+        self.assertEqual(keys(slice(4, 4)), [])
+        self.assertEqual(keys([5, 0]), [(2, [False, False, True]), (0, [True, False])])
+        self.assertEqual(
+            keys(np.array([False, True, True, False, False, False])),
+            [(0, [False, True]), (1, [True])],
+        )
+        self.assertEqual(
+            keys(slice(None, None, -2)),
+            [(2, [True, False, True]), (0, [False, True])],
+        )
+        with self.assertRaises(IndexError):
+            keys(6)
+        with self.assertRaises(ErrorInitIndexNonUnique):
+            keys([3, 1, 3])
+
 
 if __name__ == '__main__':
     import unittest
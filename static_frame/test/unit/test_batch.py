@@ -41,6 +41,10 @@ def func2(label: TLabel, f: Frame) -> Frame:
     return f.loc['q']
 
 
+def func3(f: Frame) -> Frame:
+    return f * 2
+
+
 class TestUnit(TestCase):
     def test_normalize_container_a(self) -> None:
         post = normalize_container(np.arange(8).reshape(2, 4))
@@ -387,6 +391,47 @@ class TestUnit(TestCase):
         )
         self.assertEqual(post.to_pairs(), (('d', (('f3', 20),)), ('b', (('f3', 60),))))
 
+    def test_batch_apply_shared_memory_a(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2), b=(3, 4)), index=('x', 'y'), name='f1')
+        f2 = Frame.from_dict(
+            dict(c=(1.5, 2.5, 3.5), b=('p', 'q', 'r')),
+            index=IndexDate.from_date_range('2024-01-01', '2024-01-03'),
+            name='f2',
+        )
+        # object dtypes are pickled
+        f3 = Frame.from_dict(dict(d=(10, 'w'), b=(50, 60)), index=('x', 'q'), name='f3')
+
+        post = dict(
+            Batch.from_frames((f1, f2, f3), max_workers=3, use_shared_memory=True)
+            .apply(func3)
+            .items()
+        )
+        self.assertEqualFrames(post['f1'], f1 * 2)
+        self.assertEqualFrames(post['f2'], f2 * 2)
+        self.assertEqualFrames(post['f3'], f3 * 2)
+        self.assertEqual(post['f2'].index.__class__, IndexDate)
+
+        post = (
+            Batch.from_frames((f1, f2, f3), max_workers=3, use_shared_memory=True)
+            .apply_except(func1, KeyError)
+            .to_frame()
+        )
+        self.assertEqual(post.to_pairs(), (('d', (('f3', 'w'),)), ('b', (('f3', 60),))))
+
+    def test_batch_apply_shared_memory_b(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2), b=(3, 4)), index=('x', 'y'), name='f1')
+        f2 = Frame.from_dict(dict(a=(5, 6), b=(7, 8)), index=('x', 'y'), name='f2')
+
+        post = (
+            Batch.from_frames((f1, f2), max_workers=2, use_shared_memory=True)
+            .sum()
+            .to_frame()
+        )
+        self.assertEqual(
+            post.to_pairs(),
+            (('a', (('f1', 3), ('f2', 11))), ('b', (('f1', 7), ('f2', 15)))),
+        )
+
     # ---------------------------------------------------------------------------
 
     def test_batch_apply_items_a(self) -> None:
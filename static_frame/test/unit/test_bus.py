@@ -3,7 +3,9 @@ from __future__ import annotations
 import ast
 import os
 import pickle
+import time
 from ast import literal_eval
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from hashlib import sha256
 from tempfile import TemporaryDirectory
@@ -13,7 +15,7 @@ import numpy as np
 import typing_extensions as tp
 
 from static_frame.core.batch import Batch
-from static_frame.core.bus import Bus, FrameDeferred
+from static_frame.core.bus import Bus, FrameDeferred, iter_prefetch
 from static_frame.core.display_config import DisplayConfig
 from static_frame.core.exception import (
     ErrorInitBus,
@@ -30,7 +32,7 @@ from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.series import Series
 from static_frame.core.store_config import StoreConfig, StoreConfigMap
 from static_frame.core.store_zip import StoreZipTSV
-from static_frame.core.util import SortStatus
+from static_frame.core.util import SortStatus, TLabel
 from static_frame.test.test_case import TestCase, skip_win, temp_file
 
 
@@ -244,6 +246,84 @@ class TestUnit(TestCase):
                 b2.shapes.to_pairs(), (('f1', None), ('f2', (3, 2)), ('f3', (2, 2)))
             )
 
+    def test_bus_shapes_b(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2), b=(3, 4)), index=('x', 'y'), name='f1')
+        f2 = Frame.from_dict(
+            dict(c=(1.5, 2, 3), b=(4, 5, 6)), index=('x', 'y', 'z'), name='f2'
+        )
+        b1 = Bus.from_frames((f1, f2))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp, config=StoreConfig(write_manifest=True))
+            b2 = Bus.from_zip_npz(fp, config=StoreConfig(read_manifest=True))
+            self.assertIsNot(b2._store._get_manifest(), None)
+
+            self.assertEqual(b2.shapes.to_pairs(), (('f1', (2, 2)), ('f2', (3, 2))))
+            self.assertEqual(
+                b2.dtypes.sort_columns().to_pairs(),
+                (
+                    ('a', (('f1', np.dtype('int64')), ('f2', None))),
+                    ('b', (('f1', np.dtype('int64')), ('f2', np.dtype('int64')))),
+                    ('c', (('f1', None), ('f2', np.dtype('float64')))),
+                ),
+            )
+            self.assertEqual(b2.status['loaded'].sum(), 0)
+
+    def test_bus_shapes_c(self) -> None:
+        f1 = ff.parse('s(2,3)|v(int,float)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(4,2)|v(bool)|c(I,str)').rename('f2')
+        b1 = Bus.from_frames((f1, f2))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp)
+            f2_loaded = b2['f2']
+
+            # metadata of unloaded Frame is read from NPY headers
+            self.assertEqual(b2.shapes.to_pairs(), (('f1', (2, 3)), ('f2', (4, 2))))
+            self.assertEqual(
+                b2.dtypes.sort_columns().to_pairs(),
+                (
+                    ('zUvW', (('f1', np.dtype('int64')), ('f2', None))),
+                    ('zZbu', (('f1', np.dtype('int64')), ('f2', np.dtype('bool')))),
+                    ('ztsv', (('f1', np.dtype('float64')), ('f2', np.dtype('bool')))),
+                ),
+            )
+            self.assertEqual(
+                b2.status['loaded'].to_pairs(), (('f1', False), ('f2', True))
+            )
+
+    def test_bus_shapes_d(self) -> None:
+        f1 = Frame.from_dict(dict(p=(1, 2, 3), q=(1.5, 2.5, 3.5)), name='f1')
+        f2 = Frame.from_dict(dict(p=(4, 5, 6), q=(True, False, True)), name='f2')
+        b1 = Bus.from_frames((f1, f2))
+
+        # metadata from both NPY headers and manifests
+        for config in (
+            StoreConfig(columns_select=['p']),
+            StoreConfig(read_frame_filter=lambda l, f: f.iloc[:1]),
+            StoreConfig(columns_select=['p'], read_manifest=True),
+            StoreConfig(read_frame_filter=lambda l, f: f.iloc[:1], read_manifest=True),
+        ):
+            for to_zip, from_zip in (
+                (b1.to_zip_npz, Bus.from_zip_npz),
+                (b1.to_zip_npy, Bus.from_zip_npy),
+            ):
+                with temp_file('.zip') as fp:
+                    to_zip(fp, config=StoreConfig(write_manifest=True))
+                    b2 = from_zip(fp, config=config)
+                    # metadata is not known without reading Frame
+                    shapes = b2.shapes
+                    self.assertEqual(shapes.to_pairs(), (('f1', None), ('f2', None)))
+                    self.assertEqual(b2.dtypes.shape, (2, 0))
+                    self.assertEqual(b2.status['loaded'].sum(), 0)
+
+                    b2.values  # force loading
+                    self.assertEqual(
+                        b2.shapes.to_pairs(),
+                        tuple((label, f.shape) for label, f in b2.items()),
+                    )
+
     @skip_win
     def test_bus_nbytes_a(self) -> None:
         f1 = Frame.from_dict(dict(a=(1, 2), b=(3, 4)), index=('x', 'y'), name='f1')
@@ -329,7 +409,7 @@ class TestUnit(TestCase):
             b2 = Bus.from_zip_pickle(fp)
 
             status = b2.status
-            self.assertEqual(status.shape, (3, 4))
+            self.assertEqual(status.shape, (3, 7))
             # force load all
             tuple(b2.items())
 
@@ -340,6 +420,9 @@ class TestUnit(TestCase):
                     ('size', (('f1', 4.0), ('f2', 6.0), ('f3', 4.0))),
                     ('nbytes', (('f1', 32.0), ('f2', 48.0), ('f3', 32.0))),
                     ('shape', (('f1', (2, 2)), ('f2', (3, 2)), ('f3', (2, 2)))),
+                    ('hits', (('f1', 0), ('f2', 0), ('f3', 0))),
+                    ('misses', (('f1', 1), ('f2', 1), ('f3', 1))),
+                    ('evictions', (('f1', 0), ('f2', 0), ('f3', 0))),
                 ),
             )
 
@@ -1638,6 +1721,228 @@ class TestUnit(TestCase):
 
             items = list(b2.items())
 
+    # ---------------------------------------------------------------------------
+    def test_bus_prefetch_a(self) -> None:
+        frames = [ff.parse(f's({i + 2},3)').rename(f'f{i}') for i in range(12)]
+        b1 = Bus.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            for max_persist in (None, 1, 3):
+                for prefetch in (1, 2, 5):
+                    b2 = Bus.from_zip_npz(fp, max_persist=max_persist, prefetch=prefetch)
+                    # load some Frame before iteration; these will be evicted
+                    _ = b2.iloc[8]
+                    _ = b2.iloc[1]
+                    for f1, (label, f2) in zip(frames, b2.items()):
+                        self.assertEqual(f1.name, label)
+                        self.assertTrue(f1.equals(f2))
+                        if max_persist is not None:
+                            self.assertTrue(b2._loaded.sum() <= max_persist)
+
+                    if max_persist is None:
+                        self.assertTrue(b2._loaded_all)
+                    else:
+                        # Frame read ahead count against max_persist
+                        held = max_persist - min(prefetch, max_persist - 1)
+                        self.assertEqual(
+                            list(b2._last_loaded),
+                            [f'f{i}' for i in range(12 - held, 12)],
+                        )
+
+    def test_bus_prefetch_b(self) -> None:
+        frames = [ff.parse(f's({i + 2},3)').rename(f'f{i}') for i in range(6)]
+        b1 = Bus.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp, max_persist=2, prefetch=2)
+
+            # terminating iteration early stops reading ahead
+            it = b2.items()
+            self.assertEqual(next(it)[0], 'f0')
+            self.assertEqual(next(it)[0], 'f1')
+            it.close()
+            # one Frame is read ahead, such that one Frame is held
+            self.assertEqual(b2.status['loaded'].sum(), 1)
+
+            b3 = b2.rename('foo')
+            self.assertEqual(b3._prefetch, 2)
+            self.assertEqual(
+                [f.shape for f in b3.iloc[2:].values], [(4, 3), (5, 3), (6, 3), (7, 3)]
+            )
+
+    def test_bus_prefetch_c(self) -> None:
+        with self.assertRaises(ErrorInitBus):
+            Bus(None, index=('a',), store=StoreZipTSV('foo.zip'), prefetch=0)
+
+    def test_bus_prefetch_d(self) -> None:
+        def read_many(labels: np.ndarray) -> tp.Iterator[Frame]:
+            for label in labels:
+                if label == 'b':
+                    raise ValueError('foo')
+                yield ff.parse('s(2,2)').rename(label)
+
+        post = iter_prefetch(read_many, np.array(('a', 'b')), 2)
+        self.assertEqual(next(post).shape, (2, 2))
+        with self.assertRaises(ValueError):
+            next(post)
+
+    def test_bus_prefetch_e(self) -> None:
+        frames = [ff.parse(f's({i + 2},3)').rename(f'f{i}') for i in range(10)]
+        b1 = Bus.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            for max_persist, prefetch in ((3, 2), (3, 8), (5, 3), (1, 2)):
+                b2 = Bus.from_zip_npz(fp, max_persist=max_persist, prefetch=prefetch)
+                store_read_many = b2._store.read_many  # type: ignore
+                read: tp.List[TLabel] = []
+
+                def read_many(labels: np.ndarray) -> tp.Iterator[Frame]:
+                    for f in store_read_many(labels):
+                        read.append(f.name)
+                        yield f
+
+                b2._store.read_many = read_many  # type: ignore
+                for count, _ in enumerate(b2.iter_element(), start=1):
+                    time.sleep(0.01)  # permit reading ahead
+                    # Frame held by the Bus and Frame read ahead of the consumer
+                    self.assertLessEqual(
+                        b2._loaded.sum() + len(read) - count, max_persist
+                    )
+                self.assertEqual(read, [f.name for f in frames])
+
+    # ---------------------------------------------------------------------------
+    def test_bus_threads_a(self) -> None:
+        frames = [ff.parse(f's({i + 2},3)').rename(f'f{i}') for i in range(12)]
+        b1 = Bus.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            for max_persist in (None, 1, 3):
+                b2 = Bus.from_zip_npz(fp, max_persist=max_persist)
+
+                def read(i: int) -> tp.List[tp.Tuple[int, int]]:
+                    shapes = [b2.iloc[(i + j) % 12].shape for j in range(12)]
+                    shapes.extend(f.shape for f in b2.values)
+                    shapes.extend(f.shape for _, f in b2.items())
+                    return shapes
+
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    for i, shapes in enumerate(executor.map(read, range(8))):
+                        self.assertEqual(
+                            shapes[:12], [((i + j) % 12 + 2, 3) for j in range(12)]
+                        )
+                        self.assertEqual(shapes[12:], [(j + 2, 3) for j in range(12)] * 2)
+
+                if max_persist is not None:
+                    self.assertLessEqual(b2.status['loaded'].sum(), max_persist)
+
+    def test_bus_threads_b(self) -> None:
+        frames = [ff.parse(f's({i + 2},3)').rename(f'f{i}') for i in range(6)]
+        b1 = Bus.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp)
+            # loading a Frame while iterating does not misalign planned reads
+            post = []
+            for label, f in b2.items():
+                if label == 'f1':
+                    self.assertEqual(b2.loc['f3'].shape, (5, 3))
+                post.append((label, f.shape))
+            self.assertEqual(post, [(f'f{i}', (i + 2, 3)) for i in range(6)])
+
+            b3 = pickle.loads(pickle.dumps(b2))
+            self.assertEqual(b3.iloc[0].shape, (2, 3))
+
+    # ---------------------------------------------------------------------------
+    def test_bus_max_persist_bytes_a(self) -> None:
+        # nbytes of 8000, 16000, 24000 repeated
+        frames = [
+            ff.parse(f's({(i % 3 + 1) * 100},10)|v(float)').rename(f'f{i}')
+            for i in range(9)
+        ]
+        b1 = Bus.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            for max_persist, prefetch in ((None, None), (None, 2), (2, None), (4, 3)):
+                b2 = Bus.from_zip_npz(
+                    fp,
+                    max_persist_bytes=30_000,
+                    max_persist=max_persist,
+                    prefetch=prefetch,
+                )
+                for _ in b2.iter_element():
+                    self.assertTrue(b2._loaded_nbytes <= 30_000)
+                    self.assertEqual(
+                        b2._loaded_nbytes,
+                        sum(f.nbytes for f in b2._values_mutable[b2._loaded]),
+                    )
+                self.assertEqual(list(b2._last_loaded), ['f8'])
+
+                # a Frame larger than the budget is still retained
+                b3 = Bus.from_zip_npz(fp, max_persist_bytes=10_000)
+                self.assertEqual(b3.iloc[2].shape, (300, 10))
+                self.assertEqual(b3._loaded.sum(), 1)
+                self.assertEqual(b3.iloc[0].shape, (100, 10))
+                self.assertEqual(b3._loaded.tolist(), [True] + [False] * 8)
+
+    def test_bus_max_persist_bytes_b(self) -> None:
+        frames = [
+            ff.parse(f's({(i % 3 + 1) * 100},10)|v(float)').rename(f'f{i}')
+            for i in range(6)
+        ]
+        b1 = Bus.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp, max_persist_bytes=30_000)
+
+            _ = b2.iloc[5]
+            # all targets of a persist are retained, even if exceeding the budget
+            b2.persist.iloc[[0, 1, 2]]
+            self.assertEqual(b2._loaded.tolist(), [True, True, True, False, False, False])
+            self.assertEqual(b2._loaded_nbytes, 48_000)
+
+            b2.persist.loc[['f3', 'f4']]
+            self.assertEqual(
+                b2._loaded.tolist(), [False, False, False, True, True, False]
+            )
+
+            b2.unpersist()
+            self.assertEqual(b2._loaded_nbytes, 0)
+
+            with self.assertRaises(ErrorInitBus):
+                Bus.from_zip_npz(fp, max_persist_bytes=0)
+
+    def test_bus_persist_counts_a(self) -> None:
+        frames = [ff.parse('s(4,3)').rename(f'f{i}') for i in range(4)]
+        b1 = Bus.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp, max_persist=2)
+
+            _ = b2['f0']
+            _ = b2['f0']
+            _ = b2['f1']
+            _ = b2['f2']
+            _ = b2['f0']
+
+            self.assertEqual(
+                b2.status[['hits', 'misses', 'evictions']].to_pairs(),
+                (
+                    ('hits', (('f0', 1), ('f1', 0), ('f2', 0), ('f3', 0))),
+                    ('misses', (('f0', 2), ('f1', 1), ('f2', 1), ('f3', 0))),
+                    ('evictions', (('f0', 1), ('f1', 1), ('f2', 0), ('f3', 0))),
+                ),
+            )
+
     # ---------------------------------------------------------------------------
     def test_bus_persistant_a1(self) -> None:
         f1 = ff.parse('s(4,2)').rename('f1')
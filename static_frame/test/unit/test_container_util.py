@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import csv
 import datetime
 
 import frame_fixtures as ff
@@ -22,8 +23,10 @@ from static_frame.core.container_util import (
     apex_to_name,
     apply_binary_operator_blocks_columnar,
     arrays_from_index_frame,
+    axis_window_reduce_items,
     bloc_key_normalize,
     container_to_exporter_attr,
+    delimited_to_arrays_chunked,
     get_block_match,
     get_col_dtype_factory,
     get_col_fill_value_factory,
@@ -33,17 +36,21 @@ from static_frame.core.container_util import (
     index_many_concat,
     index_many_to_one,
     is_static,
+    iter_array_signature_bytes,
+    iter_delimited_chunks,
     key_to_ascending_key,
     matmul,
     pandas_to_numpy,
+    parquet_row_groups_select,
+    parquet_where_to_expression,
 )
 
 # from static_frame.core.container_util import pandas_version_under_1
-from static_frame.core.exception import AxisInvalid
+from static_frame.core.exception import AxisInvalid, ErrorInitFrame, InvalidWindowLabel
 from static_frame.core.fill_value_auto import FillValueAuto
 from static_frame.core.frame import FrameHE
 from static_frame.core.util import ManyToOneType
-from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import TestCase, temp_file
 
 
 class TestUnit(TestCase):
@@ -1108,6 +1115,246 @@ class TestUnit(TestCase):
         )
         self.assertEqual(labels, [1, 2])
 
+    # ---------------------------------------------------------------------------
+
+    def test_axis_window_reduce_items_a(self) -> None:
+        s = Series(range(6), index=tuple('abcdef'))
+        # not a recognized reduction
+        self.assertIsNone(
+            axis_window_reduce_items(source=s, func=np.median, size=2, as_array=True)
+        )
+        # windows are not recognized reductions of a Series
+        self.assertIsNone(
+            axis_window_reduce_items(source=s, func=np.mean, size=2, as_array=False)
+        )
+        # windows of variable size that do not share a start
+        self.assertIsNone(
+            axis_window_reduce_items(
+                source=s, func=np.sum, size=2, size_increment=1, as_array=True
+            )
+        )
+        # windows of a shared start without an accumulation
+        self.assertIsNone(
+            axis_window_reduce_items(
+                source=s, func=np.var, size=1, step=0, size_increment=1, as_array=True
+            )
+        )
+        self.assertIsNone(
+            axis_window_reduce_items(
+                source=s, func=np.sum, size=2, window_func=lambda w: w, as_array=True
+            )
+        )
+        self.assertIsNone(
+            axis_window_reduce_items(
+                source=s.astype(str), func=np.sum, size=2, as_array=True
+            )
+        )
+
+    def test_axis_window_reduce_items_b(self) -> None:
+        s = Series(range(8), index=tuple('abcdefgh'))
+        labels, values = axis_window_reduce_items(  # type: ignore
+            source=s, func=np.sum, size=3, step=2, start_shift=-1, as_array=True
+        )
+        self.assertEqual(labels.tolist(), ['d', 'f', 'h'])
+        self.assertEqual(values.tolist(), [6, 12, 18])
+
+    def test_axis_window_reduce_items_c(self) -> None:
+        f = Frame(np.arange(12).reshape(3, 4), columns=tuple('abcd'))
+        labels, values = axis_window_reduce_items(  # type: ignore
+            source=f,
+            func=np.max,
+            size=2,
+            axis=1,
+            label_shift=1,
+            label_missing_skips=False,
+            as_array=True,
+        )
+        self.assertEqual(list(labels), ['c', 'd', None])
+        self.assertEqual(values.tolist(), [9, 10, 11])
+
+        with self.assertRaises(InvalidWindowLabel):
+            axis_window_reduce_items(
+                source=f,
+                func=np.max,
+                size=2,
+                axis=1,
+                label_shift=1,
+                label_missing_raises=True,
+                as_array=True,
+            )
+
+    def test_axis_window_reduce_items_d(self) -> None:
+        s = Series((3, 1, 4, 1, 5), index=tuple('abcde'))
+        labels, values = axis_window_reduce_items(  # type: ignore
+            source=s, func=np.max, size=1, step=0, size_increment=1, as_array=True
+        )
+        self.assertEqual(labels.tolist(), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(values.tolist(), [3, 3, 4, 4, 5])
+
+        labels, values = axis_window_reduce_items(  # type: ignore
+            source=s,
+            func=len,
+            size=3,
+            window_sized=False,
+            start_shift=-2,
+            as_array=True,
+        )
+        self.assertEqual(labels.tolist(), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(values.tolist(), [1, 2, 3, 3, 3])
+
+    def test_axis_window_reduce_items_e(self) -> None:
+        s = Series((1.0, np.nan, 3.0, 4.0), index=tuple('abcd'))
+        # a Series window reduced with np.sum skips NaN
+        labels, values = axis_window_reduce_items(  # type: ignore
+            source=s, func=np.sum, size=2, as_array=False
+        )
+        self.assertEqual(labels.tolist(), ['b', 'c', 'd'])
+        self.assertEqual(values.tolist(), [1.0, 3.0, 7.0])
+
+        labels, values = axis_window_reduce_items(  # type: ignore
+            source=s, func=np.nanmean, size=1, step=0, size_increment=1, as_array=True
+        )
+        self.assertEqual(values.tolist(), [1.0, 1.0, 2.0, 2.6666666666666665])
+
+    # ---------------------------------------------------------------------------
+
+    def test_iter_array_signature_bytes_a(self) -> None:
+        a1 = np.arange(20).reshape(5, 4)  # C contiguous
+        for a in (a1, a1.T, a1[::2], a1[:, 1:3], a1[:, 2]):
+            for chunk_bytes in (1, 7, 16, 2**20):
+                post = list(iter_array_signature_bytes(a, chunk_bytes=chunk_bytes))
+                self.assertEqual(b''.join(post), a.tobytes('F'))
+                self.assertTrue(all(len(p) <= max(chunk_bytes, 8) for p in post))
+
+    def test_iter_array_signature_bytes_b(self) -> None:
+        a1 = np.array(['a', 'bcd', 'ef'])
+        a2 = np.arange(3).astype('datetime64[D]')
+        for a in (a1, a2, a1[::-1], a2[:0]):
+            post = b''.join(iter_array_signature_bytes(a, chunk_bytes=5))
+            self.assertEqual(post, a.tobytes())
+
+        with self.assertRaises(TypeError):
+            _ = list(iter_array_signature_bytes(np.array([None, 1])))
+
+    def test_iter_array_signature_bytes_c(self) -> None:
+        a1 = np.arange(10)
+        post = list(iter_array_signature_bytes(a1, chunk_bytes=40))
+        # contiguous arrays are yielded as views, not copies
+        self.assertTrue(all(isinstance(p, memoryview) for p in post))
+        self.assertEqual([len(p) for p in post], [40, 40])
+
+    # ---------------------------------------------------------------------------
+
+    def test_iter_delimited_chunks_a(self) -> None:
+        lines = ['1,a\n', '2,"b\n', 'c"\n', '3,"d""\n', '"\n', '4,e\n']
+        post = list(
+            iter_delimited_chunks(
+                lines,
+                chunk_rows=1,
+                delimiter=',',
+                quoting=csv.QUOTE_MINIMAL,
+                quote_char='"',
+                quote_double=True,
+                escape_char=None,
+                skip_initial_space=False,
+            )
+        )
+        self.assertEqual([len(chunk) for chunk in post], [1, 2, 2, 1])
+
+    def test_iter_delimited_chunks_b(self) -> None:
+        # with QUOTE_NONE, quote characters do not continue a record
+        lines = ['1,"a\n', '2,b\\\n', 'c\n', '3,d\n']
+        post = list(
+            iter_delimited_chunks(
+                lines,
+                chunk_rows=1,
+                delimiter=',',
+                quoting=csv.QUOTE_NONE,
+                quote_char='"',
+                quote_double=True,
+                escape_char='\\',
+                skip_initial_space=False,
+            )
+        )
+        self.assertEqual([len(chunk) for chunk in post], [1, 2, 1])
+
+    def test_iter_delimited_chunks_c(self) -> None:
+        # fields larger than the csv field size limit are scanned
+        lines = ['1,"a\n', 'b"\n', f'2,"{"x" * 200_000}"\n', '3,"c\n', 'd"\n', '4,e\n']
+        post = list(
+            iter_delimited_chunks(
+                lines,
+                chunk_rows=2,
+                delimiter=',',
+                quoting=csv.QUOTE_MINIMAL,
+                quote_char='"',
+                quote_double=True,
+                escape_char=None,
+                skip_initial_space=False,
+            )
+        )
+        self.assertEqual([len(chunk) for chunk in post], [3, 3])
+
+    def test_delimited_to_arrays_chunked_a(self) -> None:
+        # the second column is int in the first chunk and str in the second
+        lines = ['1,2,True', '3,4,False', '5,a,True']
+        post = delimited_to_arrays_chunked(
+            lines,
+            chunk_rows=2,
+            max_workers=2,
+            line_select=None,
+            dtypes=None,
+            delimiter=',',
+            quoting=csv.QUOTE_MINIMAL,
+            quote_char='"',
+            quote_double=True,
+            escape_char=None,
+            thousands_char='',
+            decimal_char='.',
+            skip_initial_space=False,
+        )
+        self.assertEqual([a.dtype.kind for a in post], ['i', 'U', 'b'])
+        self.assertEqual(post[1].tolist(), ['2', '4', 'a'])
+        self.assertFalse(post[0].flags.writeable)
+
+    def test_parquet_row_groups_select_a(self) -> None:
+        import pyarrow.parquet as pq
+
+        f = Frame.from_fields(
+            (np.arange(10), list('abcdefghij')),
+            columns=('a', 'b'),
+        )
+        with temp_file('.parquet') as fp:
+            f.to_parquet(fp, include_index=False, row_group_size=3)
+            with pq.ParquetFile(fp) as pf:
+                metadata = pf.metadata
+
+        def select(**kwargs: tp.Any) -> tp.List[int]:
+            kwargs.setdefault('row_groups', None)
+            kwargs.setdefault('where', None)
+            return parquet_row_groups_select(metadata, **kwargs)
+
+        self.assertEqual(select(), [0, 1, 2, 3])
+        self.assertEqual(select(row_groups=(3, 0, 3)), [0, 3])
+        self.assertEqual(select(where=[('a', '==', 4)]), [1])
+        self.assertEqual(select(where=[('a', '<', 3)]), [0])
+        self.assertEqual(select(where=[('a', '<=', 3)]), [0, 1])
+        self.assertEqual(select(where=[('a', '>', 8)]), [3])
+        self.assertEqual(select(where=[('a', '>=', 8)]), [2, 3])
+        self.assertEqual(select(where=[('a', '!=', 9)]), [0, 1, 2])
+        self.assertEqual(select(where=[('b', 'in', ('a', 'j'))]), [0, 3])
+        self.assertEqual(select(where=[('a', '>', 2), ('b', '<', 'g')]), [1])
+        self.assertEqual(select(where=[('a', '>', 2)], row_groups=(0, 1)), [1])
+        # incomparable values do not exclude row groups
+        self.assertEqual(select(where=[('a', '==', 'x')]), [0, 1, 2, 3])
+
+        with self.assertRaises(ErrorInitFrame):
+            select(row_groups=(-1,))
+
+    def test_parquet_where_to_expression_a(self) -> None:
+        expression = parquet_where_to_expression([('a', 'in', (1, 2)), ('b', '<', 3)])
+        self.assertIn('is_in', str(expression))
+
 
 if __name__ == '__main__':
     import unittest
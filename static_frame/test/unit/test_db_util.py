@@ -324,6 +324,92 @@ def test_dbquery_create_a7():
         ]
 
 
+def test_dbquery_insert_chunks_a():
+    f = Frame.from_records(
+        [('a', 3, False), ('b', -20, True), ('c', 5, True)],
+        columns=('x', 'y', 'z'),
+        index=IndexHierarchy.from_labels([('p', 100), ('q', 200), ('r', 300)]),
+        name='foo',
+        dtypes=(np.str_, np.int64, np.bool_),
+    )
+    conn = sqlite3.connect(':memory:')
+    dbq = DBQuery.from_defaults(conn)
+    post = list(
+        dbq._sql_insert_chunks(
+            frame=f,
+            label=f.name,
+            schema='',
+            include_index=True,
+            chunksize=2,
+        )
+    )
+    assert post[0][0] == (
+        'INSERT INTO foo (__index0__,__index1__,x,y,z) VALUES (?,?,?,?,?),(?,?,?,?,?);'
+    )
+    assert post[0][1] == ['p', 100, 'a', 3, False, 'q', 200, 'b', -20, True]
+    assert (
+        post[1][0] == 'INSERT INTO foo (__index0__,__index1__,x,y,z) VALUES (?,?,?,?,?);'
+    )
+    assert post[1][1] == ['r', 300, 'c', 5, True]
+    assert post[1][1][1].__class__ is int
+
+
+def test_dbquery_insert_chunks_b():
+    f = Frame(np.arange(12).reshape(4, 3), columns=('x', 'y', 'z'), name='foo')
+    conn = sqlite3.connect(':memory:')
+    dbq = DBQuery(conn, DBType.SQLITE, '?', DBType.SQLITE.to_dytpe_to_type_decl())
+    # rows per query are limited by the maximum number of parameters
+    dbq._db_type = DBType.UNKNOWN
+    post = list(
+        dbq._sql_insert_chunks(
+            frame=f,
+            label=f.name,
+            schema='',
+            include_index=False,
+            chunksize=1000,
+        )
+    )
+    assert len(post) == 1
+    assert len(post[0][1]) == 12
+
+    f = Frame(np.arange(3000).reshape(1000, 3), name='foo')
+    post = list(
+        dbq._sql_insert_chunks(
+            frame=f,
+            label=f.name,
+            schema='',
+            include_index=False,
+            chunksize=1000,
+        )
+    )
+    assert [len(p) for _, p in post] == [999, 999, 999, 3]
+
+
+def test_dbquery_insert_chunks_c():
+    f = Frame.from_records(
+        [('a', 3, None), ('b', -20, 1.5), ('c', 5, 2.5)],
+        columns=('x', 'y', 'z'),
+        index=('p', 'q', 'r'),
+        name='foo',
+    )
+    with temp_file('.db') as fp:
+        conn = sqlite3.connect(fp)
+        dbq = DBQuery.from_defaults(conn)
+        dbq.execute(frame=f, label=f.name, include_index=True, chunksize=2)
+        conn.commit()
+        conn.close()
+
+        conn = sqlite3.connect(fp)
+        post = list(conn.cursor().execute(f'select * from {f.name}'))
+        assert post == [('p', 'a', 3, None), ('q', 'b', -20, 1.5), ('r', 'c', 5, 2.5)]
+
+    # a Frame without columns or index has nothing to insert
+    f = Frame(index=('a', 'b'), name='foo')
+    assert not list(
+        dbq._sql_insert_chunks(frame=f, label='foo', schema='', include_index=False)
+    )
+
+
 # -------------------------------------------------------------------------------
 def test_dbquery_create_b1():
     f = Frame.from_records(
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+
+from static_frame.core.batch import Batch
+from static_frame.core.executor import ExecutorContext
+from static_frame.core.frame import Frame
+from static_frame.core.series import Series
+from static_frame.core.util import get_concurrent_executor
+from static_frame.test.test_case import TestCase
+
+
+def get_pid(_: object) -> int:
+    return os.getpid()
+
+
+def get_pid_frame(f: Frame) -> Frame:
+    return Frame.from_element(os.getpid(), index=f.index, columns=('pid',))
+
+
+def is_nested_shared(_: object) -> bool:
+    return ExecutorContext.active(use_threads=True, mp_context=None) is not None
+
+
+class TestUnit(TestCase):
+    def test_executor_context_a(self) -> None:
+        ec = ExecutorContext(max_workers=2, use_threads=True)
+        self.assertEqual(repr(ec), '<ExecutorContext max_workers=2 threads>')
+        self.assertIsNone(ec.executor)
+
+        with ec:
+            executor = ec.executor
+            self.assertIsNotNone(executor)
+            self.assertIs(
+                ExecutorContext.active(use_threads=True, mp_context=None), executor
+            )
+            self.assertIsNone(ExecutorContext.active(use_threads=False, mp_context=None))
+
+            pool_executor = get_concurrent_executor(
+                use_threads=True, max_workers=8, mp_context=None
+            )
+            with pool_executor() as e:
+                self.assertIs(e, executor)
+            # not shut down by exiting the block
+            self.assertEqual(executor.submit(sum, (1, 2)).result(), 3)  # type: ignore
+
+            with self.assertRaises(RuntimeError):
+                ec.__enter__()
+
+        self.assertIsNone(ec.executor)
+        self.assertIsNone(ExecutorContext.active(use_threads=True, mp_context=None))
+
+    def test_executor_context_b(self) -> None:
+        s1 = Series(range(8))
+        with ExecutorContext(max_workers=2) as ec:
+            post1 = s1.iter_element().apply_pool(get_pid, max_workers=4)
+            post2 = s1.iter_element().apply_pool(get_pid, max_workers=4)
+            pids = set(post1.values.tolist()) | set(post2.values.tolist())
+
+            f1 = Frame.from_dict(dict(a=(1, 2), b=(3, 4)), name='f1')
+            f2 = Frame.from_dict(dict(a=(5, 6), b=(7, 8)), name='f2')
+            post3 = Batch.from_frames((f1, f2), max_workers=4).apply(get_pid_frame)
+            for _, f in post3.items():
+                pids.update(f['pid'].values.tolist())
+
+            # the same two workers serve all calls
+            self.assertTrue(len(pids) <= 2)
+            self.assertNotIn(os.getpid(), pids)
+
+            # a differing start method uses its own executor
+            self.assertIsNone(
+                ExecutorContext.active(use_threads=False, mp_context='spawn')
+            )
+            self.assertIsNotNone(ec.executor)
+
+    def test_executor_context_c(self) -> None:
+        s1 = Series(range(4))
+        with ExecutorContext(max_workers=2, use_threads=True, warm=False):
+            with ExecutorContext(max_workers=1, use_threads=True) as ec2:
+                self.assertIs(
+                    ExecutorContext.active(use_threads=True, mp_context=None),
+                    ec2.executor,
+                )
+                # threads of a shared executor do not wait on a shared executor
+                post = s1.iter_element().apply_pool(
+                    is_nested_shared, max_workers=2, use_threads=True
+                )
+                self.assertEqual(post.values.tolist(), [False, False, False, False])
+            self.assertIsNotNone(
+                ExecutorContext.active(use_threads=True, mp_context=None)
+            )
+
+
+if __name__ == '__main__':
+    import unittest
+
+    unittest.main()
@@ -7,11 +7,12 @@ import io
 import itertools as it
 import os
 import pickle
+import sqlite3
 import string
 import unittest
 from collections import OrderedDict, defaultdict, namedtuple
 from functools import partial
-from hashlib import sha256
+from hashlib import blake2b, md5, sha256
 from io import StringIO
 from itertools import chain, repeat
 from pathlib import Path
@@ -24,6 +25,7 @@ import typing_extensions as tp
 
 import static_frame as sf
 from static_frame import (
+    Bus,
     DisplayConfig,
     Frame,
     FrameGO,
@@ -43,6 +45,7 @@ from static_frame import (
     IndexYear,
     IndexYearGO,
     IndexYearMonth,
+    Quilt,
     Series,
     TypeBlocks,
     isna_element,
@@ -72,10 +75,6 @@ from static_frame.core.util import (
 )
 from static_frame.test.test_case import TestCase, skip_win, temp_file
 
-if tp.TYPE_CHECKING:
-    import sqlite3
-
-
 nan = np.nan
 
 
@@ -1272,6 +1271,74 @@ class TestUnit(TestCase):
             ),
         )
 
+    def test_frame_from_arrow_e(self) -> None:
+        f1 = Frame.from_fields(
+            (
+                np.arange(4),
+                np.arange(4) * 0.5,
+                np.arange(4).astype('datetime64[ns]'),
+                np.array([True, False, True, True]),
+            ),
+            columns=('a', 'b', 'c', 'd'),
+        )
+        at = f1.to_arrow(include_index=False)
+        # numeric and datetime arrays share memory in both directions
+        self.assertEqual(
+            at.column(0).chunk(0).buffers()[1].address, f1['a'].values.ctypes.data
+        )
+        f2 = Frame.from_arrow(at)
+        self.assertTrue(f2.equals(f1, compare_dtype=True))
+        for i, label in enumerate(('a', 'b', 'c')):
+            a = f2[label].values
+            self.assertEqual(a.ctypes.data, at.column(i).chunk(0).buffers()[1].address)
+            self.assertFalse(a.flags.writeable)
+
+        with self.assertRaises(ErrorInitFrame):
+            _ = Frame.from_arrow(at, zero_copy_only=True)
+
+        f3 = Frame.from_arrow(at.select(['a', 'b', 'c']), zero_copy_only=True)
+        self.assertEqual(f3.shape, (4, 3))
+
+    def test_frame_from_arrow_f(self) -> None:
+        import pyarrow
+
+        at = pyarrow.table(
+            {
+                'a': pyarrow.chunked_array([[1, 2], [3]]),
+                'b': pyarrow.array([1, None, 3]),
+                'c': pyarrow.array(np.arange(3).astype('datetime64[us]')),
+            }
+        )
+        f1 = Frame.from_arrow(at)
+        self.assertEqual([dt.kind for dt in f1.dtypes.values], ['i', 'f', 'M'])
+        self.assertEqual(f1['a'].values.tolist(), [1, 2, 3])
+        for label in ('a', 'b', 'c'):
+            with self.assertRaises(ErrorInitFrame):
+                _ = Frame.from_arrow(at.select([label]), zero_copy_only=True)
+
+    def test_frame_to_arrow_b(self) -> None:
+        f1 = Frame.from_fields(
+            (np.arange(4), np.arange(4).astype('datetime64[s]')),
+            columns=('a', 'b'),
+        )
+        at = f1.to_arrow(include_index=False, zero_copy_only=True)
+        self.assertEqual(
+            at.column(1).chunk(0).buffers()[1].address, f1['b'].values.ctypes.data
+        )
+        # the index is included
+        self.assertEqual(f1.to_arrow(zero_copy_only=True).num_columns, 3)
+        with self.assertRaises(ValueError):
+            _ = f1.relabel(index=('w', 'x', 'y', 'z')).to_arrow(zero_copy_only=True)
+
+        for f in (
+            f1.assign['b'](np.arange(4).astype('datetime64[D]')),
+            f1.assign['b'](('a', 'b', 'c', 'd')),
+            Frame(np.arange(8).reshape(4, 2)),  # columns of a 2D block are not contiguous
+        ):
+            with self.assertRaises(ValueError):
+                _ = f.to_arrow(include_index=False, zero_copy_only=True)
+            self.assertEqual(f.to_arrow(include_index=False).num_rows, 4)
+
     # ---------------------------------------------------------------------------
 
     def test_frame_to_parquet_a(self) -> None:
@@ -1820,6 +1887,96 @@ class TestUnit(TestCase):
         with self.assertRaises(ValueError):
             f1 = Frame.from_parquet(None)
 
+    def test_frame_from_parquet_g(self) -> None:
+        f1 = Frame.from_fields(
+            (np.arange(10), np.arange(10) * 0.5, list('abcdefghij')),
+            columns=('a', 'b', 'c'),
+        )
+        with temp_file('.parquet') as fp:
+            f1.to_parquet(fp, include_index=False, row_group_size=3)
+
+            f2 = Frame.from_parquet(fp)
+            self.assertTrue(f2.equals(f1, compare_dtype=False))
+
+            f3 = Frame.from_parquet(fp, row_groups=(3, 1))
+            self.assertEqual(f3['a'].values.tolist(), [3, 4, 5, 9])
+
+            f4 = Frame.from_parquet(fp, where=[('a', '>=', 7)], columns_select=['c'])
+            self.assertEqual(f4.columns.values.tolist(), ['c'])
+            self.assertEqual(f4['c'].values.tolist(), ['h', 'i', 'j'])
+
+            f5 = Frame.from_parquet(fp, where=[('a', 'in', (1, 8)), ('c', '!=', 'b')])
+            self.assertEqual(f5['a'].values.tolist(), [8])
+
+            f6 = Frame.from_parquet(fp, where=[('a', '>', 100)])
+            self.assertEqual(f6.shape, (0, 3))
+
+            with self.assertRaises(ErrorInitFrame):
+                Frame.from_parquet(fp, row_groups=(4,))
+            with self.assertRaises(ErrorInitFrame):
+                Frame.from_parquet(fp, where=[('x', '==', 1)])
+            with self.assertRaises(ErrorInitFrame):
+                Frame.from_parquet(fp, row_groups=(0,), columns_select=['x'])
+
+    def test_frame_from_parquet_h(self) -> None:
+        import pyarrow
+        import pyarrow.parquet as pq
+
+        t = np.array(
+            ['2020-01-01T00:00', '2020-01-02T12:00', '2020-01-03'],
+            dtype='datetime64[ns]',
+        )
+        at = pyarrow.table(
+            {
+                't': pyarrow.array(t),
+                'd': pyarrow.array(t.astype('datetime64[D]')),
+                'v': pyarrow.array(np.arange(3)),
+            }
+        )
+        with temp_file('.parquet') as fp:
+            pq.write_table(at, fp, row_group_size=1)
+
+            for value in (np.datetime64('2020-01-02'), datetime.date(2020, 1, 2)):
+                f1 = Frame.from_parquet(fp, where=[('t', '>=', value)])
+                self.assertEqual(f1['v'].values.tolist(), [1, 2])
+
+                f2 = Frame.from_parquet(fp, where=[('d', '<=', value)])
+                self.assertEqual(f2['v'].values.tolist(), [0, 1])
+
+                f3 = Frame.from_parquet(fp, where=[('d', 'in', [value])])
+                self.assertEqual(f3['v'].values.tolist(), [1])
+
+            f4 = Frame.from_parquet(fp, where=[('t', '<', np.datetime64('2020-01'))])
+            self.assertEqual(f4.shape, (0, 3))
+
+            f5 = Frame.from_parquet(
+                fp, where=[('t', 'in', (np.datetime64('2020-01-03'),))]
+            )
+            self.assertEqual(f5['v'].values.tolist(), [2])
+
+    def test_frame_from_parquet_iter_a(self) -> None:
+        f1 = ff.parse('s(10,3)|v(int,str,bool)|i(I,str)|c(I,str)')
+        with temp_file('.parquet') as fp:
+            f1.to_parquet(fp, row_group_size=4)
+
+            post1 = tuple(Frame.from_parquet_iter(fp, index_depth=1))
+            self.assertEqual([f.shape for f in post1], [(4, 3), (4, 3), (2, 3)])
+            self.assertTrue(Frame.from_concat(post1).equals(f1, compare_dtype=False))
+
+            post2 = tuple(Frame.from_parquet_iter(fp, index_depth=1, row_groups=(2,)))
+            self.assertEqual(
+                post2[0].index.values.tolist(), f1.index.values[-2:].tolist()
+            )
+
+            label = f1.index[-1]
+            post3 = tuple(
+                Frame.from_parquet_iter(
+                    fp, index_depth=1, where=[('__index0__', '==', label)]
+                )
+            )
+            self.assertEqual(len(post3), 1)
+            self.assertEqual(post3[0].index.values.tolist(), [label])
+
     # ---------------------------------------------------------------------------
 
     def test_frame_to_xarray_a(self) -> None:
@@ -5805,6 +5962,16 @@ class TestUnit(TestCase):
             (('w', 2.0), ('x', 30.0), ('y', 1.0), ('z', 30.0)),
         )
 
+    def test_frame_min_b(self) -> None:
+        f1 = Frame.from_items(
+            (('a', np.array([0.5], dtype=object)), ('b', np.array([3], dtype=object)))
+        )
+        post1 = f1.min(skipna=False)
+        self.assertEqual(post1.dtype, np.dtype(object))
+        self.assertEqual([type(v) for v in post1.values], [float, int])
+        post2 = f1.sum(skipna=False)
+        self.assertEqual([type(v) for v in post2.values], [float, int])
+
     def test_frame_max_a(self) -> None:
         # Address bug reported in #1072
         data = np.arange(9).reshape(3, 3).astype('datetime64[D]')
@@ -9874,8 +10041,133 @@ class TestUnit(TestCase):
         with self.assertRaises(ValueError):
             f = Frame.from_delimited(msg.split('\n'), delimiter=',', dtypes=dtypes)
 
+    def test_frame_from_delimited_v(self) -> None:
+        lines = ['a,b,c,d,e']
+        for i in range(40):
+            lines.append(
+                f'{i},{i * 0.5 if i % 3 else ""},"x{i}{chr(10) if i % 7 == 0 else ""}",'
+                f'{"" if i < 20 else i},{"q" if i == 39 else i % 2 == 0}'
+            )
+        msg = '\n'.join(lines)
+        f1 = Frame.from_csv(StringIO(msg))
+        for chunk_rows in (1, 3, 16, 100):
+            f2 = Frame.from_csv(StringIO(msg), max_workers=2, chunk_rows=chunk_rows)
+            self.assertTrue(f1.equals(f2, compare_dtype=True))
+
+        self.assertEqual([dt.kind for dt in f1.dtypes.values], ['i', 'f', 'U', 'i', 'U'])
+        self.assertEqual(f1.loc[7, 'c'], 'x7\n')
+
+    def test_frame_from_delimited_w(self) -> None:
+        msg = 'a|b|c\n1|x|True\n2|"y|z"|False\n3|w|True\n4|v|False\n5|u|True'
+        for kwargs in (
+            dict(columns_select=('c', 'a')),
+            dict(index_depth=1, dtypes={'c': str}),
+            dict(skip_header=1, columns_depth=0, skip_footer=1),
+        ):
+            f1 = Frame.from_delimited(msg.split('\n'), delimiter='|', **kwargs)  # type: ignore
+            f2 = Frame.from_delimited(
+                msg.split('\n'),
+                delimiter='|',
+                max_workers=2,
+                chunk_rows=2,
+                **kwargs,  # type: ignore
+            )
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_name=True))
+
+    def test_frame_from_delimited_x(self) -> None:
+        f1 = Frame.from_csv(StringIO('a,b\n'), max_workers=2)
+        self.assertEqual(f1.shape, (0, 2))
+
+        with self.assertRaises(ErrorInitFrame):
+            Frame.from_csv(StringIO('a,b\n1,2'), max_workers=2, chunk_rows=0)
+
     # ---------------------------------------------------------------------------
 
+    def test_frame_from_delimited_iter_a(self) -> None:
+        msg = 'a|b|c\n' + '\n'.join(f'{i}|{i * 0.5}|"x{i}"' for i in range(10))
+        f1 = Frame.from_delimited(msg.split('\n'), delimiter='|', index_depth=1)
+        post = list(
+            Frame.from_delimited_iter(
+                msg.split('\n'), delimiter='|', index_depth=1, chunk_rows=4
+            )
+        )
+        self.assertEqual([f.shape for f in post], [(4, 2), (4, 2), (2, 2)])
+        self.assertTrue(Frame.from_concat(post).equals(f1, compare_dtype=True))
+        self.assertEqual(post[2].index.values.tolist(), [8, 9])
+
+    def test_frame_from_delimited_iter_b(self) -> None:
+        # dtypes are evaluated on the first chunk
+        msg = 'a,b,c\n1,True,x\n2,False,yyy\n,,zz\n3,True,\n'
+        post = list(Frame.from_csv_iter(StringIO(msg), chunk_rows=2))
+        self.assertEqual(
+            [[dt.kind for dt in f.dtypes.values] for f in post],
+            [['i', 'b', 'U'], ['i', 'b', 'U']],
+        )
+        self.assertEqual(
+            post[1].to_pairs(),
+            (
+                ('a', ((2, 0), (3, 3))),
+                ('b', ((2, False), (3, True))),
+                ('c', ((2, 'zz'), (3, ''))),
+            ),
+        )
+
+        msg = 'a,b\n1,x\n2,y\n3.5,z\n'
+        with self.assertRaises(ErrorInitFrame) as cm:
+            _ = list(Frame.from_csv_iter(StringIO(msg), chunk_rows=2))
+        self.assertIn("record 2: values of field 'a'", str(cm.exception))
+        self.assertIn('int64', str(cm.exception))
+
+        post = list(Frame.from_csv_iter(StringIO(msg), chunk_rows=2, dtypes={'a': float}))
+        self.assertEqual(post[1]['a'].values.tolist(), [3.5])
+
+    def test_frame_from_delimited_iter_c(self) -> None:
+        msg = 'a\tb\tc\n1\t"p\nq"\t3\n4\tr\t6\n7\ts\t9\n10\tt\t12\n'
+        post = list(
+            FrameGO.from_tsv_iter(StringIO(msg), chunk_rows=3, columns_select=('b', 'c'))
+        )
+        self.assertEqual([f.shape for f in post], [(3, 2), (1, 2)])
+        self.assertEqual(post[0]['b'].values.tolist(), ['p\nq', 'r', 's'])
+        # each Frame has its own columns
+        post[0]['d'] = None
+        self.assertEqual(post[1].columns.values.tolist(), ['b', 'c'])
+
+        self.assertEqual(list(Frame.from_csv_iter(StringIO('a,b\n'))), [])
+
+    def test_frame_from_delimited_iter_d(self) -> None:
+        msg = 'a,b\n' + '\n'.join(f'{i},{i * 2}' for i in range(7))
+        frames = Frame.from_csv_iter(StringIO(msg), chunk_rows=3)
+        b = Bus.from_items(enumerate(frames))
+        self.assertEqual(b.shapes.values.tolist(), [(3, 2), (3, 2), (1, 2)])
+        q = Quilt(b, retain_labels=True)
+        self.assertEqual(q.to_frame()['b'].sum(), 42)
+
+    def test_frame_from_delimited_iter_e(self) -> None:
+        msg = 'a,b\n' + '\n'.join(f'{i},{i * 0.5}' for i in range(10))
+        f1 = Frame.from_csv(StringIO(msg))
+        post = list(Frame.from_csv_iter(StringIO(msg), chunk_rows=4))
+        self.assertEqual(
+            [f.index.values.tolist() for f in post],
+            [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]],
+        )
+        self.assertEqual([f.name for f in post], [0, 1, 2])
+
+        q = Quilt.from_frames(post, retain_labels=False)
+        self.assertTrue(q.to_frame().equals(f1, compare_dtype=True))
+
+        post = list(Frame.from_csv_iter(StringIO(msg), chunk_rows=4, name='x'))
+        self.assertEqual([f.name for f in post], [('x', 0), ('x', 1), ('x', 2)])
+
+    def test_frame_from_delimited_iter_f(self) -> None:
+        msg = 'a,b,c\n1,2,x\n3,4,y\n5,6.5,z\n'
+        with self.assertRaises(ErrorInitFrame) as cm:
+            _ = list(
+                Frame.from_csv_iter(
+                    StringIO(msg), chunk_rows=2, columns_select=('c', 'b')
+                )
+            )
+        self.assertIn("values of field 'b'", str(cm.exception))
+
     def test_frame_from_tsv_a(self) -> None:
         with temp_file('.txt', path=True) as fp:
             with open(fp, 'w', encoding='utf-8') as file:
@@ -16339,6 +16631,90 @@ class TestUnit(TestCase):
             ),
         )
 
+    def test_frame_from_sql_chunksize_a(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_b()
+
+        for index_depth in (0, 1, 3):
+            f1 = sf.Frame.from_sql(
+                'select * from events',
+                connection=conn,
+                index_depth=index_depth,
+            )
+            for chunksize in (1, 3, 4):
+                f2 = sf.Frame.from_sql(
+                    'select * from events',
+                    connection=conn,
+                    index_depth=index_depth,
+                    chunksize=chunksize,
+                )
+                self.assertEqualFrames(f1, f2)
+
+        with self.assertRaises(ErrorInitFrame):
+            sf.Frame.from_sql('select * from events', connection=conn, chunksize=0)
+
+    def test_frame_from_sql_chunksize_b(self) -> None:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('create table t (a, b)')
+        conn.executemany(
+            'insert into t values (?, ?)',
+            ((1, 'x'), (2, 'y'), (3.5, None), (4, 'zzz')),
+        )
+        # chunks with different types are resolved
+        f1 = sf.Frame.from_sql('select * from t', connection=conn, chunksize=2)
+        self.assertEqual(f1.dtypes.values.tolist(), [np.dtype(float), np.dtype(object)])
+        self.assertEqual(f1['a'].values.tolist(), [1.0, 2.0, 3.5, 4.0])
+
+        f2 = sf.Frame.from_sql('select * from t', connection=conn, chunksize=3)
+        self.assertEqualFrames(f1, f2)
+
+    def test_frame_from_sql_iter_a(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_b()
+
+        post = list(
+            sf.Frame.from_sql_iter(
+                'select * from events',
+                connection=conn,
+                index_depth=1,
+                columns_select=['value', 'count'],
+                chunksize=3,
+                name='a',
+            )
+        )
+        self.assertEqual([f.shape for f in post], [(3, 2), (1, 2)])
+        self.assertEqual([f.name for f in post], ['a', 'a'])
+        self.assertEqual(
+            post[1].to_pairs(), (('value', ((3, 12.5),)), ('count', ((3, 8),)))
+        )
+        self.assertEqualFrames(
+            sf.Frame.from_concat(post, name='a'),
+            sf.Frame.from_sql(
+                'select * from events',
+                connection=conn,
+                index_depth=1,
+                columns_select=['value', 'count'],
+                name='a',
+            ),
+        )
+
+    def test_frame_from_sql_iter_b(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_a()
+
+        post = list(
+            sf.FrameGO.from_sql_iter('select * from events', connection=conn, chunksize=2)
+        )
+        self.assertEqual(len(post), 2)
+        # mutable columns are not shared
+        post[0]['x'] = None
+        self.assertEqual(post[0].shape, (2, 5))
+        self.assertEqual(post[1].shape, (2, 4))
+
+        post = list(
+            sf.Frame.from_sql_iter(
+                'select * from events where count > 100', connection=conn
+            )
+        )
+        self.assertEqual(post, [])
+
     # ---------------------------------------------------------------------------
 
     def test_frame_from_records_items_a(self) -> None:
@@ -22868,6 +23244,23 @@ class TestUnit(TestCase):
         with self.assertRaises(TypeError):
             hd = f1.via_hashlib(include_name=False).sha256().hexdigest()
 
+    def test_frame_via_hashlib_c(self) -> None:
+        f1 = Frame.from_fields(
+            (np.arange(40_000), np.arange(40_000) * 0.5, np.arange(40_000) % 2 == 0),
+            columns=('a', 'b', 'c'),
+        )
+        f2 = Frame(np.arange(60_000).reshape(20_000, 3))
+        for f in (f1, f2, f1.iloc[::3], f2.iloc[:, [0, 2]]):
+            hl = f.via_hashlib(include_name=False)
+            b = f._to_signature_bytes(include_name=False)
+            self.assertEqual(hl.to_bytes(), b)
+            self.assertEqual(hl.sha256().hexdigest(), sha256(b).hexdigest())
+            self.assertEqual(hl.md5().hexdigest(), md5(b).hexdigest())
+            self.assertEqual(
+                hl.blake2b(digest_size=20).hexdigest(),
+                blake2b(b, digest_size=20).hexdigest(),
+            )
+
     # ---------------------------------------------------------------------------
     def test_frame_consolidate_a(self) -> None:
         f1 = Frame.from_fields(
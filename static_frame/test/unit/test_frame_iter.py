@@ -68,6 +68,19 @@ class TestUnit(TestCase):
         self.assertEqual(post.shape, (100,))
         self.assertAlmostEqual(f1.sum().sum(), post.sum())
 
+    def test_frame_iter_group_apply_pool_a(self) -> None:
+        f1 = Frame.from_fields(
+            ([1, 2, 1, 2, 1], [0.5, 1.5, 2.5, 3.5, 4.5], list('abcde')),
+            columns=('p', 'q', 'r'),
+        )
+        post1 = f1.iter_group('p').apply_pool(len, max_workers=2, use_shared_memory=True)
+        self.assertEqual(post1.to_pairs(), ((1, 3), (2, 2)))
+
+        post2 = f1.iter_group_items('p').apply_pool(
+            len, max_workers=2, use_shared_memory=True
+        )
+        self.assertEqual(post2.to_pairs(), ((1, 2), (2, 2)))
+
     def test_frame_iter_array_c(self) -> None:
         arrays = []
         for _ in range(8):
@@ -1716,6 +1729,170 @@ class TestUnit(TestCase):
             ),
         )
 
+    def test_frame_iter_window_array_a(self) -> None:
+        f1 = Frame(
+            np.arange(40).reshape(10, 4),
+            columns=list('ABCD'),
+            index=self.get_letters(10),
+        )
+        s1 = f1.iter_window_array(size=3, step=4).apply(np.sum)
+        self.assertEqual(s1.to_pairs(), (('c', 66), ('g', 258)))
+
+        s2 = f1.iter_window_array(size=2, axis=1).apply(np.max)
+        self.assertEqual(s2.to_pairs(), (('B', 37), ('C', 38), ('D', 39)))
+
+        s3 = f1.iter_window_array(size=2, axis=1).apply(np.mean)
+        self.assertEqual(
+            s3.to_pairs(),
+            tuple(
+                (label, w.mean())
+                for label, w in f1.iter_window_array_items(size=2, axis=1)
+            ),
+        )
+
+    def test_frame_iter_window_array_b(self) -> None:
+        f1 = ff.parse('s(20,3)|v(int,float,int)|i(I,str)')
+        for func in (np.sum, np.var, np.nanmin):
+            s1 = f1.iter_window_array(size=5, step=2, start_shift=1).apply(func)
+            s2 = Series.from_items(
+                (label, func(w))
+                for label, w in f1.iter_window_array_items(size=5, step=2, start_shift=1)
+            )
+            self.assertTrue(s1.index.equals(s2.index))
+            self.assertTrue(np.allclose(s1.values, s2.values))
+
+    def test_frame_iter_window_reduce_a(self) -> None:
+        f1 = Frame.from_fields(
+            ((1, 2, 3, 4, 5), (0.5, np.nan, 2.5, 3.5, 4.5)),
+            columns=('p', 'q'),
+            index=tuple('abcde'),
+        )
+        f2 = f1.iter_window(size=3).reduce.from_map_func(np.nansum).to_frame()
+        self.assertEqual(
+            f2.to_pairs(),
+            (
+                ('p', (('c', 6), ('d', 9), ('e', 12))),
+                ('q', (('c', 3.0), ('d', 6.0), ('e', 10.5))),
+            ),
+        )
+        f3 = (
+            f1.iter_window(size=1, step=0, size_increment=1)
+            .reduce.from_label_map({'p': np.max, 'q': len})
+            .to_frame()
+        )
+        self.assertEqual(
+            f3.to_pairs(),
+            (
+                ('p', (('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))),
+                ('q', (('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))),
+            ),
+        )
+
+    def test_frame_iter_window_reduce_b(self) -> None:
+        f1 = ff.parse('s(20,3)|v(int,float,int)|i(I,str)')
+        kwargs = dict(size=4, step=3, start_shift=-2, window_sized=False)
+        for func in (np.sum, np.mean, np.nanmin, np.var, len):
+            f2 = f1.iter_window_array(**kwargs).reduce.from_map_func(func).to_frame()  # type: ignore
+            f3 = Frame.from_concat(
+                (
+                    Series(
+                        [func(w[:, i]) for i in range(3)], index=f1.columns, name=label
+                    )
+                    for label, w in f1.iter_window_array_items(**kwargs)  # type: ignore
+                ),
+            )
+            self.assertTrue(f2.index.equals(f3.index))
+            self.assertTrue(np.allclose(f2.values, f3.values))
+
+    def test_frame_iter_group_reduce_a(self) -> None:
+        f1 = Frame.from_fields(
+            (
+                ('b', 'a', 'b', 'a', 'c'),
+                (1, 2, 3, 4, 5),
+                (0.5, 1.5, 2.5, 3.5, 4.5),
+            ),
+            columns=('k', 'p', 'q'),
+        )
+        f2 = (
+            f1.iter_group('k')
+            .reduce.from_label_map({'p': np.sum, 'q': np.mean, 'k': len})
+            .to_frame()
+        )
+        self.assertEqual(
+            f2.to_pairs(),
+            (
+                ('p', (('a', 6), ('b', 4), ('c', 5))),
+                ('q', (('a', 2.5), ('b', 1.5), ('c', 4.5))),
+                ('k', (('a', 2), ('b', 2), ('c', 1))),
+            ),
+        )
+        self.assertEqual(f2.dtypes.values.tolist(), [np.int64, np.float64, np.int64])
+
+        f3 = f1.iter_group('k', drop=True).reduce.from_map_func(np.max).to_frame()
+        self.assertEqual(
+            f3.to_pairs(),
+            (
+                ('p', (('a', 4), ('b', 3), ('c', 5))),
+                ('q', (('a', 3.5), ('b', 2.5), ('c', 4.5))),
+            ),
+        )
+
+    def test_frame_iter_group_reduce_b(self) -> None:
+        f1 = ff.parse('s(30,4)|v(int,float,int,str)').assign[0].apply(lambda s: s % 3)
+        for func in (np.sum, np.min, np.std):
+            f2 = f1.iter_group(0).reduce.from_label_map({1: func, 2: func}).to_frame()
+            f3 = Frame.from_concat(
+                (
+                    Frame.from_fields(
+                        ((func(f[1].values),), (func(f[2].values),)),
+                        columns=(1, 2),
+                        index=(label,),
+                    )
+                    for label, f in f1.iter_group_items(0)
+                ),
+            )
+            self.assertTrue(f2.index.equals(f3.index))
+            self.assertTrue(np.allclose(f2.values, f3.values))
+
+    def test_frame_iter_group_reduce_c(self) -> None:
+        f1 = Frame.from_fields(
+            (
+                np.array((2, 1, 2, 1), dtype=np.int64),
+                np.array((3, 4, 5, 6), dtype=np.uint8),
+                np.array((0.5, 1.5, 2.5, 3.5), dtype=np.float32),
+            ),
+            columns=('k', 'p', 'q'),
+        )
+        f2 = f1.iter_group('k').reduce.from_map_func(np.sum).to_frame()
+        self.assertEqual(
+            f2.to_pairs(),
+            (
+                ('k', ((1, 2), (2, 4))),
+                ('p', ((1, 10), (2, 8))),
+                ('q', ((1, 5.0), (2, 3.0))),
+            ),
+        )
+        # unsigned integer sums are signed, as with per-group reduction
+        self.assertEqual(f2.dtypes.values.tolist(), [np.int64, np.int64, np.float32])
+
+        f3 = f1.iter_group('k').reduce.from_map_func(np.max).to_frame()
+        self.assertEqual(f3.dtypes.values.tolist(), [np.int64, np.uint8, np.float32])
+
+    def test_frame_iter_group_array_apply_a(self) -> None:
+        f1 = Frame.from_fields(
+            ((10, 20, 10, 20, 30), (1, 2, 3, 4, 5), (6, 7, 8, 9, 10)),
+            columns=('k', 'p', 'q'),
+        )
+        s1 = f1.iter_group_array('k', drop=True).apply(np.sum)
+        self.assertEqual(s1.to_pairs(), ((10, 18), (20, 22), (30, 15)))
+        self.assertEqual(s1.index.name, 'k')
+
+        s2 = f1.iter_group_array('k').apply(np.mean)
+        self.assertEqual(
+            s2.to_pairs(),
+            ((10, np.mean((10, 10, 1, 3, 6, 8))), (20, 62 / 6), (30, 15.0)),
+        )
+
     # ---------------------------------------------------------------------------
 
     def test_frame_axis_interface_a(self) -> None:
@@ -5,7 +5,7 @@ import numpy as np
 import static_frame as sf
 from static_frame import Frame, FrameGO, IndexDate, IndexHierarchy
 from static_frame.core.fill_value_auto import FillValueAuto
-from static_frame.core.join import join
+from static_frame.core.join import _join_codes, join
 from static_frame.test.test_case import TestCase
 
 dt64 = np.datetime64
@@ -2874,3 +2874,95 @@ class TestUnit(TestCase):
                 ),
             ),
         )
+
+    # ---------------------------------------------------------------------------
+
+    def test_join_codes_a(self) -> None:
+        codes_src, codes_dst = _join_codes(
+            np.array([1.0, np.nan, 2.0, 3.0]),
+            np.array([2, 1, 2]),
+        )
+        self.assertEqual(codes_src.tolist(), [0, -1, 1, 2])
+        self.assertEqual(codes_dst.tolist(), [1, 0, 1])
+
+        codes_src, codes_dst = _join_codes(
+            np.array(['2020-01-01', 'NaT'], dtype='datetime64[D]'),
+            np.array(['NaT', '2020-01-01T00:00:00'], dtype='datetime64[s]'),
+        )
+        self.assertEqual(codes_src.tolist(), [0, -1])
+        self.assertEqual(codes_dst.tolist(), [-1, 0])
+
+        codes_src, codes_dst = _join_codes(
+            np.array([1, 'a', None, np.nan], dtype=object),
+            np.array(['a', True, None]),
+        )
+        self.assertEqual(codes_src.tolist(), [1, 0, 2, -1])
+        self.assertEqual(codes_dst.tolist(), [0, 1, 2])
+
+        # kinds that cannot be factorized together
+        self.assertIsNone(_join_codes(np.array(['a']), np.array([b'a'])))
+        self.assertIsNone(_join_codes(np.array(['a']), np.array([1])))
+        self.assertIsNone(
+            _join_codes(
+                np.array([None], dtype=object),
+                np.array(['2020-01-01'], dtype='datetime64[D]'),
+            )
+        )
+        self.assertIsNone(_join_codes(np.array([[1], None], dtype=object), np.array([1])))
+
+    def test_frame_join_codes_a(self) -> None:
+        f1 = Frame.from_fields(
+            ((1, 2, 2, 3, 4), (0, 0, 1, 0, 0), tuple('abcde')),
+            columns=('k1', 'k2', 'v'),
+        )
+        f2 = Frame.from_fields(
+            ((2.0, 2.0, 4.0, 5.0, np.nan), (0, 1, 0, 0, 0), tuple('pqrst')),
+            columns=('j1', 'j2', 'w'),
+        )
+        post = f1.join_outer(
+            f2,
+            left_columns=['k1', 'k2'],
+            right_columns=['j1', 'j2'],
+            include_index=True,
+        )
+        self.assertEqual(
+            post.index.values.tolist(),
+            [(0, None), (1, 0), (2, 1), (3, None), (4, 2), (None, 3), (None, 4)],
+        )
+        self.assertEqual(
+            post.fillna(None)[['v', 'w']].values.tolist(),
+            [
+                ['a', None],
+                ['b', 'p'],
+                ['c', 'q'],
+                ['d', None],
+                ['e', 'r'],
+                [None, 's'],
+                [None, 't'],
+            ],
+        )
+
+    def test_frame_join_codes_b(self) -> None:
+        # many matches retain destination order
+        f1 = Frame.from_fields(((3, 1, 3), ('a', 'b', 'c')), columns=('k', 'v'))
+        f2 = Frame.from_fields(((3, 2, 3, 3), ('p', 'q', 'r', 's')), columns=('j', 'w'))
+        post = f1.join_left(f2, left_columns='k', right_columns='j')
+        self.assertEqual(
+            post['w'].values.tolist(), ['p', 'r', 's', np.nan, 'p', 'r', 's']
+        )
+        self.assertEqual(post['v'].values.tolist(), ['a', 'a', 'a', 'b', 'c', 'c', 'c'])
+
+    def test_frame_join_codes_c(self) -> None:
+        # single-row frames with many target columns
+        f1 = Frame.from_fields(
+            ([1, 2, 3], [4, 5, 6], [7, 8, 9]), columns=('a0', 'a1', 'v')
+        )
+        f2 = Frame.from_fields(([1], [4], [0]), columns=('b0', 'b1', 'w'))
+
+        post1 = f1.join_left(f2, left_columns=['a0', 'a1'], right_columns=['b0', 'b1'])
+        self.assertEqual(post1.shape, (3, 6))
+        self.assertEqual(post1['w'].fillna(-1).values.tolist(), [0.0, -1.0, -1.0])
+
+        post2 = f2.join_inner(f1, left_columns=['b0', 'b1'], right_columns=['a0', 'a1'])
+        self.assertEqual(post2.shape, (1, 6))
+        self.assertEqual(post2['v'].values.tolist(), [7])
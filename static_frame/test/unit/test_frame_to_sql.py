@@ -56,3 +56,12 @@ def test_frame_to_sql_c():
             (8, 1, '1517-12-31'),
             (3, 0, '1517-06-30'),
         ]
+
+
+def test_frame_to_sql_chunksize_a():
+    f1 = ff.parse('s(7,3)|v(int,str,bool)|i(IH,(str,int))|c(I,str)').rename('x')
+    conn = sqlite3.connect(':memory:')
+    f1.to_sql(conn, chunksize=3)
+    f2 = Frame.from_sql('select * from x', connection=conn, index_depth=2)
+    assert f2.shape == (7, 3)
+    assert f2.values.tolist() == f1.astype({'zUvW': int}).values.tolist()
@@ -9,7 +9,7 @@ from io import StringIO
 
 import numpy as np
 import typing_extensions as tp
-from arraykit import mloc
+from arraykit import AutoMap, FrozenAutoMap, mloc
 
 from static_frame import (
     DisplayConfig,
@@ -31,7 +31,7 @@ from static_frame.core.exception import (
     ErrorInitIndexNonUnique,
     LocInvalid,
 )
-from static_frame.core.index import _index_initializer_needs_init
+from static_frame.core.index import _index_initializer_needs_init, _MapDeferred
 from static_frame.core.util import (
     NULL_SLICE,
     PositionsAllocator,
@@ -1838,6 +1838,92 @@ class TestUnit(TestCase):
         with self.assertRaises(TypeError):
             _ = idx1.via_hashlib().sha256().hexdigest()
 
+    def test_index_get_sort_status_a(self) -> None:
+        idx1 = Index((3, 10, 20))
+        self.assertIs(idx1._sort_status, SortStatus.UNKNOWN)
+        self.assertIs(idx1._get_sort_status(), SortStatus.ASC)
+        self.assertIs(idx1._sort_status, SortStatus.ASC)
+
+        idx2 = Index(('c', 'b', 'a'))
+        self.assertIs(idx2._get_sort_status(), SortStatus.DESC)
+
+        idx3 = Index((3, 1, 2))
+        self.assertIs(idx3._get_sort_status(), SortStatus.UNKNOWN)
+        self.assertTrue(idx3._sort_status_checked)
+
+        idx4 = Index((3, 'a', None))
+        self.assertIs(idx4._get_sort_status(), SortStatus.UNKNOWN)
+
+        idx5 = IndexGO((1, 2))
+        idx5.append(3)
+        self.assertIs(idx5._get_sort_status(), SortStatus.ASC)
+        idx5.append(0)
+        self.assertIs(idx5._get_sort_status(), SortStatus.UNKNOWN)
+
+    def test_index_map_deferred_a(self) -> None:
+        idx1 = Index(np.array([3, 10, 20]))
+        self.assertIsInstance(idx1._map, _MapDeferred)
+        self.assertEqual(idx1._loc_to_iloc(10), 1)
+        self.assertNotIn(4, idx1)
+        self.assertIsInstance(idx1._map, FrozenAutoMap)
+
+        idx2 = Index(np.array(['c', 'b', 'a']))
+        self.assertIsInstance(idx2._map, _MapDeferred)
+        self.assertIn('b', idx2)
+        self.assertEqual(idx2.loc[['a', 'c']].values.tolist(), ['a', 'c'])
+
+        # unordered, object, and grow-only labels create the map on initialization
+        self.assertIsInstance(Index(np.array([3, 1, 2]))._map, FrozenAutoMap)
+        self.assertIsInstance(Index(np.array([1, 2], dtype=object))._map, FrozenAutoMap)
+        self.assertIsInstance(IndexGO(np.array([1, 2]))._map, AutoMap)
+
+        with self.assertRaises(ErrorInitIndexNonUnique):
+            Index(np.array([1, 2, 2]))
+
+    def test_index_map_deferred_b(self) -> None:
+        idx1 = IndexDate(
+            np.array(['2020-01-01', '2020-01-03', '2020-01-04'], dtype='datetime64[D]')
+        )
+        self.assertIsInstance(idx1._map, _MapDeferred)
+
+        idx2 = pickle.loads(pickle.dumps(idx1))
+        self.assertIsInstance(idx2._map, _MapDeferred)
+        self.assertIsNot(idx2._map, idx1._map)
+        idx3 = copy.deepcopy(idx1)
+        self.assertIsInstance(idx3._map, _MapDeferred)
+        self.assertIsNot(idx3._map, idx1._map)
+        self.assertIn('2020-01-03', idx3)
+        self.assertIsInstance(idx1._map, _MapDeferred)
+
+        # a deferred map is shared, and created once
+        idx4 = IndexDate(idx1)
+        self.assertIs(idx4._map, idx1._map)
+        self.assertEqual(idx4.loc['2020-01-03'], np.datetime64('2020-01-03'))
+        self.assertIsInstance(idx4._map, FrozenAutoMap)
+        self.assertIs(idx1._get_map(), idx4._map)
+
+        # a created map is shared
+        idx5 = IndexDate(idx4)
+        self.assertIs(idx5._map, idx4._map)
+
+        self.assertIsInstance(idx1[1:]._map, _MapDeferred)
+        self.assertEqual(idx1[1:].loc['2020-01-03'], np.datetime64('2020-01-03'))
+
+    def test_index_map_deferred_c(self) -> None:
+        idx1 = Index(np.array([3, 10, 20]))
+        idx2 = Index(idx1)
+        idx3 = Index(idx1)
+        # a map created by one Index is taken by the others
+        self.assertEqual(idx2._loc_to_iloc(20), 2)
+        self.assertIs(idx1._get_map(), idx2._map)
+        self.assertIs(idx3._get_map(), idx2._map)
+        self.assertEqual(idx1._loc_to_iloc(3), 0)
+
+        # a map of different labels is not shared
+        idx4 = Index(np.array([4, 5, 6]))
+        self.assertEqual(idx4._loc_to_iloc(6), 2)
+        self.assertIsNot(idx4._map, idx1._map)
+
     def test_index_get_argsort_cache_a(self) -> None:
         idx1 = Index(('a', 'b', 'c', 'd'), name='')
         idx2 = IndexGO(('a', 'b', 'c', 'd'), name='')
@@ -36,6 +36,7 @@ from static_frame.core.exception import (
     LocInvalid,
 )
 from static_frame.core.index_datetime import dtype_to_index_cls
+from static_frame.core.util import SortStatus
 from static_frame.test.test_case import TestCase
 
 
@@ -984,6 +985,58 @@ class TestUnit(TestCase):
             [5, 31],
         )
 
+    def test_index_datetime_iloc_searchsorted_c(self) -> None:
+        idx = IndexDate.from_date_range('2020-01-01', '2020-01-31')
+        values = np.array(
+            ['2020-01-05T00', '2020-01-05T05', '2019-12-31T23', '2020-01-31T01', 'NaT'],
+            dtype='datetime64[h]',
+        )
+        for side_left in (True, False):
+            # values more granular than labels are searched at the unit of labels
+            self.assertEqual(
+                idx.iloc_searchsorted(values, side_left=side_left).tolist(),
+                np.searchsorted(
+                    idx.values.astype(values.dtype),
+                    values,
+                    'left' if side_left else 'right',
+                ).tolist(),
+            )
+        self.assertEqual(idx.iloc_searchsorted(np.datetime64('2020-01-05T05', 'h')), 5)
+        self.assertEqual(
+            idx.iloc_searchsorted(np.datetime64('2020-01-05T05', 'h'), side_left=False),
+            5,
+        )
+
+    def test_index_datetime_loc_ascending_a(self) -> None:
+        labels = np.arange(
+            '2024-01-30', '2024-06-02', np.timedelta64(5, 'h'), dtype='datetime64[h]'
+        )
+        s1 = Series(np.arange(len(labels)), index=IndexNanosecond(labels))
+        s2 = s1.iloc[np.random.default_rng(0).permutation(len(labels))]
+
+        post = s1.loc['2024-03':'2024-05']  # type: ignore
+        self.assertEqual(
+            post.index.values.tolist(),
+            labels[
+                (labels >= np.datetime64('2024-03-01'))
+                & (labels < np.datetime64('2024-06-01'))
+            ]
+            .astype('datetime64[ns]')
+            .tolist(),
+        )
+        for key in (
+            '2024-04',
+            ['2024-05', '2024-02'],
+            np.datetime64('2024'),
+        ):
+            # s1 is ascending and uses binary search; s2 does not
+            self.assertEqual(
+                s1.loc[key].sort_values().values.tolist(),
+                s2.loc[key].sort_values().values.tolist(),
+            )
+        self.assertIs(s1.index._sort_status, SortStatus.ASC)
+        self.assertIs(s2.index._sort_status, SortStatus.UNKNOWN)
+
     def test_index_datetime_iloc_searchsorted_b(self) -> None:
         dt64 = np.datetime64
         idx = IndexDate.from_date_range('2020-01-01', '2020-01-31')
@@ -8,10 +8,15 @@ import typing_extensions as tp
 from static_frame import IndexHierarchy
 from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.index import Index
-from static_frame.core.index_datetime import IndexDate
+from static_frame.core.index_datetime import IndexDate, IndexNanosecond
 from static_frame.core.index_hierarchy import build_indexers_from_product
 from static_frame.core.loc_map import HierarchicalLocMap, LocMap
-from static_frame.core.util import DTYPE_UINT_DEFAULT, NULL_SLICE, PositionsAllocator
+from static_frame.core.util import (
+    DTYPE_UINT_DEFAULT,
+    NULL_SLICE,
+    PositionsAllocator,
+    SortStatus,
+)
 from static_frame.test.test_case import TestCase
 
 if tp.TYPE_CHECKING:
@@ -29,7 +34,7 @@ class TestLocMapUnit(TestCase):
     def test_loc_map_a(self) -> None:
         idx = Index(['a', 'b', 'c'])
         post1 = LocMap.loc_to_iloc(
-            label_to_pos=idx._map,
+            label_to_pos=idx._get_map(),
             labels=idx._labels,
             positions=idx._positions,
             key='b',
@@ -38,7 +43,7 @@ class TestLocMapUnit(TestCase):
         self.assertEqual(post1, 1)
 
         post2 = LocMap.loc_to_iloc(
-            label_to_pos=idx._map,
+            label_to_pos=idx._get_map(),
             labels=idx._labels,
             positions=idx._positions,
             key=NULL_SLICE,
@@ -49,7 +54,7 @@ class TestLocMapUnit(TestCase):
     def test_loc_map_b(self) -> None:
         idx = Index(['a', 'b', 'c', 'd', 'e'])
         post1 = LocMap.loc_to_iloc(
-            label_to_pos=idx._map,
+            label_to_pos=idx._get_map(),
             labels=idx._labels,
             positions=idx._positions,
             key=['b', 'd'],
@@ -62,7 +67,7 @@ class TestLocMapUnit(TestCase):
         idx = IndexDate.from_date_range('1985-01-01', '1985-01-08')
 
         post1 = LocMap.loc_to_iloc(
-            label_to_pos=idx._map,
+            label_to_pos=idx._get_map(),
             labels=idx._labels,
             positions=idx._positions,
             key=slice(dt64('1985-01-01'), dt64('1985-01-04')),
@@ -71,7 +76,7 @@ class TestLocMapUnit(TestCase):
         self.assertEqual(post1, slice(0, 4, None))
 
         post2 = LocMap.loc_to_iloc(
-            label_to_pos=idx._map,
+            label_to_pos=idx._get_map(),
             labels=idx._labels,
             positions=idx._positions,
             key=slice(dt64('1985-01-01'), dt64('1985-01-04'), 2),
@@ -85,7 +90,7 @@ class TestLocMapUnit(TestCase):
 
         with self.assertRaises(RuntimeError):
             post1 = LocMap.loc_to_iloc(
-                label_to_pos=idx._map,
+                label_to_pos=idx._get_map(),
                 labels=idx._labels,
                 positions=idx._positions,
                 key=slice(dt64('1985-01-01'), dt64('1985-01-04'), dt64('1985-01-04')),
@@ -97,7 +102,7 @@ class TestLocMapUnit(TestCase):
         idx = IndexDate.from_date_range('1985-01-01', '1985-01-08')
 
         post1 = LocMap.loc_to_iloc(
-            label_to_pos=idx._map,
+            label_to_pos=idx._get_map(),
             labels=idx._labels,
             positions=idx._positions,
             key=slice(dt64('1985-01-01'), dt64('1985-01-04')),
@@ -110,7 +115,7 @@ class TestLocMapUnit(TestCase):
         idx = IndexDate.from_date_range('1985-01-06', '1985-04-08')
 
         post1 = LocMap.loc_to_iloc(
-            label_to_pos=idx._map,
+            label_to_pos=idx._get_map(),
             labels=idx._labels,
             positions=idx._positions,
             key=slice(dt64('1985-01'), dt64('1985-03')),
@@ -118,6 +123,40 @@ class TestLocMapUnit(TestCase):
         )
         self.assertEqual(post1, slice(0, 85, None))
 
+    def test_loc_map_dt64_ascending_a(self) -> None:
+        labels = np.arange(
+            '2024-01-30', '2024-06-02', np.timedelta64(7, 'h'), dtype='datetime64[h]'
+        ).astype('datetime64[ns]')
+        labels.flags.writeable = False
+        idx = IndexNanosecond(labels)
+        asc = lambda: SortStatus.ASC
+
+        keys = (
+            slice(np.datetime64('2024-03'), np.datetime64('2024-05')),
+            slice(np.datetime64('2024-02-29'), None),
+            slice(None, np.datetime64('2024-06-01')),
+            slice(np.datetime64('2023-12'), None),  # empty start
+            slice(None, np.datetime64('2024-07')),  # empty stop
+            np.datetime64('2024-04'),
+            np.datetime64('2024-08'),
+            np.array(['2024-05', '2024-02', '2024-05', '2025-01'], dtype='datetime64[M]'),
+            np.array(['2025-01'], dtype='datetime64[M]'),
+        )
+        for key in keys:
+            post = [
+                LocMap.loc_to_iloc(
+                    label_to_pos=idx._get_map(),
+                    labels=idx._labels,
+                    positions=idx._positions,
+                    key=key,
+                    sort_status=sort_status,
+                )
+                for sort_status in (None, asc)
+            ]
+            self.assertEqual(
+                idx._positions[post[0]].tolist(), idx._positions[post[1]].tolist()
+            )
+
 
 class TestHierarchicalLocMapUnit(TestCase):
     # ---------------------------------------------------------------------------
@@ -460,6 +460,7 @@ class TestUnit(TestCase):
                     idx._labels_mutable_dtype,
                     idx._positions_mutable_count,
                     idx._sort_status,
+                    idx._sort_status_checked,
                     idx,
                 )
             ),
@@ -702,6 +703,12 @@ class TestUnit(TestCase):
                     b._store,
                     # b._last_accessed, # not initialized, not a "max_persist" bus
                     b._max_persist,
+                    b._prefetch,
+                    b._max_persist_bytes,
+                    b._loaded_nbytes,
+                    b._persist_counts,
+                    b._lock,
+                    b._persist_epoch,
                 )
             )
             + getsizeof(b),
@@ -738,6 +745,12 @@ class TestUnit(TestCase):
                         b2._store,
                         b2._last_loaded,
                         b2._max_persist,
+                        b2._prefetch,
+                        b2._max_persist_bytes,
+                        b2._loaded_nbytes,
+                        b2._persist_counts,
+                        b2._lock,
+                        b2._persist_epoch,
                     )
                 )
                 + getsizeof(b2),
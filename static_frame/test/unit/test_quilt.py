@@ -11,11 +11,17 @@ from static_frame.core.axis_map import bus_to_hierarchy
 from static_frame.core.batch import Batch
 from static_frame.core.bus import Bus
 from static_frame.core.display_config import DisplayConfig
-from static_frame.core.exception import AxisInvalid, ErrorInitQuilt, ImmutableTypeError
+from static_frame.core.exception import (
+    AxisInvalid,
+    ErrorInitIndexNonUnique,
+    ErrorInitQuilt,
+    ImmutableTypeError,
+)
 from static_frame.core.frame import Frame
 from static_frame.core.hloc import HLoc
 from static_frame.core.index import ILoc, Index
 from static_frame.core.index_auto import IndexAutoConstructorFactory as IACF
+from static_frame.core.index_auto import IndexAutoFactory
 from static_frame.core.index_datetime import IndexDate, IndexSecond
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.quilt import Quilt
@@ -2541,6 +2547,126 @@ class TestUnit(TestCase):
             ),
         )
 
+    def test_quilt_extract_offsets_a(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int)').rename('a')
+        f2 = ff.parse('s(2,3)|v(int)|i(I,int)').rename('b')
+        f3 = ff.parse('s(3,3)|v(int)|i(I,str)').rename('c')
+        f = Frame.from_concat((f1, f2, f3), index=IndexAutoFactory)
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames((f1, f2, f3)).to_zip_pickle(fp)
+            q1 = Quilt.from_zip_pickle(fp, retain_labels=True)
+            self.assertEqual(q1.shape, (9, 3))
+            q1.unpersist()
+
+            self.assertEqual(q1.iloc[5:7].values.tolist(), f.iloc[5:7].values.tolist())
+            self.assertEqual(q1.status['loaded'].values.tolist(), [False, True, True])
+
+            q1.unpersist()
+            self.assertEqual(q1.iloc[-1].values.tolist(), f.iloc[-1].values.tolist())
+            self.assertEqual(q1.status['loaded'].values.tolist(), [False, False, True])
+
+            q1.unpersist()
+            self.assertEqual(
+                q1._extract_array(slice(0, 2), 1).tolist(),
+                f.iloc[0:2, 1].values.tolist(),
+            )
+            self.assertEqual(q1.status['loaded'].values.tolist(), [True, False, False])
+
+            offsets, labels = q1._get_axis_offsets()
+            self.assertEqual(offsets.tolist(), [0, 4, 6, 9])
+            self.assertEqual(labels, ['a', 'b', 'c'])
+            self.assertIs(q1.rename('x')._axis_offsets, q1._axis_offsets)
+
+            # selections that are not ascending slices retain order of first occurrence
+            self.assertEqual(
+                q1.iloc[[8, 0, 1]].values.tolist(),
+                f.iloc[[8, 0, 1]].values.tolist(),
+            )
+            self.assertEqual(
+                q1.iloc[::-3].values.tolist(),
+                f.iloc[[8, 5, 2]].values.tolist(),
+            )
+            # positions cannot be selected more than once
+            with self.assertRaises(ErrorInitIndexNonUnique):
+                q1.iloc[[3, 3]]
+            with self.assertRaises(ErrorInitIndexNonUnique):
+                q1._extract_array([3, 7, 3])
+
+    def test_quilt_reduce_a(self) -> None:
+        f1 = ff.parse('s(12,4)|v(int,float)|c(I,str)')
+        f2 = f1.assign.iloc[2:5, 1](np.nan)
+        q1 = Quilt.from_frame(f2, chunksize=5, retain_labels=False)
+
+        for method in ('sum', 'min', 'max', 'mean', 'count'):
+            for axis in (0, 1):
+                post = getattr(q1, method)(axis=axis)
+                expected = getattr(f2, method)(axis=axis)
+                self.assertTrue(post.index.equals(expected.index))
+                self.assertAlmostEqualValues(
+                    post.values.tolist(), expected.values.tolist()
+                )
+
+        self.assertEqual(q1.count(skipna=False).values.tolist(), [12, 12, 12, 12])
+        self.assertTrue(np.isnan(q1.sum(skipna=False).iloc[1]))
+
+        with self.assertRaises(AxisInvalid):
+            q1.sum(axis=2)
+
+    def test_quilt_reduce_b(self) -> None:
+        f1 = ff.parse('s(6,9)|v(float)')
+        q1 = Quilt.from_frame(f1, chunksize=2, retain_labels=True, axis=1)
+
+        post1 = q1.mean(axis=0, max_workers=2, use_threads=True)
+        self.assertEqual(post1.index.depth, 2)
+        self.assertAlmostEqualValues(
+            post1.values.tolist(), f1.mean(axis=0).values.tolist()
+        )
+
+        post2 = q1.max(axis=1, max_workers=2)
+        self.assertTrue(post2.index.equals(f1.index))
+        self.assertEqual(post2.values.tolist(), f1.max(axis=1).values.tolist())
+
+    def test_quilt_reduce_c(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int)').rename('a')
+        f2 = ff.parse('s(4,3)|v(int)|i(I,str)').rename('b')
+        f3 = ff.parse('s(4,3)|v(int)|i(I,int)').rename('c')
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames((f1, f2, f3)).to_zip_npz(fp)
+            q1 = Quilt.from_zip_npz(fp, retain_labels=True, max_persist=1)
+            post = q1.sum(max_workers=1, use_threads=True)
+            self.assertEqual(
+                post.values.tolist(),
+                Frame.from_concat((f1, f2, f3), index=IndexAutoFactory)
+                .sum()
+                .values.tolist(),
+            )
+            self.assertEqual(q1.status['loaded'].sum(), 1)
+
+    def test_quilt_reduce_d(self) -> None:
+        f1 = Frame.from_records([[0.5, 2.0]], columns=('p', 'q'), name='a')
+        f2 = Frame.from_records(
+            [[np.nan, 1.5], [0.25, 3.0]], columns=('p', 'q'), index=(1, 2), name='b'
+        ).astype(object)
+        q1 = Quilt(Bus.from_frames((f1, f2)), retain_labels=False)
+
+        post1 = q1.mean()
+        self.assertEqual(post1.dtype, np.float64)
+        self.assertAlmostEqualValues(post1.values.tolist(), [0.375, 6.5 / 3])
+        self.assertEqual(q1.mean(axis=1).dtype, np.float64)
+
+        for method in ('min', 'max', 'sum'):
+            post2 = getattr(q1, method)(skipna=False)
+            self.assertTrue(np.isnan(post2['p']))
+            self.assertIsInstance(post2['q'], float)
+            post3 = getattr(q1, method)(axis=1, skipna=False)
+            self.assertTrue(np.isnan(post3[1]))
+            self.assertEqual(post3.dtype, np.dtype(object))
+
+        self.assertEqual(q1.min(skipna=False)['q'], 1.5)
+        self.assertEqual(q1.max(skipna=False)['q'], 3.0)
+
 
 if __name__ == '__main__':
     import unittest
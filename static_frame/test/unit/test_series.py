@@ -4897,6 +4897,47 @@ class TestUnit(TestCase):
             ),
         )
 
+    def test_series_iter_window_array_c(self) -> None:
+        s1 = Series(np.arange(1, 21) / 2, index=self.get_letters(20))
+        for func in (np.sum, np.mean, np.std, np.min, np.nanmax, np.any):
+            kwargs = dict(size=4, step=3, start_shift=-2, label_shift=1)
+            s2 = s1.iter_window_array(**kwargs).apply(func)  # type: ignore
+            s3 = Series.from_items(
+                (label, func(w))
+                for label, w in s1.iter_window_array_items(**kwargs)  # type: ignore
+            )
+            self.assertEqual(s2.index.values.tolist(), s3.index.values.tolist())
+            self.assertEqual(s2.dtype, s3.dtype)
+            self.assertTrue(np.allclose(s2.values, s3.values))
+
+    def test_series_iter_window_array_d(self) -> None:
+        s1 = Series(range(1, 7), index=self.get_letters(6))
+        s2 = s1.iter_window_array(size=3, label_shift=-1).apply(np.sum, name='x')
+        self.assertEqual(s2.to_pairs(), (('b', 6), ('c', 9), ('d', 12), ('e', 15)))
+        self.assertEqual(s2.name, 'x')
+
+        s3 = s1.iter_window_array(size=7).apply(np.sum)
+        self.assertEqual(len(s3), 0)
+
+    def test_series_iter_window_array_e(self) -> None:
+        s1 = Series((3, 1, 4, 1, 5, 9), index=self.get_letters(6))
+        kwargs = dict(size=1, step=0, size_increment=1)
+        for func in (np.sum, np.max, np.mean, np.any, len):
+            s2 = s1.iter_window_array(**kwargs).apply(func)  # type: ignore
+            s3 = Series.from_items(
+                (label, func(w))
+                for label, w in s1.iter_window_array_items(**kwargs)  # type: ignore
+            )
+            self.assertTrue(s2.equals(s3, compare_dtype=True))
+
+    def test_series_iter_window_i(self) -> None:
+        s1 = Series((1.0, np.nan, 3.0, 4.0), index=self.get_letters(4))
+        # np.sum of a Series window skips NaN
+        s2 = s1.iter_window(size=2).apply(np.sum)
+        self.assertEqual(s2.to_pairs(), (('b', 1.0), ('c', 3.0), ('d', 7.0)))
+        s3 = s1.iter_window(size=2, window_sized=False, start_shift=-1).apply(len)
+        self.assertEqual(s3.to_pairs(), (('a', 1), ('b', 2), ('c', 2), ('d', 2)))
+
     # ---------------------------------------------------------------------------
 
     def test_series_iter_window_a(self) -> None:
@@ -143,6 +143,11 @@ class TestUnit(TestCase):
             merge_hierarchical_labels=True,
             read_max_workers=1,
             read_chunksize=1,
+            read_use_threads=True,
+            read_memory_map=True,
+            read_where=[('a', 'in', [1, 2]), ('b', '>', 0)],
+            read_order_by=['a'],
+            read_limit=10,
             write_max_workers=1,
             write_chunksize=1,
         )
@@ -201,6 +206,35 @@ class TestUnit(TestCase):
         config2 = StoreConfigHE(index_name_depth_level=(1, 2))
         self.assertNotEqual(config1, config2)
 
+        config1 = StoreConfigHE(read_use_threads=False)
+        config2 = StoreConfigHE(read_use_threads=True)
+        self.assertNotEqual(config1, config2)
+        self.assertNotEqual(hash(config1), hash(config2))
+
+        config1 = StoreConfigHE(read_where=[('a', '==', 1)])
+        config2 = StoreConfigHE(read_where=[('a', '==', 2)])
+        self.assertNotEqual(config1, config2)
+        self.assertNotEqual(hash(config1), hash(config2))
+
+    def test_store_config_read_where_a(self) -> None:
+        config = StoreConfig(read_where=(w for w in [('a', '<=', 3)]))
+        self.assertEqual(config.read_where, (('a', '<=', 3),))
+
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfig(read_where=[('a', '=', 3)])
+
+    def test_store_config_read_order_by_a(self) -> None:
+        config = StoreConfigHE(read_order_by=(n for n in ('a', 'b')))
+        self.assertEqual(config.read_order_by, ('a', 'b'))
+        hash(config)
+        self.assertEqual(list(config.read_order_by), ['a', 'b'])
+        self.assertEqual(config, StoreConfigHE(read_order_by=['a', 'b']))
+
+    def test_store_config_read_order_by_b(self) -> None:
+        config = StoreConfigHE(read_order_by='price')
+        self.assertEqual(config.read_order_by, ('price',))
+        self.assertEqual(config, StoreConfigHE(read_order_by=['price']))
+
     def test_store_config_not_hashable(self) -> None:
         with self.assertRaises(NotImplementedError):
             hash(StoreConfig())
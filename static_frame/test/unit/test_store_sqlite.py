@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import sqlite3
 from fractions import Fraction
 
 import frame_fixtures as ff
 import numpy as np
 
 from static_frame.core.frame import Frame
+from static_frame.core.index import Index
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_sqlite import StoreSQLite
@@ -244,6 +246,119 @@ class TestUnit(TestCase):
             post1 = [st2.read(l).shape for l in ('a', 'b', 'c')]
             self.assertEqual(post1, [(2, 3), (4, 7), (2, 3)])
 
+    def test_store_sqlite_columns_select_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,str,bool,float)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,3)|v(float)|i(I,str)|c(I,str)').rename('b')
+        select = ('zZbu', 'z2Oo', 'zkuW')
+        config = StoreConfig(index_depth=1, columns_select=select)
+
+        with temp_file('.db') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write(((f.name, f) for f in (f1, f2)))
+
+            st2 = StoreSQLite(fp, config=config)
+            conn = sqlite3.connect(fp)
+            query, columns_select = st2._query_select(
+                conn,
+                'a',
+                index_depth=1,
+                columns_depth=1,
+                columns_select=select,
+            )
+            conn.close()
+            self.assertEqual(
+                query, 'SELECT "__index0__", "zZbu", "zkuW", "z2Oo" from "a"'
+            )
+            self.assertIs(columns_select, None)
+
+            post = [st2.read(l) for l in ('a', 'b')]
+            self.assertEqual(post[0].columns.values.tolist(), ['zZbu', 'zkuW', 'z2Oo'])
+            self.assertEqual(post[0].index.values.tolist(), f1.index.values.tolist())
+            self.assertEqual(
+                post[0].values.tolist(), f1[['zZbu', 'zkuW', 'z2Oo']].values.tolist()
+            )
+            self.assertEqual(post[1].columns.values.tolist(), ['zZbu'])
+
+    def test_store_sqlite_read_where_a(self) -> None:
+        f1 = Frame.from_dict(
+            dict(x=(10, 20, 30, 40, 50), y=('a', 'b', 'c', 'd', 'e')),
+            index=Index(('p', 'q', 'r', 's', 't'), name='i'),
+            name='f1',
+        )
+        with temp_file('.db') as fp:
+            StoreSQLite(fp).write(((f1.name, f1),))
+
+            config = StoreConfig(index_depth=1, read_where=[('x', '>=', 20)])
+            post = StoreSQLite(fp, config=config).read('f1')
+            self.assertEqual(post.index.values.tolist(), ['q', 'r', 's', 't'])
+
+            config = StoreConfig(
+                index_depth=1,
+                read_where=[('i', 'in', ('p', 's', 't')), ('y', '!=', 's')],
+                read_order_by=['y'],
+                read_limit=2,
+            )
+            post = StoreSQLite(fp, config=config).read('f1')
+            self.assertEqual(
+                post.to_pairs(),
+                (('x', (('p', 10), ('s', 40))), ('y', (('p', 'a'), ('s', 'd')))),
+            )
+
+            config = StoreConfig(index_depth=1, read_limit=0)
+            post = StoreSQLite(fp, config=config).read('f1')
+            self.assertEqual(post.shape, (0, 2))
+
+    def test_store_sqlite_read_order_by_a(self) -> None:
+        f1 = Frame.from_dict(
+            dict(price=(30, 10, 20), y=('a', 'b', 'c')),
+            name='f1',
+        )
+        with temp_file('.db') as fp:
+            StoreSQLite(fp).write(((f1.name, f1),))
+
+            config = StoreConfig(index_depth=1, read_order_by='price')
+            post = StoreSQLite(fp, config=config).read('f1')
+            self.assertEqual(post.index.values.tolist(), [1, 2, 0])
+            self.assertEqual(post['price'].values.tolist(), [10, 20, 30])
+
+    def test_store_sqlite_query_clauses_a(self) -> None:
+        clauses, parameters = StoreSQLite._query_clauses(
+            read_where=[('a b', '<', 3), ('c', 'in', iter((1, 2)))],
+            read_order_by=['a b', 'c'],
+            read_limit=5,
+        )
+        self.assertEqual(
+            clauses,
+            ' WHERE "a b" < ? AND "c" IN (?, ?) ORDER BY "a b", "c" LIMIT ?',
+        )
+        self.assertEqual(parameters, [3, 1, 2, 5])
+
+    def test_store_sqlite_write_index_a(self) -> None:
+        f1 = ff.parse('s(6,2)|v(int)|i(IH,(str,int,str))|c(I,str)').rename('f1')
+        f1 = f1.rename(index=('p', 'q', 'r'))
+
+        with temp_file('.db') as fp:
+            StoreSQLite(fp).write(((f1.name, f1),))
+
+            conn = sqlite3.connect(fp)
+            plans = [
+                conn.execute(
+                    f'EXPLAIN QUERY PLAN SELECT * FROM f1 WHERE {n} = ?', (0,)
+                ).fetchone()[-1]
+                for n in ('p', 'q', 'r')
+            ]
+            conn.close()
+            for plan in plans:
+                self.assertTrue(plan.startswith('SEARCH f1 USING INDEX'))
+
+            value = f1.index[2][1]
+            config = StoreConfig(index_depth=3, read_where=[('q', '==', value)])
+            post = StoreSQLite(fp, config=config).read('f1')
+            self.assertEqual(
+                post.index.values.tolist(),
+                [list(l) for l in f1.index if l[1] == value],
+            )
+
 
 if __name__ == '__main__':
     import unittest
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import io
+import mmap
+import os
+import pickle
+import zipfile
 
 import frame_fixtures as ff
 import typing_extensions as tp
@@ -272,6 +276,33 @@ class TestUnit(TestCase):
             self.assertIs(post[0].index.__class__, IndexDate)
             self.assertIs(post[1].index.__class__, IndexDate)
 
+    def test_store_zip_parquet_d(self) -> None:
+        f1 = ff.parse('s(10,2)|v(int,float)|i(I,str)').rename('a')
+        config = StoreConfig(index_depth=1, write_row_group_size=4)
+
+        with temp_file('.zip') as fp:
+            StoreZipParquet(fp, config=config).write(((f1.name, f1),))
+
+            st1 = StoreZipParquet(fp, config=config)
+            post1 = tuple(st1.read_row_groups('a'))
+            self.assertEqual([f.shape for f in post1], [(4, 2), (4, 2), (2, 2)])
+            self.assertEqual([f.name for f in post1], ['a', 'a', 'a'])
+
+            post2 = tuple(st1.read_row_groups('a', row_groups=(1,)))
+            self.assertEqual(
+                post2[0].index.values.tolist(), f1.index.values[4:8].tolist()
+            )
+
+            label = f1.index[0]
+            st2 = StoreZipParquet(
+                fp,
+                config=StoreConfig(
+                    index_depth=1, read_where=[('__index0__', '==', label)]
+                ),
+            )
+            self.assertEqual(st2.read('a').index.values.tolist(), [label])
+            self.assertEqual(len(tuple(st2.read_row_groups('a'))), 1)
+
     def test_store_read_many_single_thread_weak_cache(self) -> None:
         f1, f2, f3 = get_test_framesA()
 
@@ -439,7 +470,160 @@ class TestUnitMultiProcess(TestCase):
             self.assertEqual(post[1].name, 'b')
             self.assertEqual(post[2].name, 'unnamed')
 
+    def test_store_zip_npz_threads_a(self) -> None:
+        f1, f2 = get_test_framesB()
+        f3 = ff.parse('s(4,6)|v(int,str,bool)|i(I,str)|c(I,str)').rename('c')
+
+        config = StoreConfig(read_max_workers=2, read_use_threads=True)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp, config=config)
+            st.write(((f.name, f) for f in (f1, f2, f3)))
+
+            # hold one frame in the cache to mix cached and read frames
+            f4 = st.read('b')
+            post = tuple(st.read_many(('c', 'b', 'a')))
+            self.assertEqual([f.name for f in post], ['c', 'b', 'a'])
+            self.assertIs(post[1], f4)
+
+            self.assertTrue(f1.equals(post[2], compare_name=True, compare_class=True))
+            self.assertTrue(f3.equals(post[0], compare_name=True, compare_class=True))
+            self.assertEqual(len(list(st._weak_cache)), 3)
+
+    def test_store_zip_parquet_threads_a(self) -> None:
+        f1, f2, f3 = get_test_framesA()
+
+        config = StoreConfig(
+            index_depth=1,
+            include_index=True,
+            columns_depth=1,
+            read_max_workers=2,
+            read_use_threads=True,
+            read_frame_filter=lambda l, f: f.iloc[:1],
+        )
+
+        with temp_file('.zip') as fp:
+            st = StoreZipParquet(fp, config=config)
+            st.write((f.name, f) for f in (f1, f2, f3))
+
+            post = tuple(st.read_many(('baz', 'bar', 'foo')))
+            self.assertEqual([f.name for f in post], ['baz', 'bar', 'foo'])
+            self.assertTrue(f2.iloc[:1].equals(post[1], compare_name=True))
+
+    def test_store_zip_npz_memory_map_a(self) -> None:
+        f1, f2 = get_test_framesB()
+        f3 = ff.parse('s(4,6)|v(int,str,bool,dtD)|i(I,str)|c(I,str)')
+
+        with temp_file('.zip') as fp:
+            st1 = StoreZipNPZ(fp)
+            # unnamed Frame are named by label
+            st1.write(
+                (('a', f1), ('b', f2), ('c', f3)),
+                compression=zipfile.ZIP_STORED,
+            )
+
+            st2 = StoreZipNPZ(fp, config=StoreConfig(read_memory_map=True))
+            post = tuple(st2.read_many(('c', 'a', 'b')))
+            self.assertTrue(post[0].equals(f3.rename('c'), compare_name=True))
+            self.assertTrue(post[1].equals(f1, compare_name=True, compare_class=True))
+            self.assertTrue(post[2].equals(f2, compare_name=True, compare_class=True))
+
+            # blocks are read-only views of a memory map
+            for f in post:
+                for a in f._blocks._blocks:
+                    self.assertFalse(a.flags.writeable)
+                    self.assertIsInstance(a.base, mmap.mmap)
+
+            self.assertIs(st2.read('a'), post[1])
+
+    def test_store_zip_npz_memory_map_b(self) -> None:
+        f1, f2 = get_test_framesB()
+
+        for cls in (StoreZipNPZ, StoreZipNPY):
+            with temp_file('.zip') as fp:
+                st1 = cls(fp)
+                # compressed members are read without memory mapping
+                st1.write(((f.name, f) for f in (f1, f2)))
+
+                st2 = cls(fp, config=StoreConfig(read_memory_map=True))
+                post = tuple(st2.read_many(('b', 'a')))
+                self.assertTrue(post[0].equals(f2, compare_name=True))
+                self.assertTrue(post[1].equals(f1, compare_name=True))
+                for f in post:
+                    for a in f._blocks._blocks:
+                        self.assertNotIsInstance(a.base, mmap.mmap)
+
+    def test_store_zip_npy_memory_map_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(4,8)|v(bool,str,float)|i(I,str)|c(I,str)').rename('b')
+        f3 = ff.parse('s(4,7)|v(dtD)|i(I,str)|c(I,str)').rename('c')
+
+        config = StoreConfig(
+            read_memory_map=True, read_frame_filter=lambda l, f: f.iloc[:2]
+        )
+
+        with temp_file('.zip') as fp:
+            st1 = StoreZipNPY(fp)
+            st1.write(((f.name, f) for f in (f1, f2, f3)), compression=zipfile.ZIP_STORED)
+
+            st2 = StoreZipNPY(fp, config=config)
+            post = tuple(st2.read_many(('b', 'c', 'a')))
+            self.assertTrue(post[0].equals(f2.iloc[:2], compare_name=True))
+            self.assertTrue(post[1].equals(f3.iloc[:2], compare_name=True))
+            self.assertTrue(post[2].equals(f1.iloc[:2], compare_name=True))
+            self.assertIsInstance(post[1]._blocks._blocks[0].base.base, mmap.mmap)
+
     # ---------------------------------------------------------------------------
+    def test_store_zip_columns_select_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,str,bool,float)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,8)|v(float)|i(I,str)|c(I,str)').rename('b')
+        select = ('zZbu', 'zUvW', 'zkuW', 'z2Oo')
+        config = StoreConfig(columns_select=select)
+
+        for cls in (StoreZipNPZ, StoreZipNPY, StoreZipPickle):
+            with temp_file('.zip') as fp:
+                st1 = cls(fp)
+                st1.write((('a', f1), ('b', f2)))
+                st2 = cls(fp, config=config)
+                for f_src, f_loaded in zip((f1, f2), st2.read_many(('a', 'b'))):
+                    self.assertTrue(
+                        f_loaded.equals(
+                            f_src.loc[:, f_src.columns.isin(select)],
+                            compare_name=True,
+                            compare_dtype=True,
+                        )
+                    )
+
+    def test_store_zip_columns_select_b(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,str,bool,float)|i(I,str)|c(I,str)').rename('a')
+        select = ('zUvW', 'z2Oo')
+        config = StoreConfig(columns_select=select, read_memory_map=True)
+
+        for cls in (StoreZipNPZ, StoreZipNPY):
+            with temp_file('.zip') as fp:
+                st1 = cls(fp)
+                st1.write((('a', f1),), compression=zipfile.ZIP_STORED)
+                f2 = cls(fp, config=config).read('a')
+                self.assertEqual(f2.columns.values.tolist(), ['zUvW', 'z2Oo'])
+                self.assertTrue(f2.equals(f1[['zUvW', 'z2Oo']], compare_dtype=True))
+
+    def test_store_zip_columns_select_c(self) -> None:
+        class StoreZipNPZGO(StoreZipNPZ):
+            _CONSTRUCTOR = FrameGO.from_npz
+
+        f1 = ff.parse('s(4,6)|v(int,str,bool,float)|i(I,str)|c(I,str)').rename('a')
+        select = ('zUvW', 'z2Oo')
+
+        with temp_file('.zip') as fp:
+            StoreZipNPZ(fp).write((('a', f1),), compression=zipfile.ZIP_STORED)
+            for read_memory_map in (False, True):
+                config = StoreConfig(
+                    columns_select=select, read_memory_map=read_memory_map
+                )
+                f2 = StoreZipNPZGO(fp, config=config).read('a')
+                self.assertIs(f2.__class__, FrameGO)
+                self.assertEqual(f2.columns.values.tolist(), ['zUvW', 'z2Oo'])
+
     def test_store_zip_npy_a(self) -> None:
         f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('a')
         f2 = ff.parse('s(4,8)|v(bool,str,float)|i(I,str)|c(I,str)').rename('b')
@@ -476,6 +660,92 @@ class TestUnitMultiProcess(TestCase):
             post = tuple(st.read_many(('a', 'b', 'c')))
             self.assertEqual(len(post), 3)
 
+    # ---------------------------------------------------------------------------
+    def test_store_zip_read_metadata_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,5)|v(str,float)|i(IH,(str,int))|c(IH,(str,int))').rename('b')
+        f3 = ff.parse('s(2,3)|v(float)').rename('c')
+        frames = (f1, f2, f3)
+
+        for cls, compression in (
+            (StoreZipNPZ, zipfile.ZIP_DEFLATED),
+            (StoreZipNPZ, zipfile.ZIP_STORED),
+            (StoreZipNPY, zipfile.ZIP_DEFLATED),
+        ):
+            with temp_file('.zip') as fp:
+                st = cls(fp, config=StoreConfig(include_columns=True))
+                st.write(((f.name, f) for f in frames), compression=compression)
+
+                post = tuple(st.read_metadata_many(('a', 'b', 'c', 'd')))
+                self.assertIs(post[3], None)
+                for f, md in zip(frames, post):
+                    self.assertEqual(md.shape, f.shape)
+                    self.assertEqual(md.nbytes, f.nbytes)
+                    self.assertTrue(md.dtypes.equals(f.dtypes, compare_class=True))
+
+                self.assertEqual(len(st._weak_cache), 0)
+                self.assertEqual(
+                    st.read_metadata('c').dtypes.index.values.tolist(), [0, 1, 2]
+                )
+
+    # ---------------------------------------------------------------------------
+    def test_store_zip_manifest_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,2)|v(bool,float)|i(I,str)|c(I,str)').rename('b')
+
+        for cls in (StoreZipNPZ, StoreZipNPY):
+            with temp_file('.zip') as fp:
+                st = cls(fp, config=StoreConfig(write_manifest=True))
+                st.write(((f.name, f) for f in (f1, f2)))
+                self.assertTrue(os.path.exists(fp + '.manifest'))
+
+                # the manifest is not read unless configured
+                st = cls(fp)
+                self.assertIs(st._get_manifest(), None)
+
+                config = StoreConfig(read_manifest=True)
+                st = cls(fp, config=config)
+                self.assertIsNot(st._get_manifest(), None)
+                self.assertEqual(tuple(st.labels()), ('a', 'b'))
+                md = st.read_metadata('b')
+                self.assertEqual(md.shape, (3, 2))
+                self.assertEqual(md.nbytes, f2.nbytes)
+                self.assertTrue(md.dtypes.equals(f2.dtypes))
+                self.assertIs(st.read_metadata('c'), None)
+
+                # the manifest is discarded on unpickling and read again
+                st = pickle.loads(pickle.dumps(st))
+                self.assertEqual(st.read_metadata('a').shape, (4, 6))
+
+                # a modified archive invalidates the manifest
+                os.utime(fp, (0, 0))
+                st = cls(fp, config=config)
+                self.assertIs(st._get_manifest(), None)
+                self.assertEqual(tuple(st.labels()), ('a', 'b'))
+
+                # writing without a manifest removes the sidecar
+                st.write(((f.name, f) for f in (f1,)))
+                self.assertFalse(os.path.exists(fp + '.manifest'))
+                self.assertEqual(tuple(st.labels()), ('a',))
+
+    def test_store_zip_manifest_b(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('a')
+
+        for cls in (StoreZipNPZ, StoreZipNPY):
+            with temp_file('.zip') as fp:
+                st = cls(fp, config=StoreConfig(write_manifest=True))
+                st.write(((f.name, f) for f in (f1,)))
+
+                # read options that alter Frame invalidate stored metadata
+                for config in (
+                    StoreConfig(read_manifest=True, columns_select=['zZbu']),
+                    StoreConfig(read_manifest=True, read_frame_filter=lambda l, f: f),
+                ):
+                    st = cls(fp, config=config)
+                    self.assertIsNot(st._get_manifest(), None)
+                    self.assertIs(st.read_metadata('a'), None)
+                    self.assertEqual(tuple(st.labels()), ('a',))
+
     # ---------------------------------------------------------------------------
     def test_store_zip_npz_frame_filter_a(self) -> None:
         f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('a')
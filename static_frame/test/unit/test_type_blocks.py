@@ -4521,6 +4521,17 @@ class TestUnit(TestCase):
         post = tuple(group_match(tb1, axis=0, key=0, drop=True))
         self.assertEqual([x.shape for _, _, x in post], [(5, 2), (1, 2), (6, 2)])
 
+    def test_type_blocks_group_match_b2(self) -> None:
+        tb1 = TypeBlocks.from_blocks(
+            (np.array([3, None, 3, 'a', None], dtype=object), np.arange(5))
+        )
+        post = tuple(group_match(tb1, axis=0, key=0))
+        self.assertEqual([g for g, _, _ in post], [3, None, 'a'])
+        self.assertEqual([s.tolist() for _, s, _ in post], [[0, 2], [1, 4], [3]])
+        self.assertEqual(
+            [x.values[:, 1].tolist() for _, _, x in post], [[0, 2], [1, 4], [3]]
+        )
+
     def test_type_blocks_group_match_c(self) -> None:
         tb1 = TypeBlocks.from_zero_size_shape((0, 3))
         post = tuple(group_match(tb1, axis=0, key=0, drop=True))
@@ -94,6 +94,7 @@ from static_frame.core.util import (
     ufunc_nansum,
     ufunc_set_iter,
     ufunc_unique,
+    ufunc_group_reduce,
     ufunc_unique1d_counts,
     ufunc_unique1d_positions,
     ufunc_unique2d_indexer,
@@ -2809,6 +2810,44 @@ class TestUnit(TestCase):
         with self.assertRaises(TypeError):
             ufunc_unique1d_counts(np.array(['foo', []], dtype=object))
 
+    # ---------------------------------------------------------------------------
+
+    def test_ufunc_group_reduce_a(self) -> None:
+        a1 = np.array([1, 2, 3, 4, 5, 6])
+        starts = np.array([0, 1, 4])
+        counts = np.array([1, 3, 2])
+        self.assertEqual(
+            ufunc_group_reduce(a1, starts, counts, np.sum).tolist(), [1, 9, 11]
+        )
+        self.assertEqual(
+            ufunc_group_reduce(a1, starts, counts, np.max).tolist(), [1, 4, 6]
+        )
+        self.assertEqual(
+            ufunc_group_reduce(a1, starts, counts, np.mean).tolist(), [1.0, 3.0, 5.5]
+        )
+        self.assertEqual(
+            ufunc_group_reduce(a1, starts, counts, np.var).tolist(), [0.0, 2 / 3, 0.25]
+        )
+        self.assertEqual(ufunc_group_reduce(a1, starts, counts, len).tolist(), [1, 3, 2])
+
+    def test_ufunc_group_reduce_b(self) -> None:
+        a1 = np.arange(12, dtype=np.int32).reshape(6, 2)
+        starts = np.array([0, 2])
+        counts = np.array([2, 4])
+        post1 = ufunc_group_reduce(a1, starts, counts, np.sum)
+        self.assertEqual(post1.tolist(), [6, 60])
+        self.assertEqual(post1.dtype, np.sum(a1).dtype)
+        post2 = ufunc_group_reduce(a1, starts, counts, np.std)
+        self.assertEqual(post2.tolist(), [np.std(a1[:2]), np.std(a1[2:])])
+
+    def test_ufunc_group_reduce_c(self) -> None:
+        a1 = np.array(['a', 'b', 'c'])
+        starts = np.array([0])
+        counts = np.array([3])
+        self.assertIsNone(ufunc_group_reduce(a1, starts, counts, np.min))
+        a2 = np.array([1.0, 2.0, 3.0])
+        self.assertIsNone(ufunc_group_reduce(a2, starts, counts, np.median))
+
     def test_warnings_silent_a(self) -> None:
         post = warnings.filters
         with WarningsSilent():
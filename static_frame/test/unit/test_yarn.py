@@ -1070,6 +1070,29 @@ class TestUnit(TestCase):
         y2 = y1[['f4', 'f1']]
         self.assertEqual(y2.dtypes.shape, (2, 8))
 
+    def test_yarn_dtypes_c(self) -> None:
+        f1 = ff.parse('s(4,2)|v(int,float)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(3,3)|v(bool)|c(I,str)').rename('f2')
+        f3 = ff.parse('s(2,2)|v(str)|c(I,str)').rename('f3')
+
+        with temp_file('.zip') as fp1, temp_file('.zip') as fp2:
+            Bus.from_frames((f1, f2)).to_zip_npz(fp1)
+            Bus.from_frames((f3,)).to_zip_npy(fp2)
+            y1 = Yarn.from_buses(
+                (Bus.from_zip_npz(fp1), Bus.from_zip_npy(fp2)),
+                retain_labels=False,
+            )
+            y2 = y1[['f3', 'f1']]
+            self.assertEqual(
+                y2.dtypes.sort_columns().to_pairs(),
+                (
+                    ('zZbu', (('f3', np.dtype('<U4')), ('f1', np.dtype('int64')))),
+                    ('ztsv', (('f3', np.dtype('<U4')), ('f1', np.dtype('float64')))),
+                ),
+            )
+            self.assertEqual(y2.shapes.to_pairs(), (('f3', (2, 2)), ('f1', (4, 2))))
+            self.assertEqual(y1.status['loaded'].sum(), 0)
+
     # ---------------------------------------------------------------------------
 
     def test_yarn_shapes_a(self) -> None: